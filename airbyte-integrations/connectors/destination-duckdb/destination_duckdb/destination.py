@@ -1,20 +1,18 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
-import datetime
 import json
 import logging
 import os
 import re
-import uuid
-from collections import defaultdict
 from logging import getLogger
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Iterable, Mapping
 
 import duckdb
 import pyarrow as pa
 
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
+from destination_duckdb.record_buffer import FLUSH_REASON_END_OF_INPUT, FLUSH_REASON_STATE, RecordBuffer
 
 
 logger = getLogger("airbyte")
@@ -110,16 +108,16 @@ class DestinationDuckdb(Destination):
 
             con.execute(query)
 
-        buffer = defaultdict(lambda: defaultdict(list))
+        def flush_stream(stream_name: str, pa_table: pa.Table) -> None:
+            DestinationDuckdb._safe_write(con=con, pa_table=pa_table, schema_name=schema_name, stream_name=stream_name)
+
+        buffer = RecordBuffer(flush_callback=flush_stream)
 
         for message in input_messages:
             if message.type == Type.STATE:
                 # flush the buffer
-                for stream_name in buffer.keys():
-                    logger.info(f"flushing buffer for state: {message}")
-                    DestinationDuckdb._safe_write(con=con, buffer=buffer, schema_name=schema_name, stream_name=stream_name)
-
-                buffer = defaultdict(lambda: defaultdict(list))
+                logger.info(f"flushing buffer for state: {message}")
+                buffer.flush_all(reason=FLUSH_REASON_STATE)
 
                 yield message
             elif message.type == Type.RECORD:
@@ -128,40 +126,28 @@ class DestinationDuckdb(Destination):
                 if stream_name not in streams:
                     logger.debug(f"Stream {stream_name} was not present in configured streams, skipping")
                     continue
-                # add to buffer
-                buffer[stream_name]["_airbyte_ab_id"].append(str(uuid.uuid4()))
-                buffer[stream_name]["_airbyte_emitted_at"].append(datetime.datetime.now().isoformat())
-                buffer[stream_name]["_airbyte_data"].append(json.dumps(data))
+                # add to buffer, which flushes on its own once a size budget is exceeded
+                buffer.append(stream_name, json.dumps(data))
 
             else:
                 logger.info(f"Message type {message.type} not supported, skipping")
 
         # flush any remaining messages
-        for stream_name in buffer.keys():
-            DestinationDuckdb._safe_write(con=con, buffer=buffer, schema_name=schema_name, stream_name=stream_name)
+        buffer.flush_all(reason=FLUSH_REASON_END_OF_INPUT)
+        logger.info(f"Write to DuckDB finished, buffer stats: {buffer.metrics}")
 
     @staticmethod
-    def _safe_write(*, con: duckdb.DuckDBPyConnection, buffer: Dict[str, Dict[str, List[Any]]], schema_name: str, stream_name: str):
+    def _safe_write(*, con: duckdb.DuckDBPyConnection, pa_table: pa.Table, schema_name: str, stream_name: str):
         table_name = f"_airbyte_raw_{stream_name}"
-        try:
-            pa_table = pa.Table.from_pydict(buffer[stream_name])
-        except:
-            logger.exception(
-                f"Writing with pyarrow view failed, falling back to writing with executemany. Expect some performance degradation."
-            )
-            query = f"""
+        # DuckDB will automatically find and SELECT from the `pa_table` argument. Record ids
+        # are minted by DuckDB while inserting instead of being buffered in Python.
+        con.sql(
+            f"""
             INSERT INTO {schema_name}.{table_name}
                 (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
-            VALUES (?,?,?)
+            SELECT uuid()::VARCHAR, _airbyte_emitted_at, _airbyte_data FROM pa_table
             """
-            entries_to_write = buffer[stream_name]
-            con.executemany(
-                query, zip(entries_to_write["_airbyte_ab_id"], entries_to_write["_airbyte_emitted_at"], entries_to_write["_airbyte_data"])
-            )
-        else:
-            # DuckDB will automatically find and SELECT from the `pa_table`
-            # local variable defined above.
-            con.sql(f"INSERT INTO {schema_name}.{table_name} SELECT * FROM pa_table")
+        )
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -0,0 +1,187 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""Bounded in-memory record buffer used by the DuckDB destination."""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Callable, Dict, List
+
+import pyarrow as pa
+
+
+logger = getLogger("airbyte")
+
+MAX_STREAM_BATCH_ROWS = 100_000
+MAX_STREAM_BATCH_BYTES = 64 * 1024 * 1024
+MAX_TOTAL_BUFFER_BYTES = 256 * 1024 * 1024
+
+ARROW_CHUNK_ROWS = 8_192
+"""Number of rows kept as Python objects before they are converted into an Arrow record batch."""
+
+# Approximate CPython cost of one pending row on top of the JSON payload: a `str` and an `int`
+# object header plus two list slots. Rows sealed into Arrow batches are accounted at their
+# actual Arrow size instead.
+ROW_OVERHEAD_BYTES = 96
+
+RAW_BATCH_SCHEMA = pa.schema(
+    [
+        ("_airbyte_emitted_at", pa.timestamp("us")),
+        ("_airbyte_data", pa.string()),
+    ]
+)
+
+FLUSH_REASON_ROWS = "row_limit"
+FLUSH_REASON_BYTES = "byte_limit"
+FLUSH_REASON_MEMORY = "memory_pressure"
+FLUSH_REASON_STATE = "state"
+FLUSH_REASON_END_OF_INPUT = "end_of_input"
+
+FlushCallback = Callable[[str, pa.Table], None]
+
+
+@dataclass
+class BufferMetrics:
+    """Counters describing how the buffer behaved over a sync."""
+
+    peak_buffer_bytes: int = 0
+    peak_buffer_rows: int = 0
+    records_flushed: int = 0
+    flushes: Counter = field(default_factory=Counter)
+
+    def __str__(self) -> str:
+        flushes = ", ".join(f"{reason}={count}" for reason, count in sorted(self.flushes.items())) or "none"
+        return (
+            f"peak_buffer_bytes={self.peak_buffer_bytes:,}, peak_buffer_rows={self.peak_buffer_rows:,}, "
+            f"records_flushed={self.records_flushed:,}, flushes=({flushes})"
+        )
+
+
+class StreamBuffer:
+    """
+    Columnar buffer for a single stream with a running size estimate.
+
+    Rows are collected as Python values for at most `ARROW_CHUNK_ROWS` rows and then converted
+    into an Arrow record batch, so most of the buffer lives in compact Arrow memory. The emitted-at
+    column is stored as a native timestamp. Record ids are not buffered at all, they are minted
+    by DuckDB during the insert (see `DestinationDuckdb._safe_write`).
+    """
+
+    __slots__ = ("_emitted_at", "_data", "_pending_bytes", "_batches", "row_count", "byte_size")
+
+    def __init__(self) -> None:
+        self._emitted_at: List[int] = []
+        self._data: List[str] = []
+        self._pending_bytes = 0
+        self._batches: List[pa.RecordBatch] = []
+        self.row_count = 0
+        self.byte_size = 0
+
+    def append(self, data: str) -> int:
+        """Append one row and return the change it made to the size estimate."""
+        self._emitted_at.append(time.time_ns() // 1_000)
+        self._data.append(data)
+        size = len(data) + ROW_OVERHEAD_BYTES
+        self._pending_bytes += size
+        self.row_count += 1
+        if len(self._data) >= ARROW_CHUNK_ROWS:
+            size += self._seal_pending_rows()
+        self.byte_size += size
+        return size
+
+    def _seal_pending_rows(self) -> int:
+        """Convert pending rows into an Arrow batch and return the change in the size estimate."""
+        if not self._data:
+            return 0
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(self._emitted_at, type=RAW_BATCH_SCHEMA.field(0).type), pa.array(self._data, type=pa.string())],
+            schema=RAW_BATCH_SCHEMA,
+        )
+        self._batches.append(batch)
+        delta = batch.nbytes - self._pending_bytes
+        self._emitted_at = []
+        self._data = []
+        self._pending_bytes = 0
+        return delta
+
+    def to_arrow_table(self) -> pa.Table:
+        self._seal_pending_rows()
+        return pa.Table.from_batches(self._batches, schema=RAW_BATCH_SCHEMA)
+
+
+class RecordBuffer:
+    """
+    Per-stream record buffer with row and byte budgets.
+
+    Each stream is flushed through `flush_callback` as soon as it reaches `max_stream_rows` or
+    `max_stream_bytes`. On top of that, the combined size of all streams is capped at
+    `max_total_bytes`: when an append pushes the total over the cap, the largest streams are
+    flushed first until the buffer fits again. Flushing outside of a STATE message is safe
+    because state is only emitted after every record preceding it has been flushed.
+    """
+
+    def __init__(
+        self,
+        flush_callback: FlushCallback,
+        max_stream_rows: int = MAX_STREAM_BATCH_ROWS,
+        max_stream_bytes: int = MAX_STREAM_BATCH_BYTES,
+        max_total_bytes: int = MAX_TOTAL_BUFFER_BYTES,
+    ) -> None:
+        self._flush_callback = flush_callback
+        self._max_stream_rows = max_stream_rows
+        self._max_stream_bytes = max_stream_bytes
+        self._max_total_bytes = max_total_bytes
+        self._streams: Dict[str, StreamBuffer] = {}
+        self._total_bytes = 0
+        self._total_rows = 0
+        self.metrics = BufferMetrics()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    @property
+    def total_rows(self) -> int:
+        return self._total_rows
+
+    def append(self, stream_name: str, data: str) -> None:
+        stream_buffer = self._streams.get(stream_name)
+        if stream_buffer is None:
+            stream_buffer = self._streams[stream_name] = StreamBuffer()
+
+        self._total_bytes += stream_buffer.append(data)
+        self._total_rows += 1
+        if self._total_bytes > self.metrics.peak_buffer_bytes:
+            self.metrics.peak_buffer_bytes = self._total_bytes
+        if self._total_rows > self.metrics.peak_buffer_rows:
+            self.metrics.peak_buffer_rows = self._total_rows
+
+        if stream_buffer.row_count >= self._max_stream_rows:
+            self.flush(stream_name, reason=FLUSH_REASON_ROWS)
+        elif stream_buffer.byte_size >= self._max_stream_bytes:
+            self.flush(stream_name, reason=FLUSH_REASON_BYTES)
+
+        while self._total_bytes > self._max_total_bytes and self._streams:
+            largest = max(self._streams, key=lambda name: self._streams[name].byte_size)
+            self.flush(largest, reason=FLUSH_REASON_MEMORY)
+
+    def flush(self, stream_name: str, reason: str = FLUSH_REASON_STATE) -> None:
+        stream_buffer = self._streams.pop(stream_name, None)
+        if stream_buffer is None or stream_buffer.row_count == 0:
+            return
+
+        logger.info(
+            f"Flushing {stream_buffer.row_count:,} records ({stream_buffer.byte_size:,} bytes) from '{stream_name}' stream buffer, "
+            f"reason: {reason}"
+        )
+        self._total_bytes -= stream_buffer.byte_size
+        self._total_rows -= stream_buffer.row_count
+        self._flush_callback(stream_name, stream_buffer.to_arrow_table())
+        self.metrics.records_flushed += stream_buffer.row_count
+        self.metrics.flushes[reason] += 1
+
+    def flush_all(self, reason: str = FLUSH_REASON_STATE) -> None:
+        for stream_name in list(self._streams):
+            self.flush(stream_name, reason=reason)
@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+from typing import List, Tuple
+
+import pyarrow as pa
+from destination_duckdb import record_buffer
+from destination_duckdb.record_buffer import (
+    FLUSH_REASON_BYTES,
+    FLUSH_REASON_MEMORY,
+    FLUSH_REASON_ROWS,
+    ROW_OVERHEAD_BYTES,
+    RecordBuffer,
+    StreamBuffer,
+)
+
+
+def _make_buffer(**kwargs) -> Tuple[RecordBuffer, List[Tuple[str, pa.Table]]]:
+    flushed: List[Tuple[str, pa.Table]] = []
+    buffer = RecordBuffer(flush_callback=lambda stream_name, pa_table: flushed.append((stream_name, pa_table)), **kwargs)
+    return buffer, flushed
+
+
+def test_flushes_stream_on_row_limit():
+    buffer, flushed = _make_buffer(max_stream_rows=3)
+    for i in range(7):
+        buffer.append("users", f'{{"id": {i}}}')
+
+    assert [pa_table.num_rows for _, pa_table in flushed] == [3, 3]
+    assert flushed[1][1].column("_airbyte_data").to_pylist() == ['{"id": 3}', '{"id": 4}', '{"id": 5}']
+    assert buffer.total_rows == 1
+    assert buffer.metrics.flushes[FLUSH_REASON_ROWS] == 2
+
+
+def test_flushes_stream_on_byte_limit():
+    data = "x" * 100
+    buffer, flushed = _make_buffer(max_stream_bytes=2 * (len(data) + ROW_OVERHEAD_BYTES))
+    for _ in range(4):
+        buffer.append("users", data)
+
+    assert len(flushed) == 2
+    assert buffer.total_bytes == 0
+    assert buffer.metrics.flushes[FLUSH_REASON_BYTES] == 2
+
+
+def test_evicts_largest_stream_when_over_memory_cap():
+    row_size = 10 + ROW_OVERHEAD_BYTES
+    buffer, flushed = _make_buffer(max_total_bytes=5 * row_size)
+    for _ in range(3):
+        buffer.append("large", "x" * 10)
+    for _ in range(3):
+        buffer.append("small", "x" * 10)
+
+    assert [stream_name for stream_name, _ in flushed] == ["large"]
+    assert buffer.total_rows == 3
+    assert buffer.total_bytes == 3 * row_size
+    assert buffer.metrics.flushes[FLUSH_REASON_MEMORY] == 1
+    assert buffer.metrics.peak_buffer_bytes == 6 * row_size
+    assert buffer.metrics.peak_buffer_rows == 6
+
+
+def test_flush_all_empties_every_stream():
+    buffer, flushed = _make_buffer()
+    buffer.append("users", "{}")
+    buffer.append("orders", "{}")
+    buffer.flush_all()
+    buffer.flush_all()
+
+    assert sorted(stream_name for stream_name, _ in flushed) == ["orders", "users"]
+    assert buffer.total_rows == 0
+    assert buffer.total_bytes == 0
+    assert buffer.metrics.records_flushed == 2
+
+
+def test_stream_buffer_seals_rows_into_arrow_batches(monkeypatch):
+    monkeypatch.setattr(record_buffer, "ARROW_CHUNK_ROWS", 2)
+    stream_buffer = StreamBuffer()
+    for i in range(5):
+        stream_buffer.append(str(i))
+
+    pa_table = stream_buffer.to_arrow_table()
+    assert pa_table.num_rows == 5
+    assert pa_table.schema.field("_airbyte_emitted_at").type == pa.timestamp("us")
+    assert pa_table.column("_airbyte_data").to_pylist() == ["0", "1", "2", "3", "4"]
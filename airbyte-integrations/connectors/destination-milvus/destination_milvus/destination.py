@@ -10,11 +10,11 @@ from airbyte_cdk.destinations import Destination
 from airbyte_cdk.destinations.vector_db_based.document_processor import DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Embedder, create_from_config
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
-from airbyte_cdk.destinations.vector_db_based.writer import Writer
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from destination_milvus.config import ConfigModel
 from destination_milvus.indexer import MilvusIndexer
+from destination_milvus.pipelined_writer import PipelinedWriter
 
 
 BATCH_SIZE = 128
@@ -33,8 +33,15 @@ class DestinationMilvus(Destination):
     ) -> Iterable[AirbyteMessage]:
         config_model = ConfigModel.parse_obj(config)
         self._init_indexer(config_model)
-        writer = Writer(
-            config_model.processing, self.indexer, self.embedder, batch_size=BATCH_SIZE, omit_raw_text=config_model.omit_raw_text
+        writer = PipelinedWriter(
+            config_model.processing,
+            self.indexer,
+            self.embedder,
+            batch_size=BATCH_SIZE,
+            omit_raw_text=config_model.omit_raw_text,
+            # the primary keys are assigned on insert, so a retried insert would duplicate the entities;
+            # pymilvus already retries the inserts rejected by the rate limiter
+            retry_upserts=False,
         )
         yield from writer.write(configured_catalog, input_messages)
 
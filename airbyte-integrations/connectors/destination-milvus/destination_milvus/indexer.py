@@ -126,6 +126,13 @@ class MilvusIndexer(Indexer):
         return result
 
     def index(self, document_chunks, namespace, stream):
+        self.upsert_vectors(self.create_vectors(document_chunks, stream), namespace)
+
+    def create_vectors(self, document_chunks, stream):
+        """
+        Return the entities inserted for the chunks. Their primary keys are assigned by Milvus on insert,
+        so an insert can't be repeated without duplicating the entities it already committed.
+        """
         entities = []
         for i in range(len(document_chunks)):
             chunk = document_chunks[i]
@@ -137,6 +144,9 @@ class MilvusIndexer(Indexer):
             if chunk.page_content is not None:
                 entity[self.config.text_field] = chunk.page_content
             entities.append(entity)
+        return entities
+
+    def upsert_vectors(self, entities, namespace):
         self._collection.insert(entities)
 
     def delete(self, delete_ids, namespace, stream):
@@ -72,7 +72,7 @@ class TestDestinationMilvus(unittest.TestCase):
         mock_embedder.check.assert_called_once()
         mock_indexer.check.assert_called_once()
 
-    @patch("destination_milvus.destination.Writer")
+    @patch("destination_milvus.destination.PipelinedWriter")
     @patch("destination_milvus.destination.MilvusIndexer")
     @patch("destination_milvus.destination.create_from_config")
     def test_write(self, MockedEmbedder, MockedMilvusIndexer, MockedWriter):
@@ -92,7 +92,9 @@ class TestDestinationMilvus(unittest.TestCase):
         destination = DestinationMilvus()
         list(destination.write(self.config, configured_catalog, input_messages))
 
-        MockedWriter.assert_called_once_with(self.config_model.processing, mock_indexer, mock_embedder, batch_size=128, omit_raw_text=False)
+        MockedWriter.assert_called_once_with(
+            self.config_model.processing, mock_indexer, mock_embedder, batch_size=128, omit_raw_text=False, retry_upserts=False
+        )
         mock_writer.write.assert_called_once_with(configured_catalog, input_messages)
 
     def test_spec(self):
@@ -1,17 +1,14 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 from __future__ import annotations
 
-import datetime
 import io
-import json
 import logging
 import os
 import re
-import uuid
 from collections import defaultdict
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Any, Dict, Iterable, List, Mapping, cast
+from typing import Any, Dict, Iterable, Mapping, cast
 from urllib.parse import urlparse
 
 import orjson
@@ -32,12 +29,13 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.models.airbyte_protocol_serializers import custom_type_resolver
 from airbyte_cdk.sql._util.name_normalizers import LowerCaseNormalizer
-from airbyte_cdk.sql.constants import AB_EXTRACTED_AT_COLUMN, AB_INTERNAL_COLUMNS, AB_META_COLUMN, AB_RAW_ID_COLUMN
 from airbyte_cdk.sql.secrets import SecretString
 from airbyte_cdk.sql.shared.catalog_providers import CatalogProvider
 from airbyte_cdk.sql.types import SQLTypeConverter
+from destination_motherduck.flush_worker import FlushWorker
 from destination_motherduck.processors.duckdb import DuckDBConfig, DuckDBSqlProcessor
 from destination_motherduck.processors.motherduck import MotherDuckConfig, MotherDuckSqlProcessor
+from destination_motherduck.record_buffer import StreamBuffer
 
 
 logger = getLogger("airbyte")
@@ -178,107 +176,117 @@ class DestinationMotherDuck(Destination):
         for configured_stream in configured_catalog.streams:
             processor.prepare_stream_table(stream_name=configured_stream.stream.name, sync_mode=configured_stream.destination_sync_mode)
 
-        buffer: dict[str, dict[str, list[Any]]] = defaultdict(lambda: defaultdict(list))
+        buffer: dict[str, StreamBuffer] = {}
         records_buffered: dict[str, int] = defaultdict(int)
         records_processed: dict[str, int] = defaultdict(int)
         records_since_last_checkpoint: dict[str, int] = defaultdict(int)
         legacy_state_messages: list[AirbyteMessage] = []
-        for message in input_messages:
-            if message.type == Type.STATE and message.state is not None:
-                if message.state.stream is None:
-                    logger.warning("Cannot process legacy state message, skipping.")
-                    # Hold until the end of the stream, and then yield them all at once.
-                    legacy_state_messages.append(message)
-                    continue
-                stream_name = message.state.stream.stream_descriptor.name
-                _ = message.state.stream.stream_descriptor.namespace  # Unused currently
-                # flush the buffer
-                self._flush_buffer(
-                    buffer=buffer,
-                    configured_catalog=configured_catalog,
-                    db_path=path,
-                    schema_name=schema_name,
-                    motherduck_api_key=motherduck_api_key,
-                    stream_name=stream_name,
-                )
-                buffer = defaultdict(lambda: defaultdict(list))
-                records_buffered[stream_name] = 0
-
-                # Annotate the state message with the number of records processed
-                message.state.destinationStats = AirbyteStateStats(
-                    recordCount=records_since_last_checkpoint[stream_name],
-                )
-                records_since_last_checkpoint[stream_name] = 0
-
-                yield message
-            elif message.type == Type.RECORD and message.record is not None:
-                data = message.record.data
-                stream_name = message.record.stream
-                if stream_name not in streams:
-                    logger.debug(f"Stream {stream_name} was not present in configured streams, skipping")
-                    continue
-                # add to buffer
-                record_meta: dict[str, str] = {}
-                for column_name in processor._get_sql_column_definitions(stream_name):
-                    if column_name in data:
-                        buffer[stream_name][column_name].append(data[column_name])
-                    elif column_name not in AB_INTERNAL_COLUMNS:
-                        buffer[stream_name][column_name].append(None)
-
-                buffer[stream_name][AB_RAW_ID_COLUMN].append(str(uuid.uuid4()))
-                buffer[stream_name][AB_EXTRACTED_AT_COLUMN].append(datetime.datetime.now().isoformat())
-                buffer[stream_name][AB_META_COLUMN].append(json.dumps(record_meta))
-                records_buffered[stream_name] += 1
-                records_since_last_checkpoint[stream_name] += 1
-
-                if records_buffered[stream_name] >= MAX_STREAM_BATCH_SIZE:
-                    logger.info(
-                        f"Loading {records_buffered[stream_name]:,} records from '{stream_name}' stream buffer...",
-                    )
+        # Batches are loaded on a background thread through the processor above, so that the next
+        # batch can be built while the previous INSERT is executing.
+        flush_worker = FlushWorker(processor)
+        try:
+            for message in input_messages:
+                if message.type == Type.STATE and message.state is not None:
+                    if message.state.stream is None:
+                        logger.warning("Cannot process legacy state message, skipping.")
+                        # Hold until the end of the stream, and then yield them all at once.
+                        legacy_state_messages.append(message)
+                        continue
+                    stream_name = message.state.stream.stream_descriptor.name
+                    _ = message.state.stream.stream_descriptor.namespace  # Unused currently
+                    # flush the buffer and wait until every record preceding the state is persisted
                     self._flush_buffer(
                         buffer=buffer,
+                        flush_worker=flush_worker,
                         configured_catalog=configured_catalog,
-                        db_path=path,
-                        schema_name=schema_name,
-                        motherduck_api_key=motherduck_api_key,
                         stream_name=stream_name,
                     )
-                    buffer = defaultdict(lambda: defaultdict(list))
-                    records_processed[stream_name] += records_buffered[stream_name]
+                    flush_worker.wait()
                     records_buffered[stream_name] = 0
-                    logger.info(
-                        f"Records loaded successfully. Total '{stream_name}' records processed: {records_processed[stream_name]:,}",
+
+                    # Annotate the state message with the number of records processed
+                    message.state.destinationStats = AirbyteStateStats(
+                        recordCount=records_since_last_checkpoint[stream_name],
                     )
+                    records_since_last_checkpoint[stream_name] = 0
+
+                    yield message
+                elif message.type == Type.RECORD and message.record is not None:
+                    data = message.record.data
+                    stream_name = message.record.stream
+                    if stream_name not in streams:
+                        logger.debug(f"Stream {stream_name} was not present in configured streams, skipping")
+                        continue
+                    # add to buffer
+                    stream_buffer = buffer.get(stream_name)
+                    if stream_buffer is None:
+                        stream_buffer = buffer[stream_name] = self._create_stream_buffer(processor, stream_name)
+                    stream_buffer.append_record(data)
+                    records_buffered[stream_name] += 1
+                    records_since_last_checkpoint[stream_name] += 1
+
+                    if records_buffered[stream_name] >= MAX_STREAM_BATCH_SIZE:
+                        logger.info(
+                            f"Loading {records_buffered[stream_name]:,} records from '{stream_name}' stream buffer...",
+                        )
+                        self._flush_buffer(
+                            buffer=buffer,
+                            flush_worker=flush_worker,
+                            configured_catalog=configured_catalog,
+                            stream_name=stream_name,
+                        )
+                        records_processed[stream_name] += records_buffered[stream_name]
+                        records_buffered[stream_name] = 0
+                        logger.info(
+                            f"Records queued for loading. Total '{stream_name}' records processed: {records_processed[stream_name]:,}",
+                        )
 
-            else:
-                logger.info(f"Message type {message.type} not supported, skipping")
+                else:
+                    logger.info(f"Message type {message.type} not supported, skipping")
+
+            # flush any remaining messages
+            self._flush_buffer(buffer=buffer, flush_worker=flush_worker, configured_catalog=configured_catalog)
+            flush_worker.wait()
+        finally:
+            flush_worker.close()
+
+        for stream_name, stream_buffer in buffer.items():
+            if stream_buffer.projector.extra_fields:
+                dropped = ", ".join(f"'{key}' ({count:,})" for key, count in stream_buffer.projector.extra_fields.most_common(10))
+                logger.warning(f"Dropped record fields not declared in the '{stream_name}' stream schema: {dropped}")
 
-        # flush any remaining messages
-        self._flush_buffer(buffer, configured_catalog, path, schema_name, motherduck_api_key)
         if legacy_state_messages:
             # Save to emit these now, since we've finished processing the stream.
             yield from legacy_state_messages
 
+    @staticmethod
+    def _create_stream_buffer(processor: DuckDBSqlProcessor | MotherDuckSqlProcessor, stream_name: str) -> StreamBuffer:
+        """Create the buffer for a stream, with its column types and record projection compiled once."""
+        return StreamBuffer(
+            processor._get_sql_column_definitions(stream_name),
+            property_names=processor.catalog_provider.get_stream_properties(stream_name),
+            normalizer=processor.normalizer,
+        )
+
     def _flush_buffer(
         self,
-        buffer: Dict[str, Dict[str, List[Any]]],
+        buffer: Dict[str, StreamBuffer],
+        flush_worker: FlushWorker,
         configured_catalog: ConfiguredAirbyteCatalog,
-        db_path: str,
-        schema_name: str,
-        motherduck_api_key: str,
         stream_name: str | None = None,
     ) -> None:
         """
-        Flush the buffer to the destination.
+        Hand the buffered records over to the flush worker and empty the stream buffers.
 
         If no stream name is provided, then all streams will be flushed.
         """
         for configured_stream in configured_catalog.streams:
             if (stream_name is None or stream_name == configured_stream.stream.name) and buffer.get(configured_stream.stream.name):
-                processor = self._get_sql_processor(
-                    configured_catalog=configured_catalog, schema_name=schema_name, db_path=db_path, motherduck_token=motherduck_api_key
+                flush_worker.submit(
+                    configured_stream.stream.name,
+                    buffer[configured_stream.stream.name].pop_arrow_table(),
+                    configured_stream.destination_sync_mode,
                 )
-                processor.write_stream_data_from_buffer(buffer, configured_stream.stream.name, configured_stream.destination_sync_mode)
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
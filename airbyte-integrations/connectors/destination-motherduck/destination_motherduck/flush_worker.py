@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""Background thread that loads buffered record batches while the next batch is being built."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from logging import getLogger
+from typing import TYPE_CHECKING, Tuple
+
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from airbyte_cdk import DestinationSyncMode
+    from destination_motherduck.processors.duckdb import DuckDBSqlProcessor
+
+
+logger = getLogger("airbyte")
+
+MAX_PENDING_FLUSHES = 2
+"""Number of Arrow tables allowed to wait for the worker before `submit()` blocks the caller."""
+
+_FlushRequest = Tuple[str, "pa.Table", "DestinationSyncMode"]
+
+
+class FlushWorker:
+    """
+    Loads Arrow tables into DuckDB/MotherDuck on a single background thread.
+
+    Flushes are executed in submission order through one long-lived processor, so batches of
+    the same stream are never reordered. `submit()` blocks once `max_pending_flushes` tables are
+    queued, which bounds memory held by batches waiting to be loaded. Callers must call `wait()`
+    before emitting a state message so that every preceding record has been persisted. An error
+    raised by a flush is re-raised from the next `submit()` or `wait()` call.
+    """
+
+    def __init__(self, processor: DuckDBSqlProcessor, max_pending_flushes: int = MAX_PENDING_FLUSHES) -> None:
+        self._processor = processor
+        self._queue: queue.Queue[_FlushRequest | None] = queue.Queue(maxsize=max_pending_flushes)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="motherduck-flush-worker", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            request = self._queue.get()
+            try:
+                if request is None:
+                    return
+                if self._error is None:
+                    stream_name, pa_table, sync_mode = request
+                    self._processor.write_stream_data_from_arrow(pa_table, stream_name, sync_mode)
+                    logger.info(f"Loaded {pa_table.num_rows:,} records into '{stream_name}'.")
+            except BaseException as ex:  # noqa: BLE001  # Re-raised on the writer thread.
+                self._error = ex
+            finally:
+                self._queue.task_done()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def submit(self, stream_name: str, pa_table: pa.Table, sync_mode: DestinationSyncMode) -> None:
+        """Queue a table for loading, blocking while the queue is full."""
+        self._raise_if_failed()
+        self._queue.put((stream_name, pa_table, sync_mode))
+
+    def wait(self) -> None:
+        """Block until every submitted table has been loaded."""
+        self._queue.join()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """
+        Stop the worker thread once pending loads have finished.
+
+        Errors are not raised here, so that `close()` is safe to call while another exception is
+        propagating. Call `wait()` first to surface them.
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
@@ -12,13 +12,13 @@ from urllib.parse import parse_qsl, urlparse
 import pyarrow as pa
 from duckdb_engine import DuckDBEngineWarning
 from overrides import overrides
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from sqlalchemy import Executable, TextClause, create_engine, text
 from sqlalchemy.exc import ProgrammingError, SQLAlchemyError
 
 from airbyte_cdk import DestinationSyncMode
 from airbyte_cdk.sql import exceptions as exc
-from airbyte_cdk.sql.constants import AB_EXTRACTED_AT_COLUMN, DEBUG_MODE
+from airbyte_cdk.sql.constants import AB_EXTRACTED_AT_COLUMN, AB_META_COLUMN, AB_RAW_ID_COLUMN, DEBUG_MODE
 from airbyte_cdk.sql.secrets import SecretString
 from airbyte_cdk.sql.shared.sql_processor import SqlConfig, SqlProcessorBase, SQLRuntimeError
 
@@ -92,14 +92,29 @@ class DuckDBConfig(SqlConfig):
             and "motherduck:" not in db_path_str
         )
 
+    _sql_engine: Any = PrivateAttr(default=None)
+    """The engine shared by every connection of a processor, created on first use."""
+
     @overrides
     def get_sql_engine(self) -> Engine:
         """
-        Return a new SQL engine to use.
+        Return the SQL engine to use, creating it on first use.
+
+        The base processor asks for an engine for every statement. Reusing a single engine lets
+        its connection pool keep the DuckDB/MotherDuck connection open for the whole write session
+        instead of reconnecting and re-authenticating each time.
+        """
+        if self._sql_engine is None:
+            self._sql_engine = self._create_sql_engine()
+        return self._sql_engine
 
-        This method is overridden to:
-            - ensure that the database parent directory is created if it doesn't exist.
-            - pass the DuckDB query parameters (such as motherduck_token) via the config
+    def _create_sql_engine(self) -> Engine:
+        """
+        Return a new SQL engine.
+
+        This method:
+            - ensures that the database parent directory is created if it doesn't exist.
+            - passes the DuckDB query parameters (such as motherduck_token) via the config
         """
         if self._is_file_based_db():
             Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -241,15 +256,30 @@ class DuckDBSqlProcessor(SqlProcessorBase):
         parameters = [[entries_to_write[column_name][n] for column_name in column_names_list] for n in range(num_entries)]
         self._executemany(sql, parameters)
 
-    def _write_from_pa_table(self, table_name: str, stream_name: str, pa_table: pa.Table) -> None:
+    def _write_from_pa_table(
+        self,
+        table_name: str,
+        stream_name: str,
+        pa_table: pa.Table,
+        generated_columns: Dict[str, str] | None = None,
+    ) -> None:
+        """
+        Insert the given Arrow table into `table_name`.
+
+        `generated_columns` maps additional column names to SQL expressions which DuckDB
+        evaluates for every inserted row, e.g. to mint ids without materializing them in Python.
+        """
+        generated_columns = generated_columns or {}
         full_table_name = self._fully_qualified(table_name)
         columns = list(self._get_sql_column_definitions(stream_name).keys())
-        if len(columns) != len(pa_table.column_names):
+        if len(columns) != len(pa_table.column_names) + len(generated_columns):
             warnings.warn(f"Schema has colums: {columns}, buffer has columns: {pa_table.column_names}")
-        column_names = ", ".join(map(self._quote_identifier, pa_table.column_names))
+        target_columns = [*pa_table.column_names, *generated_columns.keys()]
+        column_names = ", ".join(map(self._quote_identifier, target_columns))
+        select_list = ", ".join([*map(self._quote_identifier, pa_table.column_names), *generated_columns.values()])
         sql = f"""
         -- Write from PyArrow table
-        INSERT INTO {full_table_name} ({column_names}) SELECT {column_names} FROM {BUFFER_TABLE_NAME}
+        INSERT INTO {full_table_name} ({column_names}) SELECT {select_list} FROM {BUFFER_TABLE_NAME}
         """
         self._execute_sql_with_buffer(sql, buffer_data=pa_table)
 
@@ -369,6 +399,34 @@ class DuckDBSqlProcessor(SqlProcessorBase):
             # local variable defined above.
             self._write_from_pa_table(temp_table_name, stream_name, pa_table)
 
+        self._write_loaded_temp_table(stream_name, temp_table_name, sync_mode)
+
+    def write_stream_data_from_arrow(
+        self,
+        pa_table: pa.Table,
+        stream_name: str,
+        sync_mode: DestinationSyncMode,
+    ) -> None:
+        """
+        Write a columnar Arrow buffer (see `StreamBuffer.pop_arrow_table`) to the stream's table.
+
+        The table is inserted with a single `INSERT ... SELECT` over the registered Arrow data.
+        The raw id and meta columns are generated by DuckDB during the insert.
+        """
+        temp_table_name = self._create_table_for_loading(stream_name, batch_id=None)
+        self._write_from_pa_table(
+            temp_table_name,
+            stream_name,
+            pa_table,
+            generated_columns={
+                AB_RAW_ID_COLUMN: "uuid()::VARCHAR",
+                AB_META_COLUMN: "'{}'",
+            },
+        )
+        self._write_loaded_temp_table(stream_name, temp_table_name, sync_mode)
+
+    def _write_loaded_temp_table(self, stream_name: str, temp_table_name: str, sync_mode: DestinationSyncMode) -> None:
+        """Deduplicate the loaded temp table and move it into the final table, then drop it."""
         temp_table_name_dedup = self._drop_duplicates(temp_table_name, stream_name)
 
         try:
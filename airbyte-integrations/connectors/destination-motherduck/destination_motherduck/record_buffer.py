@@ -0,0 +1,204 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""Columnar Arrow record buffer for the DuckDB and MotherDuck SQL processors."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Mapping
+
+import pyarrow as pa
+import sqlalchemy
+
+from airbyte_cdk.sql._util.name_normalizers import LowerCaseNormalizer, NameNormalizerBase
+from airbyte_cdk.sql.constants import AB_EXTRACTED_AT_COLUMN, AB_INTERNAL_COLUMNS
+from airbyte_cdk.sql.exceptions import AirbyteNameNormalizationError
+
+
+ARROW_CHUNK_ROWS = 8_192
+"""Number of rows kept as Python objects before they are converted into an Arrow record batch."""
+
+MAX_MEMOIZED_KEYS = 10_000
+"""Upper bound on record keys a projector remembers, for streams whose records carry arbitrary keys."""
+
+EXTRACTED_AT_TYPE = pa.timestamp("us")
+
+
+def _json_dumps_or_none(value: Any) -> str | None:
+    return None if value is None else json.dumps(value, separators=(",", ":"))
+
+
+def _str_or_json(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _number_str_or_none(value: Any) -> str | None:
+    # `str` keeps every digit of ints, floats and decimals, which DuckDB parses exactly into the DECIMAL column
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return str(value)
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _arrow_column_type(sql_type: sqlalchemy.types.TypeEngine[Any]) -> tuple[pa.DataType, Callable[[Any], Any] | None]:
+    """
+    Return the Arrow type for a SQL column, and an optional per-value encoder.
+
+    Date and time columns are kept as strings; DuckDB casts them to the target column type
+    while inserting from the Arrow table. So are the decimal columns, as float64 would round
+    the values which have more significant digits than a double holds.
+    """
+    if isinstance(sql_type, sqlalchemy.types.JSON):
+        return pa.string(), _json_dumps_or_none
+    if isinstance(sql_type, sqlalchemy.types.Boolean):
+        return pa.bool_(), None
+    if isinstance(sql_type, sqlalchemy.types.Integer):
+        return pa.int64(), None
+    if isinstance(sql_type, sqlalchemy.types.Float):
+        return pa.float64(), None
+    if isinstance(sql_type, sqlalchemy.types.Numeric):
+        return pa.string(), _number_str_or_none
+    if isinstance(sql_type, sqlalchemy.types.ARRAY):
+        return pa.list_(pa.float64()), None
+    return pa.string(), None
+
+
+class RecordProjector:
+    """
+    Maps record dicts onto the column slots of a stream, compiled once per stream.
+
+    Both the stream's declared property names and their normalized column names resolve to a
+    slot directly. Any other record key is normalized once and the outcome is memoized, so a key
+    which differs from its column name only by case or punctuation still lands in the right slot.
+    Keys which match no column are counted as extra fields and dropped; columns missing from a
+    record are left null.
+    """
+
+    def __init__(
+        self,
+        column_names: list[str],
+        property_names: Iterable[str],
+        normalizer: type[NameNormalizerBase],
+    ) -> None:
+        self._width = len(column_names)
+        self._normalizer = normalizer
+        self._column_slots = {name: slot for slot, name in enumerate(column_names)}
+        self._key_slots: dict[str, int] = dict(self._column_slots)
+        for property_name in property_names:
+            self._key_slots[property_name] = self._resolve_slot(property_name)
+        self.extra_fields: Counter[str] = Counter()
+
+    def _resolve_slot(self, key: str) -> int:
+        try:
+            return self._column_slots.get(self._normalizer.normalize(key), -1)
+        except AirbyteNameNormalizationError:
+            return -1
+
+    def project(self, record: Mapping[str, Any]) -> list[Any]:
+        """Return the record's values in column slot order."""
+        row: list[Any] = [None] * self._width
+        key_slots = self._key_slots
+        for key, value in record.items():
+            slot = key_slots.get(key)
+            if slot is None:
+                slot = self._resolve_slot(key)
+                if len(key_slots) < MAX_MEMOIZED_KEYS:
+                    key_slots[key] = slot
+            if slot >= 0:
+                row[slot] = value
+            else:
+                self.extra_fields[key] += 1
+        return row
+
+
+class StreamBuffer:
+    """
+    Append-only columnar buffer for one stream, backed by Arrow record batches.
+
+    Column types are derived once from the stream's SQL column definitions, and records are
+    projected onto column slots by a `RecordProjector`. Rows are collected as Python lists for at
+    most `ARROW_CHUNK_ROWS` rows, then transposed and converted into a typed Arrow record batch,
+    so the bulk of the buffer is held in compact Arrow memory. The internal `_airbyte_raw_id` and
+    `_airbyte_meta` columns are not buffered at all: they are generated by DuckDB when the batch
+    is inserted (see `DuckDBSqlProcessor.write_stream_data_from_arrow`).
+    """
+
+    def __init__(
+        self,
+        column_definitions: Mapping[str, sqlalchemy.types.TypeEngine[Any]],
+        property_names: Iterable[str] = (),
+        normalizer: type[NameNormalizerBase] = LowerCaseNormalizer,
+    ) -> None:
+        self.column_names = [name for name in column_definitions if name not in AB_INTERNAL_COLUMNS]
+        column_types = [_arrow_column_type(column_definitions[name]) for name in self.column_names]
+        self._arrow_types = [arrow_type for arrow_type, _ in column_types]
+        self._encoders = [encoder for _, encoder in column_types]
+        self.projector = RecordProjector(self.column_names, property_names, normalizer)
+        self._pending_rows: list[list[Any]] = []
+        self._pending_extracted_at: list[int] = []
+        self._batches: list[pa.RecordBatch] = []
+        self.row_count = 0
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def append_record(self, record: Mapping[str, Any]) -> None:
+        """Append one record. Missing columns are null, and fields without a column are dropped."""
+        self._pending_rows.append(self.projector.project(record))
+        self._pending_extracted_at.append(time.time_ns() // 1_000)
+        self.row_count += 1
+        if len(self._pending_rows) >= ARROW_CHUNK_ROWS:
+            self._seal_pending_rows()
+
+    def _seal_pending_rows(self) -> None:
+        if not self._pending_rows:
+            return
+
+        columns = zip(*self._pending_rows)
+        arrays = [
+            self._to_arrow_array(list(values), arrow_type, encoder)
+            for values, arrow_type, encoder in zip(columns, self._arrow_types, self._encoders)
+        ]
+        arrays.append(pa.array(self._pending_extracted_at, type=EXTRACTED_AT_TYPE))
+        self._batches.append(pa.RecordBatch.from_arrays(arrays, names=[*self.column_names, AB_EXTRACTED_AT_COLUMN]))
+        self._pending_rows = []
+        self._pending_extracted_at = []
+
+    @staticmethod
+    def _to_arrow_array(values: list[Any], arrow_type: pa.DataType, encoder: Callable[[Any], Any] | None) -> pa.Array:
+        if encoder is not None:
+            return pa.array([encoder(value) for value in values], type=arrow_type)
+        try:
+            return pa.array(values, type=arrow_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # The values don't match the declared schema. Hand them to DuckDB as strings and let it
+            # cast them to the column type, or fail with a descriptive error.
+            return pa.array([_str_or_json(value) for value in values], type=pa.string())
+
+    def pop_arrow_table(self) -> pa.Table:
+        """Return the buffered rows as a single Arrow table and empty the buffer."""
+        self._seal_pending_rows()
+        batches, self._batches = self._batches, []
+        self.row_count = 0
+        column_types = [{batch.column(i).type for batch in batches} for i in range(len(self.column_names) + 1)]
+        if all(len(types) == 1 for types in column_types):
+            return pa.Table.from_batches(batches)
+
+        # Some batches fell back to strings for a column: align every batch on the string type.
+        target_types = [types.pop() if len(types) == 1 else pa.string() for types in column_types]
+        batches = [
+            pa.RecordBatch.from_arrays(
+                [
+                    array if array.type == target_type else array.cast(target_type)
+                    for array, target_type in zip(batch.columns, target_types)
+                ],
+                names=batch.schema.names,
+            )
+            for batch in batches
+        ]
+        return pa.Table.from_batches(batches)
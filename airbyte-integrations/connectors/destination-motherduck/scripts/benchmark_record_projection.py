@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+"""Compare the per-record projection of the write loop against the precompiled `StreamBuffer` path.
+
+The records of a wide stream (each one missing a few declared columns and carrying a field the schema doesn't declare)
+are projected with the loop previously done inline in `DestinationMotherDuck.write` and with the `StreamBuffer`.
+Both give the same columns, the timings are printed.
+
+Usage:
+    poetry run python scripts/benchmark_record_projection.py [--columns 200] [--records 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+CONNECTOR_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CONNECTOR_DIR))
+
+from destination_motherduck.destination import DestinationMotherDuck  # noqa: E402
+
+from airbyte_cdk.models import (  # noqa: E402
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+)
+from airbyte_cdk.sql.constants import AB_INTERNAL_COLUMNS  # noqa: E402
+
+
+STREAM_NAME = "wide_stream"
+
+
+def _legacy_projection(processor: Any, stream_name: str, data: dict[str, Any], buffer: dict[str, list[Any]]) -> None:
+    """The projection previously done inline in `DestinationMotherDuck.write` for every record."""
+    for column_name in processor._get_sql_column_definitions(stream_name):
+        if column_name in data:
+            buffer[column_name].append(data[column_name])
+        elif column_name not in AB_INTERNAL_COLUMNS:
+            buffer[column_name].append(None)
+
+
+def main(num_columns: int, num_records: int) -> None:
+    properties = {f"column_{i}": {"type": ["null", "string"]} for i in range(num_columns)}
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name=STREAM_NAME,
+                    json_schema={"type": "object", "properties": properties},
+                    supported_sync_modes=[SyncMode.full_refresh],
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    destination = DestinationMotherDuck()
+    processor = destination._get_sql_processor(configured_catalog=catalog, schema_name="main")
+    records = [{f"column_{i}": f"value_{n}" for i in range(num_columns) if (i + n) % 10} | {"extra": n} for n in range(num_records)]
+
+    legacy_buffer: dict[str, list[Any]] = {name: [] for name in processor._get_sql_column_definitions(STREAM_NAME)}
+    start = time.perf_counter()
+    for record in records:
+        _legacy_projection(processor, STREAM_NAME, record, legacy_buffer)
+    legacy_seconds = time.perf_counter() - start
+
+    stream_buffer = destination._create_stream_buffer(processor, STREAM_NAME)
+    start = time.perf_counter()
+    for record in records:
+        stream_buffer.append_record(record)
+    pa_table = stream_buffer.pop_arrow_table()
+    projected_seconds = time.perf_counter() - start
+
+    for column_name in stream_buffer.column_names:
+        if pa_table.column(column_name).to_pylist() != legacy_buffer[column_name]:
+            sys.exit(f"The projected column `{column_name}` differs from the legacy loop")
+    print(
+        f"Projected {num_records:,} records x {num_columns} columns: "
+        f"legacy loop {legacy_seconds:.3f}s, precompiled projector {projected_seconds:.3f}s "
+        f"({legacy_seconds / projected_seconds:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--records", type=int, default=2_000)
+    args = parser.parse_args()
+    main(args.columns, args.records)
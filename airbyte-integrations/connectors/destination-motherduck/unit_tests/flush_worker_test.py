@@ -0,0 +1,40 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pyarrow as pa
+import pytest
+from destination_motherduck.flush_worker import FlushWorker
+
+from airbyte_cdk.models import DestinationSyncMode
+
+
+def test_flush_worker_loads_tables_in_submission_order() -> None:
+    loaded: list[tuple[str, int]] = []
+    processor = Mock()
+    processor.write_stream_data_from_arrow.side_effect = lambda pa_table, stream_name, sync_mode: loaded.append(
+        (stream_name, pa_table.num_rows)
+    )
+    worker = FlushWorker(processor, max_pending_flushes=1)
+    for num_rows in range(1, 5):
+        worker.submit("users", pa.table({"id": list(range(num_rows))}), DestinationSyncMode.append)
+    worker.wait()
+    worker.close()
+
+    assert loaded == [("users", 1), ("users", 2), ("users", 3), ("users", 4)]
+
+
+def test_flush_worker_reraises_errors_and_skips_remaining_loads() -> None:
+    processor = Mock()
+    processor.write_stream_data_from_arrow.side_effect = RuntimeError("insert failed")
+    worker = FlushWorker(processor)
+    worker.submit("users", pa.table({"id": [1]}), DestinationSyncMode.append)
+
+    with pytest.raises(RuntimeError, match="insert failed"):
+        worker.wait()
+    with pytest.raises(RuntimeError, match="insert failed"):
+        worker.submit("users", pa.table({"id": [2]}), DestinationSyncMode.append)
+    worker.close()
+
+    assert processor.write_stream_data_from_arrow.call_count == 1
@@ -0,0 +1,73 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pyarrow as pa
+import sqlalchemy
+from destination_motherduck import record_buffer
+from destination_motherduck.record_buffer import RecordProjector, StreamBuffer
+
+from airbyte_cdk.sql._util.name_normalizers import LowerCaseNormalizer
+from airbyte_cdk.sql.constants import AB_EXTRACTED_AT_COLUMN, AB_META_COLUMN, AB_RAW_ID_COLUMN
+
+
+COLUMN_DEFINITIONS = {
+    "name": sqlalchemy.types.VARCHAR(),
+    "count": sqlalchemy.types.BIGINT(),
+    "price": sqlalchemy.types.DECIMAL(38, 9),
+    "active": sqlalchemy.types.BOOLEAN(),
+    "details": sqlalchemy.types.JSON(),
+    AB_RAW_ID_COLUMN: sqlalchemy.types.VARCHAR(),
+    AB_EXTRACTED_AT_COLUMN: sqlalchemy.TIMESTAMP(),
+    AB_META_COLUMN: sqlalchemy.types.JSON(),
+}
+
+
+def test_stream_buffer_builds_typed_arrow_table() -> None:
+    stream_buffer = StreamBuffer(COLUMN_DEFINITIONS)
+    stream_buffer.append_record({"name": "a", "count": 1, "price": 1.5, "active": True, "details": {"k": [1, 2]}})
+    stream_buffer.append_record({"name": "b", "unknown": "ignored"})
+
+    pa_table = stream_buffer.pop_arrow_table()
+    assert pa_table.column_names == ["name", "count", "price", "active", "details", AB_EXTRACTED_AT_COLUMN]
+    assert pa_table.schema.field("count").type == pa.int64()
+    assert pa_table.schema.field("price").type == pa.string()
+    assert pa_table.schema.field("active").type == pa.bool_()
+    assert pa_table.schema.field(AB_EXTRACTED_AT_COLUMN).type == pa.timestamp("us")
+    assert pa_table.column("details").to_pylist() == ['{"k":[1,2]}', None]
+    assert pa_table.column("count").to_pylist() == [1, None]
+    assert pa_table.column("price").to_pylist() == ["1.5", None]
+
+
+def test_stream_buffer_keeps_decimal_digits() -> None:
+    stream_buffer = StreamBuffer(COLUMN_DEFINITIONS)
+    for price in [12345678901234567891, Decimal("1234567890123456789.123456789"), 0.1, "2.50"]:
+        stream_buffer.append_record({"price": price})
+
+    pa_table = stream_buffer.pop_arrow_table()
+    assert pa_table.column("price").to_pylist() == ["12345678901234567891", "1234567890123456789.123456789", "0.1", "2.50"]
+
+
+def test_stream_buffer_falls_back_to_strings_for_mismatched_batches(monkeypatch) -> None:
+    monkeypatch.setattr(record_buffer, "ARROW_CHUNK_ROWS", 2)
+    stream_buffer = StreamBuffer(COLUMN_DEFINITIONS)
+    for count in [1, 2, "three", 4]:
+        stream_buffer.append_record({"count": count})
+    assert len(stream_buffer) == 4
+
+    pa_table = stream_buffer.pop_arrow_table()
+    assert len(stream_buffer) == 0
+    assert pa_table.schema.field("count").type == pa.string()
+    assert pa_table.column("count").to_pylist() == ["1", "2", "three", "4"]
+
+
+def test_record_projector_maps_keys_onto_column_slots() -> None:
+    projector = RecordProjector(
+        ["id", "user_name", "createdat"], property_names=["id", "User Name", "createdAt"], normalizer=LowerCaseNormalizer
+    )
+
+    assert projector.project({"id": 1, "User Name": "a", "createdAt": "2024-01-01"}) == [1, "a", "2024-01-01"]
+    assert projector.project({"user_name": "b"}) == [None, "b", None]
+    assert projector.project({"ID": 2, "unknown": True, "___": 0}) == [2, None, None]
+    assert projector.extra_fields == {"unknown": 1, "___": 1}
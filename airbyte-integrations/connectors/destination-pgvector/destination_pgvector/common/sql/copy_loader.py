@@ -0,0 +1,229 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""Stream JSONL batch files into Postgres tables with `COPY ... FROM STDIN`."""
+
+from __future__ import annotations
+
+import enum
+import gzip
+import io
+import json
+import struct
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional
+
+import orjson
+import sqlalchemy
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects.postgresql import JSONB
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from sqlalchemy.types import TypeEngine
+
+
+COPY_CHUNK_SIZE = 1024 * 1024
+"""Number of encoded bytes collected before they are handed to the COPY stream."""
+
+BINARY_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+BINARY_COPY_TRAILER = struct.pack(">h", -1)
+BINARY_NULL = struct.pack(">i", -1)
+TEXT_NULL = "\\N"
+
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+Encoder = Callable[[Any], Any]
+
+
+class CopyFormat(str, enum.Enum):
+    """The `COPY` wire format."""
+
+    TEXT = "text"
+    BINARY = "binary"
+
+
+def _escape_text(value: str) -> str:
+    return value.translate(_TEXT_ESCAPES)
+
+
+def _encode_text_vector(value: Any) -> str:
+    return "[" + ",".join(map(repr, map(float, value))) + "]"
+
+
+def _encode_text_json(value: Any) -> str:
+    return _escape_text(json.dumps(value))
+
+
+def _encode_text_bool(value: Any) -> str:
+    return "t" if value else "f"
+
+
+def _encode_text_default(value: Any) -> str:
+    if isinstance(value, (dict, list)):
+        return _encode_text_json(value)
+    return _escape_text(str(value))
+
+
+def _encode_binary_vector(value: Any) -> bytes:
+    # pgvector's `vector_recv`: int16 dimensions, int16 unused, then float4 values.
+    return struct.pack(f">HH{len(value)}f", len(value), 0, *value)
+
+
+def _encode_binary_json(value: Any) -> bytes:
+    return json.dumps(value).encode()
+
+
+def _encode_binary_text(value: Any) -> bytes:
+    if isinstance(value, (dict, list)):
+        return _encode_binary_json(value)
+    return str(value).encode()
+
+
+def _get_text_encoder(column_type: TypeEngine) -> Encoder:
+    if isinstance(column_type, Vector):
+        return _encode_text_vector
+    if isinstance(column_type, sqlalchemy.types.JSON):
+        return _encode_text_json
+    if isinstance(column_type, sqlalchemy.types.Boolean):
+        return _encode_text_bool
+    return _encode_text_default
+
+
+def _get_binary_encoder(column_type: TypeEngine) -> Optional[Encoder]:
+    """Return the binary encoder for a column type, or None if the type has no binary encoder."""
+    if isinstance(column_type, Vector):
+        return _encode_binary_vector
+    if isinstance(column_type, sqlalchemy.types.JSON) and not isinstance(column_type, JSONB):
+        return _encode_binary_json
+    if isinstance(column_type, sqlalchemy.types.String):
+        return _encode_binary_text
+    return None
+
+
+def supports_binary_copy(column_definitions: dict[str, TypeEngine]) -> bool:
+    """Return True if every column can be encoded in the binary `COPY` format."""
+    return all(
+        _get_binary_encoder(column_type) is not None for column_type in column_definitions.values()
+    )
+
+
+def iter_jsonl_records(files: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    """Yield the records of the given (optionally gzipped) JSONL files, one at a time."""
+    for file_path in files:
+        opener = gzip.open if file_path.suffix == ".gz" else open
+        with opener(file_path, "rb") as file:
+            for line in file:
+                if line.strip():
+                    yield orjson.loads(line)
+
+
+def iter_copy_chunks(
+    records: Iterable[dict[str, Any]],
+    column_definitions: dict[str, TypeEngine],
+    copy_format: CopyFormat,
+    normalize: Callable[[str], str],
+) -> Iterator[bytes]:
+    """Encode records into `COPY` payload chunks of roughly `COPY_CHUNK_SIZE` bytes.
+
+    Record keys are normalized to match the column names. Keys which match no column are
+    ignored, and columns missing from a record are written as NULL.
+    """
+    column_slots = {column_name: slot for slot, column_name in enumerate(column_definitions)}
+    key_slots: dict[str, int] = {}
+    num_columns = len(column_definitions)
+    if copy_format == CopyFormat.BINARY:
+        binary_encoders = [
+            _get_binary_encoder(column_type) for column_type in column_definitions.values()
+        ]
+        field_count = struct.pack(">h", num_columns)
+        pack_length = struct.Struct(">i").pack
+    else:
+        text_encoders = [
+            _get_text_encoder(column_type) for column_type in column_definitions.values()
+        ]
+
+    chunk = bytearray(BINARY_COPY_HEADER if copy_format == CopyFormat.BINARY else b"")
+    for record in records:
+        values: list[Any] = [None] * num_columns
+        for key, value in record.items():
+            slot = key_slots.get(key)
+            if slot is None:
+                slot = key_slots[key] = column_slots.get(normalize(key), -1)
+            if slot >= 0:
+                values[slot] = value
+
+        if copy_format == CopyFormat.BINARY:
+            chunk += field_count
+            for value, encoder in zip(values, binary_encoders):
+                if value is None:
+                    chunk += BINARY_NULL
+                else:
+                    encoded = encoder(value)  # type: ignore [misc]  # Checked by `supports_binary_copy()`
+                    chunk += pack_length(len(encoded))
+                    chunk += encoded
+        else:
+            chunk += (
+                "\t".join(
+                    TEXT_NULL if value is None else encoder(value)
+                    for value, encoder in zip(values, text_encoders)
+                )
+                + "\n"
+            ).encode()
+
+        if len(chunk) >= COPY_CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+
+    if copy_format == CopyFormat.BINARY:
+        chunk += BINARY_COPY_TRAILER
+    if chunk:
+        yield bytes(chunk)
+
+
+class ChunkedReader(io.RawIOBase):
+    """A read-only file object over an iterator of byte chunks, as consumed by `copy_expert()`."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+
+        while len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def copy_records_to_table(
+    dbapi_connection: Any,
+    table_name: str,
+    column_definitions: dict[str, TypeEngine],
+    records: Iterable[dict[str, Any]],
+    copy_format: CopyFormat,
+    normalize: Callable[[str], str],
+    quote: Callable[[str], str],
+) -> None:
+    """Stream records into `table_name` over `COPY ... FROM STDIN` on a psycopg2 connection."""
+    column_list = ", ".join(quote(column_name) for column_name in column_definitions)
+    sql = f"COPY {table_name} ({column_list}) FROM STDIN WITH (FORMAT {copy_format.value})"
+    payload: IO[bytes] = ChunkedReader(
+        iter_copy_chunks(records, column_definitions, copy_format, normalize)
+    )  # type: ignore [assignment]
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(sql, payload, size=COPY_CHUNK_SIZE)
@@ -6,10 +6,12 @@ from __future__ import annotations
 import abc
 import contextlib
 import enum
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, cast, final
+from typing import TYPE_CHECKING, Any, Optional, cast, final
 
 import pandas as pd
 import sqlalchemy
@@ -22,11 +24,17 @@ from airbyte.strategies import WriteStrategy
 from airbyte.types import SQLTypeConverter
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from pandas import Index
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from sqlalchemy import Column, Table, and_, create_engine, insert, null, select, text, update
 from sqlalchemy.sql.elements import TextClause
 
 from destination_pgvector.common.destinations.record_processor import RecordProcessorBase
+from destination_pgvector.common.sql.copy_loader import (
+    CopyFormat,
+    copy_records_to_table,
+    iter_jsonl_records,
+    supports_binary_copy,
+)
 from destination_pgvector.common.state.state_writers import StdOutStateWriter
 
 if TYPE_CHECKING:
@@ -64,6 +72,8 @@ class SqlConfig(BaseModel, abc.ABC):
     table_prefix: Optional[str] = ""
     """A prefix to add to created table names."""
 
+    _sql_engine: Any = PrivateAttr(default=None)
+
     @abc.abstractmethod
     def get_sql_alchemy_url(self) -> SecretString:
         """Returns a SQL Alchemy URL."""
@@ -87,14 +97,20 @@ class SqlConfig(BaseModel, abc.ABC):
             ) from ex
 
     def get_sql_engine(self) -> Engine:
-        """Return a new SQL engine to use."""
-        return create_engine(
-            url=self.get_sql_alchemy_url(),
-            echo=DEBUG_MODE,
-            execution_options={
-                "schema_translate_map": {None: self.schema_name},
-            },
-        )
+        """Return the SQL engine to use, creating it on first use.
+
+        The engine is shared by every caller, so its connection pool is reused instead of
+        opening a new connection for each statement.
+        """
+        if self._sql_engine is None:
+            self._sql_engine = create_engine(
+                url=self.get_sql_alchemy_url(),
+                echo=DEBUG_MODE,
+                execution_options={
+                    "schema_translate_map": {None: self.schema_name},
+                },
+            )
+        return self._sql_engine
 
     def get_vendor_client(self) -> object:
         """Return the vendor-specific client object.
@@ -108,6 +124,10 @@ class SqlConfig(BaseModel, abc.ABC):
         )
 
 
+LOAD_SEQUENCE_COLUMN = "_airbyte_load_seq"
+"""The column numbering the rows of the loading tables, see `SqlProcessorBase.numbers_loaded_rows`."""
+
+
 class SqlProcessorBase(RecordProcessorBase):
     """A base class to be used for SQL Caches."""
 
@@ -123,6 +143,18 @@ class SqlProcessorBase(RecordProcessorBase):
     supports_merge_insert = False
     """True if the database supports the MERGE INTO syntax."""
 
+    supports_copy_from_stdin = False
+    """True if batch files can be streamed into Postgres with `COPY ... FROM STDIN`."""
+
+    copy_format: CopyFormat = CopyFormat.BINARY
+    """The preferred `COPY` format. Falls back to text when a column has no binary encoder."""
+
+    numbers_loaded_rows = False
+    """True if the loading tables number their rows in load order, in `LOAD_SEQUENCE_COLUMN`.
+
+    The column is an identity column (Postgres syntax), so the loaders don't write it.
+    """
+
     # Constructor:
 
     def __init__(
@@ -134,7 +166,13 @@ class SqlProcessorBase(RecordProcessorBase):
         file_writer: FileWriterBase | None = None,
         temp_dir: Path | None = None,
         temp_file_cleanup: bool,
+        max_finalize_workers: int = 1,
     ) -> None:
+        """Initialize the processor.
+
+        `max_finalize_workers` is the number of streams which may be finalized concurrently at the
+        end of a sync, each over its own pooled connection.
+        """
         if not temp_dir and not file_writer:
             raise exc.PyAirbyteInternalError(
                 message="Either `temp_dir` or `file_writer` must be provided.",
@@ -143,6 +181,9 @@ class SqlProcessorBase(RecordProcessorBase):
         state_writer = state_writer or StdOutStateWriter()
 
         self._sql_config: SqlConfig = sql_config
+        self._max_finalize_workers = max(1, max_finalize_workers)
+        self._finalization_lock = threading.Lock()
+        """Guards the batch and state bookkeeping shared by streams finalized concurrently."""
 
         super().__init__(
             state_writer=state_writer,
@@ -350,6 +391,11 @@ class SqlProcessorBase(RecordProcessorBase):
             f"{self._quote_identifier(column_name)} {sql_type}"
             for column_name, sql_type in self._get_sql_column_definitions(stream_name).items()
         )
+        if self.numbers_loaded_rows:
+            column_definition_str += (
+                f",\n  {self._quote_identifier(LOAD_SEQUENCE_COLUMN)}"
+                " BIGINT GENERATED ALWAYS AS IDENTITY"
+            )
         self._create_table(temp_table_name, column_definition_str)
 
         return temp_table_name
@@ -455,6 +501,40 @@ class SqlProcessorBase(RecordProcessorBase):
 
         return columns
 
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Finalize any pending writes.
+
+        Streams are independent of each other, so up to `max_finalize_workers` of them are
+        finalized at the same time. Each stream's state messages are still only emitted once
+        that stream's data has been committed. If a stream fails, streams which have not started
+        yet are skipped and the first error is raised.
+        """
+        stream_names = list(self.catalog_provider.stream_names)
+        if self._max_finalize_workers <= 1 or len(stream_names) <= 1:
+            super().write_all_stream_data(write_strategy)
+            return
+
+        # Do the shared setup once up front, so that each worker only touches its own stream.
+        self.file_writer.flush_active_batches()
+        self._ensure_schema_exists()
+        self.get_sql_engine()
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_finalize_workers, len(stream_names)),
+            thread_name_prefix="finalize",
+        ) as executor:
+            futures = [
+                executor.submit(self.write_stream_data, stream_name, write_strategy=write_strategy)
+                for stream_name in stream_names
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
     @final
     def write_stream_data(
         self,
@@ -508,7 +588,8 @@ class SqlProcessorBase(RecordProcessorBase):
             finally:
                 self._drop_temp_table(temp_table_name, if_exists=True)
 
-        progress.log_stream_finalized(stream_name)
+        with self._finalization_lock:
+            progress.log_stream_finalized(stream_name)
 
         # Return the batch handles as measure of work completed.
         return batches_to_finalize
@@ -530,21 +611,25 @@ class SqlProcessorBase(RecordProcessorBase):
 
         Returns a mapping of batch IDs to batch handles, for those processed batches.
         """
-        batches_to_finalize: list[BatchHandle] = self.file_writer.get_pending_batches(stream_name)
-        state_messages_to_finalize: list[AirbyteStateMessage] = self._pending_state_messages[
-            stream_name
-        ].copy()
-        self._pending_state_messages[stream_name].clear()
+        with self._finalization_lock:
+            batches_to_finalize: list[BatchHandle] = self.file_writer.get_pending_batches(
+                stream_name
+            )
+            state_messages_to_finalize: list[AirbyteStateMessage] = self._pending_state_messages[
+                stream_name
+            ].copy()
+            self._pending_state_messages[stream_name].clear()
 
-        progress.log_batches_finalizing(stream_name, len(batches_to_finalize))
+            progress.log_batches_finalizing(stream_name, len(batches_to_finalize))
         yield batches_to_finalize
-        self._finalize_state_messages(state_messages_to_finalize)
-        progress.log_batches_finalized(stream_name, len(batches_to_finalize))
+        with self._finalization_lock:
+            self._finalize_state_messages(state_messages_to_finalize)
+            progress.log_batches_finalized(stream_name, len(batches_to_finalize))
 
-        for batch_handle in batches_to_finalize:
-            batch_handle.finalized = True
+            for batch_handle in batches_to_finalize:
+                batch_handle.finalized = True
 
-        self._finalized_state_messages[stream_name] += state_messages_to_finalize
+            self._finalized_state_messages[stream_name] += state_messages_to_finalize
 
     def _execute_sql(self, sql: str | TextClause | Executable) -> CursorResult:
         """Execute the given SQL statement."""
@@ -586,8 +671,14 @@ class SqlProcessorBase(RecordProcessorBase):
         """Write a file(s) to a new table.
 
         This is a generic implementation, which can be overridden by subclasses
-        to improve performance.
+        to improve performance. Processors which set `supports_copy_from_stdin` stream the
+        files with `COPY` instead, see `_copy_files_to_new_table()`.
         """
+        if self.supports_copy_from_stdin:
+            return self._copy_files_to_new_table(
+                files=files, stream_name=stream_name, batch_id=batch_id
+            )
+
         temp_table_name = self._create_table_for_loading(stream_name, batch_id)
         for file_path in files:
             dataframe = pd.read_json(file_path, lines=True)
@@ -624,6 +715,37 @@ class SqlProcessorBase(RecordProcessorBase):
             )
         return temp_table_name
 
+    def _copy_files_to_new_table(
+        self,
+        files: list[Path],
+        stream_name: str,
+        batch_id: str,
+    ) -> str:
+        """Stream file(s) into a new table with `COPY ... FROM STDIN`.
+
+        Records are decoded and encoded one at a time, so no file is ever fully loaded into memory,
+        and the load runs over a connection from the processor's own engine.
+        """
+        temp_table_name = self._create_table_for_loading(stream_name, batch_id)
+        sql_column_definitions: dict[str, TypeEngine] = self._get_sql_column_definitions(
+            stream_name
+        )
+        copy_format = self.copy_format
+        if copy_format == CopyFormat.BINARY and not supports_binary_copy(sql_column_definitions):
+            copy_format = CopyFormat.TEXT
+
+        with self.get_sql_connection() as conn:
+            copy_records_to_table(
+                conn.connection,
+                table_name=self._fully_qualified(temp_table_name),
+                column_definitions=sql_column_definitions,
+                records=iter_jsonl_records(files),
+                copy_format=copy_format,
+                normalize=self.normalizer.normalize,
+                quote=self._quote_identifier,
+            )
+        return temp_table_name
+
     def _add_column_to_table(
         self,
         table: Table,
@@ -61,6 +61,31 @@ class PGVectorIndexingModel(BaseModel):
     # E.g. "credentials": {"password": "AIRBYTE_PASSWORD"}
     credentials: PasswordBasedAuthorizationModel
 
+    embedding_cache: bool = Field(
+        default=False,
+        title="Cache Embeddings",
+        order=8,
+        description="Store the embedding of each chunk in the `_airbyte_embedding_cache` table, and reuse it "
+        "instead of calling the embedding model again when the same text is synced with the same model.",
+    )
+    skip_unchanged_chunks: bool = Field(
+        default=False,
+        title="Skip Unchanged Chunks",
+        order=9,
+        description="In deduplicated streams, leave chunks whose content, metadata and embedding are unchanged "
+        "untouched instead of rewriting them, which avoids needless vector index updates. Only applies to tables "
+        "with a unique index on `(document_id, chunk_id)`, which is created for new tables of deduplicated streams.",
+    )
+    finalize_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=8,
+        title="Stream Finalization Concurrency",
+        order=10,
+        description="Number of streams whose data is written to their final tables at the same time at the end "
+        "of a sync, each over its own database connection.",
+    )
+
     class Config:
         title = "Postgres Connection"
         schema_extra = {
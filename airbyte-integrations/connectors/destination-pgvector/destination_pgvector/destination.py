@@ -47,6 +47,9 @@ class DestinationPGVector(Destination):
             catalog_provider=CatalogProvider(configured_catalog),
             temp_dir=Path(tempfile.mkdtemp()),
             temp_file_cleanup=True,
+            use_embedding_cache=config.indexing.embedding_cache,
+            skip_unchanged_chunks=config.indexing.skip_unchanged_chunks,
+            max_finalize_workers=config.indexing.finalize_concurrency,
         )
 
     def write(
@@ -0,0 +1,124 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""A content-addressed cache of chunk embeddings, stored in a side table of the destination."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Callable, ContextManager
+
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
+    from airbyte_cdk.destinations.vector_db_based.embedder import Embedder
+    from pydantic import BaseModel
+
+
+EMBEDDING_CACHE_TABLE_NAME = "_airbyte_embedding_cache"
+
+UNCACHEABLE_EMBEDDING_MODES = {"from_field"}
+"""Modes whose embeddings don't depend on the chunk text alone, so they can't be cached."""
+
+
+def embedding_model_fingerprint(embedder_config: BaseModel, dimensions: int) -> str:
+    """Return a stable description of the embedding model, without any secret settings.
+
+    Two configs with the same fingerprint produce the same embedding for the same text, so a
+    rotated API key keeps the cache warm while a different model or endpoint does not.
+    """
+    settings = {
+        name: value
+        for name, value in embedder_config.dict().items()
+        if not type(embedder_config).__fields__[name].field_info.extra.get("airbyte_secret")
+    }
+    return json.dumps({"settings": settings, "dimensions": dimensions}, sort_keys=True, default=str)
+
+
+class EmbeddingCache:
+    """Looks up and stores embeddings keyed by model fingerprint and chunk text hash.
+
+    Entries are never updated: a key identifies the model and the exact text, so its embedding
+    can't go stale. Rows can be deleted at any time to reclaim space, at the cost of re-embedding.
+    """
+
+    def __init__(
+        self,
+        get_sql_connection: Callable[[], ContextManager[sqlalchemy.engine.Connection]],
+        model_fingerprint: str,
+        table_name: str = EMBEDDING_CACHE_TABLE_NAME,
+    ) -> None:
+        self._get_sql_connection = get_sql_connection
+        self._key_prefix = hashlib.sha256(model_fingerprint.encode()).hexdigest().encode()
+        self._table = sqlalchemy.Table(
+            table_name,
+            sqlalchemy.MetaData(),
+            sqlalchemy.Column("cache_key", sqlalchemy.String(64), primary_key=True),
+            sqlalchemy.Column("embedding", sqlalchemy.Text, nullable=False),
+        )
+        self._table_created = False
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(self, text: str) -> str:
+        return hashlib.sha256(self._key_prefix + b"\x00" + text.encode()).hexdigest()
+
+    def _ensure_table(self, connection: sqlalchemy.engine.Connection) -> None:
+        if not self._table_created:
+            self._table.create(connection, checkfirst=True)
+            self._table_created = True
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, list[float]]:
+        """Return the cached embeddings for the given keys. Missing keys are left out."""
+        keys = list(set(keys))
+        if not keys:
+            return {}
+
+        found: dict[str, list[float]] = {}
+        with self._get_sql_connection() as connection:
+            self._ensure_table(connection)
+            query = sqlalchemy.select(self._table.c.cache_key, self._table.c.embedding).where(
+                self._table.c.cache_key.in_(keys)
+            )
+            for cache_key, embedding in connection.execute(query):
+                found[cache_key] = json.loads(embedding)
+        return found
+
+    def put_many(self, embeddings: dict[str, list[float]]) -> None:
+        """Store new embeddings. Keys which are already cached are left unchanged."""
+        if not embeddings:
+            return
+
+        rows = [
+            {"cache_key": cache_key, "embedding": json.dumps(embedding)}
+            for cache_key, embedding in embeddings.items()
+        ]
+        with self._get_sql_connection() as connection:
+            self._ensure_table(connection)
+            statement: Any = sqlalchemy.insert(self._table)
+            if connection.dialect.name == "postgresql":
+                statement = postgresql.insert(self._table).on_conflict_do_nothing()
+            connection.execute(statement, rows)
+
+    def embed_chunks(self, embedder: Embedder, chunks: list[Chunk]) -> list[list[float]]:
+        """Return one embedding per chunk, only calling the embedder for chunks not in the cache."""
+        keys = [self.cache_key(chunk.page_content or "") for chunk in chunks]
+        embeddings_by_key = self.get_many(keys)
+
+        missing: dict[str, Chunk] = {}
+        for key, chunk in zip(keys, chunks):
+            if key not in embeddings_by_key:
+                missing.setdefault(key, chunk)
+        self.hits += len(chunks) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            new_embeddings = embedder.embed_documents(documents=list(missing.values()))  # type: ignore [arg-type]  # Chunks are valid documents
+            new_entries = dict(zip(missing.keys(), new_embeddings))
+            self.put_many(new_entries)
+            embeddings_by_key.update(new_entries)
+
+        return [embeddings_by_key[key] for key in keys]
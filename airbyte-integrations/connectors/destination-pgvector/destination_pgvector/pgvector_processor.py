@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import uuid
+from functools import cached_property
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
@@ -12,20 +14,31 @@ import dpath
 import sqlalchemy
 from airbyte._processors.file.jsonl import JsonlWriter
 from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
 from airbyte_cdk.destinations.vector_db_based import embedder
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.destinations.vector_db_based.document_processor import (
     DocumentProcessor as DocumentSplitter,
 )
 from airbyte_cdk.destinations.vector_db_based.document_processor import (
     ProcessingConfigModel as DocumentSplitterConfig,
 )
-from airbyte_cdk.models import AirbyteRecordMessage
+from airbyte_cdk.models import AirbyteRecordMessage, DestinationSyncMode
 from overrides import overrides
 from pgvector.sqlalchemy import Vector
 from typing_extensions import Protocol
 
 from destination_pgvector.common.catalog.catalog_providers import CatalogProvider
-from destination_pgvector.common.sql.sql_processor import SqlConfig, SqlProcessorBase
+from destination_pgvector.common.sql.sql_processor import (
+    LOAD_SEQUENCE_COLUMN,
+    SqlConfig,
+    SqlProcessorBase,
+)
+from destination_pgvector.embedding_cache import (
+    UNCACHEABLE_EMBEDDING_MODES,
+    EmbeddingCache,
+    embedding_model_fingerprint,
+)
 from destination_pgvector.globals import (
     CHUNK_ID_COLUMN,
     DOCUMENT_CONTENT_COLUMN,
@@ -60,6 +73,13 @@ class PostgresConfig(SqlConfig):
         return self.database
 
 
+EMBEDDING_BATCH_SIZE = 256
+"""Number of chunks collected across records before they are embedded together."""
+
+UPSERT_KEY_COLUMNS = (DOCUMENT_ID_COLUMN, CHUNK_ID_COLUMN)
+"""A unique index on these columns enables the `INSERT ... ON CONFLICT` merge path."""
+
+
 class EmbeddingConfig(Protocol):
     """A protocol for embedding configuration.
 
@@ -76,6 +96,12 @@ class PGVectorProcessor(SqlProcessorBase):
     supports_merge_insert = False
     """We use the emulated merge code path because each primary key has multiple rows (chunks)."""
 
+    supports_copy_from_stdin = True
+    """Batch files are streamed into Postgres with `COPY`, with embeddings in pgvector's binary format."""
+
+    numbers_loaded_rows = True
+    """The upsert merge keeps the latest version of each document by load order."""
+
     sql_config: PostgresConfig
     """The configuration for the PGVector processor, including the vector length."""
 
@@ -94,16 +120,43 @@ class PGVectorProcessor(SqlProcessorBase):
         catalog_provider: CatalogProvider,
         temp_dir: Path,
         temp_file_cleanup: bool = True,
+        use_embedding_cache: bool = False,
+        skip_unchanged_chunks: bool = False,
+        max_finalize_workers: int = 1,
     ) -> None:
-        """Initialize the PGVector processor."""
+        """Initialize the PGVector processor.
+
+        With `use_embedding_cache`, embeddings are cached in a side table keyed by embedding
+        model and chunk text, so unchanged chunks are not sent to the embedding model again.
+
+        With `skip_unchanged_chunks`, deduplicated streams leave chunks whose content, metadata
+        and embedding are unchanged untouched, so they don't churn the table and its vector index.
+        This only applies to tables which have a unique index on the document and chunk IDs.
+
+        Up to `max_finalize_workers` streams are finalized concurrently at the end of the sync.
+        """
         self.splitter_config = splitter_config
         self.embedder_config = embedder_config
+        self.skip_unchanged_chunks = skip_unchanged_chunks
+        self._upsert_index_cache: dict[str, bool] = {}
+        self._pending_records: list[tuple[AirbyteRecordMessage, list[Chunk]]] = []
+        self._pending_chunk_count = 0
         super().__init__(
             sql_config=sql_config,
             catalog_provider=catalog_provider,
             temp_dir=temp_dir,
             temp_file_cleanup=temp_file_cleanup,
+            max_finalize_workers=max_finalize_workers,
         )
+        self.embedding_cache: EmbeddingCache | None = None
+        if use_embedding_cache and embedder_config.mode not in UNCACHEABLE_EMBEDDING_MODES:
+            self.embedding_cache = EmbeddingCache(
+                self.get_sql_connection,
+                model_fingerprint=embedding_model_fingerprint(
+                    embedder_config,  # type: ignore [arg-type]  # All embedding configs are pydantic models
+                    self.embedding_dimensions,
+                ),
+            )
 
     def _get_sql_column_definitions(
         self,
@@ -122,6 +175,164 @@ class PGVectorProcessor(SqlProcessorBase):
             EMBEDDING_COLUMN: Vector(self.embedding_dimensions),
         }
 
+    @overrides
+    def _ensure_final_table_exists(
+        self,
+        stream_name: str,
+        *,
+        create_if_missing: bool = True,
+    ) -> str:
+        """Create the final table if it doesn't already exist.
+
+        New tables of deduplicated streams get a unique index on the document and chunk IDs, so
+        that they are merged with `INSERT ... ON CONFLICT` rather than by deleting and
+        re-inserting every chunk of the incoming documents. The index is dropped once the stream
+        is synced in another mode.
+        """
+        table_name = self.get_sql_table_name(stream_name)
+        did_exist = self._table_exists(table_name)
+        super()._ensure_final_table_exists(stream_name, create_if_missing=create_if_missing)
+        if (
+            self.catalog_provider.get_destination_sync_mode(stream_name)
+            != DestinationSyncMode.append_dedup
+        ):
+            if did_exist:
+                # Appended documents may repeat chunk IDs, which the index of a former
+                # deduplicated sync of the stream would reject.
+                self._execute_sql(
+                    f"DROP INDEX IF EXISTS {self._fully_qualified(self._upsert_index_name(table_name))}"
+                )
+                self._upsert_index_cache.pop(table_name, None)
+        elif not did_exist and create_if_missing:
+            self._execute_sql(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {self._upsert_index_name(table_name)} "
+                f"ON {self._fully_qualified(table_name)} ({', '.join(UPSERT_KEY_COLUMNS)})"
+            )
+            self._upsert_index_cache[table_name] = True
+        return table_name
+
+    @staticmethod
+    def _upsert_index_name(table_name: str) -> str:
+        return f"{table_name}_document_chunk_key"
+
+    def _has_upsert_index(self, table_name: str) -> bool:
+        """Return true if the table has a unique index on exactly the document and chunk IDs."""
+        if table_name not in self._upsert_index_cache:
+            with self.get_sql_connection() as conn:
+                inspector = sqlalchemy.inspect(conn)
+                unique_keys = [
+                    index["column_names"]
+                    for index in inspector.get_indexes(
+                        table_name, schema=self.sql_config.schema_name
+                    )
+                    if index.get("unique")
+                    and not index.get("dialect_options", {}).get("postgresql_where")
+                ]
+                unique_keys += [
+                    constraint["column_names"]
+                    for constraint in inspector.get_unique_constraints(
+                        table_name, schema=self.sql_config.schema_name
+                    )
+                ]
+                primary_key = inspector.get_pk_constraint(
+                    table_name, schema=self.sql_config.schema_name
+                )
+                unique_keys.append(primary_key.get("constrained_columns") or [])
+            self._upsert_index_cache[table_name] = any(
+                sorted(key) == sorted(UPSERT_KEY_COLUMNS) for key in unique_keys
+            )
+        return self._upsert_index_cache[table_name]
+
+    def _upsert_temp_table_to_final_table(
+        self,
+        stream_name: str,
+        temp_table_name: str,
+        final_table_name: str,
+    ) -> None:
+        """Merge the temp table into the final table with `INSERT ... ON CONFLICT DO UPDATE`.
+
+        Chunk IDs are derived from the document ID and the chunk's position, so a new version of a
+        document reuses the IDs of the chunks it replaces, and only chunks which no longer exist
+        are deleted. The steps are:
+
+        1. Drop superseded versions from the temp table, in case a document was received more
+           than once. A version starts at its first chunk, and `LOAD_SEQUENCE_COLUMN` numbers the
+           rows in the order they were loaded.
+        2. Delete the chunks of incoming documents which are not part of their new version.
+        3. Upsert the new chunks. With `skip_unchanged_chunks`, identical rows are not rewritten.
+        """
+        columns = list(self._get_sql_column_definitions(stream_name=stream_name).keys())
+        update_columns = [column for column in columns if column not in UPSERT_KEY_COLUMNS]
+        temp_table = self._fully_qualified(temp_table_name)
+        final_table = self._fully_qualified(final_table_name)
+
+        drop_superseded_statement = dedent(
+            f"""
+            DELETE FROM {temp_table}
+            WHERE {LOAD_SEQUENCE_COLUMN} IN (
+                SELECT {LOAD_SEQUENCE_COLUMN}
+                FROM (
+                    SELECT
+                        {LOAD_SEQUENCE_COLUMN},
+                        MAX(
+                            CASE
+                                WHEN {CHUNK_ID_COLUMN} = md5({DOCUMENT_ID_COLUMN} || ':0')
+                                THEN {LOAD_SEQUENCE_COLUMN}
+                            END
+                        ) OVER (PARTITION BY {DOCUMENT_ID_COLUMN}) AS latest_version_seq
+                    FROM {temp_table}
+                ) AS versions
+                WHERE {LOAD_SEQUENCE_COLUMN} < latest_version_seq
+            );
+            """
+        )
+        delete_stale_statement = dedent(
+            f"""
+            DELETE FROM {final_table} AS final
+            WHERE final.{DOCUMENT_ID_COLUMN} IN (
+                SELECT {DOCUMENT_ID_COLUMN}
+                FROM {temp_table}
+            )
+            AND NOT EXISTS (
+                SELECT 1
+                FROM {temp_table} AS tmp
+                WHERE tmp.{DOCUMENT_ID_COLUMN} = final.{DOCUMENT_ID_COLUMN}
+                AND tmp.{CHUNK_ID_COLUMN} = final.{CHUNK_ID_COLUMN}
+            );
+            """
+        )
+        skip_unchanged_clause = ""
+        if self.skip_unchanged_chunks:
+            skip_unchanged_clause = dedent(
+                f"""
+                WHERE (
+                    final.{DOCUMENT_CONTENT_COLUMN},
+                    final.{METADATA_COLUMN}::jsonb,
+                    final.{EMBEDDING_COLUMN}
+                ) IS DISTINCT FROM (
+                    EXCLUDED.{DOCUMENT_CONTENT_COLUMN},
+                    EXCLUDED.{METADATA_COLUMN}::jsonb,
+                    EXCLUDED.{EMBEDDING_COLUMN}
+                )
+                """
+            )
+        upsert_statement = dedent(
+            f"""
+            INSERT INTO {final_table} AS final
+                ({", ".join(columns)})
+            SELECT {", ".join(columns)}
+            FROM {temp_table}
+            ON CONFLICT ({", ".join(UPSERT_KEY_COLUMNS)}) DO UPDATE
+            SET {", ".join(f"{column} = EXCLUDED.{column}" for column in update_columns)}
+            """
+        )
+        upsert_statement += skip_unchanged_clause
+
+        with self.get_sql_connection() as conn:
+            conn.execute(drop_superseded_statement)
+            conn.execute(delete_stale_statement)
+            conn.execute(upsert_statement)
+
     def _emulated_merge_temp_table_to_final_table(
         self,
         stream_name: str,
@@ -135,7 +346,18 @@ class PGVectorProcessor(SqlProcessorBase):
 
         So instead of using UPDATE and then INSERT, we will DELETE all rows for included primary keys and then call
         the append implementation to insert new rows.
+
+        Tables with a unique index on the document and chunk IDs use the `INSERT ... ON CONFLICT`
+        path instead, which only touches the chunks that changed.
         """
+        if self._has_upsert_index(final_table_name):
+            self._upsert_temp_table_to_final_table(
+                stream_name=stream_name,
+                temp_table_name=temp_table_name,
+                final_table_name=final_table_name,
+            )
+            return
+
         columns_list: list[str] = list(
             self._get_sql_column_definitions(stream_name=stream_name).keys()
         )
@@ -173,22 +395,57 @@ class PGVectorProcessor(SqlProcessorBase):
 
         We override the SQLProcessor implementation in order to handle chunking, embedding, etc.
 
-        This method is called for each record message, before the record is written to local file.
+        This method is called for each record message. Chunks are embedded in batches of
+        `EMBEDDING_BATCH_SIZE` across records, and then written to local files.
         """
         document_chunks, id_to_delete = self.splitter.process(record_msg)
 
         _ = id_to_delete  # unused
 
-        embeddings = self.embedder.embed_documents(
-            documents=document_chunks,
-        )
-        for i, chunk in enumerate(document_chunks, start=0):
+        self._pending_records.append((record_msg, document_chunks))
+        self._pending_chunk_count += len(document_chunks)
+        if self._pending_chunk_count >= EMBEDDING_BATCH_SIZE:
+            self._embed_pending_records()
+
+    def _embed_chunks(self, chunks: list[Chunk]) -> list[list[float]]:
+        if self.embedding_cache is not None:
+            return self.embedding_cache.embed_chunks(self.embedder, chunks)
+        return self.embedder.embed_documents(documents=chunks)  # type: ignore [arg-type]  # Chunks are valid documents
+
+    def _embed_pending_records(self) -> None:
+        """Embed the chunks of all pending records and write them to local files."""
+        pending_records, self._pending_records = self._pending_records, []
+        self._pending_chunk_count = 0
+        all_chunks = [chunk for _, chunks in pending_records for chunk in chunks]
+        if not all_chunks:
+            return
+
+        embeddings = iter(self._embed_chunks(all_chunks))
+        for record_msg, document_chunks in pending_records:
+            self._write_chunks(
+                record_msg, document_chunks, [next(embeddings) for _ in document_chunks]
+            )
+
+    @overrides
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Embed any pending records before finalizing the streams."""
+        self._embed_pending_records()
+        super().write_all_stream_data(write_strategy)
+
+    def _write_chunks(
+        self,
+        record_msg: AirbyteRecordMessage,
+        document_chunks: list[Chunk],
+        embeddings: list[list[float]],
+    ) -> None:
+        document_id = self._create_document_id(record_msg)
+        for chunk_index, (chunk, embedding) in enumerate(zip(document_chunks, embeddings)):
             new_data: dict[str, Any] = {
-                DOCUMENT_ID_COLUMN: self._create_document_id(record_msg),
-                CHUNK_ID_COLUMN: str(uuid.uuid4().int),
+                DOCUMENT_ID_COLUMN: document_id,
+                CHUNK_ID_COLUMN: self._create_chunk_id(document_id, chunk_index),
                 METADATA_COLUMN: chunk.metadata,
                 DOCUMENT_CONTENT_COLUMN: chunk.page_content,
-                EMBEDDING_COLUMN: embeddings[i],
+                EMBEDDING_COLUMN: embedding,
             }
 
             self.file_writer.process_record_message(
@@ -224,7 +481,7 @@ class PGVectorProcessor(SqlProcessorBase):
         """
         pass
 
-    @property
+    @cached_property
     def embedder(self) -> embedder.Embedder:
         return embedder.create_from_config(
             embedding_config=self.embedder_config,  # type: ignore [arg-type]  # No common base class
@@ -236,7 +493,7 @@ class PGVectorProcessor(SqlProcessorBase):
         """Return the number of dimensions for the embeddings."""
         return self.embedder.embedding_dimensions
 
-    @property
+    @cached_property
     def splitter(self) -> DocumentSplitter:
         return DocumentSplitter(
             config=self.splitter_config,
@@ -251,6 +508,15 @@ class PGVectorProcessor(SqlProcessorBase):
             return f"Stream_{stream_name}_Key_{primary_key}"
         return str(uuid.uuid4().int)
 
+    @staticmethod
+    def _create_chunk_id(document_id: str, chunk_index: int) -> str:
+        """Create a chunk id which is stable across syncs for the same position in a document.
+
+        The merge step recomputes the id of a document's first chunk in SQL, as
+        `md5(document_id || ':0')`, so the two must be kept in sync.
+        """
+        return hashlib.md5(f"{document_id}:{chunk_index}".encode()).hexdigest()
+
     def _get_record_primary_key(self, record_msg: AirbyteRecordMessage) -> str | None:
         """Create primary key for the record by appending the primary keys."""
         stream_name = record_msg.stream
@@ -199,6 +199,42 @@ class PGVectorIntegrationTest(BaseIntegrationTest):
         # assert(len(result) == 1)
         # result[0] == "str_col: Cats are nice"
 
+    def test_append_dedup_upserts_latest_version_of_each_document(self):
+        self._delete_table("mystream")
+        catalog = self._get_configured_catalog(DestinationSyncMode.append_dedup)
+        first_state_message = self._state({"state": "1"})
+        first_five_records = [
+            self._record(
+                stream="mystream",
+                str_value=f"Dogs are number {i}",
+                int_value=i,
+            )
+            for i in range(5)
+        ]
+
+        destination = DestinationPGVector()
+        list(destination.write(self.config, catalog, [*first_five_records, first_state_message]))
+        assert self._get_record_count("mystream") == 5
+
+        # The same document twice in one sync: only its latest version is kept.
+        list(
+            destination.write(
+                config=self.config,
+                configured_catalog=catalog,
+                input_messages=[
+                    self._record("mystream", "Cats are nice", 4),
+                    self._record("mystream", "Cats are nice too", 4),
+                    first_state_message,
+                ],
+            )
+        )
+        assert self._get_record_count("mystream") == 5
+        contents = {
+            record["document_id"]: record["document_content"]
+            for record in self._get_all_records("mystream")
+        }
+        assert contents["Stream_mystream_Key_4"] == "str_col: Cats are nice too"
+
     def test_overwrite_mode_deletes_records(self):
         self._delete_table("mystream")
         catalog = self._get_configured_catalog(DestinationSyncMode.overwrite)
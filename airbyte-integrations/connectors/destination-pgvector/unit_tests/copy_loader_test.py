@@ -0,0 +1,130 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import json
+import struct
+from unittest.mock import MagicMock
+
+import sqlalchemy
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects.postgresql import JSONB
+
+from destination_pgvector.common.sql import copy_loader
+from destination_pgvector.common.sql.copy_loader import (
+    BINARY_COPY_HEADER,
+    BINARY_COPY_TRAILER,
+    ChunkedReader,
+    CopyFormat,
+    copy_records_to_table,
+    iter_copy_chunks,
+    iter_jsonl_records,
+    supports_binary_copy,
+)
+
+COLUMNS = {
+    "document_id": sqlalchemy.types.VARCHAR(),
+    "metadata": sqlalchemy.types.JSON(),
+    "embedding": Vector(3),
+}
+
+
+def _normalize(name):
+    return name.lower()
+
+
+def test_text_format_escapes_values_and_writes_nulls():
+    records = [
+        {
+            "Document_Id": "a\tb\\c\nd",
+            "metadata": {"k": "v"},
+            "embedding": [1, 2.5, -3],
+            "ignored": 1,
+        },
+        {"document_id": "x"},
+    ]
+
+    payload = b"".join(iter_copy_chunks(records, COLUMNS, CopyFormat.TEXT, _normalize))
+
+    assert payload.decode().splitlines() == [
+        'a\\tb\\\\c\\nd\t{"k": "v"}\t[1.0,2.5,-3.0]',
+        "x\t\\N\t\\N",
+    ]
+
+
+def test_binary_format_encodes_tuples():
+    records = [{"document_id": "é", "metadata": None, "embedding": [1.0, 2.0, 3.0]}]
+
+    payload = b"".join(iter_copy_chunks(records, COLUMNS, CopyFormat.BINARY, _normalize))
+
+    expected_vector = struct.pack(">HH3f", 3, 0, 1.0, 2.0, 3.0)
+    assert payload == (
+        BINARY_COPY_HEADER
+        + struct.pack(">h", 3)
+        + struct.pack(">i", 2)
+        + "é".encode()
+        + struct.pack(">i", -1)
+        + struct.pack(">i", len(expected_vector))
+        + expected_vector
+        + BINARY_COPY_TRAILER
+    )
+
+
+def test_supports_binary_copy():
+    assert supports_binary_copy(COLUMNS)
+    assert not supports_binary_copy({**COLUMNS, "flag": sqlalchemy.types.Boolean()})
+    assert not supports_binary_copy({**COLUMNS, "doc": JSONB()})
+
+
+def test_payload_is_split_into_chunks(monkeypatch):
+    monkeypatch.setattr(copy_loader, "COPY_CHUNK_SIZE", 64)
+    records = [{"document_id": str(i) * 20} for i in range(10)]
+
+    chunks = list(iter_copy_chunks(records, COLUMNS, CopyFormat.TEXT, _normalize))
+
+    assert len(chunks) > 1
+    assert b"".join(chunks).decode().count("\n") == 10
+
+
+def test_chunked_reader_reads_across_chunk_boundaries():
+    reader = ChunkedReader([b"abc", b"", b"defg", b"h"])
+
+    assert reader.read(2) == b"ab"
+    assert reader.read(4) == b"cdef"
+    assert reader.read(10) == b"gh"
+    assert reader.read(10) == b""
+
+
+def test_iter_jsonl_records_reads_plain_and_gzipped_files(tmp_path):
+    plain = tmp_path / "batch.jsonl"
+    plain.write_text('{"a": 1}\n\n{"a": 2}\n')
+    gzipped = tmp_path / "batch.jsonl.gz"
+    with gzip.open(gzipped, "wt") as file:
+        file.write(json.dumps({"a": 3}) + "\n")
+
+    assert list(iter_jsonl_records([plain, gzipped])) == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+
+def test_copy_records_to_table_streams_payload_to_cursor():
+    connection = MagicMock()
+    cursor = connection.cursor.return_value.__enter__.return_value
+    received = []
+    cursor.copy_expert.side_effect = lambda sql, file, size: received.append((sql, file.read()))
+
+    copy_records_to_table(
+        connection,
+        table_name="schema.tbl",
+        column_definitions=COLUMNS,
+        records=[{"document_id": "a"}],
+        copy_format=CopyFormat.TEXT,
+        normalize=_normalize,
+        quote=lambda name: f'"{name}"',
+    )
+
+    assert received == [
+        (
+            'COPY schema.tbl ("document_id", "metadata", "embedding") FROM STDIN WITH (FORMAT text)',
+            b"a\t\\N\t\\N\n",
+        )
+    ]
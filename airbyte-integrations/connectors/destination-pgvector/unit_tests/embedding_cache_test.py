@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy
+from airbyte_cdk.destinations.vector_db_based.config import (
+    CohereEmbeddingConfigModel,
+    OpenAIEmbeddingConfigModel,
+)
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
+
+from destination_pgvector.embedding_cache import EmbeddingCache, embedding_model_fingerprint
+
+
+@pytest.fixture
+def engine():
+    return sqlalchemy.create_engine("sqlite://")
+
+
+def _embedder():
+    embedder = MagicMock()
+    embedder.embed_documents.side_effect = lambda documents: [
+        [float(len(document.page_content))] for document in documents
+    ]
+    return embedder
+
+
+def _chunk(text):
+    return Chunk(page_content=text, metadata={}, record=MagicMock())
+
+
+def test_only_uncached_chunks_are_embedded(engine):
+    cache = EmbeddingCache(engine.begin, model_fingerprint="model-a")
+    embedder = _embedder()
+
+    assert cache.embed_chunks(embedder, [_chunk("a"), _chunk("bb"), _chunk("a")]) == [
+        [1.0],
+        [2.0],
+        [1.0],
+    ]
+    assert [len(call.kwargs["documents"]) for call in embedder.embed_documents.call_args_list] == [
+        2
+    ]
+
+    assert cache.embed_chunks(embedder, [_chunk("bb"), _chunk("ccc")]) == [[2.0], [3.0]]
+    assert [
+        chunk.page_content for chunk in embedder.embed_documents.call_args.kwargs["documents"]
+    ] == ["ccc"]
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_cache_is_shared_across_instances_of_the_same_model(engine):
+    EmbeddingCache(engine.begin, model_fingerprint="model-a").embed_chunks(
+        _embedder(), [_chunk("a")]
+    )
+
+    same_model = _embedder()
+    EmbeddingCache(engine.begin, model_fingerprint="model-a").embed_chunks(
+        same_model, [_chunk("a")]
+    )
+    other_model = _embedder()
+    EmbeddingCache(engine.begin, model_fingerprint="model-b").embed_chunks(
+        other_model, [_chunk("a")]
+    )
+
+    same_model.embed_documents.assert_not_called()
+    other_model.embed_documents.assert_called_once()
+
+
+def test_put_many_keeps_existing_entries(engine):
+    cache = EmbeddingCache(engine.begin, model_fingerprint="model-a")
+    cache.put_many({"key": [1.0]})
+    cache.put_many({})
+
+    assert cache.get_many(["key", "missing"]) == {"key": [1.0]}
+
+
+def test_fingerprint_ignores_secrets_but_not_model_settings():
+    openai = embedding_model_fingerprint(OpenAIEmbeddingConfigModel(openai_key="key-1"), 1536)
+
+    assert (
+        embedding_model_fingerprint(OpenAIEmbeddingConfigModel(openai_key="key-2"), 1536) == openai
+    )
+    assert "key-1" not in openai
+    assert (
+        embedding_model_fingerprint(OpenAIEmbeddingConfigModel(openai_key="key-1"), 512) != openai
+    )
+    assert (
+        embedding_model_fingerprint(CohereEmbeddingConfigModel(cohere_key="key-1"), 1536) != openai
+    )
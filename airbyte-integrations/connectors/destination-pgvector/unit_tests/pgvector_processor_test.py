@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+)
+
+from destination_pgvector.common.sql.sql_processor import LOAD_SEQUENCE_COLUMN, SqlProcessorBase
+from destination_pgvector.config import ConfigModel
+from destination_pgvector.destination import DestinationPGVector
+from destination_pgvector.pgvector_processor import PGVectorProcessor
+
+CONFIG = {
+    "processing": {"text_fields": ["str_col"], "metadata_fields": [], "chunk_size": 1000},
+    "embedding": {"mode": "fake"},
+    "indexing": {
+        "host": "MYACCOUNT",
+        "port": 5432,
+        "database": "MYDATABASE",
+        "default_schema": "myschema",
+        "username": "MYUSERNAME",
+        "credentials": {"password": "xxxxxxx"},
+    },
+}
+
+
+def _processor(destination_sync_mode=DestinationSyncMode.append_dedup) -> PGVectorProcessor:
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name="mystream",
+                    json_schema={"type": "object", "properties": {"str_col": {"type": "str"}}},
+                    supported_sync_modes=[SyncMode.incremental],
+                ),
+                primary_key=[["str_col"]],
+                sync_mode=SyncMode.incremental,
+                destination_sync_mode=destination_sync_mode,
+            )
+        ]
+    )
+    destination = DestinationPGVector()
+    with patch.object(PGVectorProcessor, "_ensure_schema_exists"):
+        destination._init_sql_processor(ConfigModel.parse_obj(CONFIG), catalog)
+    processor = destination.sql_processor
+    processor._execute_sql = MagicMock()
+    return processor
+
+
+def test_chunk_ids_are_stable_per_position():
+    first_chunk_id = PGVectorProcessor._create_chunk_id("Stream_mystream_Key_1", 0)
+
+    assert PGVectorProcessor._create_chunk_id("Stream_mystream_Key_1", 0) == first_chunk_id
+    assert PGVectorProcessor._create_chunk_id("Stream_mystream_Key_1", 1) != first_chunk_id
+    assert PGVectorProcessor._create_chunk_id("Stream_mystream_Key_2", 0) != first_chunk_id
+    # The merge step finds the first chunk of each document with `md5(document_id || ':0')`.
+    assert first_chunk_id == hashlib.md5(b"Stream_mystream_Key_1:0").hexdigest()
+
+
+@pytest.mark.parametrize("has_upsert_index", [True, False])
+def test_merge_uses_upsert_only_with_a_unique_index(has_upsert_index):
+    processor = _processor()
+    processor._upsert_index_cache = {"mystream": has_upsert_index}
+    processor._upsert_temp_table_to_final_table = MagicMock()
+    processor.get_sql_connection = MagicMock()
+
+    processor._emulated_merge_temp_table_to_final_table(
+        stream_name="mystream", temp_table_name="mystream_tmp", final_table_name="mystream"
+    )
+
+    assert processor._upsert_temp_table_to_final_table.called is has_upsert_index
+    assert processor.get_sql_connection.called is not has_upsert_index
+
+
+def test_loading_tables_number_their_rows():
+    processor = _processor()
+
+    processor._create_table_for_loading("mystream", batch_id="batch")
+
+    create_table_statement = processor._execute_sql.call_args.args[0]
+    assert f'"{LOAD_SEQUENCE_COLUMN}" BIGINT GENERATED ALWAYS AS IDENTITY' in create_table_statement
+
+
+@pytest.mark.parametrize(
+    "destination_sync_mode, table_exists, expected_statement",
+    [
+        (
+            DestinationSyncMode.append_dedup,
+            False,
+            "CREATE UNIQUE INDEX IF NOT EXISTS mystream_document_chunk_key",
+        ),
+        (DestinationSyncMode.append_dedup, True, None),
+        (
+            DestinationSyncMode.append,
+            True,
+            'DROP INDEX IF EXISTS myschema."mystream_document_chunk_key"',
+        ),
+        (DestinationSyncMode.append, False, None),
+    ],
+)
+def test_upsert_index_is_only_kept_for_deduplicated_streams(
+    destination_sync_mode, table_exists, expected_statement
+):
+    processor = _processor(destination_sync_mode)
+    processor._table_exists = MagicMock(return_value=table_exists)
+
+    with patch.object(SqlProcessorBase, "_ensure_final_table_exists"):
+        processor._ensure_final_table_exists("mystream")
+
+    statements = [call.args[0] for call in processor._execute_sql.call_args_list]
+    assert [statement.split(" ON ")[0] for statement in statements] == (
+        [expected_statement] if expected_statement else []
+    )
@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from airbyte.strategies import WriteStrategy
+from airbyte_cdk.models import (
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+)
+
+from destination_pgvector.common.catalog.catalog_providers import CatalogProvider
+from destination_pgvector.common.sql.sql_processor import SqlProcessorBase
+
+
+def _processor(stream_names, max_finalize_workers):
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name=stream_name,
+                    json_schema={"type": "object", "properties": {}},
+                    supported_sync_modes=[SyncMode.full_refresh],
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for stream_name in stream_names
+        ]
+    )
+    with patch.object(SqlProcessorBase, "_ensure_schema_exists"):
+        return SqlProcessorBase(
+            sql_config=MagicMock(),
+            catalog_provider=CatalogProvider(catalog),
+            file_writer=MagicMock(),
+            temp_file_cleanup=True,
+            max_finalize_workers=max_finalize_workers,
+        )
+
+
+def test_streams_are_finalized_concurrently():
+    all_streams_started = threading.Barrier(3, timeout=5)
+    processor = _processor(["a", "b", "c"], max_finalize_workers=3)
+    processor.write_stream_data = MagicMock(
+        side_effect=lambda stream_name, write_strategy: all_streams_started.wait()
+    )
+
+    processor.write_all_stream_data(WriteStrategy.AUTO)
+
+    assert sorted(call.args[0] for call in processor.write_stream_data.call_args_list) == [
+        "a",
+        "b",
+        "c",
+    ]
+    processor.file_writer.flush_active_batches.assert_called_once()
+
+
+def test_streams_are_finalized_in_order_with_one_worker():
+    processor = _processor(["a", "b", "c"], max_finalize_workers=1)
+    processor.write_stream_data = MagicMock()
+
+    processor.write_all_stream_data(WriteStrategy.AUTO)
+
+    assert [
+        call.args[0] for call in processor.write_stream_data.call_args_list
+    ] == processor.catalog_provider.stream_names
+
+
+def test_stream_failure_is_raised():
+    def write_stream_data(stream_name, write_strategy):
+        if stream_name == "b":
+            raise RuntimeError("merge failed")
+
+    processor = _processor(["a", "b", "c"], max_finalize_workers=2)
+    processor.write_stream_data = MagicMock(side_effect=write_stream_data)
+
+    with pytest.raises(RuntimeError, match="merge failed"):
+        processor.write_all_stream_data(WriteStrategy.AUTO)
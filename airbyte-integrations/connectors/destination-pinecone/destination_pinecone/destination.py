@@ -10,15 +10,16 @@ from airbyte_cdk.destinations import Destination
 from airbyte_cdk.destinations.vector_db_based.document_processor import DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Embedder, create_from_config
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
-from airbyte_cdk.destinations.vector_db_based.writer import Writer
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from airbyte_protocol.models.airbyte_protocol import AirbyteLogMessage, Level
 from destination_pinecone.config import ConfigModel
-from destination_pinecone.indexer import PineconeIndexer
+from destination_pinecone.indexer import PARALLELISM_LIMIT, PINECONE_BATCH_SIZE, PINECONE_MAX_REQUEST_BYTES, PineconeIndexer
+from destination_pinecone.pipelined_writer import AdaptiveBatchSizer, PipelinedWriter
 
 
-BATCH_SIZE = 32
+# enough chunks per embedding batch to keep all parallel upsert requests busy
+BATCH_SIZE = PINECONE_BATCH_SIZE * PARALLELISM_LIMIT
 
 
 class DestinationPinecone(Destination):
@@ -38,8 +39,17 @@ class DestinationPinecone(Destination):
         try:
             config_model = ConfigModel.parse_obj(config)
             self._init_indexer(config_model)
-            writer = Writer(
-                config_model.processing, self.indexer, self.embedder, batch_size=BATCH_SIZE, omit_raw_text=config_model.omit_raw_text
+            writer = PipelinedWriter(
+                config_model.processing,
+                self.indexer,
+                self.embedder,
+                batch_size=BATCH_SIZE,
+                omit_raw_text=config_model.omit_raw_text,
+                # one Pinecone upsert request per call, so the sizer adapts to the latency of single requests
+                upsert_batch_sizer=AdaptiveBatchSizer(
+                    initial_size=PINECONE_BATCH_SIZE, maximum_size=PINECONE_BATCH_SIZE, max_payload_bytes=PINECONE_MAX_REQUEST_BYTES
+                ),
+                upsert_workers=PARALLELISM_LIMIT,
             )
             yield from writer.write(configured_catalog, input_messages)
         except Exception as e:
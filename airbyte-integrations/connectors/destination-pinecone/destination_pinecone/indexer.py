@@ -26,6 +26,9 @@ PARALLELISM_LIMIT = 4
 
 MAX_METADATA_SIZE = 40_960 - 10_000
 
+# upsert requests are limited to 2MB
+PINECONE_MAX_REQUEST_BYTES = 2 * 1024 * 1024 - 64 * 1024
+
 MAX_IDS_PER_DELETE = 1000
 
 AIRBYTE_TAG = "airbyte"
@@ -127,6 +130,13 @@ class PineconeIndexer(Indexer):
         return result
 
     def index(self, document_chunks, namespace, streamName):
+        self.upsert_vectors(self.create_vectors(document_chunks, streamName), namespace)
+
+    def create_vectors(self, document_chunks, streamName):
+        """
+        Return the (id, embedding, metadata) tuples upserted for the chunks. The IDs are random,
+        so a retried upsert has to send the same tuples again to overwrite, rather than duplicate, the vectors.
+        """
         pinecone_docs = []
         for i in range(len(document_chunks)):
             chunk = document_chunks[i]
@@ -135,6 +145,9 @@ class PineconeIndexer(Indexer):
                 metadata["text"] = chunk.page_content
             prefix = streamName
             pinecone_docs.append((prefix + "#" + str(uuid.uuid4()), chunk.embedding, metadata))
+        return pinecone_docs
+
+    def upsert_vectors(self, pinecone_docs, namespace):
         serial_batches = create_chunks(pinecone_docs, batch_size=PINECONE_BATCH_SIZE * PARALLELISM_LIMIT)
         for batch in serial_batches:
             async_results = []
@@ -0,0 +1,336 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk, DocumentProcessor
+from airbyte_cdk.destinations.vector_db_based.embedder import Embedder
+from airbyte_cdk.destinations.vector_db_based.writer import Writer
+from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from destination_pinecone.indexer import PineconeIndexer
+
+
+logger = logging.getLogger("airbyte")
+
+T = TypeVar("T")
+
+MAX_ATTEMPTS = 6
+INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 60.0
+
+RETRYABLE_GRPC_CODES = {"RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED"}
+
+_StreamKey = Tuple[str, str]
+_UpsertRequest = Tuple[Dict[_StreamKey, List[str]], Dict[_StreamKey, List[Chunk]]]
+
+
+def _status_code(exception: BaseException) -> Optional[int]:
+    for candidate in (exception, getattr(exception, "response", None)):
+        for attribute in ("status_code", "status"):
+            value = getattr(candidate, attribute, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_retryable_error(exception: BaseException) -> bool:
+    """
+    Return True for errors which mean the request was throttled or hit a transient server error.
+
+    HTTP clients report this as a 429 or 5xx status, gRPC clients as a RESOURCE_EXHAUSTED or
+    UNAVAILABLE status code. Wrapped exceptions are followed through `__cause__`.
+    """
+    while exception is not None:
+        status_code = _status_code(exception)
+        if status_code is not None and (status_code == 429 or 500 <= status_code < 600):
+            return True
+        grpc_code = getattr(exception, "code", None)
+        if callable(grpc_code):
+            try:
+                if getattr(grpc_code(), "name", None) in RETRYABLE_GRPC_CODES:
+                    return True
+            except Exception:
+                pass
+        exception = exception.__cause__
+    return False
+
+
+@dataclass
+class StageMetrics:
+    """Throughput counters for one stage of the pipeline, updated by the upsert workers concurrently."""
+
+    name: str
+    calls: int = 0
+    items: int = 0
+    payload_bytes: int = 0
+    busy_seconds: float = 0.0
+    retries: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, items: int, payload_bytes: int, seconds: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self.items += items
+            self.payload_bytes += payload_bytes
+            self.busy_seconds += seconds
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.name}: {self.items:,} chunks in {self.calls:,} calls, {self.payload_bytes / 1024 / 1024:.1f} MiB, "
+            f"{self.busy_seconds:.1f}s busy ({self.items_per_second:.1f} chunks/s), {self.retries} retries"
+        )
+
+
+class AdaptiveBatchSizer:
+    """
+    Chooses how many chunks to send per upsert request.
+
+    The size grows additively while requests complete within `target_latency_seconds`, and is
+    halved when a request is slower than twice the target or gets throttled. Independently, a
+    request never carries more than `max_payload_bytes` of estimated payload.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        minimum_size: int = 1,
+        maximum_size: Optional[int] = None,
+        target_latency_seconds: float = 2.0,
+        max_payload_bytes: Optional[int] = None,
+    ) -> None:
+        self.minimum_size = minimum_size
+        self.maximum_size = maximum_size or initial_size
+        self.target_latency_seconds = target_latency_seconds
+        self.max_payload_bytes = max_payload_bytes
+        self._size = max(minimum_size, min(initial_size, self.maximum_size))
+        self._step = max(1, self.maximum_size // 16)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def record_success(self, latency_seconds: float) -> None:
+        with self._lock:
+            if latency_seconds > 2 * self.target_latency_seconds:
+                self._size = max(self.minimum_size, self._size // 2)
+            elif latency_seconds < self.target_latency_seconds:
+                self._size = min(self.maximum_size, self._size + self._step)
+
+    def record_throttled(self) -> None:
+        with self._lock:
+            self._size = max(self.minimum_size, self._size // 2)
+
+    def split(self, chunks: List[Chunk]) -> Iterable[Tuple[List[Chunk], int]]:
+        """Split chunks into request-sized batches, yielding each batch with its estimated payload size."""
+        start = 0
+        while start < len(chunks):
+            batch_size = self.size
+            end = start
+            payload_bytes = 0
+            while end < len(chunks) and end - start < batch_size:
+                chunk_bytes = estimate_chunk_bytes(chunks[end])
+                if self.max_payload_bytes is not None and end > start and payload_bytes + chunk_bytes > self.max_payload_bytes:
+                    break
+                payload_bytes += chunk_bytes
+                end += 1
+            yield chunks[start:end], payload_bytes
+            start = end
+
+
+def estimate_chunk_bytes(chunk: Chunk) -> int:
+    """Rough size of a chunk on the wire: its text, metadata and one float per embedding dimension."""
+    return len(chunk.page_content or "") + len(str(chunk.metadata)) + 8 * len(chunk.embedding or ())
+
+
+class PipelinedWriter(Writer):
+    """
+    A `Writer` which overlaps embedding with indexing.
+
+    Batches are embedded on the calling thread and handed to a background thread, which deletes
+    outdated records and indexes the new chunks while the next batch is being read and embedded.
+    Batches are indexed strictly in order, and all deletes of a batch are executed before any of
+    its chunks are indexed, so the result is the same as with the sequential `Writer`. At most
+    one embedded batch waits for the indexing thread, which bounds memory.
+
+    Each batch is split into upsert requests sized by an `AdaptiveBatchSizer`. With more than one
+    `upsert_workers`, the requests of a batch are sent concurrently. Throttling and transient server
+    errors (see `is_retryable_error`) are retried with exponential backoff. The vectors of a request
+    are created once, before its first attempt, so a retry upserts the same vector IDs again: an
+    upsert which was committed before it timed out is overwritten, not duplicated. An indexer whose
+    upserts can't be repeated safely is used with `retry_upserts=False`, its upserts are attempted once.
+    """
+
+    def __init__(
+        self,
+        processing_config: ProcessingConfigModel,
+        indexer: PineconeIndexer,
+        embedder: Embedder,
+        batch_size: int,
+        omit_raw_text: bool,
+        upsert_batch_sizer: Optional[AdaptiveBatchSizer] = None,
+        upsert_workers: int = 1,
+        retry_upserts: bool = True,
+    ) -> None:
+        super().__init__(processing_config, indexer, embedder, batch_size=batch_size, omit_raw_text=omit_raw_text)
+        self.upsert_batch_sizer = upsert_batch_sizer or AdaptiveBatchSizer(initial_size=batch_size)
+        self.upsert_workers = upsert_workers
+        self.retry_upserts = retry_upserts
+        self.embed_metrics = StageMetrics("embed")
+        self.delete_metrics = StageMetrics("delete")
+        self.upsert_metrics = StageMetrics("upsert")
+        self._queue: "queue.Queue[Optional[_UpsertRequest]]" = queue.Queue(maxsize=1)
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _call_with_backoff(self, function: Callable[[], T], metrics: StageMetrics) -> T:
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return function()
+            except Exception as e:
+                if attempt == MAX_ATTEMPTS - 1 or not is_retryable_error(e):
+                    raise
+                if metrics is self.upsert_metrics:
+                    self.upsert_batch_sizer.record_throttled()
+                metrics.record_retry()
+                delay = min(MAX_BACKOFF_SECONDS, INITIAL_BACKOFF_SECONDS * 2**attempt) * random.uniform(0.5, 1.0)
+                logger.warning(f"{metrics.name} request failed with a retryable error, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    def _process_batch(self) -> None:
+        if self._thread is None:
+            # Not running inside `write()`, behave like the sequential writer.
+            super()._process_batch()
+            return
+
+        for chunks in self.chunks.values():
+            documents = [self._convert_to_document(chunk) for chunk in chunks]
+            started = time.monotonic()
+            embeddings = self._call_with_backoff(lambda: self.embedder.embed_documents(documents), self.embed_metrics)
+            self.embed_metrics.record(len(chunks), sum(len(document.page_content) for document in documents), time.monotonic() - started)
+            for chunk, embedding in zip(chunks, embeddings):
+                chunk.embedding = embedding
+                if self.omit_raw_text:
+                    chunk.page_content = None
+
+        if self.chunks or self.ids_to_delete:
+            self._raise_if_failed()
+            self._queue.put((dict(self.ids_to_delete), dict(self.chunks)))
+        self._init_batch()
+
+    def _index(self, chunks: List[Chunk], payload_bytes: int, namespace: str, stream: str) -> None:
+        vectors = self.indexer.create_vectors(chunks, stream)
+        started = time.monotonic()
+        if self.retry_upserts:
+            self._call_with_backoff(lambda: self.indexer.upsert_vectors(vectors, namespace), self.upsert_metrics)
+        else:
+            self.indexer.upsert_vectors(vectors, namespace)
+        latency = time.monotonic() - started
+        self.upsert_batch_sizer.record_success(latency)
+        self.upsert_metrics.record(len(chunks), payload_bytes, latency)
+
+    def _upsert(self, request: _UpsertRequest) -> None:
+        ids_to_delete, chunks_by_stream = request
+        for (namespace, stream), ids in ids_to_delete.items():
+            started = time.monotonic()
+            self._call_with_backoff(lambda: self.indexer.delete(ids, namespace, stream), self.delete_metrics)
+            self.delete_metrics.record(len(ids), 0, time.monotonic() - started)
+
+        for (namespace, stream), chunks in chunks_by_stream.items():
+            batches = self.upsert_batch_sizer.split(chunks)
+            if self._executor is None:
+                for batch, payload_bytes in batches:
+                    self._index(batch, payload_bytes, namespace, stream)
+            else:
+                futures = [self._executor.submit(self._index, batch, payload_bytes, namespace, stream) for batch, payload_bytes in batches]
+                for future in futures:
+                    future.result()
+
+    def _run(self) -> None:
+        while True:
+            request = self._queue.get()
+            try:
+                if request is None:
+                    return
+                if self._error is None:
+                    self._upsert(request)
+            except BaseException as e:  # noqa: BLE001  # Re-raised on the writer thread.
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _wait(self) -> None:
+        """Block until every embedded batch has been indexed."""
+        self._queue.join()
+        self._raise_if_failed()
+
+    def _start(self) -> None:
+        self._error = None
+        if self.upsert_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.upsert_workers, thread_name_prefix="vector-db-upsert")
+        self._thread = threading.Thread(target=self._run, name="vector-db-indexer", daemon=True)
+        self._thread.start()
+
+    def _stop(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def log_metrics(self) -> None:
+        for metrics in (self.embed_metrics, self.delete_metrics, self.upsert_metrics):
+            logger.info(metrics.summary())
+        logger.info(f"Upsert batch size settled at {self.upsert_batch_sizer.size} chunks.")
+
+    def write(self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
+        self.processor = DocumentProcessor(self.processing_config, configured_catalog)
+        self.indexer.pre_sync(configured_catalog)
+        self._start()
+        try:
+            for message in input_messages:
+                if message.type == Type.STATE:
+                    # All records before a state message must be indexed before the state is emitted.
+                    self._process_batch()
+                    self._wait()
+                    yield message
+                elif message.type == Type.RECORD:
+                    record_chunks, record_id_to_delete = self.processor.process(message.record)
+                    self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
+                    if record_id_to_delete is not None:
+                        self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
+                    self.number_of_chunks += len(record_chunks)
+                    if self.number_of_chunks >= self.batch_size:
+                        self._process_batch()
+
+            self._process_batch()
+            self._wait()
+        finally:
+            self._stop()
+        self.log_metrics()
+        yield from self.indexer.post_sync()
@@ -4,7 +4,7 @@
 
 import logging
 import unittest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 from destination_pinecone.config import ConfigModel
 from destination_pinecone.destination import DestinationPinecone
@@ -87,7 +87,7 @@ class TestDestinationPinecone(unittest.TestCase):
             result = destination.check(self.logger, self.config)
         self.assertEqual(result.status, Status.FAILED)
 
-    @patch("destination_pinecone.destination.Writer")
+    @patch("destination_pinecone.destination.PipelinedWriter")
     @patch("destination_pinecone.destination.PineconeIndexer")
     @patch("destination_pinecone.destination.create_from_config")
     def test_write(self, MockedEmbedder, MockedPineconeIndexer, MockedWriter):
@@ -107,7 +107,16 @@ class TestDestinationPinecone(unittest.TestCase):
         destination = DestinationPinecone()
         list(destination.write(self.config, configured_catalog, input_messages))
 
-        MockedWriter.assert_called_once_with(self.config_model.processing, mock_indexer, mock_embedder, batch_size=32, omit_raw_text=False)
+        MockedWriter.assert_called_once_with(
+            self.config_model.processing,
+            mock_indexer,
+            mock_embedder,
+            batch_size=160,
+            omit_raw_text=False,
+            upsert_batch_sizer=ANY,
+            upsert_workers=4,
+        )
+        self.assertEqual(MockedWriter.call_args.kwargs["upsert_batch_sizer"].maximum_size, 40)
         mock_writer.write.assert_called_once_with(configured_catalog, input_messages)
 
     def test_spec(self):
@@ -9,11 +9,11 @@ from airbyte_cdk.destinations import Destination
 from airbyte_cdk.destinations.vector_db_based.document_processor import DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Embedder, create_from_config
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
-from airbyte_cdk.destinations.vector_db_based.writer import Writer
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from destination_qdrant.config import ConfigModel
 from destination_qdrant.indexer import QdrantIndexer
+from destination_qdrant.pipelined_writer import PipelinedWriter
 
 
 BATCH_SIZE = 256
@@ -32,7 +32,7 @@ class DestinationQdrant(Destination):
     ) -> Iterable[AirbyteMessage]:
         config_model = ConfigModel.parse_obj(config)
         self._init_indexer(config_model)
-        writer = Writer(
+        writer = PipelinedWriter(
             config_model.processing, self.indexer, self.embedder, batch_size=BATCH_SIZE, omit_raw_text=config_model.omit_raw_text
         )
         yield from writer.write(configured_catalog, input_messages)
@@ -102,6 +102,13 @@ class QdrantIndexer(Indexer):
             )
 
     def index(self, document_chunks, namespace, stream):
+        self.upsert_vectors(self.create_vectors(document_chunks, stream), namespace)
+
+    def create_vectors(self, document_chunks, stream):
+        """
+        Return the records uploaded for the chunks. The IDs are random, so a retried upload has to send
+        the same records again to overwrite, rather than duplicate, the points.
+        """
         entities = []
         for i in range(len(document_chunks)):
             chunk = document_chunks[i]
@@ -115,6 +122,9 @@ class QdrantIndexer(Indexer):
                     vector=chunk.embedding,
                 )
             )
+        return entities
+
+    def upsert_vectors(self, entities, namespace):
         self._client.upload_records(collection_name=self.config.collection, records=entities)
 
     def post_sync(self) -> List[AirbyteMessage]:
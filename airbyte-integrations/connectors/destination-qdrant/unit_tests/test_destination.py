@@ -72,7 +72,7 @@ class TestDestinationQdrant(unittest.TestCase):
         mock_embedder.check.assert_called_once()
         mock_indexer.check.assert_called_once()
 
-    @patch("destination_qdrant.destination.Writer")
+    @patch("destination_qdrant.destination.PipelinedWriter")
     @patch("destination_qdrant.destination.QdrantIndexer")
     @patch("destination_qdrant.destination.create_from_config")
     def test_write(self, MockedEmbedder, MockedQdrantIndexer, MockedWriter):
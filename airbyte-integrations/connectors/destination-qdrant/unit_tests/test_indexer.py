@@ -157,6 +157,16 @@ class TestQdrantIndexer(unittest.TestCase):
 
         self.qdrant_indexer._client.upload_records.assert_called_once()
 
+    def test_upsert_vectors_uploads_the_same_records_again(self):
+        records = self.qdrant_indexer.create_vectors(
+            [Mock(metadata={"key": "value1"}, page_content="some content", embedding=[1.0, 2.0, 3.0])], "some_stream"
+        )
+        self.qdrant_indexer.upsert_vectors(records, None)
+        self.qdrant_indexer.upsert_vectors(records, None)
+
+        first_upload, second_upload = self.qdrant_indexer._client.upload_records.call_args_list
+        self.assertEqual(first_upload.kwargs["records"][0].id, second_upload.kwargs["records"][0].id)
+
     def test_index_calls_delete(self):
         self.qdrant_indexer.delete(["some_id", "another_id"], None, "some_stream")
 
@@ -6,10 +6,12 @@ from __future__ import annotations
 import abc
 import contextlib
 import enum
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, cast, final
+from typing import TYPE_CHECKING, Any, Optional, cast, final
 
 import pandas as pd
 import sqlalchemy
@@ -27,7 +29,7 @@ from airbyte.strategies import WriteStrategy
 from airbyte.types import SQLTypeConverter
 from airbyte_protocol.models.airbyte_protocol import DestinationSyncMode
 from pandas import Index
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from sqlalchemy import (
     Column,
     Table,
@@ -82,6 +84,8 @@ class SqlConfig(BaseModel, abc.ABC):
     table_prefix: Optional[str] = ""
     """A prefix to add to created table names."""
 
+    _sql_engine: Any = PrivateAttr(default=None)
+
     @abc.abstractmethod
     def get_sql_alchemy_url(self) -> SecretString:
         """Returns a SQL Alchemy URL."""
@@ -105,14 +109,20 @@ class SqlConfig(BaseModel, abc.ABC):
             ) from ex
 
     def get_sql_engine(self) -> Engine:
-        """Return a new SQL engine to use."""
-        return create_engine(
-            url=self.get_sql_alchemy_url(),
-            echo=DEBUG_MODE,
-            execution_options={
-                "schema_translate_map": {None: self.schema_name},
-            },
-        )
+        """Return the SQL engine to use, creating it on first use.
+
+        The engine is shared by every caller, so its connection pool is reused instead of
+        opening a new connection for each statement.
+        """
+        if self._sql_engine is None:
+            self._sql_engine = create_engine(
+                url=self.get_sql_alchemy_url(),
+                echo=DEBUG_MODE,
+                execution_options={
+                    "schema_translate_map": {None: self.schema_name},
+                },
+            )
+        return self._sql_engine
 
     def get_vendor_client(self) -> object:
         """Return the vendor-specific client object.
@@ -152,7 +162,13 @@ class SqlProcessorBase(RecordProcessorBase):
         file_writer: FileWriterBase | None = None,
         temp_dir: Path | None = None,
         temp_file_cleanup: bool,
+        max_finalize_workers: int = 1,
     ) -> None:
+        """Initialize the processor.
+
+        `max_finalize_workers` is the number of streams which may be finalized concurrently at the
+        end of a sync, each over its own pooled connection.
+        """
         if not temp_dir and not file_writer:
             raise exc.PyAirbyteInternalError(
                 message="Either `temp_dir` or `file_writer` must be provided.",
@@ -161,6 +177,9 @@ class SqlProcessorBase(RecordProcessorBase):
         state_writer = state_writer or StdOutStateWriter()
 
         self._sql_config: SqlConfig = sql_config
+        self._max_finalize_workers = max(1, max_finalize_workers)
+        self._finalization_lock = threading.Lock()
+        """Guards the batch and state bookkeeping shared by streams finalized concurrently."""
 
         super().__init__(
             state_writer=state_writer,
@@ -473,6 +492,40 @@ class SqlProcessorBase(RecordProcessorBase):
 
         return columns
 
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Finalize any pending writes.
+
+        Streams are independent of each other, so up to `max_finalize_workers` of them are
+        finalized at the same time. Each stream's state messages are still only emitted once
+        that stream's data has been committed. If a stream fails, streams which have not started
+        yet are skipped and the first error is raised.
+        """
+        stream_names = list(self.catalog_provider.stream_names)
+        if self._max_finalize_workers <= 1 or len(stream_names) <= 1:
+            super().write_all_stream_data(write_strategy)
+            return
+
+        # Do the shared setup once up front, so that each worker only touches its own stream.
+        self.file_writer.flush_active_batches()
+        self._ensure_schema_exists()
+        self.get_sql_engine()
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_finalize_workers, len(stream_names)),
+            thread_name_prefix="finalize",
+        ) as executor:
+            futures = [
+                executor.submit(self.write_stream_data, stream_name, write_strategy=write_strategy)
+                for stream_name in stream_names
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
     @final
     def write_stream_data(
         self,
@@ -526,7 +579,8 @@ class SqlProcessorBase(RecordProcessorBase):
             finally:
                 self._drop_temp_table(temp_table_name, if_exists=True)
 
-        progress.log_stream_finalized(stream_name)
+        with self._finalization_lock:
+            progress.log_stream_finalized(stream_name)
 
         # Return the batch handles as measure of work completed.
         return batches_to_finalize
@@ -548,21 +602,25 @@ class SqlProcessorBase(RecordProcessorBase):
 
         Returns a mapping of batch IDs to batch handles, for those processed batches.
         """
-        batches_to_finalize: list[BatchHandle] = self.file_writer.get_pending_batches(stream_name)
-        state_messages_to_finalize: list[AirbyteStateMessage] = self._pending_state_messages[
-            stream_name
-        ].copy()
-        self._pending_state_messages[stream_name].clear()
+        with self._finalization_lock:
+            batches_to_finalize: list[BatchHandle] = self.file_writer.get_pending_batches(
+                stream_name
+            )
+            state_messages_to_finalize: list[AirbyteStateMessage] = self._pending_state_messages[
+                stream_name
+            ].copy()
+            self._pending_state_messages[stream_name].clear()
 
-        progress.log_batches_finalizing(stream_name, len(batches_to_finalize))
+            progress.log_batches_finalizing(stream_name, len(batches_to_finalize))
         yield batches_to_finalize
-        self._finalize_state_messages(state_messages_to_finalize)
-        progress.log_batches_finalized(stream_name, len(batches_to_finalize))
+        with self._finalization_lock:
+            self._finalize_state_messages(state_messages_to_finalize)
+            progress.log_batches_finalized(stream_name, len(batches_to_finalize))
 
-        for batch_handle in batches_to_finalize:
-            batch_handle.finalized = True
+            for batch_handle in batches_to_finalize:
+                batch_handle.finalized = True
 
-        self._finalized_state_messages[stream_name] += state_messages_to_finalize
+            self._finalized_state_messages[stream_name] += state_messages_to_finalize
 
     def _execute_sql(self, sql: str | TextClause | Executable) -> CursorResult:
         """Execute the given SQL statement."""
@@ -68,6 +68,23 @@ class SnowflakeCortexIndexingModel(BaseModel):
 
     credentials: PasswordBasedAuthorizationModel
 
+    embedding_cache: bool = Field(
+        default=False,
+        title="Cache Embeddings",
+        order=8,
+        description="Store the embedding of each chunk in the `_airbyte_embedding_cache` table, and reuse it "
+        "instead of calling the embedding model again when the same text is synced with the same model.",
+    )
+    finalize_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=8,
+        title="Stream Finalization Concurrency",
+        order=9,
+        description="Number of streams whose data is written to their final tables at the same time at the end "
+        "of a sync, each over its own database connection.",
+    )
+
     class Config:
         title = "Snowflake Connection"
         schema_extra = {
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import uuid
+from functools import cached_property
 from pathlib import Path
 from textwrap import dedent, indent
 from typing import TYPE_CHECKING, Any
@@ -12,8 +13,10 @@ import dpath
 import sqlalchemy
 from airbyte._processors.file.jsonl import JsonlWriter
 from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
 from airbyte.types import SQLTypeConverter
 from airbyte_cdk.destinations.vector_db_based import embedder
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.destinations.vector_db_based.document_processor import (
     DocumentProcessor as DocumentSplitter,
 )
@@ -30,6 +33,11 @@ from typing_extensions import Protocol
 
 from destination_snowflake_cortex.common.catalog.catalog_providers import CatalogProvider
 from destination_snowflake_cortex.common.sql.sql_processor import SqlConfig, SqlProcessorBase
+from destination_snowflake_cortex.embedding_cache import (
+    UNCACHEABLE_EMBEDDING_MODES,
+    EmbeddingCache,
+    embedding_model_fingerprint,
+)
 from destination_snowflake_cortex.globals import (
     CHUNK_ID_COLUMN,
     DOCUMENT_CONTENT_COLUMN,
@@ -121,6 +129,10 @@ class SnowflakeTypeConverter(SQLTypeConverter):
         return VARIANT()
 
 
+EMBEDDING_BATCH_SIZE = 256
+"""Number of chunks collected across records before they are embedded together."""
+
+
 class EmbeddingConfig(Protocol):
     """A protocol for embedding configuration.
 
@@ -153,16 +165,41 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         catalog_provider: CatalogProvider,
         temp_dir: Path,
         temp_file_cleanup: bool = True,
+        use_embedding_cache: bool = False,
+        max_finalize_workers: int = 1,
     ) -> None:
-        """Initialize the Snowflake processor."""
+        """Initialize the Snowflake processor.
+
+        With `use_embedding_cache`, embeddings are cached in a side table keyed by embedding
+        model and chunk text, so unchanged chunks are not sent to the embedding model again.
+        The cache is not used when Cortex computes the embeddings in Snowflake.
+
+        Up to `max_finalize_workers` streams are finalized concurrently at the end of the sync.
+        """
         self.splitter_config = splitter_config
         self.embedder_config = embedder_config
+        self._pending_records: list[tuple[AirbyteRecordMessage, list[Chunk]]] = []
+        self._pending_chunk_count = 0
         super().__init__(
             sql_config=sql_config,
             catalog_provider=catalog_provider,
             temp_dir=temp_dir,
             temp_file_cleanup=temp_file_cleanup,
+            max_finalize_workers=max_finalize_workers,
         )
+        self.embedding_cache: EmbeddingCache | None = None
+        if (
+            use_embedding_cache
+            and embedder_config.mode not in UNCACHEABLE_EMBEDDING_MODES
+            and not sql_config.cortex_embedding_model
+        ):
+            self.embedding_cache = EmbeddingCache(
+                self.get_sql_connection,
+                model_fingerprint=embedding_model_fingerprint(
+                    embedder_config,  # type: ignore [arg-type]  # All embedding configs are pydantic models
+                    self.embedding_dimensions,
+                ),
+            )
 
     def _get_sql_column_definitions(
         self,
@@ -310,28 +347,64 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
 
         We override the SQLProcessor implementation in order to handle chunking, embedding, etc.
 
-        This method is called for each record message, before the record is written to local file.
+        This method is called for each record message. Chunks are embedded in batches of
+        `EMBEDDING_BATCH_SIZE` across records, and then written to local files.
         """
         document_chunks, id_to_delete = self.splitter.process(record_msg)
 
         # TODO: Decide if we need to incorporate this into the final implementation:
         _ = id_to_delete
 
-        if not self.sql_config.cortex_embedding_model:
-            embeddings = self.embedder.embed_documents(
-                # TODO: Check this: Expects a list of documents, not chunks (docs are inconsistent)
-                documents=document_chunks,
+        self._pending_records.append((record_msg, document_chunks))
+        self._pending_chunk_count += len(document_chunks)
+        if self._pending_chunk_count >= EMBEDDING_BATCH_SIZE:
+            self._embed_pending_records()
+
+    def _embed_chunks(self, chunks: list[Chunk]) -> list[list[float] | None]:
+        if self.sql_config.cortex_embedding_model:
+            # Embeddings are calculated by Cortex while loading.
+            return [None] * len(chunks)
+        if self.embedding_cache is not None:
+            return self.embedding_cache.embed_chunks(self.embedder, chunks)  # type: ignore [return-value]
+        return self.embedder.embed_documents(  # type: ignore [return-value]
+            # TODO: Check this: Expects a list of documents, not chunks (docs are inconsistent)
+            documents=chunks,  # type: ignore [arg-type]
+        )
+
+    def _embed_pending_records(self) -> None:
+        """Embed the chunks of all pending records and write them to local files."""
+        pending_records, self._pending_records = self._pending_records, []
+        self._pending_chunk_count = 0
+        all_chunks = [chunk for _, chunks in pending_records for chunk in chunks]
+        if not all_chunks:
+            return
+
+        embeddings = iter(self._embed_chunks(all_chunks))
+        for record_msg, document_chunks in pending_records:
+            self._write_chunks(
+                record_msg, document_chunks, [next(embeddings) for _ in document_chunks]
             )
-        for i, chunk in enumerate(document_chunks, start=0):
+
+    @overrides
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Embed any pending records before finalizing the streams."""
+        self._embed_pending_records()
+        super().write_all_stream_data(write_strategy)
+
+    def _write_chunks(
+        self,
+        record_msg: AirbyteRecordMessage,
+        document_chunks: list[Chunk],
+        embeddings: list[list[float] | None],
+    ) -> None:
+        for chunk, embedding in zip(document_chunks, embeddings):
             new_data: dict[str, Any] = {
                 DOCUMENT_ID_COLUMN: self._create_document_id(record_msg),
                 CHUNK_ID_COLUMN: str(uuid.uuid4().int),
                 METADATA_COLUMN: chunk.metadata,
                 DOCUMENT_CONTENT_COLUMN: chunk.page_content,
-                EMBEDDING_COLUMN: None,
+                EMBEDDING_COLUMN: embedding,
             }
-            if not self.sql_config.cortex_embedding_model:
-                new_data[EMBEDDING_COLUMN] = embeddings[i]
 
             self.file_writer.process_record_message(
                 record_msg=AirbyteRecordMessage(
@@ -395,7 +468,7 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         """
         pass
 
-    @property
+    @cached_property
     def embedder(self) -> embedder.Embedder:
         return embedder.create_from_config(
             embedding_config=self.embedder_config,  # type: ignore [arg-type]  # No common base class
@@ -407,7 +480,7 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         """Return the number of dimensions for the embeddings."""
         return self.embedder.embedding_dimensions
 
-    @property
+    @cached_property
     def splitter(self) -> DocumentSplitter:
         return DocumentSplitter(
             config=self.splitter_config,
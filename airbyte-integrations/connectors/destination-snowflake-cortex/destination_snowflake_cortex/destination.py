@@ -48,6 +48,8 @@ class DestinationSnowflakeCortex(Destination):
             catalog_provider=CatalogProvider(configured_catalog),
             temp_dir=Path(tempfile.mkdtemp()),
             temp_file_cleanup=True,
+            use_embedding_cache=config.indexing.embedding_cache,
+            max_finalize_workers=config.indexing.finalize_concurrency,
         )
 
     def write(
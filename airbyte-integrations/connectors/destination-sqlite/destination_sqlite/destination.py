@@ -2,18 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import datetime
-import json
 import logging
 import os
 import sqlite3
-import uuid
 from asyncio.log import logger
-from collections import defaultdict
 from typing import Any, Iterable, Mapping
 
 from airbyte_cdk.destinations import Destination
-from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
+from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, Status, Type
+from destination_sqlite.writer import PrimaryKeyIndex, SqliteWriter
 
 
 class DestinationSqlite(Destination):
@@ -56,65 +53,24 @@ class DestinationSqlite(Destination):
         if path is None:
             path = ""
         path = self._get_destination_path(path)
-        con = sqlite3.connect(path)
-        with con:
-            # create the tables if needed
-            for configured_stream in configured_catalog.streams:
-                name = configured_stream.stream.name
-                table_name = f"_airbyte_raw_{name}"
-                if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
-                    # delete the tables
-                    query = """
-                    DROP TABLE IF EXISTS {}
-                    """.format(table_name)
-                    con.execute(query)
-                # create the table if needed
-                query = """
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    _airbyte_ab_id TEXT PRIMARY KEY,
-                    _airbyte_emitted_at TEXT,
-                    _airbyte_data TEXT
-                )
-                """.format(table_name=table_name)
-                con.execute(query)
-
-            buffer = defaultdict(list)
-
-            for message in input_messages:
-                if message.type == Type.STATE:
-                    # flush the buffer
-                    for stream_name in buffer.keys():
-                        query = """
-                        INSERT INTO {table_name}
-                        VALUES (?,?,?)
-                        """.format(table_name=f"_airbyte_raw_{stream_name}")
-
-                        con.executemany(query, buffer[stream_name])
-
-                    con.commit()
-                    buffer = defaultdict(list)
-
-                    yield message
-                elif message.type == Type.RECORD:
-                    data = message.record.data
-                    stream = message.record.stream
-                    if stream not in streams:
-                        logger.debug(f"Stream {stream} was not present in configured streams, skipping")
-                        continue
-
-                    # add to buffer
-                    buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
-
-            # flush any remaining messages
-            for stream_name in buffer.keys():
-                query = """
-                INSERT INTO {table_name}
-                VALUES (?,?,?)
-                """.format(table_name=f"_airbyte_raw_{stream_name}")
-
-                con.executemany(query, buffer[stream_name])
-
-            con.commit()
+        primary_key_index = config.get("primary_key_index") or PrimaryKeyIndex.IMMEDIATE
+        # Keep one prepared insert statement per stream in sqlite3's statement cache.
+        con = sqlite3.connect(path, cached_statements=max(128, len(streams)))
+        try:
+            with SqliteWriter(con, configured_catalog, primary_key_index=primary_key_index) as writer:
+                for message in input_messages:
+                    if message.type == Type.STATE:
+                        writer.flush()
+                        yield message
+                    elif message.type == Type.RECORD:
+                        stream = message.record.stream
+                        if stream not in streams:
+                            logger.debug(f"Stream {stream} was not present in configured streams, skipping")
+                            continue
+
+                        writer.write(stream, message.record.data)
+        finally:
+            con.close()
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
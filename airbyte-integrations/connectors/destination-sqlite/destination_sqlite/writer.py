@@ -0,0 +1,189 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+"""Streaming writer which loads raw records into SQLite in bounded batches."""
+
+import datetime
+import json
+import logging
+import sqlite3
+import uuid
+from enum import Enum
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from airbyte_cdk.models import ConfiguredAirbyteCatalog, DestinationSyncMode
+
+
+logger = logging.getLogger("airbyte")
+
+MAX_BATCH_ROWS = 10_000
+MAX_BATCH_BYTES = 16 * 1024 * 1024
+
+Row = Tuple[str, str, str]
+
+
+class PrimaryKeyIndex(str, Enum):
+    """How the `_airbyte_ab_id` primary key of tables recreated by overwrite syncs is maintained."""
+
+    IMMEDIATE = "immediate"
+    """A rowid table with a primary key index that is updated on every insert. This is the default."""
+
+    DEFERRED = "deferred"
+    """A rowid table without a primary key, whose unique index is built once after the data is loaded."""
+
+    WITHOUT_ROWID = "without_rowid"
+    """A `WITHOUT ROWID` table clustered on the primary key, so no separate index is maintained."""
+
+
+def raw_table_name(stream_name: str) -> str:
+    return f"_airbyte_raw_{stream_name}"
+
+
+class _RecordIds:
+    """Generates UUID-shaped record ids from a random per-sync prefix and a counter.
+
+    The ids are unique within a sync and across syncs like `uuid4` ones, but they are much cheaper
+    to generate and they increase monotonically, which keeps primary key inserts at the end of the
+    index instead of scattering them across it.
+    """
+
+    def __init__(self) -> None:
+        self._prefix = str(uuid.uuid4())[:24]
+        self._counter = 0
+
+    def next(self) -> str:
+        self._counter += 1
+        return f"{self._prefix}{self._counter:012x}"
+
+
+class SqliteWriter:
+    """Writes records into the raw tables of a SQLite database.
+
+    Records are buffered per stream and inserted with `executemany` whenever a stream's buffer
+    reaches `max_batch_rows` rows or `max_batch_bytes` bytes of JSON, so memory use doesn't depend on
+    how many records arrive between two state messages. Inserted batches only become visible when
+    `commit` is called.
+
+    The writer is a context manager: while it is open, the database uses write-ahead logging and
+    `synchronous=NORMAL`, which avoids an fsync per committed transaction. The original journal
+    mode is restored on exit.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        configured_catalog: ConfiguredAirbyteCatalog,
+        primary_key_index: PrimaryKeyIndex = PrimaryKeyIndex.IMMEDIATE,
+        max_batch_rows: int = MAX_BATCH_ROWS,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+    ) -> None:
+        self._connection = connection
+        self._configured_catalog = configured_catalog
+        self._primary_key_index = PrimaryKeyIndex(primary_key_index)
+        self._max_batch_rows = max_batch_rows
+        self._max_batch_bytes = max_batch_bytes
+
+        # The statement text is built once per table, so sqlite3's statement cache keeps it prepared.
+        self._insert_statements: Dict[str, str] = {}
+        self._deferred_indexes: List[str] = []
+        self._buffers: Dict[str, List[Row]] = {}
+        self._buffer_bytes: Dict[str, int] = {}
+        self._record_ids = _RecordIds()
+        self._emitted_at = ""
+        self._original_journal_mode: Optional[str] = None
+        self.records_written = 0
+        self.batches_written = 0
+
+    def __enter__(self) -> "SqliteWriter":
+        self._original_journal_mode = self._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+        self._start_batch()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.flush()
+            self._build_deferred_indexes()
+        else:
+            # Whatever was inserted since the last state message is not acknowledged, so drop it.
+            self._connection.rollback()
+            # Still index the committed data, so that later append syncs keep the ids unique.
+            try:
+                self._build_deferred_indexes()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not build the deferred primary key indexes: {e}")
+        self._connection.commit()
+        self._restore_journal_mode()
+        logger.info(f"Wrote {self.records_written:,} records to SQLite in {self.batches_written:,} batches")
+
+    def _create_tables(self) -> None:
+        with self._connection:
+            for configured_stream in self._configured_catalog.streams:
+                stream_name = configured_stream.stream.name
+                table_name = raw_table_name(stream_name)
+                overwrite = configured_stream.destination_sync_mode == DestinationSyncMode.overwrite
+                if overwrite:
+                    self._connection.execute(f"DROP TABLE IF EXISTS {table_name}")
+                self._connection.execute(self._create_table_statement(table_name, overwrite))
+                self._insert_statements[stream_name] = f"INSERT INTO {table_name} VALUES (?,?,?)"
+                self._buffers[stream_name] = []
+                self._buffer_bytes[stream_name] = 0
+
+    def _create_table_statement(self, table_name: str, overwrite: bool) -> str:
+        primary_key_index = self._primary_key_index if overwrite else PrimaryKeyIndex.IMMEDIATE
+        if primary_key_index == PrimaryKeyIndex.DEFERRED:
+            self._deferred_indexes.append(table_name)
+            return f"CREATE TABLE IF NOT EXISTS {table_name} (_airbyte_ab_id TEXT, _airbyte_emitted_at TEXT, _airbyte_data TEXT)"
+
+        statement = (
+            f"CREATE TABLE IF NOT EXISTS {table_name} (_airbyte_ab_id TEXT PRIMARY KEY, _airbyte_emitted_at TEXT, _airbyte_data TEXT)"
+        )
+        if primary_key_index == PrimaryKeyIndex.WITHOUT_ROWID:
+            statement += " WITHOUT ROWID"
+        return statement
+
+    def _build_deferred_indexes(self) -> None:
+        for table_name in self._deferred_indexes:
+            self._connection.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {table_name}_ab_id ON {table_name} (_airbyte_ab_id)")
+
+    def _restore_journal_mode(self) -> None:
+        if not self._original_journal_mode or self._original_journal_mode.lower() == "wal":
+            return
+        try:
+            self._connection.execute(f"PRAGMA journal_mode={self._original_journal_mode}")
+        except sqlite3.OperationalError as e:
+            # Leaving WAL mode needs exclusive access; the database stays usable in WAL mode.
+            logger.warning(f"Could not restore the SQLite journal mode to {self._original_journal_mode}: {e}")
+
+    def _start_batch(self) -> None:
+        # Records of a batch share one timestamp rather than formatting a new one per record.
+        self._emitted_at = datetime.datetime.now().isoformat()
+
+    def write(self, stream_name: str, data: Mapping[str, Any]) -> None:
+        """Buffer one record, inserting the stream's batch if it is full."""
+        serialized = json.dumps(data)
+        buffer = self._buffers[stream_name]
+        buffer.append((self._record_ids.next(), self._emitted_at, serialized))
+        self._buffer_bytes[stream_name] += len(serialized)
+        if len(buffer) >= self._max_batch_rows or self._buffer_bytes[stream_name] >= self._max_batch_bytes:
+            self._insert_batch(stream_name)
+            self._start_batch()
+
+    def _insert_batch(self, stream_name: str) -> None:
+        buffer = self._buffers[stream_name]
+        if not buffer:
+            return
+        self._connection.executemany(self._insert_statements[stream_name], buffer)
+        self.records_written += len(buffer)
+        self.batches_written += 1
+        self._buffers[stream_name] = []
+        self._buffer_bytes[stream_name] = 0
+
+    def flush(self) -> None:
+        """Insert all buffered records and commit them."""
+        for stream_name in self._buffers:
+            self._insert_batch(stream_name)
+        self._connection.commit()
+        self._start_batch()
@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import sqlite3
+
+import pytest
+from destination_sqlite.writer import PrimaryKeyIndex, SqliteWriter
+
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
+
+
+def _catalog(destination_sync_mode=DestinationSyncMode.overwrite):
+    stream = AirbyteStream(name="users", json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh])
+    return ConfiguredAirbyteCatalog(
+        streams=[ConfiguredAirbyteStream(stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=destination_sync_mode)]
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "sqlite.db")
+
+
+def _rows(path):
+    con = sqlite3.connect(path)
+    try:
+        return con.execute("SELECT _airbyte_ab_id, _airbyte_emitted_at, _airbyte_data FROM _airbyte_raw_users").fetchall()
+    finally:
+        con.close()
+
+
+def test_batches_are_bounded_and_only_visible_after_flush(path):
+    con = sqlite3.connect(path)
+    with SqliteWriter(con, _catalog(), max_batch_rows=2) as writer:
+        for i in range(5):
+            writer.write("users", {"id": i})
+        assert writer.batches_written == 2
+        assert _rows(path) == []
+
+        writer.flush()
+        assert [json.loads(data) for _, _, data in _rows(path)] == [{"id": i} for i in range(5)]
+        writer.write("users", {"id": 5})
+    con.close()
+
+    rows = _rows(path)
+    assert len(rows) == 6
+    assert len({ab_id for ab_id, _, _ in rows}) == 6
+    assert [ab_id for ab_id, _, _ in rows] == sorted(ab_id for ab_id, _, _ in rows)
+
+
+def test_unflushed_records_are_rolled_back_on_failure(path):
+    con = sqlite3.connect(path)
+    with pytest.raises(RuntimeError):
+        with SqliteWriter(con, _catalog(), max_batch_rows=1) as writer:
+            writer.write("users", {"id": 1})
+            writer.flush()
+            writer.write("users", {"id": 2})
+            raise RuntimeError("source failed")
+    con.close()
+
+    assert [json.loads(data) for _, _, data in _rows(path)] == [{"id": 1}]
+
+
+def test_wal_mode_is_only_used_during_the_sync(path):
+    con = sqlite3.connect(path)
+    with SqliteWriter(con, _catalog()):
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert con.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    con.close()
+
+
+@pytest.mark.parametrize(
+    "primary_key_index, table_sql, index_names",
+    [
+        (PrimaryKeyIndex.IMMEDIATE, "_airbyte_ab_id TEXT PRIMARY KEY", ["sqlite_autoindex__airbyte_raw_users_1"]),
+        (PrimaryKeyIndex.DEFERRED, "_airbyte_ab_id TEXT,", ["_airbyte_raw_users_ab_id"]),
+        (PrimaryKeyIndex.WITHOUT_ROWID, "WITHOUT ROWID", []),
+    ],
+)
+def test_primary_key_index_of_overwritten_tables(path, primary_key_index, table_sql, index_names):
+    con = sqlite3.connect(path)
+    with SqliteWriter(con, _catalog(), primary_key_index=primary_key_index) as writer:
+        writer.write("users", {"id": 1})
+    con.close()
+
+    con = sqlite3.connect(path)
+    assert table_sql in con.execute("SELECT sql FROM sqlite_master WHERE name = '_airbyte_raw_users'").fetchone()[0]
+    assert [name for (name,) in con.execute("SELECT name FROM sqlite_master WHERE type = 'index'")] == index_names
+    con.close()
+
+
+def test_appended_tables_always_have_a_primary_key(path):
+    con = sqlite3.connect(path)
+    with SqliteWriter(con, _catalog(DestinationSyncMode.append), primary_key_index=PrimaryKeyIndex.DEFERRED) as writer:
+        writer.write("users", {"id": 1})
+    con.close()
+
+    con = sqlite3.connect(path)
+    assert "PRIMARY KEY" in con.execute("SELECT sql FROM sqlite_master WHERE name = '_airbyte_raw_users'").fetchone()[0]
+    con.close()
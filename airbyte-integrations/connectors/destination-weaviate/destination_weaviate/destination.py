@@ -10,12 +10,12 @@ from airbyte_cdk.destinations import Destination
 from airbyte_cdk.destinations.vector_db_based.document_processor import DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Embedder, create_from_config
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
-from airbyte_cdk.destinations.vector_db_based.writer import Writer
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from destination_weaviate.config import ConfigModel
 from destination_weaviate.indexer import WeaviateIndexer
 from destination_weaviate.no_embedder import NoEmbedder
+from destination_weaviate.pipelined_writer import PipelinedWriter
 
 
 class DestinationWeaviate(Destination):
@@ -35,7 +35,7 @@ class DestinationWeaviate(Destination):
     ) -> Iterable[AirbyteMessage]:
         config_model = ConfigModel.parse_obj(config)
         self._init_indexer(config_model)
-        writer = Writer(
+        writer = PipelinedWriter(
             config_model.processing,
             self.indexer,
             self.embedder,
@@ -138,25 +138,35 @@ class WeaviateIndexer(Indexer):
                     )
 
     def index(self, document_chunks, namespace, stream):
-        if len(document_chunks) == 0:
+        self.upsert_vectors(self.create_vectors(document_chunks, stream), namespace)
+
+    def create_vectors(self, document_chunks, stream):
+        """
+        Return the (object, class name, id, vector) tuples added for the chunks. The IDs are random, so a retried batch
+        has to send the same tuples again to overwrite, rather than duplicate, the objects.
+        """
+        weaviate_objects = []
+        for chunk in document_chunks:
+            weaviate_object = {**self._normalize(chunk.metadata)}
+            if chunk.page_content is not None:
+                weaviate_object[self.config.text_field] = chunk.page_content
+            object_id = str(uuid.uuid4())
+            class_name = self._stream_to_class_name(chunk.record.stream)
+            weaviate_objects.append((weaviate_object, class_name, object_id, chunk.embedding))
+        return weaviate_objects
+
+    def upsert_vectors(self, weaviate_objects, namespace):
+        if len(weaviate_objects) == 0:
             return
 
         # As a single record can be split into lots of documents, break them into batches as configured to not overwhelm the cluster
-        batches = create_chunks(document_chunks, batch_size=self.config.batch_size)
+        batches = create_chunks(weaviate_objects, batch_size=self.config.batch_size)
         for batch in batches:
-            for i in range(len(batch)):
-                chunk = batch[i]
-                weaviate_object = {**self._normalize(chunk.metadata)}
-                if chunk.page_content is not None:
-                    weaviate_object[self.config.text_field] = chunk.page_content
-                object_id = str(uuid.uuid4())
-                class_name = self._stream_to_class_name(chunk.record.stream)
+            for weaviate_object, class_name, object_id, vector in batch:
                 if self.config.tenant_id.strip():
-                    self.client.batch.add_data_object(
-                        weaviate_object, class_name, object_id, vector=chunk.embedding, tenant=self.config.tenant_id
-                    )
+                    self.client.batch.add_data_object(weaviate_object, class_name, object_id, vector=vector, tenant=self.config.tenant_id)
                 else:
-                    self.client.batch.add_data_object(weaviate_object, class_name, object_id, vector=chunk.embedding)
+                    self.client.batch.add_data_object(weaviate_object, class_name, object_id, vector=vector)
             self._flush()
 
     def _stream_to_class_name(self, stream_name: str) -> str:
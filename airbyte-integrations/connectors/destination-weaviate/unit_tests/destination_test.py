@@ -63,7 +63,7 @@ class TestDestinationWeaviate(unittest.TestCase):
         mock_embedder.check.assert_called_once()
         mock_indexer.check.assert_called_once()
 
-    @patch("destination_weaviate.destination.Writer")
+    @patch("destination_weaviate.destination.PipelinedWriter")
     @patch("destination_weaviate.destination.WeaviateIndexer")
     @patch("destination_weaviate.destination.create_from_config")
     def test_write(self, MockedEmbedder, MockedWeaviateIndexer, MockedWriter):
@@ -201,6 +201,23 @@ class TestWeaviateIndexer(unittest.TestCase):
         self.indexer.index([mock_chunk1, mock_chunk2, mock_chunk3], None, "test")
         assert mock_client.batch.create_objects.call_count == 2
 
+    def test_upsert_vectors_adds_the_same_objects_again(self):
+        mock_client = Mock()
+        self.indexer.client = mock_client
+        mock_client.batch.create_objects.return_value = []
+        mock_chunk = Chunk(
+            page_content="some_content",
+            embedding=[1, 2, 3],
+            metadata={"someField": "some_value"},
+            record=AirbyteRecordMessage(stream="test", data={"someField": "some_value"}, emitted_at=0),
+        )
+        weaviate_objects = self.indexer.create_vectors([mock_chunk], "test")
+        self.indexer.upsert_vectors(weaviate_objects, None)
+        self.indexer.upsert_vectors(weaviate_objects, None)
+
+        first_add, second_add = mock_client.batch.add_data_object.call_args_list
+        self.assertEqual(first_add, second_add)
+
     def test_index_on_empty_batch(self):
         mock_client = Mock()
         self.indexer.client = mock_client
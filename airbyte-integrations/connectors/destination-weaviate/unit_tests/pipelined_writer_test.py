@@ -0,0 +1,221 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from destination_weaviate import pipelined_writer
+from destination_weaviate.pipelined_writer import AdaptiveBatchSizer, PipelinedWriter, is_retryable_error
+
+from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+
+
+class StatusError(Exception):
+    def __init__(self, status):
+        super().__init__(f"status {status}")
+        self.status = status
+
+
+def _catalog():
+    stream = AirbyteStream(
+        name="example_stream",
+        json_schema={"type": "object"},
+        supported_sync_modes=[SyncMode.full_refresh],
+        source_defined_primary_key=[["id"]],
+    )
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=stream,
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append_dedup,
+                primary_key=[["id"]],
+            )
+        ]
+    )
+
+
+def _record(i):
+    return AirbyteMessage(
+        type=Type.RECORD, record=AirbyteRecordMessage(stream="example_stream", data={"id": i, "text": f"text {i}"}, emitted_at=0)
+    )
+
+
+def _state():
+    return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={}))
+
+
+def _writer(indexer, embedder, batch_size=2, **kwargs):
+    processing_config = ProcessingConfigModel(chunk_size=1000, text_fields=["text"])
+    return PipelinedWriter(processing_config, indexer, embedder, batch_size=batch_size, omit_raw_text=False, **kwargs)
+
+
+def _indexer():
+    """The vectors of the fake indexer are the ids of the records."""
+    indexer = MagicMock()
+    indexer.create_vectors.side_effect = lambda chunks, stream: [chunk.record.data["id"] for chunk in chunks]
+    indexer.post_sync.return_value = []
+    return indexer
+
+
+def _embedder():
+    embedder = MagicMock()
+    embedder.embed_documents.side_effect = lambda documents: [[float(len(document.page_content))] for document in documents]
+    return embedder
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(pipelined_writer.time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture(autouse=True)
+def document_processor(monkeypatch):
+    """One chunk per record, and every record replaces the previous version of its id."""
+
+    def process(record):
+        return [Chunk(page_content=record.data["text"], metadata={}, record=record)], f"{record.stream}_{record.data['id']}"
+
+    processor = MagicMock()
+    processor.process.side_effect = process
+    monkeypatch.setattr(pipelined_writer, "DocumentProcessor", MagicMock(return_value=processor))
+
+
+def test_deletes_and_indexes_batches_in_order_before_emitting_state():
+    events = []
+    indexer = _indexer()
+    indexer.delete.side_effect = lambda ids, namespace, stream: events.append(("delete", list(ids)))
+    indexer.upsert_vectors.side_effect = lambda vectors, namespace: events.append(("index", vectors))
+
+    output = []
+    for message in _writer(indexer, _embedder()).write(_catalog(), [_record(1), _record(2), _record(3), _state(), _record(4)]):
+        output.append(message)
+        events.append(("state",))
+
+    assert output == [_state()]
+    assert events == [
+        ("delete", ["example_stream_1", "example_stream_2"]),
+        ("index", [1, 2]),
+        ("delete", ["example_stream_3"]),
+        ("index", [3]),
+        ("state",),
+        ("delete", ["example_stream_4"]),
+        ("index", [4]),
+    ]
+    indexer.post_sync.assert_called_once()
+
+
+def test_embedding_overlaps_indexing():
+    second_batch_embedded = threading.Event()
+    embedder = _embedder()
+    embed_calls = []
+
+    def embed(documents):
+        embed_calls.append(len(documents))
+        if len(embed_calls) == 2:
+            second_batch_embedded.set()
+        return [[1.0] for _ in documents]
+
+    embedder.embed_documents.side_effect = embed
+    indexer = _indexer()
+    overlapped = []
+    indexer.upsert_vectors.side_effect = lambda vectors, namespace: overlapped.append(second_batch_embedded.wait(timeout=5))
+
+    list(_writer(indexer, embedder).write(_catalog(), [_record(i) for i in range(4)]))
+
+    # The first batch was still being indexed while the second one was embedded.
+    assert overlapped[0] is True
+    assert embed_calls == [2, 2]
+
+
+def test_retries_throttled_upserts_and_shrinks_batch_size():
+    indexer = _indexer()
+    indexer.upsert_vectors.side_effect = [StatusError(429), StatusError(503), None, None, None, None]
+    sizer = AdaptiveBatchSizer(initial_size=4)
+    writer = _writer(indexer, _embedder(), batch_size=4, upsert_batch_sizer=sizer)
+
+    list(writer.write(_catalog(), [_record(i) for i in range(4)]))
+
+    assert writer.upsert_metrics.retries == 2
+    assert sizer.size == 2
+    assert writer.upsert_metrics.items == 4
+    # the retries upsert the vectors created for the first attempt, with the same IDs
+    assert indexer.create_vectors.call_count == 1
+    assert [call.args[0] for call in indexer.upsert_vectors.call_args_list] == [[0, 1, 2, 3]] * 3
+
+
+def test_non_retryable_error_fails_the_sync():
+    indexer = _indexer()
+    indexer.upsert_vectors.side_effect = StatusError(400)
+
+    with pytest.raises(StatusError):
+        list(_writer(indexer, _embedder()).write(_catalog(), [_record(1), _record(2), _state()]))
+    assert indexer.upsert_vectors.call_count == 1
+
+
+def test_upserts_are_attempted_once_without_retry_upserts():
+    indexer = _indexer()
+    indexer.upsert_vectors.side_effect = StatusError(503)
+    writer = _writer(indexer, _embedder(), retry_upserts=False)
+
+    with pytest.raises(StatusError):
+        list(writer.write(_catalog(), [_record(1), _record(2), _state()]))
+    assert indexer.upsert_vectors.call_count == 1
+    assert writer.upsert_metrics.retries == 0
+
+
+def test_upserts_requests_concurrently_with_multiple_workers():
+    indexer = _indexer()
+    barrier = threading.Barrier(2, timeout=5)
+    indexer.upsert_vectors.side_effect = lambda vectors, namespace: barrier.wait()
+    writer = _writer(indexer, _embedder(), batch_size=4, upsert_batch_sizer=AdaptiveBatchSizer(initial_size=2), upsert_workers=2)
+
+    list(writer.write(_catalog(), [_record(i) for i in range(4)]))
+
+    assert writer.upsert_metrics.calls == 2
+
+
+def test_batch_sizer_adapts_to_latency_and_payload():
+    sizer = AdaptiveBatchSizer(initial_size=32, minimum_size=4, maximum_size=64, target_latency_seconds=1.0, max_payload_bytes=100)
+    sizer.record_success(0.1)
+    assert sizer.size == 36
+    sizer.record_success(5.0)
+    assert sizer.size == 18
+    sizer.record_throttled()
+    sizer.record_throttled()
+    sizer.record_throttled()
+    assert sizer.size == 4
+
+    chunks = [Chunk(page_content="x" * 40, metadata={}, record=MagicMock()) for _ in range(5)]
+    assert [len(batch) for batch, _ in sizer.split(chunks)] == [2, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (StatusError(429), True),
+        (StatusError(502), True),
+        (StatusError(404), False),
+        (ValueError("boom"), False),
+    ],
+)
+def test_is_retryable_error(error, retryable):
+    assert is_retryable_error(error) is retryable
+    try:
+        raise RuntimeError("wrapped") from error
+    except RuntimeError as wrapped:
+        assert is_retryable_error(wrapped) is retryable
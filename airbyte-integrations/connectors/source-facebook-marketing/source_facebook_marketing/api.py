@@ -4,8 +4,10 @@
 
 import json
 import logging
+import re
 from dataclasses import dataclass
 from time import sleep
+from typing import Dict, Optional
 
 import backoff
 import pendulum
@@ -46,13 +48,29 @@ class MyFacebookAdsApi(FacebookAdsApi):
         per_application: float
         per_account: float
 
-    # Insights async jobs throttle
+    # Insights async jobs throttle, the last received one (of any ad account) and the last received one of each ad account
     _ads_insights_throttle: Throttle
+    _ads_insights_throttle_per_account: Dict[str, Throttle]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ads_insights_throttle_per_account = {}
 
     @property
     def ads_insights_throttle(self) -> Throttle:
         return self._ads_insights_throttle
 
+    def get_ads_insights_throttle(self, account_id: str) -> Throttle:
+        """Insights async jobs throttle of the ad account, or the last received one if there was no /insights call for the account yet"""
+        return self._ads_insights_throttle_per_account.get(account_id) or self._ads_insights_throttle
+
+    @staticmethod
+    def _get_account_id(path) -> Optional[str]:
+        """Ad account of the call, the path is either the URL or the tuple of the node id and the edge, like ("act_123", "insights")"""
+        path = path if isinstance(path, str) else "/".join(str(part) for part in path)
+        match = re.search(r"\bact_(\d+)", path)
+        return match.group(1) if match else None
+
     @staticmethod
     def _parse_call_rate_header(headers):
         usage = 0
@@ -131,12 +149,13 @@ class MyFacebookAdsApi(FacebookAdsApi):
             logger.warning(f"Facebook API Utilization is too high ({usage})%, pausing for {sleep_time}")
             sleep(sleep_time.total_seconds())
 
-    def _update_insights_throttle_limit(self, response: FacebookResponse):
+    def _update_insights_throttle_limit(self, response: FacebookResponse, path=None):
         """
         For /insights call every response contains x-fb-ads-insights-throttle
         header representing current throttle limit parameter for async insights
         jobs for current app/account.  We need this information to adjust
         number of running async jobs for optimal performance.
+        The throttle is kept per account as well, since the jobs of several accounts are running at the same time.
         """
         ads_insights_throttle = response.headers().get("x-fb-ads-insights-throttle")
         if ads_insights_throttle:
@@ -145,6 +164,9 @@ class MyFacebookAdsApi(FacebookAdsApi):
                 per_application=ads_insights_throttle.get("app_id_util_pct", 0),
                 per_account=ads_insights_throttle.get("acc_id_util_pct", 0),
             )
+            account_id = self._get_account_id(path) if path else None
+            if account_id:
+                self._ads_insights_throttle_per_account[account_id] = self._ads_insights_throttle
 
     def _should_restore_default_page_size(self, params):
         """
@@ -169,7 +191,7 @@ class MyFacebookAdsApi(FacebookAdsApi):
         if self._should_restore_default_page_size(params):
             params.update(**{"limit": self.default_page_size})
         response = super().call(method, path, params, headers, files, url_override, api_version)
-        self._update_insights_throttle_limit(response)
+        self._update_insights_throttle_limit(response, path)
         self._handle_call_rate_limit(response, params)
         return response
 
@@ -150,9 +150,10 @@ class SourceFacebookMarketing(AbstractSource):
             insights_lookback_window=config.insights_lookback_window,
             insights_job_timeout=config.insights_job_timeout,
             filter_statuses=[status.value for status in [*ValidAdStatuses]],
+            max_concurrent_accounts=config.max_concurrent_accounts,
         )
         streams = [
-            AdAccount(api=api, account_ids=config.account_ids),
+            AdAccount(api=api, account_ids=config.account_ids, max_concurrent_accounts=config.max_concurrent_accounts),
             AdSets(
                 api=api,
                 account_ids=config.account_ids,
@@ -160,6 +161,7 @@ class SourceFacebookMarketing(AbstractSource):
                 end_date=config.end_date,
                 filter_statuses=config.adset_statuses,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
             Ads(
                 api=api,
@@ -168,12 +170,14 @@ class SourceFacebookMarketing(AbstractSource):
                 end_date=config.end_date,
                 filter_statuses=config.ad_statuses,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
             AdCreatives(
                 api=api,
                 account_ids=config.account_ids,
                 fetch_thumbnail_images=config.fetch_thumbnail_images,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
             AdsInsights(page_size=config.page_size, **insights_args),
             AdsInsightsAgeAndGender(page_size=config.page_size, **insights_args),
@@ -202,16 +206,19 @@ class SourceFacebookMarketing(AbstractSource):
                 end_date=config.end_date,
                 filter_statuses=config.campaign_statuses,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
             CustomConversions(
                 api=api,
                 account_ids=config.account_ids,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
             CustomAudiences(
                 api=api,
                 account_ids=config.account_ids,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
             Images(
                 api=api,
@@ -219,6 +226,7 @@ class SourceFacebookMarketing(AbstractSource):
                 start_date=config.start_date,
                 end_date=config.end_date,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
             Videos(
                 api=api,
@@ -226,6 +234,7 @@ class SourceFacebookMarketing(AbstractSource):
                 start_date=config.start_date,
                 end_date=config.end_date,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
             Activities(
                 api=api,
@@ -233,6 +242,7 @@ class SourceFacebookMarketing(AbstractSource):
                 start_date=config.start_date,
                 end_date=config.end_date,
                 page_size=config.page_size,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             ),
         ]
 
@@ -318,6 +328,7 @@ class SourceFacebookMarketing(AbstractSource):
                 insights_lookback_window=insight.insights_lookback_window or config.insights_lookback_window,
                 insights_job_timeout=insight.insights_job_timeout or config.insights_job_timeout,
                 level=insight.level,
+                max_concurrent_accounts=config.max_concurrent_accounts,
             )
             streams.append(stream)
         return streams
@@ -306,6 +306,18 @@ class ConnectorConfig(BaseConfig):
         default=60,
     )
 
+    max_concurrent_accounts: Optional[PositiveInt] = Field(
+        title="Number of Concurrently Read Accounts",
+        order=13,
+        description=(
+            "The number of ad accounts read at the same time: the records of the next accounts are requested "
+            "while the records of the current account are synced. Decrease it if the syncs of many ad accounts "
+            "reach the Facebook API rate limits."
+        ),
+        maximum=50,
+        default=10,
+    )
+
     action_breakdowns_allow_empty: bool = Field(
         description="Allows action_breakdowns to be an empty list",
         default=True,
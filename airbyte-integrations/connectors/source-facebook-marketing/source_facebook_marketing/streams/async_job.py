@@ -5,6 +5,7 @@
 import copy
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
 from enum import Enum
 from typing import Any, Iterator, List, Mapping, Optional, Type, Union
 
@@ -82,6 +83,7 @@ class AsyncJob(ABC):
         self._api = api
         self._interval = interval
         self._attempt_number = 0
+        self._prefetched_result: Optional[Future] = None
 
     @property
     def interval(self) -> pendulum.Period:
@@ -118,10 +120,34 @@ class AsyncJob(ABC):
         :param batch: FB batch executor
         """
 
+    @property
+    @abstractmethod
+    def estimated_seconds_to_completion(self) -> Optional[float]:
+        """Time left until the job is completed, estimated from its progress so far, None if it can't be estimated"""
+
     @abstractmethod
     def get_result(self) -> Iterator[Any]:
         """Retrieve result of the finished job."""
 
+    @abstractmethod
+    def prefetch_result(self, executor: Executor):
+        """Start retrieving the first page of the result of the finished job in background,
+        the next call of get_result returns it once ready, the next pages are retrieved while the result is consumed.
+
+        :param executor: executor to retrieve the result with
+        """
+
+    def cancel_prefetched_result(self):
+        """Stop retrieving the result in background, the job is not going to be consumed"""
+        prefetched_result = self._take_prefetched_result()
+        if prefetched_result is not None:
+            prefetched_result.cancel()
+
+    def _take_prefetched_result(self) -> Optional[Future]:
+        """Prefetched result of the job (if any), it's only returned once"""
+        prefetched_result, self._prefetched_result = self._prefetched_result, None
+        return prefetched_result
+
     @abstractmethod
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones"""
@@ -163,11 +189,29 @@ class ParentAsyncJob(AsyncJob):
         """Checks jobs status in advance."""
         update_in_batch(api=self._api, jobs=self._jobs)
 
+    @property
+    def estimated_seconds_to_completion(self) -> Optional[float]:
+        """The group is completed once the slowest of the jobs is completed"""
+        estimates = [job.estimated_seconds_to_completion for job in self._jobs if not job.completed]
+        if not estimates or None in estimates:
+            return None
+        return max(estimates)
+
     def get_result(self) -> Iterator[Any]:
         """Retrieve result of the finished job."""
         for job in self._jobs:
             yield from job.get_result()
 
+    def prefetch_result(self, executor: Executor):
+        """Start retrieving the first page of the result of the first job in the group, the other jobs are read one by one."""
+        if self._jobs:
+            self._jobs[0].prefetch_result(executor)
+
+    def cancel_prefetched_result(self):
+        """Stop retrieving the result of the first job in the group in background"""
+        if self._jobs:
+            self._jobs[0].cancel_prefetched_result()
+
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones."""
         new_jobs = []
@@ -373,13 +417,34 @@ class InsightAsyncJob(AsyncJob):
 
         return False
 
+    @property
+    def estimated_seconds_to_completion(self) -> Optional[float]:
+        """Time left until the job is completed, assuming it keeps progressing at the same rate"""
+        if not self._job or self.completed or not self._start_time:
+            return None
+        percent = self._job.get("async_percent_completion") or 0
+        if not 0 < percent < 100:
+            return None
+        return self.elapsed_time.total_seconds() * (100 - percent) / percent
+
     @backoff_policy
     def get_result(self) -> Any:
         """Retrieve result of the finished job."""
         if not self._job or self.failed:
             raise RuntimeError(f"{self}: Incorrect usage of get_result - the job is not started or failed")
+        prefetched_result = self._take_prefetched_result()
+        if prefetched_result is not None:
+            try:
+                return prefetched_result.result()
+            except Exception as exc:
+                # the prefetch is cancelled or failed (i.e. `FacebookBadObjectError`), the result is read again
+                logger.info(f"{self}: the prefetched result is not available ({exc!r}), retrieving it again")
         return self._job.get_result(params={"limit": self.page_size})
 
+    def prefetch_result(self, executor: Executor):
+        """Start retrieving the first page of the result in background, the cursor retrieves the next pages once it's consumed."""
+        self._prefetched_result = executor.submit(self._job.get_result, params={"limit": self.page_size})
+
     def __str__(self) -> str:
         """String representation of the job wrapper."""
         job_id = self._job["report_run_id"] if self._job else "<None>"
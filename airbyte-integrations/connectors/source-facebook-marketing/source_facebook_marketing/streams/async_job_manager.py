@@ -3,8 +3,11 @@
 #
 
 import logging
+import threading
 import time
-from typing import TYPE_CHECKING, Iterator, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 from source_facebook_marketing.streams.common import JobException
 
@@ -22,27 +25,44 @@ class InsightAsyncJobManager:
     Class for managing Ads Insights async jobs. Before running next job it
     checks current insight throttle value and if it greater than THROTTLE_LIMIT variable, no new jobs added.
     To consume completed jobs use completed_job generator, jobs will be returned in the order they finished.
+
+    The status of the running jobs is checked as soon as the first of them is expected to complete (estimated from their progress),
+    the interval grows exponentially while there is no progress to estimate from. The first pages of the results of the next completed jobs
+    are retrieved in background, while the result of the current one is consumed and the new jobs are running.
+
+    The managers of several accounts can run at the same time: each of them follows the insights throttle of it's own account,
+    while the number of their running jobs together is limited by the `job_slots` they share (if any).
     """
 
     # When current insights throttle hit this value no new jobs added.
     THROTTLE_LIMIT = 70
     MAX_NUMBER_OF_ATTEMPTS = 20
-    # Time to wait before checking job status update again.
+    # Time to wait before checking job status update again, at least and at most.
+    MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS = 5
     JOB_STATUS_UPDATE_SLEEP_SECONDS = 30
+    # Number of completed jobs with the first page of the result retrieved in background, ahead of the one being consumed.
+    MAX_PREFETCHED_RESULTS = 4
     # Maximum of concurrent jobs that could be scheduled. Since throttling
     # limit is not reliable indicator of async workload capability we still have to use this parameter.
     MAX_JOBS_IN_QUEUE = 100
 
-    def __init__(self, api: "API", jobs: Iterator[AsyncJob], account_id: str):
+    def __init__(self, api: "API", jobs: Iterator[AsyncJob], account_id: str, job_slots: Optional[threading.Semaphore] = None):
         """Init
 
         :param api:
         :param jobs:
+        :param job_slots: semaphore limiting the running jobs of all the managers sharing it, a slot is taken by each running job
         """
         self._api = api
         self._account_id = account_id
         self._jobs = iter(jobs)
+        # the next job, taken from the jobs but not started for the lack of the job slot
+        self._next_job: Optional[AsyncJob] = None
+        self._job_slots = job_slots
+        self._job_slots_taken = 0
         self._running_jobs = []
+        # number of status checks in a row without any job completed
+        self._idle_checks = 0
 
     def _start_jobs(self):
         """Enqueue new jobs."""
@@ -51,19 +71,43 @@ class InsightAsyncJobManager:
         self._wait_throttle_limit_down()
         prev_jobs_count = len(self._running_jobs)
         while self._get_current_throttle_value() < self.THROTTLE_LIMIT and len(self._running_jobs) < self.MAX_JOBS_IN_QUEUE:
-            job = next(self._jobs, None)
+            job = self._next_job or next(self._jobs, None)
+            self._next_job = None
             if not job:
                 self._empty = True
                 break
+            if not self._acquire_job_slot():
+                self._next_job = job
+                break
             job.start()
             self._running_jobs.append(job)
 
         logger.info(
             f"Added: {len(self._running_jobs) - prev_jobs_count} jobs. "
-            f"Current throttle limit is {self._api.api.ads_insights_throttle}, "
+            f"Current throttle limit is {self._api.api.get_ads_insights_throttle(self._account_id)}, "
             f"{len(self._running_jobs)}/{self.MAX_JOBS_IN_QUEUE} job(s) in queue"
         )
 
+    def _acquire_job_slot(self) -> bool:
+        """Take the job slot shared with the managers of the other accounts. Wait for it, when there are no running jobs
+        of this manager, otherwise the new job is started later, once the slot is available.
+
+        :return: True if the slot is taken
+        """
+        if self._job_slots is None:
+            return True
+        if not self._job_slots.acquire(blocking=not self._running_jobs):
+            return False
+        self._job_slots_taken += 1
+        return True
+
+    def _release_job_slots(self, count: int = 1):
+        """Give the job slots back to the managers of the other accounts."""
+        count = min(count, self._job_slots_taken)
+        self._job_slots_taken -= count
+        for _ in range(count):
+            self._job_slots.release()
+
     def completed_jobs(self) -> Iterator[AsyncJob]:
         """Wait until job is ready and return it. If job
             failed try to restart it for FAILED_JOBS_RESTART_COUNT times. After job
@@ -74,14 +118,57 @@ class InsightAsyncJobManager:
         if not self._running_jobs:
             self._start_jobs()
 
-        while self._running_jobs:
-            completed_jobs = self._check_jobs_status_and_restart()
-            while not completed_jobs:
-                logger.info(f"No jobs ready to be consumed, wait for {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
-                time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+        executor = ThreadPoolExecutor(max_workers=self.MAX_PREFETCHED_RESULTS, thread_name_prefix="insights_result")
+        try:
+            while self._running_jobs:
                 completed_jobs = self._check_jobs_status_and_restart()
-            yield from completed_jobs
-            self._start_jobs()
+                while not completed_jobs:
+                    sleep_seconds = self._status_update_sleep_seconds()
+                    logger.info(f"No jobs ready to be consumed, wait for {sleep_seconds:.0f} seconds")
+                    time.sleep(sleep_seconds)
+                    self._idle_checks += 1
+                    completed_jobs = self._check_jobs_status_and_restart()
+                self._idle_checks = 0
+                # the new jobs are running while the results of the completed ones are consumed
+                self._start_jobs()
+                yield from self._prefetch_results(completed_jobs, executor)
+        finally:
+            # the jobs yielded already may be consumed later (i.e. buffered by the reader of the accounts), so their prefetches are kept
+            executor.shutdown(wait=False)
+            # the jobs which are not going to be consumed give up their slots
+            self._release_job_slots(self._job_slots_taken)
+
+    def _prefetch_results(self, jobs: List[AsyncJob], executor: ThreadPoolExecutor) -> Iterator[AsyncJob]:
+        """Yield the jobs one by one, while the first pages of the results of up to MAX_PREFETCHED_RESULTS of them are retrieved in background.
+
+        :yield: completed jobs
+        """
+        jobs = deque(jobs)
+        prefetched_jobs = deque()
+        try:
+            while jobs or prefetched_jobs:
+                while jobs and len(prefetched_jobs) < self.MAX_PREFETCHED_RESULTS:
+                    job = jobs.popleft()
+                    job.prefetch_result(executor)
+                    prefetched_jobs.append(job)
+                yield prefetched_jobs.popleft()
+        finally:
+            # the jobs are not consumed to the end, only the prefetches of the jobs which are never yielded are stopped
+            for job in prefetched_jobs:
+                job.cancel_prefetched_result()
+
+    def _status_update_sleep_seconds(self) -> float:
+        """Time to wait before checking job status update again: until the first of the running jobs is expected to complete,
+        or exponentially growing with the number of status checks without any job completed, when none of the jobs can be estimated.
+
+        :return: number of seconds between MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS and JOB_STATUS_UPDATE_SLEEP_SECONDS
+        """
+        sleep_seconds = self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS * 2**self._idle_checks
+        for job in self._running_jobs:
+            estimate = job.estimated_seconds_to_completion
+            if estimate is not None:
+                sleep_seconds = min(sleep_seconds, estimate)
+        return max(self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS, min(sleep_seconds, self.JOB_STATUS_UPDATE_SLEEP_SECONDS))
 
     def _check_jobs_status_and_restart(self) -> List[AsyncJob]:
         """Checks jobs status in advance and restart if some failed.
@@ -120,6 +207,7 @@ class InsightAsyncJobManager:
                 failed_num += 1
             elif job.completed:
                 completed_jobs.append(job)
+                self._release_job_slots()
             else:
                 running_jobs.append(job)
 
@@ -130,7 +218,10 @@ class InsightAsyncJobManager:
 
     def _wait_throttle_limit_down(self):
         while self._get_current_throttle_value() > self.THROTTLE_LIMIT:
-            logger.info(f"Current throttle is {self._api.api.ads_insights_throttle}, wait {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
+            logger.info(
+                f"Current throttle is {self._api.api.get_ads_insights_throttle(self._account_id)}, "
+                f"wait {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds"
+            )
             time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
             self._update_api_throttle_limit()
 
@@ -142,7 +233,7 @@ class InsightAsyncJobManager:
         running and it capable serve new requests). Because of this behaviour
         facebook throttle limit is not reliable metric to estimate async workload.
         """
-        throttle = self._api.api.ads_insights_throttle
+        throttle = self._api.api.get_ads_insights_throttle(self._account_id)
 
         return min(throttle.per_account, throttle.per_application)
 
@@ -3,6 +3,7 @@
 #
 
 import logging
+import threading
 from functools import cache, cached_property
 from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
 
@@ -17,6 +18,7 @@ from airbyte_cdk.utils import AirbyteTracedException
 from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob
 from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager
 from source_facebook_marketing.streams.common import traced_exception
+from source_facebook_marketing.streams.concurrent_accounts import read_concurrently
 
 from .base_streams import FBMarketingIncrementalStream
 
@@ -29,6 +31,11 @@ class AdsInsights(FBMarketingIncrementalStream):
 
     cursor_field = "date_start"
 
+    # Number of completed jobs of all the accounts, waiting for their results to be read
+    MAX_COMPLETED_JOBS_IN_QUEUE = 10
+    # Number of running jobs of all the accounts together, the same as for the jobs of one account
+    MAX_RUNNING_JOBS = InsightAsyncJobManager.MAX_JOBS_IN_QUEUE
+
     ALL_ACTION_ATTRIBUTION_WINDOWS = [
         "1d_click",
         "7d_click",
@@ -254,7 +261,8 @@ class AdsInsights(FBMarketingIncrementalStream):
         :return:
         """
 
-        self._next_cursor_values = self._get_start_date()
+        # only the cursor of this account is reset, the jobs of the other accounts may be running
+        self._next_cursor_values[account_id] = self._get_start_date()[account_id]
         for ts_start in self._date_intervals(account_id):
             if (
                 ts_start in self._completed_slices.get(account_id, [])
@@ -306,21 +314,37 @@ class AdsInsights(FBMarketingIncrementalStream):
 
         when slice is not next one we just update state with it
         to do so source will check state attribute and call get_state,
+
+        The jobs of up to max_concurrent_accounts accounts are running at the same time, each account follows it's own insights throttle,
+        and all of them share the limit of MAX_RUNNING_JOBS running jobs. The slices of the accounts are interleaved,
+        in the order their jobs complete, which is fine since the state is kept per account.
         """
         if stream_state:
             self.state = stream_state
 
-        for account_id in self._account_ids:
-            try:
-                manager = InsightAsyncJobManager(
-                    api=self._api,
-                    jobs=self._generate_async_jobs(params=self.request_params(), account_id=account_id),
-                    account_id=account_id,
-                )
-                for job in manager.completed_jobs():
-                    yield {"insight_job": job, "account_id": account_id}
-            except FacebookRequestError as exc:
-                raise traced_exception(exc)
+        job_slots = threading.BoundedSemaphore(self.MAX_RUNNING_JOBS)
+        yield from read_concurrently(
+            sources=[
+                lambda account_id=account_id: self._account_stream_slices(account_id=account_id, job_slots=job_slots)
+                for account_id in self._account_ids
+            ],
+            max_concurrent=self.max_concurrent_accounts,
+            max_buffered=self.MAX_COMPLETED_JOBS_IN_QUEUE,
+        )
+
+    def _account_stream_slices(self, account_id: str, job_slots: threading.Semaphore) -> Iterator[Mapping[str, Any]]:
+        """Slices of the account, it's called from the background thread of the account"""
+        try:
+            manager = InsightAsyncJobManager(
+                api=self._api,
+                jobs=self._generate_async_jobs(params=self.request_params(), account_id=account_id),
+                account_id=account_id,
+                job_slots=job_slots,
+            )
+            for job in manager.completed_jobs():
+                yield {"insight_job": job, "account_id": account_id}
+        except FacebookRequestError as exc:
+            raise traced_exception(exc)
 
     def _get_start_date(self) -> Mapping[str, pendulum.Date]:
         """Get start date to begin sync with. It is not that trivial as it might seem.
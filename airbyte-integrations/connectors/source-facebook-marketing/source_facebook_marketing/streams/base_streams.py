@@ -19,6 +19,7 @@ from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from source_facebook_marketing.streams.common import traced_exception
 
 from .common import deep_merge
+from .concurrent_accounts import AccountsReadAhead
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -40,6 +41,8 @@ class FBMarketingStream(Stream, ABC):
     entity_prefix = None
     # In case of Error 'Too much data was requested in batch' some fields should be removed from request
     fields_exceptions = []
+    # Number of ad accounts read at the same time, the records of the next accounts are read ahead while the current one is consumed
+    max_concurrent_accounts = 10
 
     @property
     def availability_strategy(self) -> Optional["AvailabilityStrategy"]:
@@ -51,15 +54,19 @@ class FBMarketingStream(Stream, ABC):
         account_ids: List[str],
         filter_statuses: list = [],
         page_size: int = 100,
+        max_concurrent_accounts: Optional[int] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self._api = api
         self._account_ids = account_ids
         self.page_size = page_size if page_size is not None else 100
+        if max_concurrent_accounts is not None:
+            self.max_concurrent_accounts = max_concurrent_accounts
         self._filter_statuses = filter_statuses
         self._fields = None
         self._saved_fields = None
+        self._accounts_read_ahead: Optional[AccountsReadAhead] = None
 
     @cache
     def fields(self, **kwargs) -> List[str]:
@@ -185,30 +192,51 @@ class FBMarketingStream(Stream, ABC):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
         """Main read method used by CDK"""
-        account_id = stream_slice["account_id"]
-        account_state = stream_slice.get("stream_state", {})
+        records = self._accounts_read_ahead.read(stream_slice["account_id"]) if self._accounts_read_ahead else None
+        if records is None:
+            records = self._read_account_records(stream_slice)
 
         try:
-            for record in self.list_objects(
-                params=self.request_params(stream_state=account_state),
-                account_id=account_id,
-            ):
-                if isinstance(record, AbstractObject):
-                    record = record.export_all_data()  # convert FB object to dict
-                self.fix_date_time(record)
-                self.add_account_id(record, stream_slice["account_id"])
-                yield record
+            yield from records
         except FacebookRequestError as exc:
             raise traced_exception(exc)
 
+    def _read_account_records(self, stream_slice: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
+        """Read the records of the slice's account, it's called from the read ahead threads as well"""
+        account_id = stream_slice["account_id"]
+        account_state = stream_slice.get("stream_state", {})
+
+        for record in self.list_objects(
+            params=self.request_params(stream_state=account_state),
+            account_id=account_id,
+        ):
+            if isinstance(record, AbstractObject):
+                record = record.export_all_data()  # convert FB object to dict
+            self.fix_date_time(record)
+            self.add_account_id(record, account_id)
+            yield record
+
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, any]]]:
         if stream_state:
             stream_state = self._transform_state_from_one_account_format(stream_state, ["include_deleted"])
             stream_state = self._transform_state_from_old_deleted_format(stream_state)
 
-        for account_id in self._account_ids:
-            account_state = self.get_account_state(account_id, stream_state)
-            yield {"account_id": account_id, "stream_state": account_state}
+        slices = [
+            {"account_id": account_id, "stream_state": self.get_account_state(account_id, stream_state)} for account_id in self._account_ids
+        ]
+        if self.max_concurrent_accounts <= 1 or len(slices) <= 1:
+            yield from slices
+            return
+
+        # the records of the slices are read in background, read_records consumes them in the order of the slices
+        read_ahead = AccountsReadAhead(self._read_account_records, slices, self.max_concurrent_accounts)
+        self._accounts_read_ahead = read_ahead
+        try:
+            yield from slices
+        finally:
+            read_ahead.close()
+            if self._accounts_read_ahead is read_ahead:
+                self._accounts_read_ahead = None
 
     @abstractmethod
     def list_objects(self, params: Mapping[str, Any]) -> Iterable:
@@ -340,7 +368,11 @@ class FBMarketingIncrementalStream(FBMarketingStream, CheckpointMixin, ABC):
 class FBMarketingReversedIncrementalStream(FBMarketingIncrementalStream, ABC):
     """The base class for streams that don't support filtering and return records sorted desc by cursor_value"""
 
+    # the read of the account stops at the first record older than the state, so it is not read ahead
+    max_concurrent_accounts = 1
+
     def __init__(self, **kwargs):
+        kwargs.pop("max_concurrent_accounts", None)
         super().__init__(**kwargs)
         self._cursor_values = {}
 
@@ -0,0 +1,192 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Mapping, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# the number of records of each ad account read ahead, until they are consumed
+MAX_BUFFERED_RECORDS = 1000
+# how often the threads waiting for the room in the buffer check if the items are still consumed, in seconds
+_STOP_CHECK_INTERVAL = 0.1
+
+
+def _start_daemon(target: Callable[..., None], name: str, *args: Any) -> None:
+    """The readers are daemon threads, so the ones still waiting for the API (i.e. polling the insights jobs)
+    don't keep the connector running, once the consumer is done or failed."""
+    threading.Thread(target=target, args=args, name=name, daemon=True).start()
+
+
+class _Done:
+    """All the items of the source are read."""
+
+
+class _Failure:
+    """The source failed, the exception is raised by the consumer."""
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class _Buffer(Generic[T]):
+    """The bounded queue of the items read in background, which can be abandoned by the consumer."""
+
+    def __init__(self, max_size: int):
+        self.items: "queue.Queue" = queue.Queue(maxsize=max_size)
+        self.stopped = threading.Event()
+
+    def put(self, item: Any) -> bool:
+        """Wait for the room in the buffer, unless the items are no longer consumed.
+
+        :return: False if the items are no longer consumed
+        """
+        while not self.stopped.is_set():
+            try:
+                self.items.put(item, timeout=_STOP_CHECK_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def fill(self, source: Callable[[], Iterable[T]]) -> None:
+        """Read all the items of the source into the buffer, followed by the end (or the failure) marker."""
+        if self.stopped.is_set():
+            return
+        items = None
+        try:
+            items = iter(source())
+            for item in items:
+                if not self.put(item):
+                    return
+        except Exception as exc:
+            self.put(_Failure(exc))
+            return
+        finally:
+            # the generators (like the jobs manager) release what they hold, when they are not read to the end
+            close = getattr(items, "close", None)
+            if close:
+                close()
+        self.put(_Done())
+
+
+class AccountsReadAhead:
+    """
+    Reads the records of the ad accounts one account after another, in the order of their slices,
+    while the records of the next `max_concurrent_accounts - 1` accounts are read in background:
+        - the records of each account are consumed in the same order as before, so the state is updated the same way.
+        - up to `max_buffered_records` records of each account are kept in memory, until they are consumed.
+        - the accounts skipped by the consumer (or not read to the end) are no longer read.
+
+    Example:
+        reader = AccountsReadAhead(read_account=stream._read_account_records, slices=slices, max_concurrent_accounts=10)
+        for stream_slice in slices:
+            records = reader.read(stream_slice["account_id"])  # or None if the account is read already
+        reader.close()
+    """
+
+    def __init__(
+        self,
+        read_account: Callable[[Mapping[str, Any]], Iterable[T]],
+        slices: List[Mapping[str, Any]],
+        max_concurrent_accounts: int,
+        max_buffered_records: int = MAX_BUFFERED_RECORDS,
+    ):
+        self._read_account = read_account
+        self._slices = slices
+        self._indexes = {stream_slice["account_id"]: index for index, stream_slice in enumerate(slices)}
+        self.max_concurrent_accounts = max(max_concurrent_accounts, 1)
+        self.max_buffered_records = max(max_buffered_records, 1)
+        self._buffers: Dict[str, _Buffer[T]] = {}
+        # index of the next account to consume
+        self._next_index = 0
+        self._closed = False
+
+    def read(self, account_id: str) -> Optional[Iterator[T]]:
+        """The records of the account read in background, or None if the account is not read by this reader (or read already)."""
+        index = self._indexes.get(account_id)
+        if self._closed or index is None or index < self._next_index:
+            return None
+
+        for skipped_index in range(self._next_index, index):
+            self._stop(self._slices[skipped_index]["account_id"])
+        self._next_index = index + 1
+        # the read of the account is submitted after the previous ones, so it has a thread of it's own
+        for next_index in range(index, min(index + self.max_concurrent_accounts, len(self._slices))):
+            self._submit(self._slices[next_index])
+        return self._drain(self._buffers[account_id])
+
+    def close(self) -> None:
+        self._closed = True
+        for account_id in self._indexes:
+            self._stop(account_id)
+
+    def _submit(self, stream_slice: Mapping[str, Any]) -> None:
+        account_id = stream_slice["account_id"]
+        if account_id not in self._buffers:
+            self._buffers[account_id] = _Buffer(self.max_buffered_records)
+            _start_daemon(self._buffers[account_id].fill, f"fb_account_read_ahead_{account_id}", lambda: self._read_account(stream_slice))
+
+    def _stop(self, account_id: str) -> None:
+        buffer = self._buffers.setdefault(account_id, _Buffer(self.max_buffered_records))
+        buffer.stopped.set()
+
+    @staticmethod
+    def _drain(buffer: _Buffer[T]) -> Iterator[T]:
+        try:
+            while True:
+                try:
+                    item = buffer.items.get(timeout=_STOP_CHECK_INTERVAL)
+                except queue.Empty:
+                    if buffer.stopped.is_set():
+                        # the reader is closed, the rest of the records are not read anymore
+                        return
+                    continue
+                if isinstance(item, _Done):
+                    return
+                if isinstance(item, _Failure):
+                    raise item.exception
+                yield item
+        finally:
+            buffer.stopped.set()
+
+
+def read_concurrently(sources: List[Callable[[], Iterable[T]]], max_concurrent: int, max_buffered: int) -> Iterator[T]:
+    """
+    Reads up to `max_concurrent` of the sources at the same time in background, and yields their items as soon as they are read,
+    the next source is read once one of the running ones is read to the end. Up to `max_buffered` items are kept in memory.
+    The first failure of any source is raised, the rest of the sources are no longer read then.
+    """
+    if not sources:
+        return
+
+    buffer: _Buffer[T] = _Buffer(max_buffered)
+    sources_to_read: "queue.SimpleQueue" = queue.SimpleQueue()
+    for source in sources:
+        sources_to_read.put(source)
+
+    def read_sources() -> None:
+        while not buffer.stopped.is_set():
+            try:
+                source = sources_to_read.get_nowait()
+            except queue.Empty:
+                return
+            buffer.fill(source)
+
+    for index in range(min(max(max_concurrent, 1), len(sources))):
+        _start_daemon(read_sources, f"fb_account_read_{index}")
+    try:
+        sources_left = len(sources)
+        while sources_left:
+            item = buffer.items.get()
+            if isinstance(item, _Done):
+                sources_left -= 1
+            elif isinstance(item, _Failure):
+                raise item.exception
+            else:
+                yield item
+    finally:
+        buffer.stopped.set()
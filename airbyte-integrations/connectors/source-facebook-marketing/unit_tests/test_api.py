@@ -172,6 +172,25 @@ class TestMyFacebookAdsApi:
                 f"Facebook API Utilization is too high ({usage})%, pausing for {fb_api._compute_pause_interval.return_value}"
             )
 
+    def test__update_insights_throttle_limit_per_account(self, mocker, fb_api):
+        def response(per_account):
+            return mocker.Mock(
+                headers=mocker.Mock(
+                    return_value={"x-fb-ads-insights-throttle": f'{{"app_id_util_pct": 10, "acc_id_util_pct": {per_account}}}'}
+                )
+            )
+
+        fb_api._update_insights_throttle_limit(response(50), ("act_111", "insights"))
+        fb_api._update_insights_throttle_limit(response(20), f"{FacebookSession.GRAPH}/{FB_API_VERSION}/act_222/insights")
+        # the status of the report run is not related to any account
+        fb_api._update_insights_throttle_limit(response(30), ("1571860060019500",))
+
+        assert fb_api.get_ads_insights_throttle("111") == fb_api.Throttle(per_application=10, per_account=50)
+        assert fb_api.get_ads_insights_throttle("222") == fb_api.Throttle(per_application=10, per_account=20)
+        assert (
+            fb_api.get_ads_insights_throttle("333") == fb_api.ads_insights_throttle == fb_api.Throttle(per_application=10, per_account=30)
+        )
+
     def test_find_account(self, api, account_id, requests_mock):
         requests_mock.register_uri(
             "GET",
@@ -4,6 +4,7 @@
 
 import copy
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterator
 
 import freezegun
@@ -15,7 +16,7 @@ from facebook_business.adobjects.adreportrun import AdReportRun
 from facebook_business.adobjects.adset import AdSet
 from facebook_business.adobjects.adsinsights import AdsInsights
 from facebook_business.adobjects.campaign import Campaign
-from facebook_business.api import FacebookAdsApiBatch, FacebookBadObjectError
+from facebook_business.api import Cursor, FacebookAdsApiBatch, FacebookBadObjectError
 from source_facebook_marketing.api import MyFacebookAdsApi
 from source_facebook_marketing.streams.async_job import InsightAsyncJob, ParentAsyncJob, Status, update_in_batch
 
@@ -345,6 +346,47 @@ class TestInsightAsyncJob:
         # in case this is not retried, an error will be raised
         job.get_result()
 
+    def test_get_result_prefetched(self, job, adreport, api):
+        job.start()
+        api.call().json.return_value = {"data": [{"some_data": 123}, {"some_data": 77}]}
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            job.prefetch_result(executor)
+            result = job.get_result()
+
+        adreport.get_result.assert_called_once()
+        # only the first page is retrieved ahead, the cursor retrieves the next ones while it's consumed
+        assert isinstance(result, Cursor)
+        assert [row.export_all_data() for row in result] == [{"some_data": 123}, {"some_data": 77}]
+        # the prefetched result is returned once, the next call retrieves it again
+        job.get_result()
+        assert adreport.get_result.call_count == 2
+
+    def test_get_result_prefetch_cancelled(self, job, adreport, api, mocker):
+        job.start()
+        api.call().json.return_value = {"data": [{"some_data": 123}, {"some_data": 77}]}
+        cancelled_result = Future()
+        cancelled_result.cancel()
+        executor = mocker.Mock()
+        executor.submit.return_value = cancelled_result
+
+        job.prefetch_result(executor)
+        result = job.get_result()
+
+        # the result is retrieved again, instead of the prefetch which is cancelled
+        adreport.get_result.assert_called_once()
+        assert [row.export_all_data() for row in result] == [{"some_data": 123}, {"some_data": 77}]
+
+    def test_estimated_seconds_to_completion(self, started_job, adreport):
+        started_job._start_time = pendulum.now() - pendulum.duration(seconds=60)
+        assert started_job.estimated_seconds_to_completion is None, "should be None while there is no progress"
+
+        adreport["async_percent_completion"] = 25
+        assert started_job.estimated_seconds_to_completion == pytest.approx(180, abs=1)
+
+    def test_estimated_seconds_to_completion_of_completed_job(self, completed_job):
+        assert completed_job.estimated_seconds_to_completion is None
+
     def test_get_result_when_job_is_not_started(self, job):
         with pytest.raises(
             RuntimeError,
@@ -481,6 +523,32 @@ class TestParentAsyncJob:
         assert isinstance(generator, Iterator)
         assert list(generator) == list(range(3, 8)) + list(range(4, 11))
 
+    def test_prefetch_result(self, parent_job, grouped_jobs, mocker):
+        executor = mocker.Mock()
+
+        parent_job.prefetch_result(executor)
+
+        grouped_jobs[0].prefetch_result.assert_called_once_with(executor)
+        for job in grouped_jobs[1:]:
+            job.prefetch_result.assert_not_called()
+
+    def test_cancel_prefetched_result(self, parent_job, grouped_jobs):
+        parent_job.cancel_prefetched_result()
+
+        grouped_jobs[0].cancel_prefetched_result.assert_called_once()
+        for job in grouped_jobs[1:]:
+            job.cancel_prefetched_result.assert_not_called()
+
+    def test_estimated_seconds_to_completion(self, parent_job, grouped_jobs):
+        for index, job in enumerate(grouped_jobs):
+            job.estimated_seconds_to_completion = index * 10
+        grouped_jobs[-1].completed = True
+
+        assert parent_job.estimated_seconds_to_completion == 80, "should be the estimate of the slowest running job"
+
+        grouped_jobs[0].estimated_seconds_to_completion = None
+        assert parent_job.estimated_seconds_to_completion is None
+
     def test_split_job(self, parent_job, grouped_jobs, mocker):
         grouped_jobs[0].failed = True
         grouped_jobs[0].split_job.return_value = [
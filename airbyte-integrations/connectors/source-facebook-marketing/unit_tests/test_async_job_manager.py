@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
+
 import pytest
 from facebook_business.api import FacebookAdsApiBatch
 from source_facebook_marketing.api import MyFacebookAdsApi
@@ -14,6 +16,7 @@ from source_facebook_marketing.streams.common import JobException
 def api_fixture(mocker):
     api = mocker.Mock()
     api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(0, 0)
+    api.api.get_ads_insights_throttle.return_value = MyFacebookAdsApi.Throttle(0, 0)
     api.api.new_batch.return_value = mocker.MagicMock(spec=FacebookAdsApiBatch)
     return api
 
@@ -58,8 +61,8 @@ class TestInsightAsyncManager:
 
         update_job_mock.side_effect = update_job_behaviour()
         jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_seconds_to_completion=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_seconds_to_completion=None),
         ]
         manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
 
@@ -69,11 +72,104 @@ class TestInsightAsyncManager:
 
         job = next(manager.completed_jobs(), None)
         assert job == jobs[0]
-        time_mock.sleep.assert_called_with(InsightAsyncJobManager.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+        time_mock.sleep.assert_called_with(InsightAsyncJobManager.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS)
 
         job = next(manager.completed_jobs(), None)
         assert job is None
 
+    def test_jobs_wait_interval(self, api, mocker, time_mock, update_job_mock, some_config):
+        """Manager should wait until the first job is expected to complete, or exponentially longer without the estimate"""
+
+        def update_job_behaviour():
+            yield from range(4)
+            jobs[1].estimated_seconds_to_completion = 12
+            yield from range(2)
+            jobs[0].completed = True
+            yield
+
+        update_job_mock.side_effect = update_job_behaviour()
+        jobs = [
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_seconds_to_completion=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_seconds_to_completion=None),
+        ]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+
+        assert next(manager.completed_jobs(), None) == jobs[0]
+        assert [call.args[0] for call in time_mock.sleep.call_args_list] == [5, 10, 20, 30, 12, 12]
+
+    def test_jobs_results_prefetched(self, api, mocker, time_mock, some_config):
+        """Manager should retrieve the results of the next completed jobs in background, while the current one is consumed"""
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False) for _ in range(10)]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+
+        completed_jobs = manager.completed_jobs()
+        assert next(completed_jobs) == jobs[0]
+        assert [job.prefetch_result.called for job in jobs] == [True] * InsightAsyncJobManager.MAX_PREFETCHED_RESULTS + [False] * 6
+
+        assert list(completed_jobs) == jobs[1:]
+        for job in jobs:
+            job.prefetch_result.assert_called_once()
+
+    def test_jobs_consumed_after_the_manager_is_done(self, api, mocker, time_mock, some_config):
+        """The jobs yielded already may be consumed once the manager is done, their results are still retrieved in background"""
+        results_requested = threading.Event()
+        prefetched_results = []
+
+        def prefetch_result(executor, index):
+            prefetched_results.append(executor.submit(lambda: results_requested.wait(timeout=5) and index))
+
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False) for _ in range(12)]
+        for index, job in enumerate(jobs):
+            job.prefetch_result.side_effect = lambda executor, index=index: prefetch_result(executor, index)
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+
+        assert list(manager.completed_jobs()) == jobs
+        results_requested.set()
+
+        assert [result.result(timeout=5) for result in prefetched_results] == list(range(12))
+        for job in jobs:
+            job.cancel_prefetched_result.assert_not_called()
+
+    def test_jobs_not_consumed_stop_prefetching(self, api, mocker, time_mock, some_config):
+        """Manager should stop retrieving the results of the jobs which are never yielded"""
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False) for _ in range(10)]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+
+        completed_jobs = manager.completed_jobs()
+        assert next(completed_jobs) == jobs[0]
+        completed_jobs.close()
+
+        assert [job.cancel_prefetched_result.called for job in jobs] == [False] + [True] * (
+            InsightAsyncJobManager.MAX_PREFETCHED_RESULTS - 1
+        ) + [False] * 6
+
+    def test_jobs_share_job_slots(self, api, mocker, time_mock, update_job_mock, some_config):
+        """Manager should run only as many jobs as there are job slots shared with the managers of the other accounts"""
+        running_jobs = []
+
+        def update_job_behaviour():
+            running_jobs.append(sum(job.start.called for job in jobs))
+            jobs[0].completed = jobs[1].completed = True
+            yield
+            running_jobs.append(sum(job.start.called for job in jobs))
+            jobs[2].completed = jobs[3].completed = True
+            yield
+
+        update_job_mock.side_effect = update_job_behaviour()
+        jobs = [
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_seconds_to_completion=None)
+            for _ in range(4)
+        ]
+        job_slots = threading.BoundedSemaphore(3)
+        job_slots.acquire()  # taken by the job of another account
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0], job_slots=job_slots)
+
+        assert list(manager.completed_jobs()) == jobs
+        assert running_jobs == [2, 4]
+        # the slots of the completed jobs are given back
+        assert job_slots.acquire(blocking=False) and job_slots.acquire(blocking=False)
+        assert not job_slots.acquire(blocking=False)
+
     def test_job_restarted(self, api, mocker, time_mock, update_job_mock, some_config):
         """Manager should restart failed jobs"""
 
@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+
+import pytest
+from source_facebook_marketing.streams.concurrent_accounts import AccountsReadAhead, read_concurrently
+
+
+def _slices(number_of_accounts):
+    return [{"account_id": str(index), "stream_state": {}} for index in range(number_of_accounts)]
+
+
+class TestAccountsReadAhead:
+    def test_records_are_read_in_the_order_of_accounts(self):
+        reader = AccountsReadAhead(
+            read_account=lambda stream_slice: [{"account_id": stream_slice["account_id"], "index": index} for index in range(5)],
+            slices=_slices(4),
+            max_concurrent_accounts=2,
+            max_buffered_records=2,
+        )
+
+        records = [record for stream_slice in _slices(4) for record in reader.read(stream_slice["account_id"])]
+        reader.close()
+
+        assert records == [{"account_id": str(account), "index": index} for account in range(4) for index in range(5)]
+
+    def test_next_accounts_are_read_ahead(self):
+        started = {str(index): threading.Event() for index in range(3)}
+
+        def read_account(stream_slice):
+            started[stream_slice["account_id"]].set()
+            yield {"account_id": stream_slice["account_id"]}
+
+        reader = AccountsReadAhead(read_account=read_account, slices=_slices(3), max_concurrent_accounts=2)
+
+        records = reader.read("0")
+        assert started["1"].wait(timeout=5)
+        assert not started["2"].is_set()
+        assert list(records) == [{"account_id": "0"}]
+        reader.close()
+
+    def test_account_read_already_is_not_read_again(self):
+        reader = AccountsReadAhead(
+            read_account=lambda stream_slice: [stream_slice["account_id"]], slices=_slices(2), max_concurrent_accounts=2
+        )
+
+        assert list(reader.read("1")) == ["1"]
+        assert reader.read("0") is None
+        assert reader.read("1") is None
+        reader.close()
+        assert reader.read("unknown") is None
+
+    def test_failure_is_raised_by_the_consumer(self):
+        def read_account(stream_slice):
+            yield {"id": 1}
+            raise ValueError("read failed")
+
+        reader = AccountsReadAhead(read_account=read_account, slices=_slices(2), max_concurrent_accounts=2)
+
+        records = reader.read("0")
+        assert next(records) == {"id": 1}
+        with pytest.raises(ValueError, match="read failed"):
+            next(records)
+        reader.close()
+
+
+class TestReadConcurrently:
+    def test_items_of_all_sources_are_read(self):
+        sources = [lambda account=account: ({"account_id": account, "index": index} for index in range(10)) for account in range(5)]
+
+        items = list(read_concurrently(sources, max_concurrent=3, max_buffered=2))
+
+        assert sorted(items, key=lambda item: (item["account_id"], item["index"])) == [
+            {"account_id": account, "index": index} for account in range(5) for index in range(10)
+        ]
+        # the items of each source keep their order
+        for account in range(5):
+            assert [item["index"] for item in items if item["account_id"] == account] == list(range(10))
+
+    def test_sources_are_read_at_the_same_time(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def source(account):
+            # fails with BrokenBarrierError, unless all the sources are running
+            barrier.wait()
+            yield account
+
+        items = read_concurrently([lambda account=account: source(account) for account in range(3)], max_concurrent=3, max_buffered=1)
+
+        assert sorted(items) == [0, 1, 2]
+
+    def test_failure_stops_the_other_sources(self):
+        closed = threading.Event()
+
+        def endless_source():
+            try:
+                while True:
+                    yield "item"
+            finally:
+                closed.set()
+
+        def failed_source():
+            raise ValueError("read failed")
+            yield
+
+        with pytest.raises(ValueError, match="read failed"):
+            list(read_concurrently([endless_source, failed_source], max_concurrent=2, max_buffered=1))
+        assert closed.wait(timeout=5)
+
+    def test_sources_are_read_by_daemon_threads(self):
+        def source():
+            yield threading.current_thread().daemon
+
+        assert list(read_concurrently([source], max_concurrent=1, max_buffered=1)) == [True]
@@ -150,6 +150,15 @@ class TestSourceFacebookMarketing:
 
         assert len(streams) == 30
 
+    def test_streams_read_the_configured_number_of_accounts_at_once(self, config, api, fb_marketing):
+        config["max_concurrent_accounts"] = 3
+        streams = {stream.name: stream for stream in fb_marketing.streams(config)}
+
+        assert streams["ads"].max_concurrent_accounts == 3
+        assert streams["ads_insights"].max_concurrent_accounts == 3
+        # the reversed incremental streams read one account at a time
+        assert streams["images"].max_concurrent_accounts == 1
+
     def test_spec(self, fb_marketing):
         spec = fb_marketing.spec()
 
@@ -6,6 +6,7 @@
 import json
 import logging
 import os
+import shutil
 import sys
 import tempfile
 import traceback
@@ -257,6 +258,11 @@ class Client:
     """Class that manages reading and parsing data from streams"""
 
     CSV_CHUNK_SIZE = 10_000
+    # the size of the chunks the binary sources are copied by to the temporary file
+    CACHE_CHUNK_SIZE = 1024 * 1024
+    # the sample of the JSONL records the schema is inferred from, can be changed with the reader options of the same name
+    SCHEMA_INFERENCE_MAX_RECORDS = 10_000
+    SCHEMA_INFERENCE_MAX_BYTES = 100 * 1024 * 1024
     binary_formats = {"excel", "excel_binary", "feather", "parquet", "orc", "pickle"}
 
     def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: dict = None):
@@ -264,7 +270,10 @@ class Client:
         self._url = url
         self._provider = provider
         self._reader_format = format or "csv"
-        self._reader_options = reader_options or {}
+        self._reader_options = dict(reader_options or {})
+        # the options of the schema inference are not passed to the readers
+        self.schema_inference_max_records = int(self._reader_options.pop("schema_inference_max_records", self.SCHEMA_INFERENCE_MAX_RECORDS))
+        self.schema_inference_max_bytes = int(self._reader_options.pop("schema_inference_max_bytes", self.SCHEMA_INFERENCE_MAX_BYTES))
         self._is_zip = url.lower().endswith(".zip")
         self.binary_source = self._reader_format in self.binary_formats or self._is_zip
         self.encoding = self._reader_options.get("encoding")
@@ -286,8 +295,14 @@ class Client:
         # Use Genson Library to take JSON objects and generate schemas that describe them,
         builder = SchemaBuilder()
         if self._reader_format == "jsonl":
-            for o in self.read():
-                builder.add_object(o)
+            # the schema is inferred from the first records only, so the discovery doesn't read the whole file
+            records_read, bytes_read = 0, 0
+            for line in fp:
+                builder.add_object(json.loads(line))
+                records_read += 1
+                bytes_read += len(line)
+                if records_read >= self.schema_inference_max_records or bytes_read >= self.schema_inference_max_bytes:
+                    break
         else:
             builder.add_object(json.load(fp))
 
@@ -299,18 +314,16 @@ class Client:
         result["$schema"] = "http://json-schema.org/draft-07/schema#"
         return result
 
-    def load_nested_json(self, fp) -> list:
+    def load_nested_json(self, fp) -> Iterable[dict]:
         if self._reader_format == "jsonl":
-            result = []
-            line = fp.readline()
-            while line:
-                result.append(json.loads(line))
-                line = fp.readline()
+            # the records are parsed line by line, as they are read
+            for line in fp:
+                yield json.loads(line)
         else:
             result = json.load(fp)
             if not isinstance(result, list):
                 result = [result]
-        return result
+            yield from result
 
     def load_yaml(self, fp):
         if self._reader_format == "yaml":
@@ -460,7 +473,7 @@ class Client:
     def _cache_stream(self, fp):
         """cache stream to file"""
         fp_tmp = tempfile.NamedTemporaryFile(mode="w+b")
-        fp_tmp.write(fp.read())
+        shutil.copyfileobj(fp, fp_tmp, self.CACHE_CHUNK_SIZE)
         fp_tmp.seek(0)
         fp.close()
         return fp_tmp
@@ -3,6 +3,7 @@
 #
 
 
+from io import BytesIO
 from tempfile import NamedTemporaryFile
 from unittest.mock import patch, sentinel
 
@@ -107,7 +108,39 @@ def test_load_nested_json(client, config, absolute_path, test_files, file_format
         client = Client(**config)
     f = f"{absolute_path}/{test_files}/{file_path}"
     with open(f, mode="rb") as file:
-        assert client.load_nested_json(fp=file)
+        assert list(client.load_nested_json(fp=file))
+
+
+def test_load_nested_json_lines_are_read_lazily(config):
+    config["format"] = "jsonl"
+    client = Client(**config)
+    lines = iter(['{"id": 1}\n', '{"id": 2}\n', "not a json\n"])
+
+    records = client.load_nested_json(fp=lines)
+    assert next(records) == {"id": 1}
+    assert next(records) == {"id": 2}
+    # the lines after the records already yielded are not read yet
+    assert next(lines) == "not a json\n"
+
+
+@pytest.mark.parametrize(
+    "reader_options, expected_properties",
+    [
+        ({}, ["id", "late_field"]),
+        ({"schema_inference_max_records": 2}, ["id"]),
+        ({"schema_inference_max_bytes": 15}, ["id"]),
+    ],
+)
+def test_load_nested_json_schema_of_jsonl_sample(config, reader_options, expected_properties):
+    config["format"] = "jsonl"
+    client = Client(**config, reader_options=reader_options)
+    lines = ['{"id": 1}\n', '{"id": 2}\n', '{"id": 3, "late_field": "a"}\n']
+
+    schema = client.load_nested_json_schema(fp=iter(lines))
+
+    assert sorted(schema["properties"]) == expected_properties
+    # the options of the schema inference are not passed to the readers
+    assert client._reader_options == {}
 
 
 @pytest.mark.parametrize(
@@ -133,6 +166,18 @@ def test_cache_stream(client, absolute_path, test_files):
         assert client._cache_stream(file)
 
 
+def test_cache_stream_copies_by_chunks(client):
+    content = b"a,b\n" + b"1,2\n" * 1000
+
+    class _Stream(BytesIO):
+        def read(self, size=-1):
+            assert 0 < size <= Client.CACHE_CHUNK_SIZE
+            return super().read(size)
+
+    with client._cache_stream(_Stream(content)) as cached:
+        assert cached.read() == content
+
+
 def test_unzip_stream(client, absolute_path, test_files):
     f = f"{absolute_path}/{test_files}/test.csv.zip"
     with open(f, mode="rb") as file:
@@ -0,0 +1,42 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+"""Compare the time it takes to import the pruned GraphQL schema against the whole one.
+
+Each schema is imported in a fresh interpreter, the best of the `--runs` timings is printed.
+See `scripts/prune_github_schema.py` for how the pruned schema is generated.
+
+Usage:
+    poetry run python scripts/benchmark_schema_import.py [--runs 3]
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+
+CONNECTOR_DIR = Path(__file__).resolve().parents[1]
+TIMED_IMPORT = "import time; start = time.perf_counter(); import source_github.{}; print(time.perf_counter() - start)"
+
+
+def _import_seconds(module_name: str, runs: int) -> float:
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", TIMED_IMPORT.format(module_name)], cwd=CONNECTOR_DIR, capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(runs)
+    )
+
+
+def main(runs: int) -> None:
+    whole_seconds = _import_seconds("github_schema", runs)
+    pruned_seconds = _import_seconds("github_schema_pruned", runs)
+    print(f"Imported the GraphQL schema: whole {whole_seconds:.3f}s, pruned {pruned_seconds:.3f}s ({whole_seconds / pruned_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    main(parser.parse_args().runs)
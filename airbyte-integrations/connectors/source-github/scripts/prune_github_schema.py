@@ -0,0 +1,155 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+"""Generate `source_github/github_schema_pruned.py`, the GitHub GraphQL schema reduced to what the connector queries.
+
+`source_github/github_schema.py` is the whole GitHub schema generated by `sgqlc-codegen`. Importing it takes longer than
+importing the rest of the connector, so the GraphQL streams build their queries with the pruned schema instead:
+only the types and the fields selected by the queries of `source_github/graphql.py` are kept (with all the arguments of the fields).
+
+Run it whenever a query in `source_github/graphql.py` selects a new field, or `github_schema.py` is regenerated:
+
+Usage:
+    poetry run python scripts/prune_github_schema.py
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+import graphql
+from sgqlc.codegen.schema import CodeGen
+
+
+CONNECTOR_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CONNECTOR_DIR))
+
+from source_github import github_schema  # noqa: E402
+from source_github import graphql as github_graphql  # noqa: E402
+
+
+PRUNED_SCHEMA_PATH = CONNECTOR_DIR / "source_github" / "github_schema_pruned.py"
+HEADER = """#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+# Generated by `scripts/prune_github_schema.py` from `github_schema.py`, do not edit.
+#
+
+"""
+
+
+def build_queries() -> List[str]:
+    """Every query sent by the GraphQL streams, including all the branches of the query builders."""
+    reactions = github_graphql.QueryReactions()
+    return [
+        github_graphql.get_query_pull_requests("owner", "name", first=10, after="cursor", direction="ASC"),
+        github_graphql.get_query_projectsV2("owner", "name", first=10, after="cursor", direction="ASC"),
+        github_graphql.get_query_reviews("owner", "name", first=10, after="cursor"),
+        github_graphql.get_query_reviews("owner", "name", first=10, after="cursor", number=1),
+        github_graphql.get_query_issue_reactions("owner", "name", first=10, after="cursor"),
+        github_graphql.get_query_issue_reactions("owner", "name", first=10, after="cursor", number=1),
+        reactions.get_query_root_repository("owner", "name", first=10, after="cursor"),
+        reactions.get_query_root_pull_request("node_id", first=10, after="cursor"),
+        reactions.get_query_root_review("node_id", first=10, after="cursor"),
+        reactions.get_query_root_comment("node_id", first=10, after="cursor"),
+    ]
+
+
+def to_sdl(schema: Any) -> str:
+    sdl = "\n\n".join(repr(schema_type) for schema_type in schema)
+    # sgqlc separates the implemented interfaces with commas, while graphql-core expects ampersands
+    sdl = re.sub(
+        r"^((?:type|interface) \w+ implements )(.+) \{$",
+        lambda match: match.group(1) + match.group(2).replace(", ", " & ") + " {",
+        sdl,
+        flags=re.MULTILINE,
+    )
+    return f"{sdl}\n\nschema {{\n  query: {schema.query_type}\n}}\n"
+
+
+def collect_selected_fields(schema: graphql.GraphQLSchema, queries: List[str]) -> Dict[str, Set[str]]:
+    """The names of the fields selected by the queries, by the name of their type (the types of the inline fragments included)."""
+    selected_fields: Dict[str, Set[str]] = defaultdict(set)
+    type_info = graphql.TypeInfo(schema)
+
+    class SelectedFieldsCollector(graphql.Visitor):
+        def enter_field(self, node: graphql.FieldNode, *args: Any) -> None:
+            selected_fields[type_info.get_parent_type().name].add(node.name.value)
+
+        def enter_inline_fragment(self, node: graphql.InlineFragmentNode, *args: Any) -> None:
+            selected_fields[node.type_condition.name.value]
+
+    for query in queries:
+        document = graphql.parse(query)
+        errors = graphql.validate(schema, document)
+        if errors:
+            raise ValueError(f"The query doesn't match the schema: {errors}")
+        graphql.visit(document, graphql.TypeInfoVisitor(type_info, SelectedFieldsCollector()))
+    return selected_fields
+
+
+def _named_type(type_ref: Dict[str, Any]) -> str:
+    while type_ref.get("ofType"):
+        type_ref = type_ref["ofType"]
+    return type_ref["name"]
+
+
+def prune_introspection(schema: graphql.GraphQLSchema, selected_fields: Dict[str, Set[str]]) -> Dict[str, Any]:
+    types = {schema_type["name"]: schema_type for schema_type in graphql.introspection_from_schema(schema)["__schema"]["types"]}
+    kept: Dict[str, Dict[str, Any]] = {}
+
+    def keep(name: str) -> None:
+        if name in kept or name.startswith("__"):
+            return
+        schema_type = dict(types[name])
+        kept[name] = schema_type
+        if schema_type["kind"] in ("OBJECT", "INTERFACE"):
+            schema_type["fields"] = [field for field in schema_type["fields"] if field["name"] in selected_fields.get(name, ())]
+            for field in schema_type["fields"]:
+                keep(_named_type(field["type"]))
+                for arg in field["args"]:
+                    keep(_named_type(arg["type"]))
+        elif schema_type["kind"] == "INPUT_OBJECT":
+            for input_field in schema_type["inputFields"]:
+                keep(_named_type(input_field["type"]))
+        elif schema_type["kind"] == "UNION":
+            for possible_type in schema_type["possibleTypes"]:
+                keep(possible_type["name"])
+
+    for name in selected_fields:
+        keep(name)
+
+    # the interfaces are only declared when they are queried
+    for schema_type in kept.values():
+        if schema_type.get("interfaces") is not None:
+            schema_type["interfaces"] = [interface for interface in schema_type["interfaces"] if interface["name"] in kept]
+        if schema_type["kind"] == "INTERFACE" and schema_type.get("possibleTypes") is not None:
+            schema_type["possibleTypes"] = [
+                possible_type for possible_type in schema_type["possibleTypes"] if possible_type["name"] in kept
+            ]
+    return {"queryType": {"name": schema.query_type.name}, "mutationType": None, "subscriptionType": None, "types": list(kept.values())}
+
+
+def generate_pruned_schema() -> str:
+    queries = build_queries()
+    schema = graphql.build_schema(to_sdl(github_schema.github_schema))
+    introspection = prune_introspection(schema, collect_selected_fields(schema, queries))
+
+    output = io.StringIO()
+    CodeGen("github_schema", introspection, output.write, docstrings=False).write()
+    return HEADER + output.getvalue()
+
+
+def main() -> None:
+    # the queries are built with the whole schema, so the fields missing in the pruned one are found
+    github_graphql._schema_root = github_schema.github_schema
+    PRUNED_SCHEMA_PATH.write_text(generate_pruned_schema())
+    print(f"Written {PRUNED_SCHEMA_PATH.relative_to(CONNECTOR_DIR)}, run the formatter on it before committing.")
+
+
+if __name__ == "__main__":
+    main()
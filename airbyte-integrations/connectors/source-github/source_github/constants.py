@@ -7,3 +7,6 @@ DEFAULT_PAGE_SIZE_FOR_LARGE_STREAM = 10
 DEFAULT_PAGE_SIZE = 100
 PERSONAL_ACCESS_TOKEN_TITLE = "Personal Access Token"
 ACCESS_TOKEN_TITLE = "Access Token"
+# the directory to keep the responses cache in between the syncs, the conditional requests are not sent unless it's set
+RESPONSE_CACHE_PATH_ENV = "GITHUB_RESPONSE_CACHE_PATH"
+RESPONSE_CACHE_FILENAME = "github_responses.sqlite"
@@ -0,0 +1,584 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+# Generated by `scripts/prune_github_schema.py` from `github_schema.py`, do not edit.
+#
+
+import sgqlc.types
+import sgqlc.types.datetime
+import sgqlc.types.relay
+
+
+github_schema = sgqlc.types.Schema()
+
+
+# Unexport Node/PageInfo, let schema re-declare them
+github_schema -= sgqlc.types.relay.Node
+github_schema -= sgqlc.types.relay.PageInfo
+
+
+########################################################################
+# Scalars and Enumerations
+########################################################################
+Boolean = sgqlc.types.Boolean
+
+
+class CommentAuthorAssociation(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("COLLABORATOR", "CONTRIBUTOR", "FIRST_TIMER", "FIRST_TIME_CONTRIBUTOR", "MANNEQUIN", "MEMBER", "NONE", "OWNER")
+
+
+DateTime = sgqlc.types.datetime.DateTime
+
+
+class GitObjectID(sgqlc.types.Scalar):
+    __schema__ = github_schema
+
+
+ID = sgqlc.types.ID
+
+Int = sgqlc.types.Int
+
+
+class IssueCommentOrderField(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("UPDATED_AT",)
+
+
+class IssueOrderField(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("COMMENTS", "CREATED_AT", "UPDATED_AT")
+
+
+class IssueState(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("CLOSED", "OPEN")
+
+
+class MergeStateStatus(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("BEHIND", "BLOCKED", "CLEAN", "DIRTY", "HAS_HOOKS", "UNKNOWN", "UNSTABLE")
+
+
+class MergeableState(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("CONFLICTING", "MERGEABLE", "UNKNOWN")
+
+
+class OrderDirection(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("ASC", "DESC")
+
+
+class ProjectV2OrderField(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("CREATED_AT", "NUMBER", "TITLE", "UPDATED_AT")
+
+
+class PullRequestReviewState(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("APPROVED", "CHANGES_REQUESTED", "COMMENTED", "DISMISSED", "PENDING")
+
+
+class PullRequestState(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("CLOSED", "MERGED", "OPEN")
+
+
+class ReactionContent(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("CONFUSED", "EYES", "HEART", "HOORAY", "LAUGH", "ROCKET", "THUMBS_DOWN", "THUMBS_UP")
+
+
+class ReactionOrderField(sgqlc.types.Enum):
+    __schema__ = github_schema
+    __choices__ = ("CREATED_AT",)
+
+
+String = sgqlc.types.String
+
+
+class URI(sgqlc.types.Scalar):
+    __schema__ = github_schema
+
+
+########################################################################
+# Input Objects
+########################################################################
+class IssueCommentOrder(sgqlc.types.Input):
+    __schema__ = github_schema
+    __field_names__ = ("field", "direction")
+    field = sgqlc.types.Field(sgqlc.types.non_null(IssueCommentOrderField), graphql_name="field")
+    direction = sgqlc.types.Field(sgqlc.types.non_null(OrderDirection), graphql_name="direction")
+
+
+class IssueFilters(sgqlc.types.Input):
+    __schema__ = github_schema
+    __field_names__ = (
+        "assignee",
+        "created_by",
+        "labels",
+        "mentioned",
+        "milestone",
+        "milestone_number",
+        "since",
+        "states",
+        "viewer_subscribed",
+    )
+    assignee = sgqlc.types.Field(String, graphql_name="assignee")
+    created_by = sgqlc.types.Field(String, graphql_name="createdBy")
+    labels = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null(String)), graphql_name="labels")
+    mentioned = sgqlc.types.Field(String, graphql_name="mentioned")
+    milestone = sgqlc.types.Field(String, graphql_name="milestone")
+    milestone_number = sgqlc.types.Field(String, graphql_name="milestoneNumber")
+    since = sgqlc.types.Field(DateTime, graphql_name="since")
+    states = sgqlc.types.Field(sgqlc.types.list_of(sgqlc.types.non_null(IssueState)), graphql_name="states")
+    viewer_subscribed = sgqlc.types.Field(Boolean, graphql_name="viewerSubscribed")
+
+
+class IssueOrder(sgqlc.types.Input):
+    __schema__ = github_schema
+    __field_names__ = ("field", "direction")
+    field = sgqlc.types.Field(sgqlc.types.non_null(IssueOrderField), graphql_name="field")
+    direction = sgqlc.types.Field(sgqlc.types.non_null(OrderDirection), graphql_name="direction")
+
+
+class ProjectV2Order(sgqlc.types.Input):
+    __schema__ = github_schema
+    __field_names__ = ("field", "direction")
+    field = sgqlc.types.Field(sgqlc.types.non_null(ProjectV2OrderField), graphql_name="field")
+    direction = sgqlc.types.Field(sgqlc.types.non_null(OrderDirection), graphql_name="direction")
+
+
+class ReactionOrder(sgqlc.types.Input):
+    __schema__ = github_schema
+    __field_names__ = ("field", "direction")
+    field = sgqlc.types.Field(sgqlc.types.non_null(ReactionOrderField), graphql_name="field")
+    direction = sgqlc.types.Field(sgqlc.types.non_null(OrderDirection), graphql_name="direction")
+
+
+########################################################################
+# Output Objects and Interfaces
+########################################################################
+class Actor(sgqlc.types.Interface):
+    __schema__ = github_schema
+    __field_names__ = ("avatar_url", "login", "resource_path", "url")
+    avatar_url = sgqlc.types.Field(
+        sgqlc.types.non_null(URI),
+        graphql_name="avatarUrl",
+        args=sgqlc.types.ArgDict((("size", sgqlc.types.Arg(Int, graphql_name="size", default=None)),)),
+    )
+    login = sgqlc.types.Field(sgqlc.types.non_null(String), graphql_name="login")
+    resource_path = sgqlc.types.Field(sgqlc.types.non_null(URI), graphql_name="resourcePath")
+    url = sgqlc.types.Field(sgqlc.types.non_null(URI), graphql_name="url")
+
+
+class Node(sgqlc.types.Interface):
+    __schema__ = github_schema
+    __field_names__ = ()
+
+
+class ProjectV2Owner(sgqlc.types.Interface):
+    __schema__ = github_schema
+    __field_names__ = ("id",)
+    id = sgqlc.types.Field(sgqlc.types.non_null(ID), graphql_name="id")
+
+
+class RepositoryOwner(sgqlc.types.Interface):
+    __schema__ = github_schema
+    __field_names__ = ("login",)
+    login = sgqlc.types.Field(sgqlc.types.non_null(String), graphql_name="login")
+
+
+class IssueCommentConnection(sgqlc.types.relay.Connection):
+    __schema__ = github_schema
+    __field_names__ = ("total_count",)
+    total_count = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="totalCount")
+
+
+class IssueConnection(sgqlc.types.relay.Connection):
+    __schema__ = github_schema
+    __field_names__ = ("page_info", "nodes")
+    page_info = sgqlc.types.Field(sgqlc.types.non_null("PageInfo"), graphql_name="pageInfo")
+    nodes = sgqlc.types.Field(sgqlc.types.list_of("Issue"), graphql_name="nodes")
+
+
+class PageInfo(sgqlc.types.Type):
+    __schema__ = github_schema
+    __field_names__ = ("end_cursor", "has_next_page")
+    end_cursor = sgqlc.types.Field(String, graphql_name="endCursor")
+    has_next_page = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="hasNextPage")
+
+
+class ProjectV2Connection(sgqlc.types.relay.Connection):
+    __schema__ = github_schema
+    __field_names__ = ("page_info", "nodes")
+    page_info = sgqlc.types.Field(sgqlc.types.non_null(PageInfo), graphql_name="pageInfo")
+    nodes = sgqlc.types.Field(sgqlc.types.list_of("ProjectV2"), graphql_name="nodes")
+
+
+class PullRequestCommitConnection(sgqlc.types.relay.Connection):
+    __schema__ = github_schema
+    __field_names__ = ("total_count",)
+    total_count = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="totalCount")
+
+
+class PullRequestConnection(sgqlc.types.relay.Connection):
+    __schema__ = github_schema
+    __field_names__ = ("page_info", "nodes", "total_count")
+    page_info = sgqlc.types.Field(sgqlc.types.non_null(PageInfo), graphql_name="pageInfo")
+    nodes = sgqlc.types.Field(sgqlc.types.list_of("PullRequest"), graphql_name="nodes")
+    total_count = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="totalCount")
+
+
+class PullRequestReviewCommentConnection(sgqlc.types.relay.Connection):
+    __schema__ = github_schema
+    __field_names__ = ("page_info", "nodes", "total_count")
+    page_info = sgqlc.types.Field(sgqlc.types.non_null(PageInfo), graphql_name="pageInfo")
+    nodes = sgqlc.types.Field(sgqlc.types.list_of("PullRequestReviewComment"), graphql_name="nodes")
+    total_count = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="totalCount")
+
+
+class PullRequestReviewConnection(sgqlc.types.relay.Connection):
+    __schema__ = github_schema
+    __field_names__ = ("page_info", "nodes", "total_count")
+    page_info = sgqlc.types.Field(sgqlc.types.non_null(PageInfo), graphql_name="pageInfo")
+    nodes = sgqlc.types.Field(sgqlc.types.list_of("PullRequestReview"), graphql_name="nodes")
+    total_count = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="totalCount")
+
+
+class Query(sgqlc.types.Type):
+    __schema__ = github_schema
+    __field_names__ = ("node", "repository")
+    node = sgqlc.types.Field(
+        Node,
+        graphql_name="node",
+        args=sgqlc.types.ArgDict((("id", sgqlc.types.Arg(sgqlc.types.non_null(ID), graphql_name="id", default=None)),)),
+    )
+    repository = sgqlc.types.Field(
+        "Repository",
+        graphql_name="repository",
+        args=sgqlc.types.ArgDict(
+            (
+                ("owner", sgqlc.types.Arg(sgqlc.types.non_null(String), graphql_name="owner", default=None)),
+                ("name", sgqlc.types.Arg(sgqlc.types.non_null(String), graphql_name="name", default=None)),
+                ("follow_renames", sgqlc.types.Arg(Boolean, graphql_name="followRenames", default=True)),
+            )
+        ),
+    )
+
+
+class ReactionConnection(sgqlc.types.relay.Connection):
+    __schema__ = github_schema
+    __field_names__ = ("page_info", "nodes", "total_count")
+    page_info = sgqlc.types.Field(sgqlc.types.non_null(PageInfo), graphql_name="pageInfo")
+    nodes = sgqlc.types.Field(sgqlc.types.list_of("Reaction"), graphql_name="nodes")
+    total_count = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="totalCount")
+
+
+class Commit(sgqlc.types.Type, Node):
+    __schema__ = github_schema
+    __field_names__ = ("oid",)
+    oid = sgqlc.types.Field(sgqlc.types.non_null(GitObjectID), graphql_name="oid")
+
+
+class Issue(sgqlc.types.Type, Node, ProjectV2Owner):
+    __schema__ = github_schema
+    __field_names__ = ("reactions", "number")
+    reactions = sgqlc.types.Field(
+        sgqlc.types.non_null(ReactionConnection),
+        graphql_name="reactions",
+        args=sgqlc.types.ArgDict(
+            (
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+                ("content", sgqlc.types.Arg(ReactionContent, graphql_name="content", default=None)),
+                ("order_by", sgqlc.types.Arg(ReactionOrder, graphql_name="orderBy", default=None)),
+            )
+        ),
+    )
+    number = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="number")
+
+
+class ProjectV2(sgqlc.types.Type, Node):
+    __schema__ = github_schema
+    __field_names__ = (
+        "closed",
+        "closed_at",
+        "viewer_can_close",
+        "viewer_can_reopen",
+        "viewer_can_update",
+        "id",
+        "created_at",
+        "creator",
+        "database_id",
+        "number",
+        "owner",
+        "public",
+        "readme",
+        "short_description",
+        "template",
+        "title",
+        "updated_at",
+        "url",
+    )
+    closed = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="closed")
+    closed_at = sgqlc.types.Field(DateTime, graphql_name="closedAt")
+    viewer_can_close = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="viewerCanClose")
+    viewer_can_reopen = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="viewerCanReopen")
+    viewer_can_update = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="viewerCanUpdate")
+    id = sgqlc.types.Field(sgqlc.types.non_null(ID), graphql_name="id")
+    created_at = sgqlc.types.Field(sgqlc.types.non_null(DateTime), graphql_name="createdAt")
+    creator = sgqlc.types.Field(Actor, graphql_name="creator")
+    database_id = sgqlc.types.Field(Int, graphql_name="databaseId")
+    number = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="number")
+    owner = sgqlc.types.Field(sgqlc.types.non_null(ProjectV2Owner), graphql_name="owner")
+    public = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="public")
+    readme = sgqlc.types.Field(String, graphql_name="readme")
+    short_description = sgqlc.types.Field(String, graphql_name="shortDescription")
+    template = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="template")
+    title = sgqlc.types.Field(sgqlc.types.non_null(String), graphql_name="title")
+    updated_at = sgqlc.types.Field(sgqlc.types.non_null(DateTime), graphql_name="updatedAt")
+    url = sgqlc.types.Field(sgqlc.types.non_null(URI), graphql_name="url")
+
+
+class PullRequest(sgqlc.types.Type, Node, ProjectV2Owner):
+    __schema__ = github_schema
+    __field_names__ = (
+        "updated_at",
+        "database_id",
+        "repository",
+        "url",
+        "additions",
+        "can_be_rebased",
+        "changed_files",
+        "comments",
+        "commits",
+        "deletions",
+        "maintainer_can_modify",
+        "merge_state_status",
+        "mergeable",
+        "merged",
+        "merged_by",
+        "number",
+        "reviews",
+    )
+    updated_at = sgqlc.types.Field(sgqlc.types.non_null(DateTime), graphql_name="updatedAt")
+    database_id = sgqlc.types.Field(Int, graphql_name="databaseId")
+    repository = sgqlc.types.Field(sgqlc.types.non_null("Repository"), graphql_name="repository")
+    url = sgqlc.types.Field(sgqlc.types.non_null(URI), graphql_name="url")
+    additions = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="additions")
+    can_be_rebased = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="canBeRebased")
+    changed_files = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="changedFiles")
+    comments = sgqlc.types.Field(
+        sgqlc.types.non_null(IssueCommentConnection),
+        graphql_name="comments",
+        args=sgqlc.types.ArgDict(
+            (
+                ("order_by", sgqlc.types.Arg(IssueCommentOrder, graphql_name="orderBy", default=None)),
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+            )
+        ),
+    )
+    commits = sgqlc.types.Field(
+        sgqlc.types.non_null(PullRequestCommitConnection),
+        graphql_name="commits",
+        args=sgqlc.types.ArgDict(
+            (
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+            )
+        ),
+    )
+    deletions = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="deletions")
+    maintainer_can_modify = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="maintainerCanModify")
+    merge_state_status = sgqlc.types.Field(sgqlc.types.non_null(MergeStateStatus), graphql_name="mergeStateStatus")
+    mergeable = sgqlc.types.Field(sgqlc.types.non_null(MergeableState), graphql_name="mergeable")
+    merged = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="merged")
+    merged_by = sgqlc.types.Field(Actor, graphql_name="mergedBy")
+    number = sgqlc.types.Field(sgqlc.types.non_null(Int), graphql_name="number")
+    reviews = sgqlc.types.Field(
+        PullRequestReviewConnection,
+        graphql_name="reviews",
+        args=sgqlc.types.ArgDict(
+            (
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+                (
+                    "states",
+                    sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(PullRequestReviewState)), graphql_name="states", default=None),
+                ),
+                ("author", sgqlc.types.Arg(String, graphql_name="author", default=None)),
+            )
+        ),
+    )
+
+
+class PullRequestReview(sgqlc.types.Type, Node):
+    __schema__ = github_schema
+    __field_names__ = (
+        "id",
+        "author",
+        "author_association",
+        "body",
+        "created_at",
+        "updated_at",
+        "database_id",
+        "repository",
+        "comments",
+        "commit",
+        "state",
+        "submitted_at",
+        "url",
+    )
+    id = sgqlc.types.Field(sgqlc.types.non_null(ID), graphql_name="id")
+    author = sgqlc.types.Field(Actor, graphql_name="author")
+    author_association = sgqlc.types.Field(sgqlc.types.non_null(CommentAuthorAssociation), graphql_name="authorAssociation")
+    body = sgqlc.types.Field(sgqlc.types.non_null(String), graphql_name="body")
+    created_at = sgqlc.types.Field(sgqlc.types.non_null(DateTime), graphql_name="createdAt")
+    updated_at = sgqlc.types.Field(sgqlc.types.non_null(DateTime), graphql_name="updatedAt")
+    database_id = sgqlc.types.Field(Int, graphql_name="databaseId")
+    repository = sgqlc.types.Field(sgqlc.types.non_null("Repository"), graphql_name="repository")
+    comments = sgqlc.types.Field(
+        sgqlc.types.non_null(PullRequestReviewCommentConnection),
+        graphql_name="comments",
+        args=sgqlc.types.ArgDict(
+            (
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+            )
+        ),
+    )
+    commit = sgqlc.types.Field(Commit, graphql_name="commit")
+    state = sgqlc.types.Field(sgqlc.types.non_null(PullRequestReviewState), graphql_name="state")
+    submitted_at = sgqlc.types.Field(DateTime, graphql_name="submittedAt")
+    url = sgqlc.types.Field(sgqlc.types.non_null(URI), graphql_name="url")
+
+
+class PullRequestReviewComment(sgqlc.types.Type, Node):
+    __schema__ = github_schema
+    __field_names__ = ("id", "database_id", "reactions", "repository")
+    id = sgqlc.types.Field(sgqlc.types.non_null(ID), graphql_name="id")
+    database_id = sgqlc.types.Field(Int, graphql_name="databaseId")
+    reactions = sgqlc.types.Field(
+        sgqlc.types.non_null(ReactionConnection),
+        graphql_name="reactions",
+        args=sgqlc.types.ArgDict(
+            (
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+                ("content", sgqlc.types.Arg(ReactionContent, graphql_name="content", default=None)),
+                ("order_by", sgqlc.types.Arg(ReactionOrder, graphql_name="orderBy", default=None)),
+            )
+        ),
+    )
+    repository = sgqlc.types.Field(sgqlc.types.non_null("Repository"), graphql_name="repository")
+
+
+class Reaction(sgqlc.types.Type, Node):
+    __schema__ = github_schema
+    __field_names__ = ("id", "content", "created_at", "database_id", "user")
+    id = sgqlc.types.Field(sgqlc.types.non_null(ID), graphql_name="id")
+    content = sgqlc.types.Field(sgqlc.types.non_null(ReactionContent), graphql_name="content")
+    created_at = sgqlc.types.Field(sgqlc.types.non_null(DateTime), graphql_name="createdAt")
+    database_id = sgqlc.types.Field(Int, graphql_name="databaseId")
+    user = sgqlc.types.Field("User", graphql_name="user")
+
+
+class Repository(sgqlc.types.Type, Node):
+    __schema__ = github_schema
+    __field_names__ = ("name", "owner", "issue", "issues", "projects_v2", "pull_request", "pull_requests")
+    name = sgqlc.types.Field(sgqlc.types.non_null(String), graphql_name="name")
+    owner = sgqlc.types.Field(sgqlc.types.non_null(RepositoryOwner), graphql_name="owner")
+    issue = sgqlc.types.Field(
+        Issue,
+        graphql_name="issue",
+        args=sgqlc.types.ArgDict((("number", sgqlc.types.Arg(sgqlc.types.non_null(Int), graphql_name="number", default=None)),)),
+    )
+    issues = sgqlc.types.Field(
+        sgqlc.types.non_null(IssueConnection),
+        graphql_name="issues",
+        args=sgqlc.types.ArgDict(
+            (
+                ("order_by", sgqlc.types.Arg(IssueOrder, graphql_name="orderBy", default=None)),
+                ("labels", sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(String)), graphql_name="labels", default=None)),
+                ("states", sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(IssueState)), graphql_name="states", default=None)),
+                ("filter_by", sgqlc.types.Arg(IssueFilters, graphql_name="filterBy", default=None)),
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+            )
+        ),
+    )
+    projects_v2 = sgqlc.types.Field(
+        sgqlc.types.non_null(ProjectV2Connection),
+        graphql_name="projectsV2",
+        args=sgqlc.types.ArgDict(
+            (
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+                ("query", sgqlc.types.Arg(String, graphql_name="query", default=None)),
+                ("order_by", sgqlc.types.Arg(ProjectV2Order, graphql_name="orderBy", default={"field": "NUMBER", "direction": "DESC"})),
+            )
+        ),
+    )
+    pull_request = sgqlc.types.Field(
+        PullRequest,
+        graphql_name="pullRequest",
+        args=sgqlc.types.ArgDict((("number", sgqlc.types.Arg(sgqlc.types.non_null(Int), graphql_name="number", default=None)),)),
+    )
+    pull_requests = sgqlc.types.Field(
+        sgqlc.types.non_null(PullRequestConnection),
+        graphql_name="pullRequests",
+        args=sgqlc.types.ArgDict(
+            (
+                (
+                    "states",
+                    sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(PullRequestState)), graphql_name="states", default=None),
+                ),
+                ("labels", sgqlc.types.Arg(sgqlc.types.list_of(sgqlc.types.non_null(String)), graphql_name="labels", default=None)),
+                ("head_ref_name", sgqlc.types.Arg(String, graphql_name="headRefName", default=None)),
+                ("base_ref_name", sgqlc.types.Arg(String, graphql_name="baseRefName", default=None)),
+                ("order_by", sgqlc.types.Arg(IssueOrder, graphql_name="orderBy", default=None)),
+                ("after", sgqlc.types.Arg(String, graphql_name="after", default=None)),
+                ("before", sgqlc.types.Arg(String, graphql_name="before", default=None)),
+                ("first", sgqlc.types.Arg(Int, graphql_name="first", default=None)),
+                ("last", sgqlc.types.Arg(Int, graphql_name="last", default=None)),
+            )
+        ),
+    )
+
+
+class User(sgqlc.types.Type, Node, Actor, ProjectV2Owner, RepositoryOwner):
+    __schema__ = github_schema
+    __field_names__ = ("database_id", "is_site_admin")
+    database_id = sgqlc.types.Field(Int, graphql_name="databaseId")
+    is_site_admin = sgqlc.types.Field(sgqlc.types.non_null(Boolean), graphql_name="isSiteAdmin")
+
+
+########################################################################
+# Unions
+########################################################################
+
+########################################################################
+# Schema Entry Points
+########################################################################
+github_schema.query_type = Query
+github_schema.mutation_type = None
+github_schema.subscription_type = None
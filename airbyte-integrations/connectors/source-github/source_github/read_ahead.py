@@ -0,0 +1,188 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter
+
+
+# the number of pages of each slice kept in memory until they are read
+MAX_BUFFERED_PAGES = 2
+# how often the waiting threads check if the pages are still needed, in seconds
+_STOP_CHECK_INTERVAL = 0.1
+
+
+class _Done:
+    """All the pages of the slice are fetched."""
+
+
+class _Failure:
+    """Fetching the pages failed, the exception is raised to the reader of the slice."""
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class _Pages:
+    def __init__(self, max_size: int):
+        self.queue: "queue.Queue" = queue.Queue(maxsize=max_size)
+        self.stopped = threading.Event()
+
+    def put(self, item: Any) -> bool:
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=_STOP_CHECK_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def fetch(self, fetch_pages: Callable[[], Iterable[Any]]) -> None:
+        if self.stopped.is_set():
+            return
+        try:
+            for page in fetch_pages():
+                if not self.put(page):
+                    return
+        except Exception as exc:
+            self.put(_Failure(exc))
+            return
+        self.put(_Done())
+
+    def read(self) -> Iterator[Any]:
+        try:
+            while True:
+                try:
+                    item = self.queue.get(timeout=_STOP_CHECK_INTERVAL)
+                except queue.Empty:
+                    if self.stopped.is_set():
+                        return
+                    continue
+                if isinstance(item, _Done):
+                    return
+                if isinstance(item, _Failure):
+                    raise item.exception
+                yield item
+        finally:
+            self.stopped.set()
+
+
+class SlicesReadAhead:
+    """
+    Fetches the pages of the slices in background threads, so the slices of the stream (the repositories) are requested
+    at the same time, up to `max_concurrent_slices` of them: the slice being read and the ones following it.
+    The slices are still read one after another in their order, so the records and the state are the same as the sequential read gives.
+
+    Example:
+        read_ahead = SlicesReadAhead(fetch_pages=stream._fetch_slice_pages, slices=slices, max_concurrent_slices=3)
+        for stream_slice in slices:
+            pages = read_ahead.read(stream_slice, stream_state)  # or None, if the slice is not known (or read already)
+        read_ahead.close()
+    """
+
+    def __init__(
+        self,
+        fetch_pages: Callable[[Mapping[str, Any], Optional[Mapping[str, Any]]], Iterable[Any]],
+        slices: List[Mapping[str, Any]],
+        max_concurrent_slices: int,
+        max_buffered_pages: int = MAX_BUFFERED_PAGES,
+    ):
+        self._fetch_pages = fetch_pages
+        self._slices = slices
+        self.max_concurrent_slices = max(max_concurrent_slices, 1)
+        self.max_buffered_pages = max(max_buffered_pages, 1)
+        self._pages: Dict[int, _Pages] = {}
+        # the index of the next slice to read
+        self._next_index = 0
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent_slices, thread_name_prefix="github_slices_read_ahead")
+
+    def read(self, stream_slice: Mapping[str, Any], stream_state: Optional[Mapping[str, Any]] = None) -> Optional[Iterator[Any]]:
+        """The pages of the slice fetched in background, the next slices are fetched with the same state."""
+        index = self._index(stream_slice)
+        if self._closed or index is None:
+            return None
+
+        for skipped_index in range(self._next_index, index):
+            if skipped_index in self._pages:
+                self._pages[skipped_index].stopped.set()
+        self._next_index = index + 1
+        for next_index in range(index, min(index + self.max_concurrent_slices, len(self._slices))):
+            self._submit(next_index, stream_state)
+        return self._pages[index].read()
+
+    def close(self) -> None:
+        self._closed = True
+        for pages in self._pages.values():
+            pages.stopped.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _index(self, stream_slice: Mapping[str, Any]) -> Optional[int]:
+        for index in range(self._next_index, len(self._slices)):
+            if self._slices[index] == stream_slice:
+                return index
+        return None
+
+    def _submit(self, index: int, stream_state: Optional[Mapping[str, Any]]) -> None:
+        if index not in self._pages:
+            self._pages[index] = _Pages(self.max_buffered_pages)
+            stream_slice = self._slices[index]
+            self._executor.submit(self._pages[index].fetch, lambda: self._fetch_pages(stream_slice, stream_state))
+
+
+class ReadAheadAdapter(BaseAdapter):
+    """
+    Gives the responses read ahead to the requests of the thread reading the slice, so the stream paginates as usual.
+    The requests sent within `read_ahead()` take the pages in their order, the pages requested by that thread in another way
+    (e.g. taken from the `requests_cache`) are skipped. The rest of the requests are sent by the wrapped `adapter`.
+
+    Example:
+        session.mount(api_url, ReadAheadAdapter(session.get_adapter(api_url)))
+        with adapter.read_ahead(read_ahead.read(stream_slice, stream_state)):
+            records = list(stream.read_records(...))
+    """
+
+    def __init__(self, adapter: BaseAdapter):
+        super().__init__()
+        self.adapter = adapter
+        self._local = threading.local()
+
+    @contextmanager
+    def read_ahead(self, pages: Optional[Iterator[Tuple[requests.PreparedRequest, requests.Response]]]) -> Iterator[None]:
+        self._local.pages = pages
+        try:
+            yield
+        finally:
+            self._local.pages = None
+            if pages:
+                pages.close()
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        response = self._take_page(request)
+        if response is not None:
+            return response
+        return self.adapter.send(request, **kwargs)
+
+    def close(self) -> None:
+        self.adapter.close()
+
+    def _take_page(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        pages = getattr(self._local, "pages", None)
+        if not pages:
+            return None
+        try:
+            for page_request, response in pages:
+                if page_request.method == request.method and page_request.url == request.url:
+                    return response
+        except Exception:
+            # the request is sent again, so the error is handled the usual way
+            pass
+        # the rest of the pages (if any) are requested as usual
+        self._local.pages = None
+        return None
@@ -0,0 +1,121 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+import requests
+
+from .utils import TokenReleasingAdapter
+
+
+# the headers of the cached response replayed along with it's body, the rest of the headers come from the `304 Not Modified` response
+REPLAYED_HEADERS = ("Content-Type", "Link")
+
+
+@dataclass
+class CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Mapping[str, str]
+    content: bytes
+
+
+class ResponseCache:
+    """
+    The responses of the GitHub REST API stored on disk by their URL, along with their `ETag` and `Last-Modified` headers,
+    so they can be requested conditionally by the next sync.
+    The cache is shared by the streams, which may be read from several threads at once.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, headers TEXT, content BLOB)"
+            )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute("SELECT etag, last_modified, headers, content FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, headers, content = row
+        return CachedResponse(etag=etag, last_modified=last_modified, headers=json.loads(headers), content=bytes(content))
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, last_modified, headers, content) VALUES (?, ?, ?, ?, ?)",
+                (key, response.etag, response.last_modified, json.dumps(dict(response.headers)), response.content),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class ConditionalRequestAdapter(TokenReleasingAdapter):
+    """
+    Sends the GET requests with the `If-None-Match` / `If-Modified-Since` headers of the cached response (if any).
+    GitHub doesn't count the `304 Not Modified` responses against the rate limit, such a response is replayed
+    as the cached one with the `200 OK` status, so the streams parse and paginate it as usual.
+
+    API docs: https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#use-conditional-requests-if-appropriate
+    """
+
+    def __init__(self, cache: ResponseCache, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    @staticmethod
+    def cache_key(request: requests.PreparedRequest) -> str:
+        # the same URL gives the different content for the different media types and the different tokens,
+        # the token is only stored as a fingerprint
+        token_fingerprint = hashlib.sha256(request.headers.get("Authorization", "").encode()).hexdigest()[:16]
+        return f"{token_fingerprint} {request.headers.get('Accept', '')} {request.url}"
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        key = self.cache_key(request)
+        cached = self.cache.get(key)
+        if cached:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = super().send(request, **kwargs)
+        if cached and response.status_code == requests.codes.NOT_MODIFIED:
+            return self._replay(response, cached)
+        if response.status_code == requests.codes.OK and (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+            self.cache.set(
+                key,
+                CachedResponse(
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    headers={name: response.headers[name] for name in REPLAYED_HEADERS if name in response.headers},
+                    content=response.content,
+                ),
+            )
+        return response
+
+    @staticmethod
+    def _replay(response: requests.Response, cached: CachedResponse) -> requests.Response:
+        # the empty body is read, so the connection is released to the pool
+        response.content
+        response.status_code = requests.codes.OK
+        response.reason = "OK"
+        response.headers.update(cached.headers)
+        response.headers.pop("Content-Length", None)
+        response._content = cached.content
+        return response
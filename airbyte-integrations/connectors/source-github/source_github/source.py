@@ -2,11 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import logging
-from os import getenv
-from typing import Any, List, Mapping, MutableMapping, Optional, Tuple
+from os import getenv, makedirs, path
+from typing import Any, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 from urllib.parse import urlparse
 
-from airbyte_cdk.models import FailureType
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, ConfiguredAirbyteCatalog, FailureType
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http.requests_native_auth import MultipleTokenAuthenticator
@@ -14,6 +14,7 @@ from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter
 
 from . import constants
+from .response_cache import ResponseCache
 from .streams import (
     Assignees,
     Branches,
@@ -62,6 +63,10 @@ from .utils import read_full_refresh
 class SourceGithub(AbstractSource):
     continue_sync_on_stream_failure = True
 
+    def __init__(self):
+        super().__init__()
+        self._response_caches: List[ResponseCache] = []
+
     @staticmethod
     def _get_org_repositories(
         config: Mapping[str, Any], authenticator: MultipleTokenAuthenticator, is_check_connection: bool = False
@@ -208,6 +213,27 @@ class SourceGithub(AbstractSource):
             user_message = self.user_friendly_error_message(message)
             return False, user_message or message
 
+    @staticmethod
+    def _get_response_cache() -> Optional[ResponseCache]:
+        cache_path = getenv(constants.RESPONSE_CACHE_PATH_ENV)
+        if not cache_path:
+            return None
+        makedirs(cache_path, exist_ok=True)
+        return ResponseCache(path.join(cache_path, constants.RESPONSE_CACHE_FILENAME))
+
+    def read(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[List[AirbyteStateMessage]] = None,
+    ) -> Iterator[AirbyteMessage]:
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            for response_cache in self._response_caches:
+                response_cache.close()
+
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         authenticator = self._get_authenticator(config)
         config = self._validate_and_transform_config(config)
@@ -239,12 +265,16 @@ class SourceGithub(AbstractSource):
         page_size = config.get("page_size_for_large_streams", constants.DEFAULT_PAGE_SIZE_FOR_LARGE_STREAM)
         access_token_type, _ = self.get_access_token(config)
         max_waiting_time = config.get("max_waiting_time", 10) * 60
+        response_cache = self._get_response_cache()
+        if response_cache:
+            self._response_caches.append(response_cache)
         organization_args = {
             "authenticator": authenticator,
             "organizations": organizations,
             "api_url": config.get("api_url"),
             "access_token_type": access_token_type,
             "max_waiting_time": max_waiting_time,
+            "response_cache": response_cache,
         }
         start_date = config.get("start_date")
         organization_args_with_start_date = {**organization_args, "start_date": start_date}
@@ -256,6 +286,7 @@ class SourceGithub(AbstractSource):
             "page_size_for_large_streams": page_size,
             "access_token_type": access_token_type,
             "max_waiting_time": max_waiting_time,
+            "response_cache": response_cache,
         }
         repository_args_with_start_date = {**repository_args, "start_date": start_date}
 
@@ -4,7 +4,7 @@
 
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib import parse
 
 import pendulum
@@ -13,6 +13,7 @@ import requests
 from airbyte_cdk import BackoffStrategy, StreamSlice
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
 from airbyte_cdk.sources.streams.checkpoint.substream_resumable_full_refresh_cursor import SubstreamResumableFullRefreshCursor
 from airbyte_cdk.sources.streams.core import CheckpointMixin, Stream
@@ -38,7 +39,9 @@ from .graphql import (
     get_query_pull_requests,
     get_query_reviews,
 )
-from .utils import GitHubAPILimitException, getter
+from .read_ahead import ReadAheadAdapter, SlicesReadAhead
+from .response_cache import ConditionalRequestAdapter, ResponseCache
+from .utils import GitHubAPILimitException, MultipleTokenAuthenticatorWithRateLimiter, TokenReleasingAdapter, getter
 
 
 class GithubStreamABC(HttpStream, ABC):
@@ -48,8 +51,16 @@ class GithubStreamABC(HttpStream, ABC):
     large_stream = False
     max_retries: int = 5
     stream_base_params = {}
+    # Send the requests conditionally, using the cached responses of the previous sync (if the cache is given)
+    use_conditional_requests = False
 
-    def __init__(self, api_url: str = "https://api.github.com", access_token_type: str = "", **kwargs):
+    def __init__(
+        self,
+        api_url: str = "https://api.github.com",
+        access_token_type: str = "",
+        response_cache: Optional[ResponseCache] = None,
+        **kwargs,
+    ):
         if kwargs.get("authenticator"):
             kwargs["authenticator"].max_time = kwargs.pop("max_waiting_time", self.max_time)
         super().__init__(**kwargs)
@@ -58,6 +69,17 @@ class GithubStreamABC(HttpStream, ABC):
         self.api_url = api_url
         self.state = {}
 
+        authenticator = self._http_client._session.auth
+        adapter_args = {
+            "authenticator": authenticator if isinstance(authenticator, MultipleTokenAuthenticatorWithRateLimiter) else None,
+            "pool_connections": MAX_CONNECTION_POOL_SIZE,
+            "pool_maxsize": MAX_CONNECTION_POOL_SIZE,
+        }
+        if response_cache and self.use_conditional_requests:
+            self._http_client._session.mount(self.api_url, ConditionalRequestAdapter(response_cache, **adapter_args))
+        elif adapter_args["authenticator"]:
+            self._http_client._session.mount(self.api_url, TokenReleasingAdapter(**adapter_args))
+
         if not self.supports_incremental:
             self.cursor = SubstreamResumableFullRefreshCursor()
 
@@ -189,19 +211,81 @@ class GithubStreamABC(HttpStream, ABC):
 
 
 class GithubStream(GithubStreamABC):
+    # Request the next repositories in background while the current one is read, as many at a time as there are tokens
+    read_slices_ahead = True
+
     def __init__(self, repositories: List[str], page_size_for_large_streams: int, **kwargs):
         super().__init__(**kwargs)
         self.repositories = repositories
         # GitHub pagination could be from 1 to 100.
         # This parameter is deprecated and in future will be used sane default, page_size: 10
         self.page_size = page_size_for_large_streams if self.large_stream else constants.DEFAULT_PAGE_SIZE
+        self._slices_read_ahead: Optional[SlicesReadAhead] = None
+        self._read_ahead_adapter: Optional[ReadAheadAdapter] = None
+        if self.read_slices_ahead and self.max_concurrent_slices > 1:
+            # the pages read ahead are given to the requests of the stream, see `read_records()`
+            session = self._http_client._session
+            self._read_ahead_adapter = ReadAheadAdapter(session.get_adapter(self.api_url))
+            session.mount(self.api_url, self._read_ahead_adapter)
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/{self.name}"
 
+    @property
+    def max_concurrent_slices(self) -> int:
+        max_concurrent_requests = getattr(self._http_client._session.auth, "max_concurrent_requests", 1)
+        return min(max_concurrent_requests, MAX_CONNECTION_POOL_SIZE)
+
     def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
-        for repository in self.repositories:
-            yield {"repository": repository}
+        slices = [{"repository": repository} for repository in self.repositories]
+        if self._read_ahead_adapter and len(slices) > 1:
+            self._slices_read_ahead = SlicesReadAhead(self._fetch_slice_pages, slices, self.max_concurrent_slices)
+        try:
+            yield from slices
+        finally:
+            if self._slices_read_ahead:
+                self._slices_read_ahead.close()
+                self._slices_read_ahead = None
+
+    def read_records(
+        self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, **kwargs
+    ) -> Iterable[Mapping[str, Any]]:
+        if not self._slices_read_ahead:
+            yield from super().read_records(stream_slice=stream_slice, stream_state=stream_state, **kwargs)
+            return
+        with self._read_ahead_adapter.read_ahead(self._slices_read_ahead.read(stream_slice, stream_state)):
+            yield from super().read_records(stream_slice=stream_slice, stream_state=stream_state, **kwargs)
+
+    def _fetch_slice_pages(
+        self, stream_slice: Mapping[str, Any], stream_state: Optional[Mapping[str, Any]]
+    ) -> Iterable[Tuple[requests.PreparedRequest, requests.Response]]:
+        """
+        Runs in the background thread, the pages are requested the same way `read_records()` does,
+        so `ReadAheadAdapter` gives them to the requests of the stream
+        """
+        next_page_token = None
+        while True:
+            request, response = self._http_client.send_request(
+                http_method=self.http_method,
+                url=self._join_url(
+                    self.url_base, self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+                ),
+                request_kwargs=self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+                headers=self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+                params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+                json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+                data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+                dedupe_query_params=True,
+                log_formatter=self.get_log_formatter(),
+                exit_on_rate_limit=self.exit_on_rate_limit,
+            )
+            yield request, response
+            # the stream sorted descending stops at the first record older than the state, so only it's first page is requested ahead
+            if getattr(self, "is_sorted", None) == "desc":
+                return
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                return
 
     def get_error_display_message(self, exception: BaseException) -> Optional[str]:
         if (
@@ -348,12 +432,16 @@ class Assignees(GithubStream):
     API docs: https://docs.github.com/en/rest/issues/assignees?apiVersion=2022-11-28#list-assignees
     """
 
+    use_conditional_requests = True
+
 
 class Branches(GithubStream):
     """
     API docs: https://docs.github.com/en/rest/branches/branches?apiVersion=2022-11-28#list-branches
     """
 
+    use_conditional_requests = True
+
     primary_key = ["repository", "name"]
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
@@ -365,12 +453,16 @@ class Collaborators(GithubStream):
     API docs: https://docs.github.com/en/rest/collaborators/collaborators?apiVersion=2022-11-28#list-repository-collaborators
     """
 
+    use_conditional_requests = True
+
 
 class IssueLabels(GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/labels?apiVersion=2022-11-28#list-labels-for-a-repository
     """
 
+    use_conditional_requests = True
+
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/labels"
 
@@ -380,6 +472,8 @@ class Organizations(GithubStreamABC):
     API docs: https://docs.github.com/en/rest/orgs/orgs?apiVersion=2022-11-28#list-organizations
     """
 
+    use_conditional_requests = True
+
     # GitHub pagination could be from 1 to 100.
     page_size = 100
 
@@ -433,6 +527,8 @@ class Tags(GithubStream):
     API docs: https://docs.github.com/en/rest/repos/repos?apiVersion=2022-11-28#list-repository-tags
     """
 
+    use_conditional_requests = True
+
     primary_key = ["repository", "name"]
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
@@ -654,6 +750,8 @@ class Commits(IncrementalMixin, GithubStream):
     primary_key = "sha"
     cursor_field = "created_at"
     slice_keys = ["repository", "branch"]
+    # The slices are the branches of the repositories
+    read_slices_ahead = False
 
     def __init__(self, branches_to_pull: List[str], **kwargs):
         super().__init__(**kwargs)
@@ -756,6 +854,8 @@ class ReviewComments(IncrementalMixin, GithubStream):
 
 class GitHubGraphQLStream(GithubStream, ABC):
     http_method = "POST"
+    # The cursors of the nested pages are kept by the stream while the records are parsed
+    read_slices_ahead = False
 
     def path(
         self, *, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
@@ -977,6 +1077,8 @@ class ReactionStream(GithubStream, CheckpointMixin, ABC):
     parent_key = "id"
     copy_parent_key = "comment_id"
     cursor_field = "created_at"
+    # The slices are the parent records of the repositories
+    read_slices_ahead = False
 
     def __init__(self, start_date: str = "", **kwargs):
         super().__init__(**kwargs)
@@ -1432,6 +1534,8 @@ class WorkflowRuns(SemiIncrementalMixin, GithubStream):
 
     # https://docs.github.com/en/actions/managing-workflow-runs/re-running-workflows-and-jobs
     re_run_period = 32  # days
+    # The repository is read back to the `re_run_period` before the state only, the pages requested ahead would be mostly wasted
+    read_slices_ahead = False
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/actions/runs"
@@ -1480,6 +1584,8 @@ class WorkflowJobs(SemiIncrementalMixin, GithubStream):
     """
 
     cursor_field = "completed_at"
+    # The slices are the workflow runs of the parent stream
+    read_slices_ahead = False
 
     def __init__(self, parent: WorkflowRuns, **kwargs):
         super().__init__(**kwargs)
@@ -2,13 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 import time
+from collections import Counter
 from dataclasses import dataclass
 from itertools import cycle
-from typing import Any, List, Mapping
+from typing import Any, List, Mapping, Optional
 
 import pendulum
 import requests
+from requests.adapters import HTTPAdapter
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams import Stream
@@ -53,6 +56,10 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
     If a token exceeds the capacity limit, the system switches to another token.
     If all tokens are exhausted, the system will enter a sleep state until
     the first token becomes available again.
+
+    The requests may be sent from several threads at once (see `max_concurrent_requests`):
+    each request takes the token with the least requests in flight, the active token is kept while it's not busy,
+    and the remaining limits of the token are updated from the `X-RateLimit-*` headers of it's responses.
     """
 
     DURATION = pendulum.duration(seconds=3600)  # Duration at which the current rate limit window resets
@@ -65,6 +72,8 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         self._tokens_iter = cycle(self._tokens)
         self._active_token = next(self._tokens_iter)
         self._max_time = 60 * 10  # 10 minutes as default
+        self._requests_in_flight = Counter()
+        self._lock = threading.RLock()
 
     @property
     def auth_header(self) -> str:
@@ -78,25 +87,79 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
 
     def __call__(self, request):
         """Attach the HTTP headers required to authenticate on the HTTP request"""
-        while True:
-            current_token = self._tokens[self.current_active_token]
-            if "graphql" in request.path_url:
-                if self.process_token(current_token, "count_graphql", "reset_at_graphql"):
-                    break
-            else:
-                if self.process_token(current_token, "count_rest", "reset_at_rest"):
+        count_attr, reset_attr = ("count_graphql", "reset_at_graphql") if "graphql" in request.path_url else ("count_rest", "reset_at_rest")
+        with self._lock:
+            self._take_least_busy_token(count_attr)
+            while True:
+                current_token = self._tokens[self.current_active_token]
+                if self.process_token(current_token, count_attr, reset_attr):
                     break
 
-        request.headers.update(self.get_auth_header())
+            request.headers.update(self.get_auth_header())
+        request.register_hook("response", self._on_response)
 
         return request
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        """GitHub asks to send the requests of the same token one at a time, the tokens are used at the same time"""
+        return len(self._tokens)
+
+    def _take_least_busy_token(self, count_attr: str) -> None:
+        tokens_left = [token for token, token_info in self._tokens.items() if getattr(token_info, count_attr) > 0]
+        if tokens_left and self._requests_in_flight[self._active_token]:
+            self._active_token = min(tokens_left, key=lambda token: (self._requests_in_flight[token], token != self._active_token))
+
+    def _on_response(self, response: requests.Response, **kwargs) -> requests.Response:
+        token = self._get_request_token(response.request)
+        if token:
+            with self._lock:
+                self._update_token_limits(token, response)
+        return response
+
+    def acquire(self, request: requests.PreparedRequest) -> None:
+        """The request is sent, it's in flight until `release()`, see `TokenReleasingAdapter`"""
+        token = self._get_request_token(request)
+        if token:
+            with self._lock:
+                self._requests_in_flight[token] += 1
+
+    def release(self, request: requests.PreparedRequest) -> None:
+        """The request is not in flight anymore: it got a response or failed, see `TokenReleasingAdapter`"""
+        token = self._get_request_token(request)
+        if token:
+            with self._lock:
+                if self._requests_in_flight[token] > 0:
+                    self._requests_in_flight[token] -= 1
+
+    def _get_request_token(self, request: requests.PreparedRequest) -> Optional[str]:
+        auth_header = request.headers.get(self.auth_header, "")
+        token = auth_header[len(self._auth_method) + 1 :] if self._auth_method else auth_header
+        return token if token in self._tokens else None
+
+    def _update_token_limits(self, token: str, response: requests.Response) -> None:
+        """Keep the remaining limits of the token up to date without requesting them, the concurrent requests may respond in any order"""
+        remaining, reset = response.headers.get("X-RateLimit-Remaining"), response.headers.get("X-RateLimit-Reset")
+        resource = response.headers.get("X-RateLimit-Resource", "core")
+        if remaining is None or reset is None or resource not in ("core", "graphql"):
+            return
+        count_attr, reset_attr = ("count_graphql", "reset_at_graphql") if resource == "graphql" else ("count_rest", "reset_at_rest")
+        token_info = self._tokens[token]
+        remaining, reset_at = int(remaining), pendulum.from_timestamp(int(reset))
+        if reset_at > getattr(token_info, reset_attr):
+            # the limits are reset
+            setattr(token_info, count_attr, remaining)
+            setattr(token_info, reset_attr, reset_at)
+        elif reset_at == getattr(token_info, reset_attr):
+            setattr(token_info, count_attr, min(getattr(token_info, count_attr), remaining))
+
     @property
     def current_active_token(self) -> str:
         return self._active_token
 
     def update_token(self) -> None:
-        self._active_token = next(self._tokens_iter)
+        with self._lock:
+            self._active_token = next(self._tokens_iter)
 
     @property
     def token(self) -> str:
@@ -152,3 +215,24 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         else:
             self.update_token()
         return False
+
+
+class TokenReleasingAdapter(HTTPAdapter):
+    """
+    Counts the requests in flight of `MultipleTokenAuthenticatorWithRateLimiter` while they are sent: the token is released
+    whether a response is received or the request failed (connection error, timeout). The requests that are prepared but
+    not sent (answered from the `requests_cache`, failed before sending) are not counted at all.
+    """
+
+    def __init__(self, authenticator: Optional[MultipleTokenAuthenticatorWithRateLimiter] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.authenticator = authenticator
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if not self.authenticator:
+            return super().send(request, **kwargs)
+        self.authenticator.acquire(request)
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            self.authenticator.release(request)
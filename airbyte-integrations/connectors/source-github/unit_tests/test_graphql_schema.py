@@ -0,0 +1,48 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from source_github import github_schema, graphql
+from source_github.github_schema_pruned import github_schema as pruned_github_schema
+
+
+CONNECTOR_DIR = Path(__file__).parents[1]
+
+QUERY_BUILDERS = {
+    "pull_requests": lambda: graphql.get_query_pull_requests("airbytehq", "airbyte", first=10, after="cursor", direction="ASC"),
+    "projects_v2": lambda: graphql.get_query_projectsV2("airbytehq", "airbyte", first=10, after="cursor", direction="ASC"),
+    "reviews": lambda: graphql.get_query_reviews("airbytehq", "airbyte", first=10, after="cursor"),
+    "reviews_of_pull_request": lambda: graphql.get_query_reviews("airbytehq", "airbyte", first=10, after="cursor", number=1),
+    "issue_reactions": lambda: graphql.get_query_issue_reactions("airbytehq", "airbyte", first=10, after="cursor"),
+    "issue_reactions_of_issue": lambda: graphql.get_query_issue_reactions("airbytehq", "airbyte", first=10, after="cursor", number=1),
+    "reactions_of_repository": lambda: graphql.QueryReactions().get_query_root_repository("airbytehq", "airbyte", first=10),
+    "reactions_of_pull_request": lambda: graphql.QueryReactions().get_query_root_pull_request("node_id", first=10, after="cursor"),
+    "reactions_of_review": lambda: graphql.QueryReactions().get_query_root_review("node_id", first=10, after="cursor"),
+    "reactions_of_comment": lambda: graphql.QueryReactions().get_query_root_comment("node_id", first=10, after="cursor"),
+}
+
+
+def _run_python(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], cwd=CONNECTOR_DIR, capture_output=True, text=True, check=True).stdout
+
+
+def test_schema_is_not_imported_with_the_connector():
+    loaded = _run_python(
+        "import sys, source_github.source; print(sorted(name for name in sys.modules if name.startswith('source_github.github_schema')))"
+    )
+
+    assert loaded.strip() == "[]"
+
+
+@pytest.mark.parametrize("build_query", QUERY_BUILDERS.values(), ids=QUERY_BUILDERS.keys())
+def test_pruned_schema_builds_the_same_queries(monkeypatch, build_query):
+    monkeypatch.setattr(graphql, "_schema_root", github_schema.github_schema)
+    query = build_query()
+
+    monkeypatch.setattr(graphql, "_schema_root", pruned_github_schema)
+    assert build_query() == query
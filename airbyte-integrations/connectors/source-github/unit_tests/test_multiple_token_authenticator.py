@@ -7,11 +7,12 @@ from unittest.mock import patch
 
 import pendulum
 import pytest
+import requests
 import responses
 from freezegun import freeze_time
 from source_github import SourceGithub
 from source_github.streams import Organizations
-from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
+from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, TokenReleasingAdapter, read_full_refresh
 
 from airbyte_cdk.utils import AirbyteTracedException
 from airbyte_protocol.models import FailureType
@@ -146,3 +147,83 @@ def test_multiple_token_authenticator_with_rate_limiter_and_sleep(sleep_mock, ca
     list(read_full_refresh(stream))
     sleep_mock.assert_called_once_with(ACCEPTED_WAITING_TIME_IN_SECONDS)
     assert [(x.count_rest, x.count_graphql) for x in authenticator._tokens.values()] == [(500, 500), (500, 500), (498, 500)]
+
+
+@responses.activate
+def test_token_limits_are_updated_from_response_headers(rate_limit_mock_response):
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2"])
+    stream = Organizations(organizations=["org1", "org2"], authenticator=authenticator)
+    rate_limit_headers = {"X-RateLimit-Remaining": "1000", "X-RateLimit-Reset": "4070908800", "X-RateLimit-Resource": "core"}
+    responses.add("GET", "https://api.github.com/orgs/org1", json={"id": 1}, headers=rate_limit_headers)
+    responses.add(
+        "GET", "https://api.github.com/orgs/org2", json={"id": 2}, headers={**rate_limit_headers, "X-RateLimit-Remaining": "1200"}
+    )
+
+    list(read_full_refresh(stream))
+
+    # the lower of the counted and the responded limits is kept, unless the limits are reset
+    assert [(x.count_rest, x.count_graphql) for x in authenticator._tokens.values()] == [(999, 5000), (5000, 5000)]
+    assert len([call for call in responses.calls if call.request.url.endswith("rate_limit")]) == 2
+
+    responses.add(
+        "GET", "https://api.github.com/orgs/org1", json={"id": 1}, headers={**rate_limit_headers, "X-RateLimit-Reset": "4070912400"}
+    )
+    list(read_full_refresh(Organizations(organizations=["org1"], authenticator=authenticator)))
+
+    assert authenticator._tokens["token1"].count_rest == 1000
+    assert authenticator._tokens["token1"].reset_at_rest == pendulum.from_timestamp(4070912400)
+
+
+@responses.activate
+def test_concurrent_requests_take_least_busy_tokens(rate_limit_mock_response):
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2", "token3"])
+    assert authenticator.max_concurrent_requests == 3
+
+    def send_request():
+        request = authenticator(requests.Request("GET", "https://api.github.com/orgs/org1").prepare())
+        authenticator.acquire(request)
+        return request
+
+    requests_in_flight = [send_request() for _ in range(4)]
+    assert [request.headers["Authorization"] for request in requests_in_flight] == [
+        "token token1",
+        "token token2",
+        "token token3",
+        "token token3",
+    ]
+
+    # the token of the responded request is taken next
+    authenticator.release(requests_in_flight[1])
+    assert send_request().headers["Authorization"] == "token token2"
+    assert [x.count_rest for x in authenticator._tokens.values()] == [4999, 4998, 4998]
+
+
+@responses.activate
+@pytest.mark.parametrize("response_body", [json.dumps({"id": 1}), requests.ConnectionError("Connection reset by peer")])
+def test_sent_requests_release_their_token(rate_limit_mock_response, response_body):
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2"])
+    session = requests.Session()
+    session.auth = authenticator
+    session.mount("https://api.github.com", TokenReleasingAdapter(authenticator))
+    responses.add("GET", "https://api.github.com/orgs/org1", body=response_body)
+
+    try:
+        session.get("https://api.github.com/orgs/org1")
+    except requests.ConnectionError:
+        pass
+
+    assert authenticator._requests_in_flight["token1"] == 0
+
+
+@responses.activate
+def test_requests_not_sent_keep_no_token(rate_limit_mock_response):
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2"])
+    session = requests.Session()
+    session.auth = authenticator
+    session.mount("https://api.github.com", TokenReleasingAdapter(authenticator))
+
+    # e.g. answered from the `requests_cache` or failed before sending
+    session.prepare_request(requests.Request("GET", "https://api.github.com/orgs/org1"))
+
+    assert sum(authenticator._requests_in_flight.values()) == 0
+    assert session.prepare_request(requests.Request("GET", "https://api.github.com/orgs/org1")).headers["Authorization"] == "token token1"
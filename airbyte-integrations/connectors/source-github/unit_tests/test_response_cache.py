@@ -0,0 +1,120 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+import responses
+from source_github.response_cache import ResponseCache
+from source_github.source import SourceGithub
+from source_github.streams import Deployments, Tags
+from source_github.utils import read_full_refresh
+
+from airbyte_cdk.sources.streams.http.requests_native_auth import MultipleTokenAuthenticator
+
+
+REPOSITORY_ARGS = {
+    "repositories": ["airbytehq/airbyte"],
+    "page_size_for_large_streams": 100,
+    "authenticator": MultipleTokenAuthenticator(tokens=["token"]),
+}
+TAGS = [[{"name": "v1"}, {"name": "v2"}], [{"name": "v3"}]]
+
+
+def _tags_callback(requested_pages):
+    def callback(request):
+        page = 2 if "page=2" in request.url else 1
+        requested_pages.append((page, request.headers.get("If-None-Match")))
+        etag = f'"tags-{page}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, ""
+        headers = {"ETag": etag, "Content-Type": "application/json"}
+        if page == 1:
+            headers["Link"] = '<https://api.github.com/repos/airbytehq/airbyte/tags?per_page=100&page=2>; rel="next"'
+        return 200, headers, json.dumps(TAGS[page - 1])
+
+    return callback
+
+
+def _read_tags(cache_path):
+    cache = ResponseCache(str(cache_path))
+    try:
+        return list(read_full_refresh(Tags(response_cache=cache, **REPOSITORY_ARGS)))
+    finally:
+        cache.close()
+
+
+@responses.activate
+def test_not_modified_responses_are_replayed_from_cache(tmp_path):
+    requested_pages = []
+    responses.add_callback("GET", "https://api.github.com/repos/airbytehq/airbyte/tags", callback=_tags_callback(requested_pages))
+    expected_records = [{"name": name, "repository": "airbytehq/airbyte"} for name in ("v1", "v2", "v3")]
+
+    assert _read_tags(tmp_path / "cache.sqlite") == expected_records
+    assert requested_pages == [(1, None), (2, None)]
+
+    requested_pages.clear()
+    assert _read_tags(tmp_path / "cache.sqlite") == expected_records
+    assert requested_pages == [(1, '"tags-1"'), (2, '"tags-2"')]
+
+
+@responses.activate
+def test_modified_responses_are_cached_again(tmp_path):
+    cache_path = tmp_path / "cache.sqlite"
+    url = "https://api.github.com/repos/airbytehq/airbyte/tags"
+    responses.add("GET", url, json=[{"name": "v1"}], headers={"ETag": '"old"'})
+    responses.add("GET", url, json=[{"name": "v2"}], headers={"ETag": '"new"'})
+    responses.add("GET", url, status=304, headers={"ETag": '"new"'})
+
+    assert [record["name"] for record in _read_tags(cache_path)] == ["v1"]
+    assert [record["name"] for record in _read_tags(cache_path)] == ["v2"]
+    assert [record["name"] for record in _read_tags(cache_path)] == ["v2"]
+    assert [call.request.headers.get("If-None-Match") for call in responses.calls] == [None, '"old"', '"new"']
+
+
+@responses.activate
+def test_streams_without_conditional_requests_are_not_cached(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    responses.add("GET", "https://api.github.com/repos/airbytehq/airbyte/deployments", json=[], headers={"ETag": '"deployments"'})
+
+    for _ in range(2):
+        stream = Deployments(response_cache=cache, start_date="2022-02-02T10:10:03Z", **REPOSITORY_ARGS)
+        list(read_full_refresh(stream))
+    cache.close()
+
+    assert [call.request.headers.get("If-None-Match") for call in responses.calls] == [None, None]
+
+
+def test_response_cache_is_enabled_by_env(tmp_path, monkeypatch):
+    assert SourceGithub._get_response_cache() is None
+
+    monkeypatch.setenv("GITHUB_RESPONSE_CACHE_PATH", str(tmp_path / "cache"))
+    cache = SourceGithub._get_response_cache()
+
+    assert cache.path == str(tmp_path / "cache" / "github_responses.sqlite")
+    cache.close()
+
+
+@responses.activate
+def test_responses_are_cached_by_token(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    url = "https://api.github.com/repos/airbytehq/airbyte/tags"
+    responses.add("GET", url, json=[{"name": "v1"}], headers={"ETag": '"tags"'})
+
+    for token in ("token", "token", "another_token"):
+        args = {**REPOSITORY_ARGS, "authenticator": MultipleTokenAuthenticator(tokens=[token])}
+        list(read_full_refresh(Tags(response_cache=cache, **args)))
+    cache.close()
+
+    assert [call.request.headers.get("If-None-Match") for call in responses.calls] == [None, '"tags"', None]
+
+
+def test_response_cache_is_closed_after_read(tmp_path, mocker):
+    source = SourceGithub()
+    response_cache = mocker.Mock()
+    source._response_caches.append(response_cache)
+    mocker.patch("airbyte_cdk.sources.abstract_source.AbstractSource.read", return_value=iter([]))
+
+    list(source.read(mocker.Mock(), {}, mocker.Mock()))
+
+    response_cache.close.assert_called_once()
@@ -3,6 +3,7 @@
 #
 
 import json
+import threading
 from http import HTTPStatus
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -49,7 +50,8 @@ from source_github.streams import (
     WorkflowJobs,
     WorkflowRuns,
 )
-from source_github.utils import read_full_refresh
+from source_github.read_ahead import ReadAheadAdapter
+from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
 
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, SyncMode
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler, ErrorResolution, HttpStatusErrorHandler, ResponseAction
@@ -1531,3 +1533,101 @@ def test_pull_request_stats():
 
     list(read_full_refresh(stream))
     assert query == expected_query
+
+
+@responses.activate
+def test_repositories_are_requested_at_the_same_time_with_multiple_tokens(rate_limit_mock_response):
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2", "token3"])
+    repositories = ["organization/repository1", "organization/repository2", "organization/repository3"]
+    stream = Tags(repositories=repositories, page_size_for_large_streams=100, authenticator=authenticator)
+    assert stream.max_concurrent_slices == 3
+    # fails with BrokenBarrierError, unless the first pages of all repositories are requested at once
+    barrier = threading.Barrier(3, timeout=5)
+
+    def request_callback(request):
+        repository = request.url.split("/repos/")[1].split("/tags")[0]
+        if "page=2" in request.url:
+            return 200, {}, json.dumps([{"name": f"{repository}-v3"}])
+        barrier.wait()
+        headers = {}
+        if repository.endswith("1"):
+            headers["Link"] = f'<https://api.github.com/repos/{repository}/tags?per_page=100&page=2>; rel="next"'
+        return 200, headers, json.dumps([{"name": f"{repository}-v1"}, {"name": f"{repository}-v2"}])
+
+    for repository in repositories:
+        responses.add_callback("GET", f"https://api.github.com/repos/{repository}/tags", callback=request_callback)
+
+    records = list(read_full_refresh(stream))
+
+    assert [record["name"] for record in records] == [
+        "organization/repository1-v1",
+        "organization/repository1-v2",
+        "organization/repository1-v3",
+        "organization/repository2-v1",
+        "organization/repository2-v2",
+        "organization/repository3-v1",
+        "organization/repository3-v2",
+    ]
+    assert {call.request.headers["Authorization"] for call in responses.calls if "/tags" in call.request.url} == {
+        "token token1",
+        "token token2",
+        "token token3",
+    }
+    assert sum(authenticator._requests_in_flight.values()) == 0
+
+
+@responses.activate
+@patch("time.sleep")
+def test_repositories_requested_ahead_are_handled_in_order(time_mock, rate_limit_mock_response, caplog):
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2"])
+    repositories = ["organization/repository1", "organization/repository2"]
+    stream = Tags(repositories=repositories, page_size_for_large_streams=100, authenticator=authenticator)
+    responses.add("GET", "https://api.github.com/repos/organization/repository1/tags", json=[{"name": "v1"}])
+    responses.add("GET", "https://api.github.com/repos/organization/repository2/tags", status=404, json={"message": "Not Found"})
+
+    records = list(read_full_refresh(stream))
+
+    assert records == [{"name": "v1", "repository": "organization/repository1"}]
+    assert "Syncing `Tags` stream isn't available for repository `organization/repository2`." in caplog.messages
+
+
+@responses.activate
+def test_workflow_runs_are_not_requested_ahead(rate_limit_mock_response):
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2"])
+    repository_args = {"repositories": ["organization/repository1", "organization/repository2"], "page_size_for_large_streams": 100}
+    workflow_runs = WorkflowRuns(authenticator=authenticator, **repository_args)
+
+    assert workflow_runs._read_ahead_adapter is None
+    assert WorkflowJobs(parent=workflow_runs, authenticator=authenticator, **repository_args)._read_ahead_adapter is None
+    assert Tags(authenticator=authenticator, **repository_args)._read_ahead_adapter
+
+
+def test_read_ahead_adapter_gives_the_pages_to_the_matching_requests():
+    def page(number):
+        request = requests.Request("GET", f"https://api.github.com/repos/organization/repository/tags?page={number}").prepare()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps([{"name": f"v{number}"}]).encode()
+        return request, response
+
+    def pages():
+        yield page(1)
+        yield page(2)
+
+    def failed_pages():
+        yield page(1)
+        raise requests.ConnectionError("Connection reset by peer")
+
+    adapter = MagicMock()
+    read_ahead_adapter = ReadAheadAdapter(adapter)
+
+    with read_ahead_adapter.read_ahead(pages()):
+        # the first page is taken from the `requests_cache`
+        assert read_ahead_adapter.send(page(2)[0]).json() == [{"name": "v2"}]
+        assert read_ahead_adapter.send(page(3)[0]) is adapter.send.return_value
+    with read_ahead_adapter.read_ahead(failed_pages()):
+        assert read_ahead_adapter.send(page(1)[0]).json() == [{"name": "v1"}]
+        assert read_ahead_adapter.send(page(2)[0]) is adapter.send.return_value
+    # the requests of the other threads are sent as usual
+    assert read_ahead_adapter.send(page(1)[0]) is adapter.send.return_value
+    assert adapter.send.call_count == 3
@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+"""Compare casting the contacts with the compiled `RecordCaster` against the previous per-field casting.
+
+The contacts get the properties of the types seen in the real portals, in the same proportions, with the empty, numeric,
+boolean, date/date-time and timestamp values. Both castings give the same records, the timings are printed.
+
+Usage:
+    poetry run python scripts/benchmark_record_caster.py [--contacts 2000] [--properties 300]
+"""
+
+import argparse
+import copy
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, MutableMapping
+
+
+CONNECTOR_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CONNECTOR_DIR))
+
+from source_hubspot.source import SourceHubspot  # noqa: E402
+from source_hubspot.streams import BaseStream, Contacts  # noqa: E402
+
+
+CONFIG = {
+    "start_date": "2021-01-10T00:00:00Z",
+    "credentials": {"credentials_title": "Private App Credentials", "access_token": "test_access_token"},
+}
+
+# the property types of the contacts, in the proportions seen in the real portals
+PROPERTY_TYPES = ["string"] * 10 + ["enumeration"] * 4 + ["number"] * 3 + ["datetime"] * 3 + ["date"] + ["bool"] * 2
+
+
+def _contacts_schema(number_of_properties: int) -> Mapping[str, Any]:
+    rnd = random.Random(0)
+    return {
+        f"property_{index}_{field_type}": BaseStream._get_field_props(field_type)
+        for index, field_type in enumerate(rnd.choice(PROPERTY_TYPES) for _ in range(number_of_properties))
+    }
+
+
+def _property_value(rnd: random.Random, field_schema: Mapping[str, Any]) -> Any:
+    if rnd.random() < 0.3:
+        return rnd.choice([None, ""])
+    field_type = field_schema["type"][-1]
+    if field_schema.get("format") == "date-time":
+        return rnd.choice(["2021-07-31T08:18:58.954Z", "2023-01-10T00:00:00Z", "1645608465000"])
+    if field_schema.get("format") == "date":
+        return rnd.choice(["2022-05-28", "1653696000000"])
+    if field_type == "number":
+        return rnd.choice(["123", "123.456", "1,234.5"])
+    if field_type == "boolean":
+        return rnd.choice(["true", "false"])
+    return rnd.choice(["lead", "customer", "+1 555 0100", "12345"])
+
+
+def _contacts(schema: Mapping[str, Any], number_of_contacts: int) -> List[MutableMapping[str, Any]]:
+    rnd = random.Random(1)
+    return [
+        {"id": str(index), "properties": {name: _property_value(rnd, field_schema) for name, field_schema in schema.items()}}
+        for index in range(number_of_contacts)
+    ]
+
+
+def _legacy_cast_record(record: MutableMapping[str, Any], properties: Mapping[str, Any]) -> MutableMapping[str, Any]:
+    """The per-field lookups previously done by `BaseStream._cast_record()`."""
+    for field_name, field_value in record["properties"].items():
+        if field_name not in properties:
+            continue
+        declared_field_types = properties[field_name].get("type", [])
+        if not isinstance(declared_field_types, Iterable):
+            declared_field_types = [declared_field_types]
+        declared_format = properties[field_name].get("format")
+        record["properties"][field_name] = BaseStream._cast_value(
+            declared_field_types=declared_field_types, field_name=field_name, field_value=field_value, declared_format=declared_format
+        )
+    return record
+
+
+def main(number_of_contacts: int, number_of_properties: int) -> None:
+    schema = _contacts_schema(number_of_properties)
+    contacts = _contacts(schema, number_of_contacts)
+    legacy_contacts, compiled_contacts = copy.deepcopy(contacts), copy.deepcopy(contacts)
+    stream = Contacts(**SourceHubspot(CONFIG, None, None).get_common_params(config=CONFIG))
+    # the casting warnings are not printed, so the output doesn't take over the timings
+    logging.disable(logging.CRITICAL)
+
+    start = time.perf_counter()
+    legacy_records = [_legacy_cast_record(record, schema) for record in legacy_contacts]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    records = [stream._cast_record(record, properties=schema, properties_key="properties") for record in compiled_contacts]
+    compiled_seconds = time.perf_counter() - start
+
+    if records != legacy_records:
+        sys.exit("The contacts cast with the compiled caster differ from the legacy ones")
+    print(
+        f"Cast {len(records):,} contacts with {number_of_properties} properties: "
+        f"legacy {legacy_seconds:.3f}s, compiled caster {compiled_seconds:.3f}s "
+        f"({legacy_seconds / compiled_seconds:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=2000)
+    parser.add_argument("--properties", type=int, default=300)
+    args = parser.parse_args()
+    main(args.contacts, args.properties)
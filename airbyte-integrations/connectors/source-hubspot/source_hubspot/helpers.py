@@ -4,7 +4,7 @@
 
 import abc
 import urllib.parse
-from typing import Iterator, List, MutableMapping
+from typing import Iterator, List, MutableMapping, Optional
 
 
 class IRecordPostProcessor(abc.ABC):
@@ -22,11 +22,24 @@ class IRecordPostProcessor(abc.ABC):
     def flat(self):
         """"""
 
+    def pop_completed(self) -> List[MutableMapping]:
+        """
+        Returns the records which are ready to be emitted before the rest, removing them from the storage.
+        """
+        return []
+
 
 class GroupByKey(IRecordPostProcessor):
-    def __init__(self, primary_key: str = None):
+    """
+    Merges the records with the same primary key, received with the different property chunks.
+    With `parts` set, the record is complete once it's received `parts` times, see `pop_completed()`.
+    """
+
+    def __init__(self, primary_key: str = None, parts: Optional[int] = None):
         self._storage = {}
         self._primary_key = primary_key
+        self._parts = parts
+        self._received = {}
 
     def add_record(self, record: MutableMapping):
         record_pk = record[self._primary_key]
@@ -36,6 +49,15 @@ class GroupByKey(IRecordPostProcessor):
         if stored_props:
             stored_props.update(record.get("properties", {}))
             self._storage[record_pk]["properties"] = stored_props
+        self._received[record_pk] = self._received.get(record_pk, 0) + 1
+
+    def pop_completed(self) -> List[MutableMapping]:
+        if not self._parts:
+            return []
+        completed_pks = [record_pk for record_pk, received in self._received.items() if received >= self._parts]
+        for record_pk in completed_pks:
+            del self._received[record_pk]
+        return [self._storage.pop(record_pk) for record_pk in completed_pks]
 
     @property
     def flat(self):
@@ -5,11 +5,11 @@
 import logging
 from http import HTTPStatus
 from itertools import chain
-from typing import Any, Generator, List, Mapping, Optional, Tuple
+from typing import Any, Generator, Iterator, List, Mapping, Optional, Tuple
 
 from requests import HTTPError
 
-from airbyte_cdk.models import ConfiguredAirbyteCatalog, FailureType
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, ConfiguredAirbyteCatalog, FailureType
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
 from airbyte_cdk.sources.source import TState
@@ -111,6 +111,8 @@ class SourceHubspot(YamlDeclarativeSource):
     logger = logging.getLogger("airbyte")
 
     def __init__(self, catalog: Optional[ConfiguredAirbyteCatalog], config: Optional[Mapping[str, Any]], state: TState, **kwargs):
+        # the API instances created for the streams, closed at the end of the read
+        self._apis: List[API] = []
         super().__init__(catalog=catalog, config=config, state=state, **{"path_to_yaml": "manifest.yaml"})
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
@@ -153,15 +155,30 @@ class SourceHubspot(YamlDeclarativeSource):
         except Exception as e:
             return False, repr(e)
 
+    def read(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[List[AirbyteStateMessage]] = None,
+    ) -> Iterator[AirbyteMessage]:
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            # the property chunks are requested on the thread pool of the API, shared by all streams
+            for api in self._apis:
+                api.close()
+
     @staticmethod
     def get_api(config: Mapping[str, Any]) -> API:
         credentials = config.get("credentials", {})
-        return API(credentials=credentials)
+        return API(credentials=credentials, property_chunks_concurrency=config.get("property_chunks_concurrency", 3))
 
     def get_common_params(self, config) -> Mapping[str, Any]:
         start_date = config.get("start_date", DEFAULT_START_DATE)
         credentials = config["credentials"]
         api = self.get_api(config=config)
+        self._apis.append(api)
         # Additional configuration is necessary for testing certain streams due to their specific restrictions.
         acceptance_test_config = config.get("acceptance_test_config", {})
         return dict(api=api, start_date=start_date, credentials=credentials, acceptance_test_config=acceptance_test_config)
@@ -4,11 +4,14 @@
 
 import json
 import logging
+import re
 import sys
 import time
 from abc import ABC, abstractmethod
-from datetime import timedelta
-from functools import cached_property, lru_cache
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache, partial
 from http import HTTPStatus
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
@@ -76,6 +79,15 @@ CUSTOM_FIELD_TYPE_TO_VALUE = {
 
 CUSTOM_FIELD_VALUE_TO_TYPE = {v: k for k, v in CUSTOM_FIELD_TYPE_TO_VALUE.items()}
 
+DATE_FORMATS = ("date", "date-time")
+
+# the date/date-time strings in UTC, cast without `pendulum.parse`
+ISO_DATETIME_PATTERN = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})(?:[T ]([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]{1,6}))?(?:Z|\+00:00)?)?"
+)
+# the millisecond timestamps, which `pendulum.parse` never parses as dates
+TIMESTAMP_PATTERN = re.compile(r"[0-9]{9,}")
+
 CONTACTS_NEW_TO_LEGACY_FIELDS_MAPPING = {
     "hs_lifecyclestage_": "hs_v2_date_entered_",
     "hs_date_exited_": "hs_v2_date_exited_",
@@ -128,6 +140,154 @@ class RecordUnnester:
             yield final
 
 
+class RecordCaster:
+    """
+    Casts the record fields to the types declared by the properties schema, same as `BaseStream._cast_value()`,
+    but compiled once per schema: each field gets it's own function, with the fast paths for the plain strings,
+    numeric strings, booleans and the ISO date/date-time strings, falling back to `cast_value` otherwise.
+
+    The warnings are counted per field instead of being logged for every record,
+    the first one and then every 10th, 100th, 1000th... are logged, see `warnings`.
+    """
+
+    def __init__(
+        self,
+        properties: Mapping[str, Any],
+        stream_name: str,
+        logging_message: str = "",
+        stream_logger: logging.Logger = logger,
+        cast_value: Callable[..., Any] = None,
+    ):
+        self.properties = properties
+        self.stream_name = stream_name
+        self.logging_message = logging_message
+        self.logger = stream_logger
+        # the complete casting of the stream, `BaseStream._cast_value()` by default
+        self.cast_value = cast_value or BaseStream._cast_value
+        # (field name, kind) > number of warnings
+        self.warnings: Counter = Counter()
+        self._casters: Dict[str, Callable[[Any], Any]] = {
+            field_name: self._compile(field_name, field_schema) for field_name, field_schema in properties.items()
+        }
+
+    def _warn(self, field_name: str, kind: str, message: str, level: int = logging.WARNING) -> None:
+        count = self.warnings[field_name, kind] = self.warnings[field_name, kind] + 1
+        if count == 1:
+            self.logger.log(level, message)
+        elif count in (10, 100, 1000) or count % 10000 == 0:
+            self.logger.log(level, f"{message} Occurred {count} times for `{field_name}` in stream `{self.stream_name}` so far.")
+
+    def _compile(self, field_name: str, field_schema: Mapping[str, Any]) -> Callable[[Any], Any]:
+        declared_field_types = field_schema.get("type", [])
+        if not isinstance(declared_field_types, Iterable):
+            declared_field_types = [declared_field_types]
+        declared_format = field_schema.get("format")
+
+        def cast_any(field_value: Any) -> Any:
+            return self.cast_value(declared_field_types, field_name, field_value, declared_format, warn=self._warn)
+
+        if not isinstance(declared_field_types, (list, tuple)):
+            return cast_any
+
+        declared_types = set(declared_field_types)
+        target_type_name = next((field_type for field_type in declared_field_types if field_type != "null"), None)
+
+        if declared_format in DATE_FORMATS and "string" in declared_types:
+
+            def cast_datetime(field_value: Any) -> Any:
+                if type(field_value) is str:
+                    match = ISO_DATETIME_PATTERN.fullmatch(field_value)
+                    try:
+                        if match:
+                            return self._iso_datetime_to_string(match, declared_format)
+                        if TIMESTAMP_PATTERN.fullmatch(field_value):
+                            self._warn(
+                                field_name, "timestamp", f"Parsed the timestamp in {field_name}. Field value: {field_value}.", logging.INFO
+                            )
+                            return BaseStream._convert_datetime_to_string(
+                                pendulum.from_timestamp(int(field_value) / 1000), declared_format=declared_format
+                            )
+                    except (ValueError, OverflowError):
+                        pass
+                return cast_any(field_value)
+
+            return cast_datetime
+
+        if declared_format:
+            return cast_any
+
+        if "string" in declared_types:
+
+            def cast_string(field_value: Any) -> Any:
+                return field_value if type(field_value) is str else cast_any(field_value)
+
+            return cast_string
+
+        if declared_types <= {"null", "number"} and target_type_name == "number":
+
+            def cast_number(field_value: Any) -> Any:
+                if type(field_value) is float:
+                    return field_value
+                if type(field_value) is str:
+                    try:
+                        # numeric IDs are cast into integer
+                        return int(field_value) if field_value.isnumeric() else float(field_value.replace(",", ""))
+                    except ValueError:
+                        pass
+                return cast_any(field_value)
+
+            return cast_number
+
+        if declared_types <= {"null", "boolean"} and target_type_name == "boolean":
+
+            def cast_boolean(field_value: Any) -> Any:
+                if type(field_value) is bool:
+                    return field_value
+                if type(field_value) is str:
+                    lowered = field_value.lower()
+                    if lowered == "true":
+                        return True
+                    if lowered == "false":
+                        return False
+                return cast_any(field_value)
+
+            return cast_boolean
+
+        return cast_any
+
+    @staticmethod
+    def _iso_datetime_to_string(match: re.Match, declared_format: str) -> str:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        dt = datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            int((fraction or "0").ljust(6, "0")),
+            tzinfo=timezone.utc,
+        )
+        return dt.date().isoformat() if declared_format == "date" else dt.isoformat()
+
+    def cast(self, record: MutableMapping[str, Any], record_id: Any = None, field_validation: Callable = None) -> MutableMapping[str, Any]:
+        """
+        Casts the fields of the `record` in place, the fields missing from the schema are left as is.
+        """
+        casters = self._casters
+        for field_name, field_value in record.items():
+            if field_validation and not field_validation(field_name, field_value):
+                continue
+            caster = casters.get(field_name)
+            if caster is None:
+                self._warn(
+                    field_name, "discarded", f"{self.logging_message}: record id:{record_id}, property_value: {field_name}", logging.INFO
+                )
+                continue
+            record[field_name] = caster(field_value)
+        return record
+
+
 def retry_connection_handler(**kwargs):
     """Retry helper, log each attempt"""
 
@@ -225,9 +385,11 @@ class API:
         else:
             return None
 
-    def __init__(self, credentials: Mapping[str, Any]):
+    def __init__(self, credentials: Mapping[str, Any], property_chunks_concurrency: int = 3):
         self._session = requests.Session()
         self.credentials = credentials
+        # the number of property chunk requests in flight, shared by all streams
+        self.property_chunks_concurrency = property_chunks_concurrency
 
         if self.is_oauth2() or self.is_private_app():
             self._session.auth = self.get_authenticator()
@@ -239,6 +401,21 @@ class API:
             "User-Agent": self.USER_AGENT,
         }
 
+    @cached_property
+    def property_chunks_executor(self) -> ThreadPoolExecutor:
+        """
+        The thread pool to request the property chunks of the same page concurrently, see `BaseStream._read_stream_records()`.
+        """
+        return ThreadPoolExecutor(max_workers=self.property_chunks_concurrency, thread_name_prefix="hubspot-property-chunks")
+
+    def close(self) -> None:
+        """
+        Shuts down the `property_chunks_executor`, if it was started, see `SourceHubspot.read()`.
+        """
+        executor = self.__dict__.pop("property_chunks_executor", None)
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     @staticmethod
     def _parse_and_handle_errors(response) -> Union[MutableMapping[str, Any], List[MutableMapping[str, Any]]]:
         """Handle response"""
@@ -494,26 +671,43 @@ class BaseStream(HttpStream, ABC):
         stream_slice: Mapping[str, Any] = None,
         stream_state: Mapping[str, Any] = None,
         next_page_token: Mapping[str, Any] = None,
-    ) -> Tuple[List, Any]:
+    ) -> Tuple[Iterable, Any]:
         #  TODO: Additional processing was added due to the fact that users receive 414 errors while syncing their streams
         #  (issues #3977 and #5835). We will need to fix this code when the HubSpot developers add the ability to use a special parameter
         #  to get all properties for an entity. According to HubSpot Community
         #  (https://community.hubspot.com/t5/APIs-Integrations/Get-all-contact-properties-without-explicitly-listing-them/m-p/447950)
         #  and the official documentation, this does not exist at the moment.
 
+        #  The chunks of the page are requested concurrently, within the `property_chunks_concurrency` budget shared by all streams.
+        #  The record is emitted as soon as it's received from every chunk, so only the incomplete records are kept.
+
+        chunks = list(self._property_wrapper.split())
         group_by_pk = self.primary_key and not self.denormalize_records
-        post_processor: IRecordPostProcessor = GroupByKey(self.primary_key) if group_by_pk else StoreAsIs()
-        response = None
+        post_processor: IRecordPostProcessor = GroupByKey(self.primary_key, parts=len(chunks)) if group_by_pk else StoreAsIs()
 
-        properties = self._property_wrapper
-        for chunk in properties.split():
-            response = self.handle_request(
-                stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunk
-            )
-            for record in self._transform(self.parse_response(response, stream_state=stream_state)):
-                post_processor.add_record(record)
+        request_chunk = partial(self.handle_request, stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token)
+        responses = [self._api.property_chunks_executor.submit(request_chunk, properties=chunk) for chunk in chunks]
 
-        return post_processor.flat, response
+        def stitch_records() -> Iterable[Mapping[str, Any]]:
+            try:
+                for response in responses:
+                    for record in self._transform(self.parse_response(response.result(), stream_state=stream_state)):
+                        post_processor.add_record(record)
+                    yield from post_processor.pop_completed()
+                # the records missing from some chunks, if any
+                yield from post_processor.flat
+            finally:
+                for response in responses:
+                    response.cancel()
+
+        try:
+            # the pagination is the same for all chunks, the last one is used for the next page
+            response = responses[-1].result() if responses else None
+        except Exception:
+            for pending in responses:
+                pending.cancel()
+            raise
+        return stitch_records(), response
 
     def read_records(
         self,
@@ -593,11 +787,16 @@ class BaseStream(HttpStream, ABC):
         elif declared_format == "date-time":
             return dt.to_rfc3339_string()
 
+    @staticmethod
+    def _log_cast_warning(field_name: str, kind: str, message: str, level: int = logging.WARNING) -> None:
+        logger.log(level, message, exc_info=level >= logging.ERROR)
+
     @classmethod
-    def _cast_datetime(cls, field_name: str, field_value: Any, declared_format: str = None) -> Any:
+    def _cast_datetime(cls, field_name: str, field_value: Any, declared_format: str = None, warn: Callable = None) -> Any:
         """
         If format is date/date-time, but actual value is timestamp, convert timestamp to date/date-time string.
         """
+        warn = warn or cls._log_cast_warning
         if not field_value:
             return field_value
 
@@ -605,28 +804,34 @@ class BaseStream(HttpStream, ABC):
             dt = pendulum.parse(field_value)
             return cls._convert_datetime_to_string(dt, declared_format=declared_format)
         except (ValueError, TypeError) as ex:
-            logger.warning(
-                f"Couldn't parse date/datetime string in {field_name}, trying to parse timestamp... Field value: {field_value}. Ex: {ex}"
+            warn(
+                field_name,
+                "date",
+                f"Couldn't parse date/datetime string in {field_name}, trying to parse timestamp... Field value: {field_value}. Ex: {ex}",
             )
 
         try:
             dt = pendulum.from_timestamp(int(field_value) / 1000)
             return cls._convert_datetime_to_string(dt, declared_format=declared_format)
         except (ValueError, TypeError) as ex:
-            logger.warning(f"Couldn't parse timestamp in {field_name}. Field value: {field_value}. Ex: {ex}")
+            warn(field_name, "timestamp", f"Couldn't parse timestamp in {field_name}. Field value: {field_value}. Ex: {ex}")
 
         return field_value
 
     @classmethod
-    def _cast_value(cls, declared_field_types: List, field_name: str, field_value: Any, declared_format: str = None) -> Any:
+    def _cast_value(
+        cls, declared_field_types: List, field_name: str, field_value: Any, declared_format: str = None, warn: Callable = None
+    ) -> Any:
         """
         Convert record's received value according to its declared catalog json schema type / format / attribute name.
         :param declared_field_types type from catalog schema
         :param field_name value's attribute name
         :param field_value actual value to cast
         :param declared_format format field value from catalog schema
+        :param warn called with the field name, the kind of the warning, the message and the log level, logs the message by default
         :return Converted value for record
         """
+        warn = warn or cls._log_cast_warning
 
         if "null" in declared_field_types:
             if field_value is None:
@@ -637,7 +842,7 @@ class BaseStream(HttpStream, ABC):
                 return None
 
         if declared_format in ["date", "date-time"]:
-            field_value = cls._cast_datetime(field_name, field_value, declared_format=declared_format)
+            field_value = cls._cast_datetime(field_name, field_value, declared_format=declared_format, warn=warn)
 
         actual_field_type = type(field_value)
         actual_field_type_name = CUSTOM_FIELD_TYPE_TO_VALUE.get(actual_field_type)
@@ -666,11 +871,31 @@ class BaseStream(HttpStream, ABC):
         try:
             casted_value = target_type(field_value)
         except ValueError:
-            logger.exception(f"Could not cast in stream `{cls.__name__}` `{field_name}` {field_value=} to `{target_type}`")
+            warn(
+                field_name,
+                "cast",
+                f"Could not cast in stream `{cls.__name__}` `{field_name}` {field_value=} to `{target_type}`",
+                logging.ERROR,
+            )
             return field_value
 
         return casted_value
 
+    @cached_property
+    def _record_casters(self) -> Dict[int, RecordCaster]:
+        return {}
+
+    def _get_record_caster(self, properties: Mapping[str, Any], logging_message: str = "") -> RecordCaster:
+        """
+        Returns the `RecordCaster` compiled for the `properties` schema, the schemas are cached by the streams.
+        """
+        caster = self._record_casters.get(id(properties))
+        if caster is None or caster.properties is not properties:
+            caster = self._record_casters[id(properties)] = RecordCaster(
+                properties, self.name, logging_message, self.logger, cast_value=self._cast_value
+            )
+        return caster
+
     def _cast_record(
         self,
         record: Mapping,
@@ -691,25 +916,8 @@ class BaseStream(HttpStream, ABC):
         :return: record
         """
 
-        def get_record_items():
-            if properties_key:
-                return record[properties_key].items()
-            return record.items()
-
-        for field_name, field_value in get_record_items():
-            if field_validation and not field_validation(field_name, field_value):
-                continue
-            if field_name not in properties:
-                self.logger.info("{}: record id:{}, property_value: {}".format(logging_message, record.get("id"), field_name))
-                continue
-            declared_field_types = properties[field_name].get("type", [])
-            if not isinstance(declared_field_types, Iterable):
-                declared_field_types = [declared_field_types]
-            declared_format = properties[field_name].get("format")
-            record_to_cast = record[properties_key] if properties_key else record
-            record_to_cast[field_name] = self._cast_value(
-                declared_field_types=declared_field_types, field_name=field_name, field_value=field_value, declared_format=declared_format
-            )
+        record_to_cast = record[properties_key] if properties_key else record
+        self._get_record_caster(properties, logging_message).cast(record_to_cast, record.get("id"), field_validation)
         return record
 
     def _cast_record_fields_if_needed(self, record: Mapping, properties: Mapping[str, Any] = None) -> Mapping:
@@ -729,6 +937,10 @@ class BaseStream(HttpStream, ABC):
             properties_key="properties",
         )
 
+    @cached_property
+    def _cast_fields_schema_properties(self) -> Mapping[str, Any]:
+        return self.get_json_schema().get("properties")
+
     def _cast_record_fields_with_schema_if_needed(self, record: Mapping) -> Mapping:
         """
         Cast specific record items from the response to the JSON Schema type.
@@ -738,7 +950,7 @@ class BaseStream(HttpStream, ABC):
         if not self.cast_fields:
             return record
 
-        properties = self.get_json_schema().get("properties")
+        properties = self._cast_fields_schema_properties
 
         def field_validation(field_name: str, field_value: Any):
             # properties fields is cast by _cast_record_fields_if_needed
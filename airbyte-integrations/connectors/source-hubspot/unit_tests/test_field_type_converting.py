@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
+
 import pytest
-from source_hubspot.streams import BaseStream
+from source_hubspot.streams import BaseStream, RecordCaster
 
 
 @pytest.mark.parametrize(
@@ -104,3 +106,60 @@ def test_cast_type_if_needed(declared_field_types, field_name, field_value, form
 def test_cast_timestamp_to_date(field_value, declared_format, expected_casted_value):
     casted_value = BaseStream._cast_datetime("hs_recurring_billing_end_date", field_value, declared_format=declared_format)
     assert casted_value == expected_casted_value
+
+
+@pytest.mark.parametrize(
+    "declared_field_types,format,field_values",
+    [
+        (["null", "string"], None, [None, "", "test", "123", 123, 1.5, True]),
+        (["null", "number"], None, [None, "", "123", "123.456", "123,123.456", "1e3", "abc", "²", 1.5]),
+        (["null", "integer"], None, [None, "", "123", 123, "abc"]),
+        (["null", "boolean"], None, [None, "", "true", "FALSE", "yes", True, False]),
+        (["null", "object"], None, [None, ""]),
+        ("string", None, ["test"]),
+        (
+            ["null", "string"],
+            "date-time",
+            [
+                None,
+                "",
+                "2020",
+                "20220528",
+                "2022-05-28",
+                "2022-02-23 09:27:45",
+                "2021-07-31T08:18:58Z",
+                "2021-07-31T08:18:58.954Z",
+                "2021-07-31T08:18:58.1+00:00",
+                "2021-07-31T08:18:58+02:00",
+                "2021-13-31T08:18:58Z",
+                "1645608465000",
+                1645608465000,
+                "not a date",
+            ],
+        ),
+        (["null", "string"], "date", ["", "2022-05-28", "2022-02-23 09:27:45", "2021-07-31T23:59:59.999Z", "1653696000000"]),
+        (["string"], "date-time", ["", "2022-05-28"]),
+    ],
+)
+def test_record_caster_casts_as_base_stream(declared_field_types, format, field_values):
+    schema = {"some_field": {"type": declared_field_types, "format": format}}
+    caster = RecordCaster(schema, "test_stream")
+
+    for field_value in field_values:
+        expected = BaseStream._cast_value(
+            declared_field_types=declared_field_types, field_name="some_field", field_value=field_value, declared_format=format
+        )
+        assert caster.cast({"some_field": field_value}) == {"some_field": expected}
+
+
+def test_record_caster_counts_warnings(caplog):
+    caster = RecordCaster({"amount": {"type": ["null", "number"]}}, "test_stream", logging_message="Property discarded")
+
+    with caplog.at_level(logging.INFO):
+        for _ in range(20):
+            caster.cast({"amount": "not a number", "unknown": "value"}, record_id=1)
+
+    assert caster.warnings == {("amount", "cast"): 20, ("unknown", "discarded"): 20}
+    # the first and the 10th warnings are logged only
+    assert len([record for record in caplog.records if "Could not cast" in record.message]) == 2
+    assert len([record for record in caplog.records if "Property discarded" in record.message]) == 2
@@ -3,8 +3,10 @@
 #
 
 
+import json
 import logging
 import random
+import threading
 from datetime import timedelta
 from http import HTTPStatus
 from unittest.mock import MagicMock
@@ -12,8 +14,9 @@ from unittest.mock import MagicMock
 import mock
 import pendulum
 import pytest
+import requests
 from source_hubspot.errors import HubspotRateLimited, InvalidStartDateConfigError
-from source_hubspot.helpers import APIv3Property
+from source_hubspot.helpers import APIv3Property, GroupByKey
 from source_hubspot.source import SourceHubspot
 from source_hubspot.streams import API, BaseStream, Companies, Deals, Engagements, Products
 
@@ -392,6 +395,62 @@ class TestSplittingPropertiesFunctionality:
 
         assert len(stream_records) == 6
 
+    def test_stream_with_splitting_properties_requests_chunks_concurrently(self, requests_mock, common_params, fake_properties_list):
+        """
+        Check the property chunks of the page are requested at the same time, and the records are merged
+        """
+
+        parsed_properties = list(APIv3Property(fake_properties_list).split())
+        self.set_mock_properties(requests_mock, "/properties/v2/product/properties", fake_properties_list)
+        common_params["api"].property_chunks_concurrency = len(parsed_properties)
+        # every chunk request waits for the others, so the serial requests would break the barrier
+        all_chunks_requested = threading.Barrier(len(parsed_properties), timeout=10)
+        ids_list = ["6043593519", "1092593519", "1092593518"]
+
+        def handle_request(properties, **kwargs):
+            all_chunks_requested.wait()
+            response = requests.Response()
+            response.status_code = 200
+            results = [
+                {**self.BASE_OBJECT_BODY, "id": id, "properties": {p: "fake_data" for p in properties.properties}} for id in ids_list
+            ]
+            response._content = json.dumps({"results": results, "paging": {}}).encode()
+            return response
+
+        test_stream = Products(**common_params)
+        test_stream.handle_request = handle_request
+
+        stream_records = list(test_stream.read_records(sync_mode=SyncMode.incremental))
+
+        assert [record["id"] for record in stream_records] == ids_list
+        for record in stream_records:
+            assert len(record["properties"]) == NUMBER_OF_PROPERTIES
+
+
+def test_group_by_key_pops_records_received_from_all_parts():
+    post_processor = GroupByKey("id", parts=2)
+    post_processor.add_record({"id": "1", "properties": {"a": 1}})
+    post_processor.add_record({"id": "2", "properties": {"a": 2}})
+    assert post_processor.pop_completed() == []
+
+    post_processor.add_record({"id": "1", "properties": {"b": 1}})
+    assert post_processor.pop_completed() == [{"id": "1", "properties": {"a": 1, "b": 1}}]
+    # the incomplete records are left for the `flat`
+    assert post_processor.flat == [{"id": "2", "properties": {"a": 2}}]
+
+
+def test_read_shuts_down_the_property_chunks_executor(mocker, config):
+    source = SourceHubspot(config, None, None)
+    api = source.get_common_params(config=config)["api"]
+    executor = api.property_chunks_executor
+    mocker.patch("airbyte_cdk.sources.declarative.concurrent_declarative_source.ConcurrentDeclarativeSource.read", return_value=iter([]))
+
+    assert list(source.read(logger, config, ConfiguredAirbyteCatalog(streams=[]))) == []
+
+    assert executor._shutdown
+    # the next read starts the new one
+    assert api.property_chunks_executor is not executor
+
 
 @pytest.fixture(name="configured_catalog")
 def configured_catalog_fixture():
@@ -0,0 +1,157 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+"""Compare the throughput of the file-based parsers reading the files inside ZIP archives against the plain files.
+
+The same CSV and JSONL content is parsed from the plain file, from the ZIP archive with the `ZipContentReader`,
+and from the ZIP archive with the character by character `readline()` previously used. All of them give the same records,
+the throughputs are printed.
+
+Usage:
+    poetry run python scripts/benchmark_zip_reader.py [--rows 5000]
+"""
+
+import argparse
+import datetime
+import io
+import json
+import logging
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Union
+
+
+CONNECTOR_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CONNECTOR_DIR))
+
+from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader  # noqa: E402
+
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat  # noqa: E402
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig  # noqa: E402
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat  # noqa: E402
+from airbyte_cdk.sources.file_based.file_types import CsvParser, JsonlParser  # noqa: E402
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser  # noqa: E402
+
+
+logger = logging.getLogger("airbyte")
+
+
+class _LegacyZipContentReader(ZipContentReader):
+    """The character by character `readline()` previously used for the files inside ZIP archives."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.legacy_buffer = bytearray()
+
+    def readline(self, limit: int = -1) -> Union[str, bytes]:
+        line = ""
+        while True:
+            char = self.legacy_read(1)
+            if not char:
+                break
+
+            line += char
+            if char in ["\n", "\r"]:
+                next_char = self.legacy_read(1)
+                if char == "\r" and next_char == "\n":
+                    line += next_char
+                else:
+                    self.legacy_buffer = next_char.encode(self.encoding) + self.legacy_buffer
+                break
+        return line
+
+    def legacy_read(self, size: int = -1) -> Union[str, bytes]:
+        while len(self.legacy_buffer) < size:
+            chunk = self.raw.read(self.buffer_size)
+            if not chunk:
+                break
+            self.legacy_buffer += chunk
+
+        data = self.legacy_buffer[:size]
+        self.legacy_buffer = self.legacy_buffer[size:]
+        return data.decode(self.encoding) if self.encoding else bytes(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self.legacy_buffer = bytearray()
+        return super().seek(offset, whence)
+
+
+class _StreamReader:
+    """Opens the one file, either as is or from the ZIP archive."""
+
+    def __init__(self, open_file: Callable[[], Any]) -> None:
+        self._open_file = open_file
+
+    def open_file(self, file, mode, encoding, logger):
+        return self._open_file()
+
+
+def _csv_content(number_of_rows: int) -> bytes:
+    lines = ["id,name,email,amount,created_at"]
+    lines += [
+        f"{index},name {index},user{index}@example.com,{index * 1.5},2024-01-01T00:00:{index % 60:02}Z" for index in range(number_of_rows)
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _jsonl_content(number_of_rows: int) -> bytes:
+    lines = [
+        json.dumps({"id": index, "name": f"name {index}", "tags": ["a", "b"], "amount": index * 1.5}) for index in range(number_of_rows)
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _zip(content: bytes) -> tuple:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("file", content)
+    info = zipfile.ZipFile(archive).infolist()[0]
+    file_info = RemoteFileInsideArchive(
+        uri="archive.zip/file",
+        last_modified=datetime.datetime(2024, 1, 1),
+        start_offset=info.header_offset,
+        compressed_size=info.compress_size,
+        uncompressed_size=info.file_size,
+        compression_method=info.compress_type,
+    )
+    return archive.getvalue(), file_info
+
+
+def _parse(parser: FileTypeParser, config: FileBasedStreamConfig, file_info, open_file: Callable[[], Any]) -> tuple:
+    start = time.perf_counter()
+    records = list(parser.parse_records(config, file_info, _StreamReader(open_file), logger, None))
+    return records, time.perf_counter() - start
+
+
+def benchmark(name: str, parser: FileTypeParser, file_format, content: bytes) -> None:
+    config = FileBasedStreamConfig(name="benchmark", format=file_format, validation_policy="Emit Record")
+    archive, file_info = _zip(content)
+
+    plain_records, plain_seconds = _parse(parser, config, file_info, lambda: io.TextIOWrapper(io.BytesIO(content), encoding="utf-8"))
+    legacy_records, legacy_seconds = _parse(
+        parser, config, file_info, lambda: _LegacyZipContentReader(DecompressedStream(io.BytesIO(archive), file_info), "utf-8")
+    )
+    zipped_records, zipped_seconds = _parse(
+        parser, config, file_info, lambda: ZipContentReader(DecompressedStream(io.BytesIO(archive), file_info), "utf-8")
+    )
+
+    if not zipped_records == legacy_records == plain_records:
+        sys.exit(f"The {name} records read from the ZIP archive differ from the plain file ones")
+    size_mb = len(content) / 1024 / 1024
+    print(
+        f"Parsed {len(zipped_records):,} {name} records ({size_mb:.1f} MB): "
+        f"plain {size_mb / plain_seconds:.1f} MB/s, zipped {size_mb / zipped_seconds:.1f} MB/s, "
+        f"zipped with character by character lines {size_mb / legacy_seconds:.2f} MB/s"
+    )
+
+
+def main(number_of_rows: int) -> None:
+    benchmark("csv", CsvParser(), CsvFormat(), _csv_content(number_of_rows))
+    benchmark("jsonl", JsonlParser(), JsonlFormat(), _jsonl_content(number_of_rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000)
+    main(parser.parse_args().rows)
@@ -26,7 +26,14 @@ from airbyte_cdk.sources.file_based.exceptions import CustomFileBasedException,
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from source_s3.v4.config import Config
-from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
+from source_s3.v4.zip_reader import (
+    DecompressedStream,
+    ReadAheadPool,
+    ReadAheadStream,
+    RemoteFileInsideArchive,
+    ZipContentReader,
+    ZipFileHandler,
+)
 
 
 AWS_EXTERNAL_ID = getenv("AWS_ASSUME_ROLE_EXTERNAL_ID")
@@ -38,6 +45,7 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
     def __init__(self):
         super().__init__()
         self._s3_client = None
+        self._read_ahead_pool = None
 
     @property
     def config(self) -> Config:
@@ -83,6 +91,15 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
 
         return self._s3_client
 
+    @property
+    def read_ahead_pool(self) -> ReadAheadPool:
+        """
+        The download threads and buffers shared by the files inside archives, which are read in parallel.
+        """
+        if self._read_ahead_pool is None:
+            self._read_ahead_pool = ReadAheadPool()
+        return self._read_ahead_pool
+
     def _get_iam_s3_client(self, client_kv_args: dict) -> BaseClient:
         """
         Creates an S3 client using AWS Security Token Service (STS) with assumed role credentials. This method handles
@@ -174,7 +191,15 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         logger.debug(f"try to open {file.uri}")
         try:
             if isinstance(file, RemoteFileInsideArchive):
-                s3_file_object = smart_open.open(f"s3://{self.config.bucket}/{file.uri.split('#')[0]}", transport_params=params, mode="rb")
+                # only the range of the file inside the archive is downloaded, by parts requested ahead of the reader
+                s3_file_object = ReadAheadStream(
+                    self.s3_client,
+                    self.config.bucket,
+                    file.uri.split("#")[0],
+                    start=file.start_offset,
+                    end=file.start_offset + DecompressedStream.MAX_LOCAL_FILE_HEADER_SIZE + file.compressed_size,
+                    pool=self.read_ahead_pool,
+                )
                 decompressed_stream = DecompressedStream(s3_file_object, file)
                 result = ZipContentReader(decompressed_stream, encoding)
             else:
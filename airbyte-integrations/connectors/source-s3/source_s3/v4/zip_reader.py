@@ -1,11 +1,17 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
+import codecs
 import io
+import re
 import struct
+import threading
 import zipfile
-from typing import IO, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Callable, Deque, List, Optional, Tuple, Union
 
 from botocore.client import BaseClient
+from botocore.exceptions import ClientError
 
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from source_s3.v4.config import Config
@@ -15,6 +21,15 @@ from source_s3.v4.config import Config
 BUFFER_SIZE_DEFAULT = 1024 * 1024
 MAX_BUFFER_SIZE_DEFAULT: int = 16 * BUFFER_SIZE_DEFAULT
 
+# Read-ahead of the files inside archives, see `ReadAheadStream`
+READ_AHEAD_PART_SIZE = 8 * BUFFER_SIZE_DEFAULT
+READ_AHEAD_MAX_BUFFERS = 16
+READ_AHEAD_MAX_PARTS_AHEAD = 4
+
+# Line endings, see `ZipContentReader.readline()`
+NEWLINE_BYTES = re.compile(b"[\r\n]")
+NEWLINE_TEXT = re.compile("[\r\n]")
+
 
 class RemoteFileInsideArchive(RemoteFile):
     """
@@ -141,6 +156,178 @@ class ZipFileHandler:
                 return zf.infolist(), central_dir_start
 
 
+class ReadAheadPool:
+    """
+    The threads and the buffers shared by the `ReadAheadStream` of all the files being read.
+
+    Every part downloaded ahead of the reader takes one of `max_buffers` buffers, from the moment it's requested
+    until it's read (or discarded), so the memory used by the read-ahead stays below `max_buffers * part_size`,
+    no matter how many files inside the archives are read at the same time.
+    """
+
+    def __init__(self, max_buffers: int = READ_AHEAD_MAX_BUFFERS, part_size: int = READ_AHEAD_PART_SIZE):
+        self.max_buffers = max(max_buffers, 1)
+        self.part_size = part_size
+        self._buffers = threading.BoundedSemaphore(self.max_buffers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_buffers, thread_name_prefix="s3_read_ahead")
+
+    def try_acquire(self) -> bool:
+        return self._buffers.acquire(blocking=False)
+
+    def release(self, *args) -> None:
+        self._buffers.release()
+
+    def submit(self, fn: Callable[..., bytes], *args) -> "Future[bytes]":
+        return self._executor.submit(fn, *args)
+
+
+class ReadAheadStream(io.RawIOBase):
+    """
+    A seekable stream over the range `[start, end)` of the file in S3, downloaded by ranged `get_object` requests.
+
+    While the current part is read, up to `max_parts_ahead` next parts are downloaded in parallel, so the reader
+    is not waiting for the round trip of each request. The parts are downloaded by the threads of the shared `ReadAheadPool`,
+    when it has no free buffer the next part is downloaded by the reader itself, once it's needed.
+
+    Seeking within the parts already requested keeps them, seeking elsewhere discards them and starts over at the new position.
+    """
+
+    def __init__(
+        self,
+        s3_client: BaseClient,
+        bucket: str,
+        key: str,
+        start: int,
+        end: int,
+        pool: ReadAheadPool,
+        max_parts_ahead: int = READ_AHEAD_MAX_PARTS_AHEAD,
+    ):
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.end = end
+        self.pool = pool
+        self.max_parts_ahead = max_parts_ahead
+        self._position = start
+        # the part being read and where it starts in the file
+        self._part = b""
+        self._part_start = start
+        # the parts requested ahead, in the order of their position in the file
+        self._ahead: Deque[Tuple[int, "Future[bytes]"]] = deque()
+        self._next_part_start = start
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=self.key, Range=f"bytes={start}-{end - 1}")
+        except ClientError as e:
+            # the range starts after the end of the file
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                return b""
+            raise
+        return response["Body"].read()
+
+    def _request_ahead(self) -> None:
+        while len(self._ahead) < self.max_parts_ahead and self._next_part_start < self.end and self.pool.try_acquire():
+            part_end = min(self._next_part_start + self.pool.part_size, self.end)
+            try:
+                part = self.pool.submit(self._fetch, self._next_part_start, part_end)
+            except RuntimeError:
+                # the pool is shut down
+                self.pool.release()
+                return
+            self._ahead.append((self._next_part_start, part))
+            self._next_part_start = part_end
+
+    def _next_part(self) -> bool:
+        """
+        Make the next part the current one, returns False at the end of the file.
+        """
+        if self._ahead:
+            self._part_start, part = self._ahead.popleft()
+            try:
+                self._part = part.result()
+            finally:
+                self.pool.release()
+        elif self._next_part_start < self.end:
+            part_end = min(self._next_part_start + self.pool.part_size, self.end)
+            self._part_start, self._part = self._next_part_start, self._fetch(self._next_part_start, part_end)
+            self._next_part_start = part_end
+        else:
+            return False
+
+        if len(self._part) < min(self.pool.part_size, self.end - self._part_start):
+            # the file ends before the end of the range
+            self.end = self._part_start + len(self._part)
+            self._discard_ahead()
+        self._request_ahead()
+        return True
+
+    def _discard_ahead(self) -> None:
+        while self._ahead:
+            self._discard(self._ahead.pop()[1])
+        self._next_part_start = self._part_start + len(self._part)
+
+    def _discard(self, part: "Future[bytes]") -> None:
+        # the buffer is taken until the download is actually finished (or cancelled)
+        part.cancel()
+        part.add_done_callback(self.pool.release)
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while size != 0 and self._position < self.end:
+            offset = self._position - self._part_start
+            if not 0 <= offset < len(self._part):
+                if not self._next_part():
+                    break
+                continue
+            chunk = self._part[offset:] if size < 0 else self._part[offset : offset + size]
+            chunks.append(chunk)
+            self._position += len(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.end
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if not self._part_start <= offset < self._next_part_start:
+            # the position is outside of the parts already requested
+            self._discard_ahead()
+            self._part, self._part_start, self._next_part_start = b"", offset, offset
+        elif offset >= self._part_start + len(self._part):
+            # skip the parts requested ahead, which end before the position
+            while self._ahead and min(self._ahead[0][0] + self.pool.part_size, self.end) <= offset:
+                self._discard(self._ahead.popleft()[1])
+        self._position = offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        if not self.closed:
+            self._discard_ahead()
+            self._part = b""
+        super().close()
+
+
 class DecompressedStream(io.IOBase):
     """
     A custom stream class that handles decompression of data from a given file object.
@@ -149,6 +336,8 @@ class DecompressedStream(io.IOBase):
 
     LOCAL_FILE_HEADER_SIZE: int = 30
     NAME_LENGTH_OFFSET: int = 26
+    # the header is followed by the name and the extra data, each one up to 65535 bytes long
+    MAX_LOCAL_FILE_HEADER_SIZE: int = LOCAL_FILE_HEADER_SIZE + 2 * 0xFFFF
 
     def __init__(self, file_obj: IO[bytes], file_info: RemoteFileInsideArchive, buffer_size: int = BUFFER_SIZE_DEFAULT):
         """
@@ -298,6 +487,11 @@ class ZipContentReader:
     """
     A custom reader class that provides buffered reading capabilities on a decompressed stream.
     Supports reading lines, reading chunks, and iterating over the content.
+
+    The decompressed data is read by chunks of `buffer_size` and the line endings (`\n`, `\r` or `\r\n`) are searched
+    in the whole buffer at once, each line is sliced out and decoded on it's own.
+    For the encodings, where the line endings are not single ASCII bytes (like `utf-16`), the chunks are decoded incrementally
+    and the line endings are searched in the decoded text instead.
     """
 
     def __init__(self, decompressed_stream: DecompressedStream, encoding: Optional[str] = None, buffer_size: int = BUFFER_SIZE_DEFAULT):
@@ -311,9 +505,25 @@ class ZipContentReader:
         self.raw = decompressed_stream
         self.encoding = encoding
         self.buffer_size = buffer_size
-        self.buffer = bytearray()
+        # the lines are decoded one by one, when the line endings can be found in the undecoded bytes
+        self._decode_lines = bool(encoding) and self._has_ascii_line_endings(encoding)
+        self._decoder = codecs.getincrementaldecoder(encoding)() if encoding and not self._decode_lines else None
+        self._newline = NEWLINE_TEXT if self._decoder else NEWLINE_BYTES
+        self._carriage_return = "\r" if self._decoder else b"\r"
+        self._line_feed = "\n" if self._decoder else b"\n"
+        self.buffer: Union[str, bytes] = "" if self._decoder else b""
+        # the position of the first unread byte/character in the buffer
+        self._position = 0
+        self._eof = False
         self._closed = False
 
+    @staticmethod
+    def _has_ascii_line_endings(encoding: str) -> bool:
+        try:
+            return "\r\n".encode(encoding) == b"\r\n"
+        except LookupError:
+            return False
+
     def __iter__(self):
         """
         Make the class iterable.
@@ -336,43 +546,76 @@ class ZipContentReader:
         if limit != -1:
             raise NotImplementedError("Limits other than -1 not implemented yet")
 
-        line = ""
+        search_from = self._position
         while True:
-            char = self.read(1)
-            if not char:
-                break
-
-            line += char
-            if char in ["\n", "\r"]:
-                # Handling different types of newlines
-                next_char = self.read(1)
-                if char == "\r" and next_char == "\n":
-                    line += next_char
-                else:
-                    self.buffer = next_char.encode(self.encoding) + self.buffer
-                break
-        return line
+            match = self._newline.search(self.buffer, search_from)
+            if match:
+                end = match.end()
+                if self.buffer[end - 1 : end] == self._carriage_return:
+                    if end == len(self.buffer) and not self._eof:
+                        # the `\r` is the last character in the buffer, it could be followed by `\n` in the next chunk
+                        search_from = end - 1 - self._position
+                        self._fill()
+                        continue
+                    if self.buffer[end : end + 1] == self._line_feed:
+                        end += 1
+                return self._take(end)
+
+            search_from = len(self.buffer) - self._position
+            if not self._fill():
+                return self._take(len(self.buffer))
 
     def read(self, size: int = -1) -> Union[str, bytes]:
         """
         Read a specified number of bytes/characters from the reader.
         """
-        while len(self.buffer) < size:
-            chunk = self.raw.read(self.buffer_size)
-            if not chunk:
-                break
-            self.buffer += chunk
-
-        data = self.buffer[:size]
-        self.buffer = self.buffer[size:]
-
-        return data.decode(self.encoding) if self.encoding else bytes(data)
+        if size is None or size < 0:
+            while self._fill():
+                pass
+            return self._take(len(self.buffer))
+
+        while len(self.buffer) - self._position < size and self._fill():
+            pass
+        return self._take(min(self._position + size, len(self.buffer)))
+
+    def _fill(self) -> bool:
+        """
+        Append the next chunk of the decompressed stream to the unread part of the buffer.
+        Returns False once the stream is exhausted.
+        """
+        if self._eof:
+            return False
+        chunk = self.raw.read(self.buffer_size)
+        if not chunk:
+            self._eof = True
+            if self._decoder:
+                chunk = self._decoder.decode(b"", final=True)
+        elif self._decoder:
+            chunk = self._decoder.decode(chunk)
+        # the buffer is rebased at the end of the stream too, the callers search it from the unread part
+        self.buffer = self.buffer[self._position :] + chunk
+        self._position = 0
+        return not self._eof
+
+    def _take(self, end: int) -> Union[str, bytes]:
+        data = self.buffer[self._position : end]
+        self._position = end
+        if self._decode_lines:
+            return data.decode(self.encoding)
+        return data
 
     def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
         """
         Seek to a specific position in the decompressed stream.
         """
-        self.buffer = bytearray()
+        if whence == io.SEEK_CUR:
+            # the position of the reader is behind the decompressed stream by the unread part of the buffer
+            offset, whence = self.tell() + offset, io.SEEK_SET
+        self.buffer = "" if self._decoder else b""
+        self._position = 0
+        self._eof = False
+        if self._decoder:
+            self._decoder.reset()
         return self.raw.seek(offset, whence)
 
     def close(self):
@@ -385,8 +628,11 @@ class ZipContentReader:
     def tell(self) -> int:
         """
         Return the current position in the decompressed stream.
+        The position is only known for the undecoded buffer, otherwise the position of the decompressed stream is returned.
         """
-        return self.raw.tell()
+        if self._decoder:
+            return self.raw.tell()
+        return self.raw.tell() - (len(self.buffer) - self._position)
 
     @property
     def closed(self) -> bool:
@@ -3,11 +3,22 @@
 import datetime
 import io
 import struct
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
-from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
+from botocore.exceptions import ClientError
+from source_s3.v4.zip_reader import (
+    DecompressedStream,
+    ReadAheadPool,
+    ReadAheadStream,
+    RemoteFileInsideArchive,
+    ZipContentReader,
+    ZipFileHandler,
+)
 
 
 # Mocking the S3 client and config for testing
@@ -138,3 +149,182 @@ def test_zip_content_reader_iteration():
 
     # Verify the lines extracted match expected values
     assert lines == ["line1\n", "line2\r", "line3\r\n", "line4\n"]
+
+
+def test_zip_content_reader_readline_across_chunks():
+    # "\r" is the last byte of the first chunk, so "\r\n" is split between chunks
+    mock_stream = MagicMock(spec=DecompressedStream)
+    mock_stream.read.side_effect = [b"line1\r", b"\nli", b"ne2\n", b"line3", b""]
+    reader = ZipContentReader(mock_stream, encoding="utf-8")
+
+    assert list(reader) == ["line1\r\n", "line2\n", "line3"]
+
+
+@pytest.mark.parametrize(
+    "encoding, content, expected_lines",
+    [
+        (None, b"a\rb\r", [b"a\r", b"b\r"]),
+        (None, b"\r\r", [b"\r", b"\r"]),
+        ("utf-8", b"a\rb\r", ["a\r", "b\r"]),
+        ("utf-8", b"\r\r", ["\r", "\r"]),
+        ("utf-16-le", "a\rb\r".encode("utf-16-le"), ["a\r", "b\r"]),
+    ],
+)
+def test_zip_content_reader_readline_ending_with_carriage_return(encoding, content, expected_lines):
+    # the last line ends with "\r" at the end of the stream, so there is nothing to look ahead for "\n"
+    mock_stream = MagicMock(spec=DecompressedStream)
+    mock_stream.read.side_effect = [content, b""]
+    reader = ZipContentReader(mock_stream, encoding=encoding)
+
+    assert list(reader) == expected_lines
+
+
+def test_zip_content_reader_readline_multibyte_characters():
+    content = "Zürich,€\n東京,¥\r\n".encode("utf-8")
+    mock_stream = MagicMock(spec=DecompressedStream)
+    # each multibyte character is split between chunks
+    mock_stream.read.side_effect = [content[index : index + 2] for index in range(0, len(content), 2)] + [b""]
+    reader = ZipContentReader(mock_stream, encoding="utf-8", buffer_size=2)
+
+    assert list(reader) == ["Zürich,€\n", "東京,¥\r\n"]
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-le"])
+def test_zip_content_reader_readline_utf16(encoding):
+    content = "line1\nline2\r\nline3".encode(encoding)
+    mock_stream = MagicMock(spec=DecompressedStream)
+    mock_stream.read.side_effect = [content[index : index + 3] for index in range(0, len(content), 3)] + [b""]
+    reader = ZipContentReader(mock_stream, encoding=encoding, buffer_size=3)
+
+    assert list(reader) == ["line1\n", "line2\r\n", "line3"]
+
+
+def test_zip_content_reader_bytes():
+    mock_stream = MagicMock(spec=DecompressedStream)
+    mock_stream.read.side_effect = [b"line1\nline2\n", b""]
+    mock_stream.tell.return_value = 12
+    reader = ZipContentReader(mock_stream)
+
+    assert reader.readline() == b"line1\n"
+    assert reader.tell() == 6
+    assert reader.read() == b"line2\n"
+
+
+def test_zip_content_reader_read_and_readline():
+    mock_stream = MagicMock(spec=DecompressedStream)
+    mock_stream.read.side_effect = [b"header\nrow1\n", b"row2\n", b""]
+    reader = ZipContentReader(mock_stream, encoding="utf-8")
+
+    assert reader.readline() == "header\n"
+    assert reader.read(3) == "row"
+    assert reader.read() == "1\nrow2\n"
+    assert reader.readline() == ""
+
+
+class _RangedS3Client:
+    """
+    Serves the ranged `get_object` requests of the one file, keeping track of the requests running at the same time.
+    """
+
+    def __init__(self, data: bytes, delay: float = 0.0) -> None:
+        self.data = data
+        self.delay = delay
+        self.ranges = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = (int(position) for position in Range[len("bytes=") :].split("-"))
+        if start >= len(self.data):
+            raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+        with self._lock:
+            self.ranges.append((start, end))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return {"Body": io.BytesIO(self.data[start : end + 1])}
+
+
+def _buffers_in_use(pool: ReadAheadPool) -> int:
+    # the buffers of the discarded parts are released once their download is actually finished
+    deadline = time.monotonic() + 5
+    while pool._buffers._value != pool.max_buffers and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return pool.max_buffers - pool._buffers._value
+
+
+def test_read_ahead_stream_reads_the_range_by_parts():
+    data = bytes(range(256)) * 40
+    client = _RangedS3Client(data)
+    pool = ReadAheadPool(max_buffers=4, part_size=1000)
+    stream = ReadAheadStream(client, "bucket", "key", start=100, end=len(data) + 5000, pool=pool)
+
+    assert stream.read(10) == data[100:110]
+    assert stream.read() == data[110:]
+    assert stream.read() == b""
+    assert stream.tell() == len(data)
+    # the parts are requested one after another, the ones after the end of the file are not
+    assert sorted(client.ranges) == [(start, start + 999) for start in range(100, len(data), 1000)]
+
+    stream.close()
+    assert _buffers_in_use(pool) == 0
+
+
+def test_read_ahead_stream_seek():
+    data = bytes(range(256)) * 40
+    client = _RangedS3Client(data)
+    pool = ReadAheadPool(max_buffers=4, part_size=1000)
+    stream = ReadAheadStream(client, "bucket", "key", start=0, end=len(data), pool=pool)
+
+    assert stream.read(10) == data[:10]
+    # the parts requested ahead are kept, when seeking forward within them
+    assert stream.seek(2500) == 2500
+    assert stream.read(10) == data[2500:2510]
+    assert stream.seek(-10, io.SEEK_CUR) == 2500
+    assert stream.read(10) == data[2500:2510]
+    requested = len(client.ranges)
+
+    # and discarded when seeking backward
+    assert stream.seek(5) == 5
+    assert stream.read(10) == data[5:15]
+    assert client.ranges[requested] == (5, 1004)
+
+    stream.close()
+    assert _buffers_in_use(pool) == 0
+
+
+def test_read_ahead_stream_members_are_read_in_parallel_with_bounded_buffers():
+    contents = {f"file{index}.csv": "".join(f"{index},row {row}\n" for row in range(2000)).encode() for index in range(4)}
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, content in contents.items():
+            zf.writestr(name, content)
+
+    client = _RangedS3Client(archive.getvalue(), delay=0.01)
+    pool = ReadAheadPool(max_buffers=3, part_size=512)
+
+    def read_member(info: zipfile.ZipInfo) -> bytes:
+        file_info = RemoteFileInsideArchive(
+            uri=f"archive.zip#{info.filename}",
+            last_modified=datetime.datetime(2024, 1, 1),
+            start_offset=info.header_offset,
+            compressed_size=info.compress_size,
+            uncompressed_size=info.file_size,
+            compression_method=info.compress_type,
+        )
+        end = info.header_offset + DecompressedStream.MAX_LOCAL_FILE_HEADER_SIZE + info.compress_size
+        stream = ReadAheadStream(client, "bucket", "archive.zip", start=info.header_offset, end=end, pool=pool)
+        with ZipContentReader(DecompressedStream(stream, file_info, buffer_size=100)) as reader:
+            return b"".join(reader)
+
+    members = zipfile.ZipFile(archive).infolist()
+    with ThreadPoolExecutor(max_workers=len(members)) as executor:
+        results = list(executor.map(read_member, members))
+
+    assert results == list(contents.values())
+    # every reader downloads the part it's waiting for, the parts ahead of all of them share the buffers
+    assert 1 < client.max_running <= len(members) + pool.max_buffers
+    assert _buffers_in_use(pool) == 0
@@ -0,0 +1,247 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import os
+import threading
+import uuid
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+
+import pandas as pd
+import requests
+from numpy import nan
+
+from airbyte_cdk.sources.declarative.retrievers import SimpleRetriever
+from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.types import StreamSlice
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer, json_to_python_simple
+
+
+LOGGER = logging.getLogger("airbyte")
+
+# the results are read as UTF-8, same as the `ResponseToFileExtractor` does
+RESULT_ENCODING = "utf-8"
+DOWNLOAD_CHUNK_SIZE = 1024 * 10
+
+
+def _filter_null_bytes(chunk: bytes) -> bytes:
+    # https://github.com/airbytehq/airbyte/issues/8300
+    filtered = chunk.replace(b"\x00", b"")
+    if len(filtered) < len(chunk):
+        LOGGER.warning("Filter 'null' bytes from string, size reduced %d -> %d chars", len(chunk), len(filtered))
+    return filtered
+
+
+# the path to the downloaded result page and the download of the next page (if any)
+DownloadedPage = Tuple[str, Optional["Future[Optional[DownloadedPage]]"]]
+
+
+@dataclass
+class BulkResultsDownloader(SimpleRetriever):
+    """
+    Downloads the result pages of the finished BULK job and reads the records from them.
+    Used as the `download_retriever` of the `AsyncHttpJobRepository`, in place of the `SimpleRetriever`
+    paginating over the `Sforce-Locator` header, which waited for each page to be downloaded and parsed before requesting the next one.
+
+    The locator of the next page is known as soon as the headers of the current page are received,
+    so the next page is requested right away, while the body of the current page is still being downloaded:
+        - up to `max_concurrent_downloads` pages are downloaded (and kept on disk) at the same time.
+        - the records are read from the pages in their order, while the next pages are being downloaded.
+
+    The pages are saved and parsed the same way as the `ResponseToFileExtractor` does it, the records are then passed
+    to the `record_selector`.
+
+    Read more: https://developer.salesforce.com/docs/atlas.en-us.api_asynch.meta/api_asynch/query_get_job_results.htm
+    """
+
+    max_concurrent_downloads: int = 3
+    # the number of rows parsed from the result file at once
+    chunk_size: int = 1000
+
+    def read_records(self, records_schema: Mapping[str, Any], stream_slice: Optional[StreamSlice] = None) -> Iterable[StreamData]:
+        yield from self.record_selector.filter_and_transform(
+            self._read_pages(stream_slice), stream_state={}, records_schema=records_schema, stream_slice=stream_slice
+        )
+
+    def _read_pages(self, stream_slice: Optional[StreamSlice]) -> Iterable[Mapping[str, Any]]:
+        max_concurrent_downloads = max(self.max_concurrent_downloads, 1)
+        # each page takes the permit from the moment it's requested, until it's records are read
+        permits = threading.Semaphore(max_concurrent_downloads)
+        stopped = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=max_concurrent_downloads, thread_name_prefix="salesforce_bulk_download")
+
+        page: Optional[Future] = executor.submit(self._download_page, executor, permits, stopped, stream_slice, None)
+        try:
+            while page is not None:
+                downloaded = page.result()
+                if downloaded is None:
+                    break
+                path, page = downloaded
+                try:
+                    # the file is removed once read
+                    yield from self._read_with_chunks(path)
+                finally:
+                    permits.release()
+        finally:
+            stopped.set()
+            if page is not None:
+                # the pages downloaded ahead are not going to be read
+                page.add_done_callback(self._discard_page)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _download_page(
+        self,
+        executor: ThreadPoolExecutor,
+        permits: threading.Semaphore,
+        stopped: threading.Event,
+        stream_slice: Optional[StreamSlice],
+        locator: Optional[str],
+    ) -> Optional[DownloadedPage]:
+        # the permit is taken before the page is requested, so no response is kept open while waiting for it
+        if not self._acquire(permits, stopped):
+            return None
+        response = self.requester.send_request(stream_slice=stream_slice, request_params={"locator": locator} if locator else None)
+        if response is None:
+            return None
+
+        next_page = None
+        next_locator = response.headers.get("Sforce-Locator")
+        if next_locator and next_locator != "null" and not stopped.is_set():
+            next_page = executor.submit(self._download_page, executor, permits, stopped, stream_slice, next_locator)
+
+        return self._save_to_file(response), next_page
+
+    @staticmethod
+    def _save_to_file(response: requests.Response) -> str:
+        """
+        Saves the (gzipped) CSV page to the temporary file, returns it's path.
+        """
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        needs_decompression = True
+        path = str(uuid.uuid4())
+        with closing(response) as response, open(path, "wb") as data_file:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if needs_decompression:
+                    try:
+                        data_file.write(decompressor.decompress(chunk))
+                        continue
+                    except zlib.error:
+                        # the page is not compressed
+                        needs_decompression = False
+                data_file.write(_filter_null_bytes(chunk))
+        return path
+
+    def _read_with_chunks(self, path: str) -> Iterable[Mapping[str, Any]]:
+        """
+        Reads the rows of the saved page, `chunk_size` rows at once, the empty cells are read as `None`. The file is removed once read.
+        """
+        try:
+            with open(path, "r", encoding=RESULT_ENCODING) as data:
+                for chunk in pd.read_csv(data, chunksize=self.chunk_size, iterator=True, dialect="unix", dtype=object):
+                    yield from chunk.replace({nan: None}).to_dict(orient="records")
+        except pd.errors.EmptyDataError as e:
+            LOGGER.info(f"Empty data received. {e}")
+        except IOError as ioe:
+            raise ValueError(f"The IO/Error occured while reading tmp data. Called: {path}", ioe)
+        finally:
+            os.remove(path)
+
+    @staticmethod
+    def _acquire(permits: threading.Semaphore, stopped: threading.Event) -> bool:
+        while not permits.acquire(timeout=0.1):
+            if stopped.is_set():
+                return False
+        return True
+
+    @classmethod
+    def _discard_page(cls, page: Future) -> None:
+        if page.cancelled() or page.exception() is not None or page.result() is None:
+            return
+        path, next_page = page.result()
+        if os.path.exists(path):
+            os.remove(path)
+        if next_page is not None:
+            next_page.add_done_callback(cls._discard_page)
+
+
+class _Fallback(Exception):
+    """
+    The value is not handled by the compiled casting, the record is transformed by the `TypeTransformer` instead.
+    """
+
+
+class BulkRecordTransformer(TypeTransformer):
+    """
+    The `TypeTransformer` for the BULK records, where every value comes from the CSV file as a string (or `None` for the empty cell).
+
+    The casting of every property is compiled once per schema, instead of traversing the schema with the jsonschema validator
+    for every record: each value goes through `default_convert()` and the registered custom transform, the same as
+    with the `TypeTransformer`. The records it can't handle (a value which doesn't end up with it's declared type, a nested object,
+    a property with several types, etc.) are transformed by the `TypeTransformer` as is, so the same warnings are logged.
+    """
+
+    def __init__(self, config: TransformConfig) -> None:
+        super().__init__(config)
+        self._compiled_casting = TransformConfig.NoTransform not in config
+        self._default_normalization = TransformConfig.DefaultSchemaNormalization in config
+        # id(schema) > (schema, the custom transform compiled with, the casting of it's properties or `None`, if the schema is not supported)
+        self._compiled: Dict[int, Tuple[Mapping[str, Any], Any, Optional[Mapping[str, Optional[Callable[[Any], Any]]]]]] = {}
+
+    def transform(self, record: Dict[str, Any], schema: Mapping[str, Any]) -> None:
+        casts = self._casts_for(schema) if self._compiled_casting else None
+        if casts is not None:
+            try:
+                updates: MutableMapping[str, Any] = {}
+                for field_name, value in record.items():
+                    if field_name not in casts:
+                        continue
+                    cast = casts[field_name]
+                    if cast is None:
+                        raise _Fallback()
+                    updates[field_name] = cast(value)
+                record.update(updates)
+                return
+            except _Fallback:
+                pass
+        super().transform(record, schema)
+
+    def _casts_for(self, schema: Mapping[str, Any]) -> Optional[Mapping[str, Optional[Callable[[Any], Any]]]]:
+        compiled = self._compiled.get(id(schema))
+        if compiled is None or compiled[0] is not schema or compiled[1] is not self._custom_normalizer:
+            compiled = self._compiled[id(schema)] = (schema, self._custom_normalizer, self._compile(schema))
+        return compiled[2]
+
+    def _compile(self, schema: Mapping[str, Any]) -> Optional[Mapping[str, Optional[Callable[[Any], Any]]]]:
+        if "$ref" in schema or schema.get("type") not in ("object", ["object"], ["null", "object"], ["object", "null"]):
+            return None
+        return {field_name: self._compile_property(field_schema) for field_name, field_schema in schema.get("properties", {}).items()}
+
+    def _compile_property(self, field_schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+        declared_types = field_schema.get("type", [])
+        declared_types = [declared_types] if isinstance(declared_types, str) else declared_types
+        types: List[str] = [field_type for field_type in declared_types if field_type != "null"]
+        # the objects (like `address`) are not queried with the BULK API, so they are never in the CSV file
+        if "$ref" in field_schema or len(types) != 1 or types[0] not in ("string", "number", "integer", "boolean"):
+            return None
+
+        python_type = json_to_python_simple[types[0]]
+        nullable = "null" in declared_types
+        default_convert = self.default_convert if self._default_normalization else None
+        custom_normalizer = self._custom_normalizer
+
+        def cast(value: Any) -> Any:
+            if default_convert:
+                value = default_convert(value, field_schema)
+            if custom_normalizer:
+                value = custom_normalizer(value, field_schema)
+            if type(value) is python_type or (value is None and nullable):
+                return value
+            # the value doesn't match the schema, the `TypeTransformer` logs it
+            raise _Fallback()
+
+        return cast
@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Tuple
+
+
+# the number of partial records kept in memory, before the oldest ones are spilled to disk
+DEFAULT_MAX_RECORDS_IN_MEMORY = 50_000
+
+
+class PartialRecordStitcher:
+    """
+    Sticks together the parts of the records, fetched by the different property chunks, by their primary key.
+
+    The partial records are kept in memory up to `max_records_in_memory`, the oldest half of them is spilled
+    to the temporary on-disk SQLite database once the budget is exceeded, so the memory usage stays bounded
+    when one property chunk runs ahead of the others, or the chunks return the records in a different order.
+    The spill database is created on the first spill only and removed on `close()`.
+
+    Example:
+        stitcher = PartialRecordStitcher(parts=2)
+        stitcher.add("001", {"Id": "001", "Name": "A"}) > None
+        stitcher.add("001", {"Id": "001", "Phone": "1"}) > {"Id": "001", "Name": "A", "Phone": "1"}
+    """
+
+    def __init__(self, parts: int, max_records_in_memory: int = DEFAULT_MAX_RECORDS_IN_MEMORY) -> None:
+        self.parts = parts
+        self.max_records_in_memory = max(max_records_in_memory, 1)
+        # primary key > (partial record, number of parts received), in the order of the first part received
+        self._in_memory: Dict[Any, Tuple[MutableMapping[str, Any], int]] = {}
+        self._spill: Optional[sqlite3.Connection] = None
+        self._spilled = 0
+
+    @property
+    def spilled(self) -> int:
+        """
+        The number of partial records currently kept on disk.
+        """
+        return self._spilled
+
+    def __len__(self) -> int:
+        return len(self._in_memory) + self._spilled
+
+    def add(self, record_id: Any, record: MutableMapping[str, Any]) -> Optional[MutableMapping[str, Any]]:
+        """
+        Adds the part of the record, returns the record once all of it's parts are received.
+        """
+
+        if record_id in self._in_memory:
+            partial_record, counter = self._in_memory.pop(record_id)
+        elif self._spilled:
+            partial_record, counter = self._unspill(record_id) or (None, 0)
+        else:
+            partial_record, counter = None, 0
+
+        if partial_record is None:
+            partial_record = record
+        else:
+            partial_record.update(record)
+        counter += 1
+
+        if counter >= self.parts:
+            return partial_record  # now it's complete
+        self._in_memory[record_id] = (partial_record, counter)
+        if len(self._in_memory) > self.max_records_in_memory:
+            self._spill_oldest()
+        return None
+
+    def incomplete_ids(self) -> Iterable[Any]:
+        """
+        The primary keys of the records, which never received all of their parts.
+        """
+        yield from self._in_memory
+        if self._spilled:
+            for (key,) in self._spill.execute("SELECT key FROM partial_records"):
+                yield json.loads(key)
+
+    def close(self) -> None:
+        self._in_memory.clear()
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        self._spilled = 0
+
+    def _spill_oldest(self) -> None:
+        if self._spill is None:
+            # the empty name stands for the private temporary database, which is deleted once it's closed
+            self._spill = sqlite3.connect("")
+            self._spill.execute("PRAGMA journal_mode = OFF")
+            self._spill.execute("PRAGMA synchronous = OFF")
+            self._spill.execute("CREATE TABLE partial_records (key TEXT PRIMARY KEY, record TEXT, counter INTEGER)")
+
+        # the oldest partial records are the least likely to be completed soon, the dict keeps the insertion order
+        to_spill: List[Tuple[str, str, int]] = []
+        for record_id in list(self._in_memory)[: len(self._in_memory) // 2 or 1]:
+            partial_record, counter = self._in_memory.pop(record_id)
+            to_spill.append((json.dumps(record_id), json.dumps(partial_record), counter))
+        with self._spill:
+            self._spill.executemany("INSERT INTO partial_records VALUES (?, ?, ?)", to_spill)
+        self._spilled += len(to_spill)
+
+    def _unspill(self, record_id: Any) -> Optional[Tuple[MutableMapping[str, Any], int]]:
+        key = json.dumps(record_id)
+        row = self._spill.execute("SELECT record, counter FROM partial_records WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with self._spill:
+            self._spill.execute("DELETE FROM partial_records WHERE key = ?", (key,))
+        self._spilled -= 1
+        return json.loads(row[0]), row[1]
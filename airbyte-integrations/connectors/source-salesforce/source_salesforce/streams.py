@@ -16,18 +16,13 @@ from requests import exceptions
 
 from airbyte_cdk import (
     BearerAuthenticator,
-    CursorPaginationStrategy,
     DeclarativeStream,
-    DefaultPaginator,
     DpathExtractor,
     HttpMethod,
     HttpRequester,
     JsonDecoder,
     MessageRepository,
     RecordSelector,
-    RequestOption,
-    RequestOptionType,
-    SimpleRetriever,
     StreamSlice,
 )
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, SyncMode
@@ -35,7 +30,6 @@ from airbyte_cdk.sources.declarative.async_job.job_orchestrator import AsyncJobO
 from airbyte_cdk.sources.declarative.async_job.job_tracker import JobTracker
 from airbyte_cdk.sources.declarative.async_job.status import AsyncJobStatus
 from airbyte_cdk.sources.declarative.auth.token_provider import InterpolatedStringTokenProvider
-from airbyte_cdk.sources.declarative.decoders import NoopDecoder
 from airbyte_cdk.sources.declarative.extractors import ResponseToFileExtractor
 from airbyte_cdk.sources.declarative.partition_routers import AsyncJobPartitionRouter
 from airbyte_cdk.sources.declarative.requesters.http_job_repository import AsyncHttpJobRepository
@@ -53,7 +47,9 @@ from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 from .api import PARENT_SALESFORCE_OBJECTS, UNSUPPORTED_FILTERING_STREAMS, Salesforce
 from .availability_strategy import SalesforceAvailabilityStrategy
+from .bulk_results import BulkRecordTransformer, BulkResultsDownloader
 from .rate_limiting import BulkNotSupportedException, SalesforceErrorHandler, default_backoff_handler
+from .stitcher import DEFAULT_MAX_RECORDS_IN_MEMORY, PartialRecordStitcher
 
 
 # https://stackoverflow.com/a/54517228
@@ -183,6 +179,8 @@ class PropertyChunk:
 
 class RestSalesforceStream(SalesforceStream):
     state_converter = IsoMillisConcurrentStreamStateConverter(is_sequential_state=False)
+    # the number of partially fetched records kept in memory, when the properties are split into chunks, see `PartialRecordStitcher`
+    max_partial_records_in_memory = DEFAULT_MAX_RECORDS_IN_MEMORY
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -256,6 +254,8 @@ class RestSalesforceStream(SalesforceStream):
         """
         Figure out which chunk is going to be read next.
         It should be the one with the least number of records read by the moment.
+        As all chunks read the records ordered by the primary key, the chunks progress through the same primary key ranges
+        in lockstep, so only about a page of records per chunk is waiting for it's other parts at any moment.
         """
         non_exhausted_chunks = {
             # We skip chunks that have already attempted a sync before and do not have a next page
@@ -276,62 +276,56 @@ class RestSalesforceStream(SalesforceStream):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
-        records_by_primary_key = {}
         property_chunks: Mapping[int, PropertyChunk] = {
             index: PropertyChunk(properties=properties) for index, properties in enumerate(self.chunk_properties())
         }
-        while True:
-            chunk_id = self._next_chunk_id(property_chunks)
-            if chunk_id is None:
-                # pagination complete
-                break
-
-            property_chunk = property_chunks[chunk_id]
-            request, response = self._fetch_next_page_for_chunk(
-                stream_slice, stream_state, property_chunk.next_page, property_chunk.properties
-            )
+        stitcher = PartialRecordStitcher(parts=len(property_chunks), max_records_in_memory=self.max_partial_records_in_memory)
+        try:
+            while True:
+                chunk_id = self._next_chunk_id(property_chunks)
+                if chunk_id is None:
+                    # pagination complete
+                    break
+
+                property_chunk = property_chunks[chunk_id]
+                request, response = self._fetch_next_page_for_chunk(
+                    stream_slice, stream_state, property_chunk.next_page, property_chunk.properties
+                )
+
+                # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the next chunk
+                if property_chunk.first_time:
+                    property_chunk.first_time = False
+                property_chunk.next_page = self.next_page_token(response)
+                chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
+                if not self.too_many_properties:
+                    # this is the case when a stream has no primary key
+                    # (it is allowed when properties length does not exceed the maximum value)
+                    # so there would be a single chunk, therefore we may and should yield records immediately
+                    for record in chunk_page_records:
+                        property_chunk.record_counter += 1
+                        yield record
+                    continue
 
-            # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the next chunk
-            if property_chunk.first_time:
-                property_chunk.first_time = False
-            property_chunk.next_page = self.next_page_token(response)
-            chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
-            if not self.too_many_properties:
-                # this is the case when a stream has no primary key
-                # (it is allowed when properties length does not exceed the maximum value)
-                # so there would be a single chunk, therefore we may and should yield records immediately
+                # stick together different parts of records by their primary key and emit if a record is complete
                 for record in chunk_page_records:
                     property_chunk.record_counter += 1
-                    yield record
-                continue
-
-            # stick together different parts of records by their primary key and emit if a record is complete
-            for record in chunk_page_records:
-                property_chunk.record_counter += 1
-                record_id = record[self.primary_key]
-                if record_id not in records_by_primary_key:
-                    records_by_primary_key[record_id] = (record, 1)
-                    continue
-                partial_record, counter = records_by_primary_key[record_id]
-                partial_record.update(record)
-                counter += 1
-                if counter == len(property_chunks):
-                    yield partial_record  # now it's complete
-                    records_by_primary_key.pop(record_id)
-                else:
-                    records_by_primary_key[record_id] = (partial_record, counter)
-
-        # Process what's left.
-        # Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
-        # there's a chance that the number of records corresponding to the query may change between the calls.
-        # Select 'a', 'b' from table order by pk -> returns records with ids `1`, `2`
-        #   <insert smth.>
-        # Select 'c', 'd' from table order by pk -> returns records with ids `1`, `3`
-        # Then records `2` and `3` would be incomplete.
-        # This may result in data inconsistency. We skip such records for now and log a warning message.
-        incomplete_record_ids = ",".join([str(key) for key in records_by_primary_key])
-        if incomplete_record_ids:
-            self.logger.warning(f"Inconsistent record(s) with primary keys {incomplete_record_ids} found. Skipping them.")
+                    complete_record = stitcher.add(record[self.primary_key], record)
+                    if complete_record is not None:
+                        yield complete_record
+
+            # Process what's left.
+            # Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
+            # there's a chance that the number of records corresponding to the query may change between the calls.
+            # Select 'a', 'b' from table order by pk -> returns records with ids `1`, `2`
+            #   <insert smth.>
+            # Select 'c', 'd' from table order by pk -> returns records with ids `1`, `3`
+            # Then records `2` and `3` would be incomplete.
+            # This may result in data inconsistency. We skip such records for now and log a warning message.
+            incomplete_record_ids = ",".join([str(key) for key in stitcher.incomplete_ids()])
+            if incomplete_record_ids:
+                self.logger.warning(f"Inconsistent record(s) with primary keys {incomplete_record_ids} found. Skipping them.")
+        finally:
+            stitcher.close()
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
@@ -631,7 +625,7 @@ class BulkSalesforceStream(SalesforceStream):
             use_cache=False,
             stream_response=True,
         )
-        download_retriever = SimpleRetriever(
+        download_retriever = BulkResultsDownloader(
             requester=download_requester,
             record_selector=RecordSelector(
                 extractor=ResponseToFileExtractor(parameters={}),
@@ -643,27 +637,9 @@ class BulkSalesforceStream(SalesforceStream):
             ),
             primary_key=None,
             name=job_download_components_name,
-            paginator=DefaultPaginator(
-                decoder=NoopDecoder(),
-                page_size_option=None,
-                page_token_option=RequestOption(
-                    field_name="locator",
-                    inject_into=RequestOptionType.request_parameter,
-                    parameters={},
-                ),
-                pagination_strategy=CursorPaginationStrategy(
-                    cursor_value="{{ headers['Sforce-Locator'] }}",
-                    stop_condition="{{ headers.get('Sforce-Locator', None) == 'null' or not headers.get('Sforce-Locator', None) }}",
-                    decoder=NoopDecoder(),
-                    config=config,
-                    parameters={},
-                ),
-                url_base=url_base,
-                config=config,
-                parameters={},
-            ),
             config=config,
             parameters={},
+            max_concurrent_downloads=self.MAX_CONCURRENT_DOWNLOADS,
         )
 
         abort_requester = HttpRequester(
@@ -762,8 +738,10 @@ class BulkSalesforceStream(SalesforceStream):
     DEFAULT_WAIT_TIMEOUT = timedelta(hours=24)
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    # the number of result pages of the BULK job downloaded at the same time, see `BulkResultsDownloader`
+    MAX_CONCURRENT_DOWNLOADS = 3
 
-    transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
+    transformer = BulkRecordTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
 
     def get_query_select_fields(self) -> str:
         return ", ".join(
@@ -947,6 +925,10 @@ class IncrementalRestSalesforceStream(RestSalesforceStream, CheckpointMixin, ABC
 
         where_clause = f"WHERE {' AND '.join(where_conditions)}"
         query = f"SELECT {select_fields} FROM {table_name} {where_clause}"
+        if self.too_many_properties and self.name not in UNSUPPORTED_FILTERING_STREAMS:
+            # all property chunks read the records in the same order, so they progress through the same primary key ranges
+            # and the parts of each record are received close to each other
+            query += f" ORDER BY {self.primary_key} ASC"
 
         return {"q": query}
 
@@ -14,7 +14,7 @@ import freezegun
 import pytest
 import requests_mock
 from config_builder import ConfigBuilder
-from conftest import generate_stream
+from conftest import generate_stream, mock_stream_api
 from salesforce_job_response_builder import JobInfoResponseBuilder
 from source_salesforce.api import API_VERSION, Salesforce
 from source_salesforce.source import SourceSalesforce
@@ -532,6 +532,39 @@ def test_too_many_properties(stream_config, stream_api_v2_pk_too_many_properties
         assert len(call.url) < Salesforce.REQUEST_SIZE_LIMITS
 
 
+def test_too_many_properties_partial_records_spilled(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
+    stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
+    stream.max_partial_records_in_memory = 1
+    chunks_len = len(list(stream.chunk_properties()))
+    url = f"https://fase-account.salesforce.com/services/data/{API_VERSION}/queryAll"
+    requests_mock.get(
+        url,
+        [
+            {"json": {"records": [{"Id": 1, "propertyA": "A"}, {"Id": 2, "propertyA": "A"}, {"Id": 3, "propertyA": "A"}]}},
+            # the chunks return the records in a different order
+            {"json": {"records": [{"Id": 3, "propertyB": "B"}, {"Id": 1, "propertyB": "B"}]}},
+            *[{"json": {"records": [{"Id": 3}, {"Id": 1}]}} for _ in range(chunks_len - 2)],
+        ],
+    )
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert records == [
+        {"Id": 3, "propertyA": "A", "propertyB": "B"},
+        {"Id": 1, "propertyA": "A", "propertyB": "B"},
+    ]
+
+
+def test_request_params_incremental_too_many_properties(stream_config_date_format):
+    describe_response_data = {"fields": [{"name": f"Property{str(i)}", "type": "string"} for i in range(Salesforce.REQUEST_SIZE_LIMITS)]}
+    describe_response_data["fields"].extend([{"name": "LastModifiedDate", "type": "datetime"}, {"name": "Id", "type": "string"}])
+    stream_api = mock_stream_api(stream_config_date_format, describe_response_data=describe_response_data)
+    stream = generate_stream("Account", stream_config_date_format, stream_api).get_standard_instance()
+    assert isinstance(stream, IncrementalRestSalesforceStream)
+    property_chunk = next(iter(stream.chunk_properties()))
+    params = stream.request_params(stream_state={}, stream_slice={"start_date": "2020", "end_date": "2021"}, property_chunk=property_chunk)
+
+    assert params["q"].endswith("ORDER BY Id ASC")
+
+
 def test_stream_with_no_records_in_response(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
     stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
     chunks = list(stream.chunk_properties())
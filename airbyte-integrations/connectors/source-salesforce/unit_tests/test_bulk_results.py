@@ -0,0 +1,191 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import copy
+import gzip
+import io
+import os
+import random
+import threading
+import time
+from typing import Any, List, Mapping, Optional
+
+import pytest
+import requests
+from source_salesforce.bulk_results import BulkRecordTransformer, BulkResultsDownloader
+from source_salesforce.streams import BulkSalesforceStream, transform_empty_string_to_none
+
+from airbyte_cdk.sources.declarative.extractors import RecordSelector, ResponseToFileExtractor
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+
+
+SCHEMA = {
+    "type": "object",
+    "additionalProperties": True,
+    "properties": {
+        "Id": {"type": ["string", "null"]},
+        "Name": {"type": ["string", "null"]},
+        "CreatedDate": {"type": ["string", "null"], "format": "date-time"},
+        "Amount": {"type": ["number", "null"]},
+        "NumberOfEmployees": {"type": ["integer", "null"]},
+        "IsDeleted": {"type": ["boolean", "null"]},
+        "BillingAddress": {"type": ["object", "null"], "properties": {"city": {"type": ["null", "string"]}}},
+    },
+}
+
+VALUES = {
+    "Id": ["001", " ", None],
+    "Name": ["Acme", "", "  ", None, "123"],
+    "CreatedDate": ["2024-01-01T00:00:00.000Z", None],
+    "Amount": ["1.5", " 2 ", "1e3", "-3", " ", None],
+    "NumberOfEmployees": ["10", " 7 ", "", None],
+    "IsDeleted": ["true", "False", "1", "off", " ", None],
+}
+
+
+def _legacy_transformer() -> TypeTransformer:
+    transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
+    transformer.registerCustomTransform(transform_empty_string_to_none)
+    return transformer
+
+
+def _records(count: int) -> List[Mapping[str, Any]]:
+    rnd = random.Random(0)
+    return [{field_name: rnd.choice(values) for field_name, values in VALUES.items()} for _ in range(count)]
+
+
+def _transformed(transformer: TypeTransformer, records: List[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+    records = copy.deepcopy(records)
+    for record in records:
+        transformer.transform(record, SCHEMA)
+    return records
+
+
+def test_bulk_record_transformer_gives_the_same_records() -> None:
+    records = _records(500)
+
+    assert _transformed(BulkSalesforceStream.transformer, records) == _transformed(_legacy_transformer(), records)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"Amount": "not a number"},
+        {"NumberOfEmployees": "1.5"},
+        {"IsDeleted": "maybe"},
+        {"Amount": 1},
+        {"BillingAddress": {"city": " "}},
+    ],
+)
+def test_bulk_record_transformer_falls_back_to_type_transformer(record, caplog) -> None:
+    expected = _transformed(_legacy_transformer(), [record])
+    legacy_warnings = [message for message in caplog.messages if "Failed to transform" in message]
+    caplog.clear()
+
+    assert _transformed(BulkSalesforceStream.transformer, [record]) == expected
+    assert [message for message in caplog.messages if "Failed to transform" in message] == legacy_warnings
+
+
+def test_bulk_record_transformer_applies_the_registered_transform() -> None:
+    def to_upper_case(instance: Any, schema: Any) -> Any:
+        return instance.upper() if isinstance(instance, str) else instance
+
+    transformer = BulkRecordTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
+    transformer.registerCustomTransform(to_upper_case)
+    legacy_transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization)
+    legacy_transformer.registerCustomTransform(to_upper_case)
+    records = _records(100)
+
+    assert _transformed(transformer, records) == _transformed(legacy_transformer, records)
+
+
+class _FakeRequester:
+    """
+    Returns the gzipped CSV result pages, each one pointing to the next one with the `Sforce-Locator` header.
+    """
+
+    def __init__(self, pages: List[str]) -> None:
+        self.pages = pages
+        self.requested: List[Optional[str]] = []
+        self.all_requested = threading.Event()
+
+    def send_request(self, stream_slice=None, request_params=None) -> requests.Response:
+        locator = (request_params or {}).get("locator")
+        self.requested.append(locator)
+        index = int(locator) if locator else 0
+        if len(self.requested) == len(self.pages):
+            self.all_requested.set()
+
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Sforce-Locator"] = str(index + 1) if index + 1 < len(self.pages) else "null"
+        response.raw = io.BytesIO(gzip.compress(self.pages[index].encode()))
+        return response
+
+
+def _downloader(pages: List[str], tmp_path, monkeypatch) -> tuple:
+    monkeypatch.chdir(tmp_path)
+    requester = _FakeRequester(pages)
+    record_selector = RecordSelector(
+        extractor=ResponseToFileExtractor(parameters={}),
+        record_filter=None,
+        transformations=[],
+        schema_normalization=TypeTransformer(TransformConfig.NoTransform),
+        config={},
+        parameters={},
+    )
+    downloader = BulkResultsDownloader(
+        requester=requester,
+        record_selector=record_selector,
+        primary_key=None,
+        name="download",
+        config={},
+        parameters={},
+        max_concurrent_downloads=3,
+    )
+    return requester, downloader
+
+
+def test_result_pages_are_read_in_order(tmp_path, monkeypatch) -> None:
+    pages = [f"Id,Name\n{page}-1,a\n{page}-2,b\n" for page in range(5)]
+    requester, downloader = _downloader(pages, tmp_path, monkeypatch)
+
+    records = list(downloader.read_records({}, None))
+
+    assert [record.data["Id"] for record in records] == [f"{page}-{index}" for page in range(5) for index in (1, 2)]
+    assert requester.requested == [None, "1", "2", "3", "4"]
+    assert not os.listdir(tmp_path)
+
+
+def test_next_pages_are_downloaded_while_the_page_is_read(tmp_path, monkeypatch) -> None:
+    pages = [f"Id\n{page}\n" for page in range(3)]
+    requester, downloader = _downloader(pages, tmp_path, monkeypatch)
+
+    records = iter(downloader.read_records({}, None))
+    assert next(records).data == {"Id": "0"}
+    # all pages fit into the concurrent downloads, so they are requested before the first page is read to the end
+    assert requester.all_requested.wait(timeout=5)
+
+    # the pages downloaded ahead are removed, when the records are no longer read
+    records.close()
+    deadline = time.monotonic() + 5
+    while os.listdir(tmp_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not os.listdir(tmp_path)
+
+
+def test_page_is_saved_before_waiting_for_the_next_download(tmp_path, monkeypatch) -> None:
+    pages = [f"Id\n{page}\n" for page in range(3)]
+    requester, downloader = _downloader(pages, tmp_path, monkeypatch)
+    downloader.max_concurrent_downloads = 1
+    records = []
+    # each page waits for the single download to be released by the page being read, before it's requested
+    reader = threading.Thread(target=lambda: records.extend(downloader.read_records({}, None)), daemon=True)
+
+    reader.start()
+    reader.join(timeout=5)
+
+    assert not reader.is_alive()
+    assert [record.data["Id"] for record in records] == ["0", "1", "2"]
+    assert requester.requested == [None, "1", "2"]
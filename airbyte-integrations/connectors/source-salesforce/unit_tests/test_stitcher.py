@@ -0,0 +1,56 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import random
+
+from source_salesforce.stitcher import PartialRecordStitcher
+
+
+def _chunk_parts(record_ids, chunk_index):
+    return [{"Id": record_id, f"property{chunk_index}": f"{record_id}-{chunk_index}"} for record_id in record_ids]
+
+
+def test_records_are_complete_once_all_parts_received():
+    stitcher = PartialRecordStitcher(parts=2)
+
+    assert stitcher.add("001", {"Id": "001", "Name": "A"}) is None
+    assert stitcher.add("001", {"Id": "001", "Phone": "1"}) == {"Id": "001", "Name": "A", "Phone": "1"}
+    assert len(stitcher) == 0
+
+
+def test_partial_records_are_spilled_over_the_memory_budget():
+    record_ids = [f"001{index:05}" for index in range(1000)]
+    stitcher = PartialRecordStitcher(parts=3, max_records_in_memory=10)
+
+    completed = []
+    for chunk_index in range(3):
+        # the chunks return the records in a different order, so the partial records pile up
+        shuffled_ids = random.Random(chunk_index).sample(record_ids, len(record_ids))
+        for part in _chunk_parts(shuffled_ids, chunk_index):
+            record = stitcher.add(part["Id"], part)
+            if record is not None:
+                completed.append(record)
+            assert len(stitcher._in_memory) <= 10
+        if chunk_index == 0:
+            assert stitcher.spilled >= len(record_ids) - 10
+
+    assert len(completed) == len(record_ids)
+    assert sorted(completed, key=lambda record: record["Id"]) == [
+        {"Id": record_id, **{f"property{index}": f"{record_id}-{index}" for index in range(3)}} for record_id in record_ids
+    ]
+    assert len(stitcher) == 0
+    stitcher.close()
+
+
+def test_incomplete_ids_include_spilled_records():
+    stitcher = PartialRecordStitcher(parts=2, max_records_in_memory=2)
+    for record_id in [1, 2, 3, 4, 5]:
+        stitcher.add(record_id, {"Id": record_id})
+    stitcher.add(2, {"Id": 2, "Name": "B"})
+
+    assert stitcher.spilled
+    assert sorted(stitcher.incomplete_ids()) == [1, 3, 4, 5]
+
+    stitcher.close()
+    assert list(stitcher.incomplete_ids()) == []
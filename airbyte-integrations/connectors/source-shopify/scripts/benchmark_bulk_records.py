@@ -0,0 +1,117 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+"""Compare the per-line work of `ShopifyBulkRecord` before and after the compiled `ShopifyBulkRecordTransform`.
+
+The recorded `metafield_orders` BULK Job result (`Order` lines, each followed by it's `Metafield` lines) is read
+with the type checks, `id` resolution and field renames previously done for every line, and with the compiled transform.
+Both give the same records, the timings are printed.
+
+Usage:
+    poetry run python scripts/benchmark_bulk_records.py [--repeat 20]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable, Mapping, MutableMapping
+from unittest.mock import patch
+
+import pendulum as pdm
+
+
+CONNECTOR_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CONNECTOR_DIR))
+
+from source_shopify.shopify_graphql.bulk.query import MetafieldOrder  # noqa: E402
+from source_shopify.shopify_graphql.bulk.record import ShopifyBulkRecord  # noqa: E402
+from source_shopify.shopify_graphql.bulk.tools import BULK_PARENT_KEY, BulkTools  # noqa: E402
+
+
+RESULT_PATH = Path(__file__).parent / "resource" / "metafield_orders.jsonl"
+CONFIG = {
+    "shop": "test_shop",
+    "credentials": {"auth_method": "api_password", "api_password": "api_password"},
+    "shop_id": 0,
+}
+
+
+def _legacy_camel_to_snake(camel_case: str) -> str:
+    snake_case = []
+    for char in camel_case:
+        if char.isupper():
+            snake_case.append("_" + char.lower())
+        else:
+            snake_case.append(char)
+    return "".join(snake_case).lstrip("_")
+
+
+def _legacy_resolve_str_id(str_input=None, output_type=int):
+    if str_input:
+        return output_type(re.search(r"\d+", str_input).group())
+    return None
+
+
+def _legacy_fields_names_to_snake_case(self, dict_input=None):
+    if dict_input:
+        return {_legacy_camel_to_snake(k) if dict_input and k != BULK_PARENT_KEY else k: v for k, v in dict_input.items()}
+
+
+class _LegacyBulkRecord(ShopifyBulkRecord):
+    """The type checks, `id` resolution and field renames previously done for every line."""
+
+    def record_compose(self, record: Mapping[str, Any]) -> Iterable[MutableMapping[str, Any]]:
+        if self.check_type(record, self.composition.get("new_record")):
+            yield from self.buffer_flush()
+            self.record_new(record)
+        elif self.check_type(record, self.components):
+            self.record_new_component(record)
+
+    def record_resolve_id(self, record: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+        id = record.get("id")
+        if id and isinstance(id, str):
+            record["admin_graphql_api_id"] = id
+            record["id"] = _legacy_resolve_str_id(id)
+        return record
+
+    def produce_records_from_lines(self, lines: Iterable[str]) -> Iterable[MutableMapping[str, Any]]:
+        self.record_composed = 0
+        for record in self.process_line(lines):
+            yield _legacy_fields_names_to_snake_case(None, record)
+            self.record_composed += 1
+
+
+def _produce(record_producer: ShopifyBulkRecord, lines: Iterable[str]) -> tuple:
+    start = time.perf_counter()
+    records = list(record_producer.produce_records_from_lines(lines))
+    return records, time.perf_counter() - start
+
+
+def main(repeat: int) -> None:
+    lines = RESULT_PATH.read_text().splitlines() * repeat
+
+    # the query components share the `BulkTools` helpers, so they are restored to their previous versions too
+    with (
+        patch.object(BulkTools, "camel_to_snake", staticmethod(_legacy_camel_to_snake)),
+        patch.object(BulkTools, "resolve_str_id", staticmethod(_legacy_resolve_str_id)),
+        patch.object(BulkTools, "fields_names_to_snake_case", _legacy_fields_names_to_snake_case),
+        patch.object(BulkTools, "_datetime_str_to_rfc3339", staticmethod(lambda value: pdm.parse(value).to_rfc3339_string())),
+    ):
+        legacy_records, legacy_seconds = _produce(_LegacyBulkRecord(MetafieldOrder(CONFIG)), lines)
+
+    records, compiled_seconds = _produce(ShopifyBulkRecord(MetafieldOrder(CONFIG)), lines)
+
+    if records != legacy_records:
+        sys.exit("The records produced with the compiled transform differ from the legacy ones")
+    print(
+        f"Produced {len(records):,} records from {len(lines):,} lines: "
+        f"legacy {legacy_seconds:.3f}s, compiled transform {compiled_seconds:.3f}s "
+        f"({legacy_seconds / compiled_seconds:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="how many times the recorded result is read")
+    main(parser.parse_args().repeat)
@@ -30,6 +30,11 @@ class ShopifyBulkExceptions:
     class BulkJobResultUrlError(BaseBulkException):
         """Raised when BULK Job has ACCESS_DENIED status"""
 
+    class BulkJobResultDownloadError(BaseBulkException):
+        """Raised when the BULK Job result could not be downloaded, after the download was resumed a few times"""
+
+        failure_type: FailureType = FailureType.transient_error
+
     class BulkRecordProduceError(BaseBulkException):
         """Raised when there are error producing records from BULK Job result"""
 
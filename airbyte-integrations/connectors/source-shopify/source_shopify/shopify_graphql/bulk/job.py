@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from time import sleep, time
-from typing import Any, Final, Iterable, List, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Final, Iterable, List, Mapping, Optional
 
 import pendulum as pdm
 import requests
@@ -19,11 +19,16 @@ from airbyte_cdk.sources.streams.http import HttpClient
 from .exceptions import AirbyteTracedException, ShopifyBulkExceptions
 from .query import ShopifyBulkQuery, ShopifyBulkTemplates
 from .record import ShopifyBulkRecord
+from .result import ShopifyBulkResult
 from .retry import bulk_retry_on_exception
 from .status import ShopifyBulkJobStatus
 from .tools import END_OF_FILE, BulkTools
 
 
+if TYPE_CHECKING:
+    from .scheduler import ShopifyBulkJobScheduler
+
+
 class BulkOperationUserErrorCode(Enum):
     """
     Possible error codes that can be returned by BulkOperationUserError.
@@ -45,6 +50,12 @@ class ShopifyBulkManager:
 
     parent_stream_name: Optional[str] = None
     parent_stream_cursor: Optional[str] = None
+    # produce records while the result is downloaded, instead of saving the whole result first
+    job_result_streaming: bool = True
+    # while streaming, download the result to the local file in the background and read the records from it
+    job_result_spill_to_disk: bool = False
+    # the shop-level scheduler, shared by the BULK streams, to run their BULK Jobs ahead
+    job_scheduler: Optional["ShopifyBulkJobScheduler"] = None
 
     # 10Mb chunk size to save the file
     _retrieve_chunk_size: Final[int] = 1024 * 1024 * 10
@@ -68,8 +79,12 @@ class ShopifyBulkManager:
     _job_state: str | None = field(init=False, default=None)  # this string is based on ShopifyBulkJobStatus
     # completed and saved Bulk Job result filename
     _job_result_filename: Optional[str] = field(init=False, default=None)
+    # completed Bulk Job result url, to be streamed
+    _job_result_url: Optional[str] = field(init=False, default=None)
     # date-time when the Bulk Job was created on the server
     _job_created_at: Optional[str] = field(init=False, default=None)
+    # the slice of the BULK Job created ahead of the stream read, see `prefetch_job()`
+    _job_prefetched_slice: Optional[Mapping[str, str]] = field(init=False, default=None)
     # indicated whether or not we manually force-cancel the current job
     _job_self_canceled: bool = field(init=False, default=False)
     # time between job status checks
@@ -208,12 +223,16 @@ class ShopifyBulkManager:
         self._job_state = None
         # reset the filename to default
         self._job_result_filename = None
+        self._job_result_url = None
         # setting self-cancelation to default
         self._job_self_canceled = False
         # set the running job message counter to default
         self._log_job_msg_count = 0
         # set the running job object count to default
         self._job_last_rec_count = 0
+        # free the concurrency slot, if it's still taken
+        if self.job_scheduler:
+            self.job_scheduler.release(self)
 
     def _set_checkpointing(self) -> None:
         # set the flag to adjust the next slice from the checkpointed cursor value
@@ -267,6 +286,24 @@ class ShopifyBulkManager:
         # sleep to ensure the cancelation
         sleep(self._job_check_interval)
 
+    def _job_cancel_prefetched(self) -> None:
+        """
+        Cancels the BULK Job created ahead of the stream read, without waiting for the cancelation,
+        the manager is left ready to create the new BULK Job.
+        """
+        job_id = self._job_id
+        self._job_id = None
+        self._job_state = None
+        self._job_created_at = None
+        self._job_prefetched_slice = None
+        if job_id:
+            self.http_client.send_request(
+                http_method="POST",
+                url=self.base_url,
+                json={"query": ShopifyBulkTemplates.cancel(job_id)},
+                request_kwargs={},
+            )
+
     def _log_job_state_with_count(self) -> None:
         """
         Print the status/state Job info message every N request, to minimize the noise in the logs.
@@ -295,8 +332,12 @@ class ShopifyBulkManager:
         partial_result_url = parsed_response.get("partialDataUrl") if parsed_response else None
         job_result_url = full_result_url if full_result_url else partial_result_url
         if job_result_url:
-            # save to local file using chunks to avoid OOM
             filename = self._tools.filename_from_url(job_result_url)
+            if self.job_result_streaming:
+                # the result is downloaded and parsed at the same time, see `_process_bulk_results()`
+                self._job_result_url = job_result_url
+                return filename
+            # save to local file using chunks to avoid OOM
             _, response = self.http_client.send_request(http_method="GET", url=job_result_url, request_kwargs={"stream": True})
             response.raise_for_status()
             with open(filename, "wb") as file:
@@ -411,13 +452,21 @@ class ShopifyBulkManager:
         if self._job_state and errors:
             self._on_job_with_errors(errors)
 
-    def _job_track_running(self) -> None:
+    def _job_poll_status(self) -> requests.Response:
+        if self.job_scheduler:
+            # the status is polled along with the other running BULK Jobs
+            return self.job_scheduler.poll(self)
+
         _, response = self.http_client.send_request(
             http_method="POST",
             url=self.base_url,
             json={"query": ShopifyBulkTemplates.status(self._job_id)},
             request_kwargs={},
         )
+        return response
+
+    def _job_track_running(self) -> None:
+        response = self._job_poll_status()
         self._job_healthcheck(response)
         self._job_update_state(response)
         self._job_state_to_fn_map.get(self._job_state)(response=response)
@@ -475,8 +524,49 @@ class ShopifyBulkManager:
             else:
                 self._job_track_running()
 
+    def _job_adopt_prefetched(self, stream_slice: Mapping[str, str]) -> bool:
+        """
+        Takes over the BULK Job created ahead for the `stream_slice`, if any.
+        The BULK Job created ahead for the different slice is canceled.
+        """
+        if self._job_prefetched_slice is None:
+            return False
+
+        if self._job_id and self._job_prefetched_slice == stream_slice:
+            self._job_prefetched_slice = None
+            self.job_scheduler.adopt(self)
+            LOGGER.info(f"Stream: `{self.http_client.name}`, the BULK Job: `{self._job_id}` was created ahead of the stream read.")
+            return True
+
+        LOGGER.info(f"Stream: `{self.http_client.name}`, the BULK Job: `{self._job_id}` created ahead doesn't match the slice, canceling.")
+        self.job_scheduler.cancel_prefetched_job(self)
+        return False
+
     @bulk_retry_on_exception()
     def create_job(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+        if self._job_adopt_prefetched(stream_slice):
+            return
+
+        if self.job_scheduler:
+            # wait for the concurrency slot, instead of hitting the `OPERATION_IN_PROGRESS` error
+            self.job_scheduler.acquire(self)
+            self._job_create(stream_slice, filter_field)
+            self.job_scheduler.register(self)
+        else:
+            self._job_create(stream_slice, filter_field)
+
+    def prefetch_job(self, stream_slice: Mapping[str, str], filter_field: str) -> "ShopifyBulkManager":
+        """
+        Creates the BULK Job for the `stream_slice` ahead of the stream read, used by the `ShopifyBulkJobScheduler`.
+        The BULK Job is adopted by the `create_job()` for the same slice, when the stream is read.
+        """
+        self._job_id = None
+        self._job_create(stream_slice, filter_field)
+        if self._job_id:
+            self._job_prefetched_slice = stream_slice
+        return self
+
+    def _job_create(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
         if stream_slice:
             query = self.query.get(filter_field, stream_slice["start"], stream_slice["end"])
         else:
@@ -567,8 +657,19 @@ class ShopifyBulkManager:
         # emit final Bulk job status message
         LOGGER.info(f"{final_message}")
 
+    def _stream_bulk_results(self) -> Iterable[Mapping[str, Any]]:
+        result = ShopifyBulkResult(
+            http_client=self.http_client,
+            url=self._job_result_url,
+            spill_filename=self._job_result_filename if self.job_result_spill_to_disk else None,
+        )
+        yield from self.record_producer.read_lines(result.lines())
+
     def _process_bulk_results(self) -> Iterable[Mapping[str, Any]]:
-        if self._job_result_filename:
+        if self._job_result_url:
+            # produce records from the result, while it's being downloaded
+            yield from self._stream_bulk_results()
+        elif self._job_result_filename:
             # produce records from saved bulk job result
             yield from self.record_producer.read_file(self._job_result_filename)
         else:
@@ -36,6 +36,25 @@ class ShopifyBulkTemplates:
                 }"""
         ).substitute(job_id=bulk_job_id)
 
+    @staticmethod
+    def statuses(bulk_job_ids: List[str]) -> str:
+        return Template(
+            """query {
+                    nodes(ids: [$job_ids]) {
+                        ... on BulkOperation {
+                            id
+                            status
+                            errorCode
+                            createdAt
+                            objectCount
+                            fileSize
+                            url
+                            partialDataUrl
+                        }
+                    }
+                }"""
+        ).substitute(job_ids=", ".join(f'"{job_id}"' for job_id in bulk_job_ids))
+
     @staticmethod
     def cancel(bulk_job_id: str) -> str:
         return Template(
@@ -15,6 +15,7 @@ from source_shopify.utils import LOGGER
 from .exceptions import ShopifyBulkExceptions
 from .query import ShopifyBulkQuery
 from .tools import END_OF_FILE, BulkTools
+from .transform import NEW_COMPONENT, NEW_RECORD, ShopifyBulkRecordTransform
 
 
 @dataclass
@@ -32,10 +33,12 @@ class ShopifyBulkRecord:
         components (List[str]): A list of components derived from the record composition.
         _parent_stream_cursor_value (Optional[str | int]): The current value of the parent stream cursor.
         record_composed (int): The count of records composed.
+        transform (ShopifyBulkRecordTransform): The per-line work, compiled once for the query.
 
     Methods:
         __post_init__(): Initializes additional attributes after the object is created.
         tools(): Returns an instance of BulkTools.
+        transform(): Returns the per-line work, compiled for the query.
         has_parent_stream(): Checks if the record has a parent stream.
         parent_cursor_key(): Returns the key for the parent cursor if a parent stream exists.
         check_type(record, types): Checks if the record's type matches the given type(s).
@@ -48,9 +51,11 @@ class ShopifyBulkRecord:
         component_prepare(record): Prepares the given record by initializing a "record_components" dictionary.
         buffer_flush(): Flushes the buffer by processing each record in the buffer.
         record_compose(record): Processes a given record and yields buffered records if certain conditions are met.
-        process_line(jsonl_file): Processes a JSON Lines (jsonl) file and yields records.
+        process_line(jsonl_file): Processes JSON Lines (jsonl) from a file or any other iterable of lines and yields records.
         record_resolve_id(record): Resolves and updates the 'id' field in the given record.
         produce_records(filename): Reads the JSONL content saved from `job.job_retrieve_result()` line-by-line to avoid OOM.
+        produce_records_from_lines(lines): Produces records from the JSON Lines, with field names in snake_case.
+        read_lines(lines): Reads the lines of the BULK Job result, while it's being downloaded, and produces records from them.
         read_file(filename, remove_file): Reads a file and produces records from it.
     """
 
@@ -75,6 +80,11 @@ class ShopifyBulkRecord:
     def tools(self) -> BulkTools:
         return BulkTools()
 
+    @cached_property
+    def transform(self) -> ShopifyBulkRecordTransform:
+        # compiled on the first use, for the query and it's record composition
+        return ShopifyBulkRecordTransform.for_query(self.query, self.composition)
+
     @cached_property
     def has_parent_stream(self) -> bool:
         return True if self.parent_stream_name and self.parent_stream_cursor else False
@@ -260,16 +270,17 @@ class ShopifyBulkRecord:
         Step 3: repeat until the `<END_OF_FILE>`.
         """
 
-        if self.check_type(record, self.composition.get("new_record")):
+        action = self.transform.dispatch.get(record.get("__typename"))
+        if action == NEW_RECORD:
             # emit from previous iteration, if present
             yield from self.buffer_flush()
             # register the record
             self.record_new(record)
         # components check
-        elif self.check_type(record, self.components):
+        elif action == NEW_COMPONENT:
             self.record_new_component(record)
 
-    def process_line(self, jsonl_file: TextIOWrapper) -> Iterable[MutableMapping[str, Any]]:
+    def process_line(self, jsonl_file: Union[TextIOWrapper, Iterable[str]]) -> Iterable[MutableMapping[str, Any]]:
         """
         Processes a JSON Lines (jsonl) file and yields records.
 
@@ -313,11 +324,7 @@ class ShopifyBulkRecord:
                 { "id": 19435458986123, "admin_graphql_api_id": "gid://shopify/Order/19435458986123"}
         """
 
-        id = record.get("id")
-        if id and isinstance(id, str):
-            record["admin_graphql_api_id"] = id
-            record["id"] = self.tools.resolve_str_id(id)
-        return record
+        return self.transform.resolve_id(record)
 
     def produce_records(self, filename: str) -> Iterable[MutableMapping[str, Any]]:
         """
@@ -334,12 +341,49 @@ class ShopifyBulkRecord:
         """
 
         with open(filename, "r") as jsonl_file:
-            # reset the counter
-            self.record_composed = 0
+            yield from self.produce_records_from_lines(jsonl_file)
+
+    def produce_records_from_lines(self, lines: Iterable[str]) -> Iterable[MutableMapping[str, Any]]:
+        """
+        Produce records from the JSON Lines, taken from the file or from the streamed BULK Job result.
+
+        Args:
+            lines (Iterable[str]): The JSON Lines to process.
 
-            for record in self.process_line(jsonl_file):
-                yield self.tools.fields_names_to_snake_case(record)
-                self.record_composed += 1
+        Yields:
+            MutableMapping[str, Any]: A dictionary representing a processed record with field names in snake_case.
+        """
+
+        # reset the counter
+        self.record_composed = 0
+
+        for record in self.process_line(lines):
+            yield self.transform.fields_names_to_snake_case(record)
+            self.record_composed += 1
+
+    def read_lines(self, lines: Iterable[str]) -> Iterable[Mapping[str, Any]]:
+        """
+        Read the JSONL content of the BULK Job result, while it's being downloaded.
+
+        Args:
+            lines (Iterable[str]): The lines of the result, typically from `ShopifyBulkResult.lines()`.
+
+        Yields:
+            Iterable[Mapping[str, Any]]: An iterable of records produced from the lines.
+
+        Raises:
+            ShopifyBulkExceptions.BulkRecordProduceError: If an error occurs while producing records from the lines.
+        """
+
+        try:
+            yield from self.produce_records_from_lines(lines)
+        except ShopifyBulkExceptions.BaseBulkException:
+            # the download errors are raised as is
+            raise
+        except Exception as e:
+            raise ShopifyBulkExceptions.BulkRecordProduceError(
+                f"An error occured while producing records from BULK Job result. Trace: {repr(e)}.",
+            )
 
     def read_file(self, filename: str, remove_file: Optional[bool] = True) -> Iterable[Mapping[str, Any]]:
         """
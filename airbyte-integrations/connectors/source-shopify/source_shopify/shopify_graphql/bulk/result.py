@@ -0,0 +1,186 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+
+from dataclasses import dataclass, field
+from os import remove
+from threading import Condition, Thread
+from typing import BinaryIO, Final, Iterable, Iterator, Mapping, Optional
+
+import requests
+from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
+from source_shopify.utils import LOGGER
+
+from airbyte_cdk.sources.streams.http import HttpClient
+
+from .exceptions import ShopifyBulkExceptions
+
+
+# the errors raised by `iter_content()`, when the connection breaks in the middle of the download
+RESULT_DOWNLOAD_ERRORS: Final = (ChunkedEncodingError, ConnectionError, Timeout)
+
+
+@dataclass
+class _SpillProgress:
+    """
+    The progress of the background download into the spill file, shared with the reading thread.
+    """
+
+    condition: Condition = field(default_factory=Condition)
+    # bytes written and flushed to the spill file
+    written: int = 0
+    finished: bool = False
+    error: Optional[BaseException] = None
+    # set by the reading thread, when the records are no longer needed
+    canceled: bool = False
+
+
+@dataclass
+class ShopifyBulkResult:
+    """
+    Reads the JSONL result of the BULK Job line-by-line, while it's being downloaded.
+
+    The lines are split from the chunks of the streamed response, so the first records are produced
+    as soon as the first chunk arrives, instead of after the whole result is saved. Only the current
+    chunk and the incomplete line at its end are held in memory.
+
+    When the connection breaks in the middle of the download, the request is resumed from the last
+    received byte, using the `Range` header.
+
+    With the `spill_filename` provided, the result is downloaded into that file by the background thread
+    and the lines are read from the file as it grows. This way the download never waits for the records
+    to be consumed, so the slow consumer can't make the connection idle (and reset) half-way through,
+    at the cost of the disk space equal to the size of the result.
+    """
+
+    http_client: HttpClient
+    url: str
+    # 1Mb chunks, so the records are produced without waiting for the bigger ones to be filled
+    chunk_size: int = 1024 * 1024
+    spill_filename: Optional[str] = None
+    max_retries: int = 5
+
+    # bytes received so far, the resumed download starts from here
+    bytes_received: int = field(init=False, default=0)
+
+    def _range_headers(self) -> Mapping[str, str]:
+        return {"Range": f"bytes={self.bytes_received}-"} if self.bytes_received else {}
+
+    def _get(self) -> requests.Response:
+        _, response = self.http_client.send_request(
+            http_method="GET",
+            url=self.url,
+            request_kwargs={"stream": True},
+            headers=self._range_headers(),
+        )
+        response.raise_for_status()
+        return response
+
+    def iter_chunks(self) -> Iterable[bytes]:
+        """
+        Yields the raw chunks of the result, resuming the download on connection errors.
+        """
+
+        attempt = 0
+        while True:
+            response = self._get()
+            # the server might ignore the `Range` header and send the result from the start
+            skip = self.bytes_received if self.bytes_received and response.status_code != 206 else 0
+            try:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if skip:
+                        if len(chunk) <= skip:
+                            skip -= len(chunk)
+                            continue
+                        chunk, skip = chunk[skip:], 0
+                    self.bytes_received += len(chunk)
+                    yield chunk
+                return
+            except RESULT_DOWNLOAD_ERRORS as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise ShopifyBulkExceptions.BulkJobResultDownloadError(
+                        f"Could not download the BULK Job result after {self.max_retries} retries, {self.bytes_received} bytes received. Trace: {repr(e)}."
+                    )
+                LOGGER.warning(
+                    f"Stream: `{self.http_client.name}`, the BULK Job result download was interrupted after {self.bytes_received} bytes. Resuming {attempt}/{self.max_retries}."
+                )
+            finally:
+                response.close()
+
+    @staticmethod
+    def split_lines(chunks: Iterable[bytes]) -> Iterable[str]:
+        """
+        Splits the byte chunks into decoded lines, without the line breaks.
+        Each chunk is cut after its last line break, so the multi-byte characters on the chunk edges stay intact,
+        and the complete lines are decoded at once.
+        """
+
+        tail = b""
+        for chunk in chunks:
+            buffer = tail + chunk
+            end = buffer.rfind(b"\n")
+            if end == -1:
+                tail = buffer
+                continue
+            tail = buffer[end + 1 :]
+            yield from buffer[:end].decode("utf-8").split("\n")
+        if tail:
+            yield tail.decode("utf-8")
+
+    def _spill(self, file: BinaryIO, progress: _SpillProgress) -> None:
+        try:
+            for chunk in self.iter_chunks():
+                if progress.canceled:
+                    break
+                file.write(chunk)
+                file.flush()
+                with progress.condition:
+                    progress.written += len(chunk)
+                    progress.condition.notify()
+        except BaseException as e:
+            progress.error = e
+        finally:
+            file.close()
+            with progress.condition:
+                progress.finished = True
+                progress.condition.notify()
+
+    def _iter_spilled_chunks(self) -> Iterable[bytes]:
+        progress = _SpillProgress()
+        # the file is created before the download starts, so it's always there to be read
+        spill_file = open(self.spill_filename, "wb")
+        downloader = Thread(target=self._spill, args=(spill_file, progress), name=f"{self.spill_filename}-download", daemon=True)
+        downloader.start()
+        try:
+            with open(self.spill_filename, "rb") as file:
+                read = 0
+                while True:
+                    with progress.condition:
+                        progress.condition.wait_for(lambda: progress.written > read or progress.finished)
+                        available = progress.written - read
+                        finished = progress.finished
+                    if available:
+                        chunk = file.read(min(available, self.chunk_size))
+                        read += len(chunk)
+                        yield chunk
+                    elif finished:
+                        if progress.error:
+                            raise progress.error
+                        return
+        finally:
+            progress.canceled = True
+            downloader.join()
+            try:
+                remove(self.spill_filename)
+            except OSError as e:
+                LOGGER.info(f"Failed to remove the `tmp job result` file. Details: {repr(e)}.")
+
+    def lines(self) -> Iterator[str]:
+        """
+        Yields the lines of the result, as they are downloaded.
+        """
+
+        chunks = self._iter_spilled_chunks() if self.spill_filename else self.iter_chunks()
+        yield from self.split_lines(chunks)
@@ -0,0 +1,245 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from time import sleep
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Final, Iterable, List, Mapping, Optional, Tuple
+
+import requests
+from source_shopify.utils import LOGGER
+
+from .query import ShopifyBulkTemplates
+from .status import ShopifyBulkJobStatus
+
+
+if TYPE_CHECKING:
+    from .job import ShopifyBulkManager
+
+
+# the statuses, after which the BULK Job no longer takes the concurrency slot on the server
+FINAL_STATUSES: Final[List[str]] = [
+    ShopifyBulkJobStatus.COMPLETED.value,
+    ShopifyBulkJobStatus.CANCELED.value,
+    ShopifyBulkJobStatus.FAILED.value,
+    ShopifyBulkJobStatus.TIMEOUT.value,
+    ShopifyBulkJobStatus.ACCESS_DENIED.value,
+]
+
+
+@dataclass
+class ShopifyBulkJobScheduler:
+    """
+    The shop-level scheduler for the BULK Jobs of all selected streams.
+
+    The streams are still read one after another, but the BULK Jobs are not:
+        - the BULK Jobs of the upcoming streams (their first slices) are queued with `plan()`, in the order the streams are read,
+          and started when there is the free concurrency slot (once the stream being read has it's own BULK Job),
+          so the next Job runs on the server while the previous result is still being parsed.
+          The stream drops it's own (and the preceding) queued BULK Jobs, once it's read, see `stream_started()`.
+        - all running BULK Jobs are polled with the single GraphQL request, the statuses polled for other streams
+          are kept until their streams ask for them.
+        - no more than `max_concurrent_jobs` are running at the same time, instead of backing off on `OPERATION_IN_PROGRESS` errors.
+
+    When the stream reaches it's prefetched slice, the `ShopifyBulkManager` adopts the BULK Job already created for it,
+    see `ShopifyBulkManager.create_job()`.
+    """
+
+    # the number of BULK query operations allowed to run at the same time for the app and shop
+    max_concurrent_jobs: int = 1
+    # time between status checks, when waiting for the concurrency slot
+    check_interval: int = 3
+
+    # job id > manager, for the jobs taking the concurrency slot
+    _running: Dict[str, "ShopifyBulkManager"] = field(init=False, default_factory=dict)
+    # job id > the final status polled, not yet handed over to it's manager
+    _statuses: Dict[str, requests.Response] = field(init=False, default_factory=dict)
+    # the stream name > the BULK Job to start ahead of it's stream
+    _upcoming: Deque[Tuple[str, Callable[[], Optional["ShopifyBulkManager"]]]] = field(init=False, default_factory=deque)
+    # the managers with the BULK Jobs started ahead of their streams
+    _prefetched: List["ShopifyBulkManager"] = field(init=False, default_factory=list)
+
+    @property
+    def has_free_slot(self) -> bool:
+        return len(self._running) < self.max_concurrent_jobs
+
+    def plan(self, upcoming: Iterable[Tuple[str, Callable[[], Optional["ShopifyBulkManager"]]]]) -> None:
+        """
+        Replace the queue of the BULK Jobs to start ahead, by the names of their streams in the order they are read,
+        each one is created by it's callable, returning the manager of the created BULK Job (if any).
+        """
+        self._upcoming = deque(upcoming)
+
+    def stream_started(self, stream_name: str) -> None:
+        """
+        The stream is being read, it creates the BULK Jobs on it's own from now on,
+        the queued BULK Jobs of the streams read before it are no longer started either.
+        """
+        if any(name == stream_name for name, _ in self._upcoming):
+            while self._upcoming and self._upcoming.popleft()[0] != stream_name:
+                pass
+
+    def register(self, manager: "ShopifyBulkManager") -> None:
+        """
+        Takes the concurrency slot for the created BULK Job.
+        """
+        if manager._job_id:
+            self._running[manager._job_id] = manager
+
+    def release(self, manager: "ShopifyBulkManager") -> None:
+        """
+        Frees the concurrency slot of the BULK Job, typically when it's no longer running.
+        """
+        if manager._job_id:
+            self._running.pop(manager._job_id, None)
+            self._statuses.pop(manager._job_id, None)
+        if manager in self._prefetched:
+            self._prefetched.remove(manager)
+
+    def adopt(self, manager: "ShopifyBulkManager") -> None:
+        """
+        The stream has reached it's prefetched BULK Job.
+        """
+        if manager in self._prefetched:
+            self._prefetched.remove(manager)
+
+    def start_upcoming(self, reserved: int = 0) -> None:
+        """
+        Starts the queued BULK Jobs, while there are free concurrency slots,
+        keeping the `reserved` number of slots for the stream being read.
+        """
+        while self._upcoming and len(self._running) + reserved < self.max_concurrent_jobs:
+            _, start_job = self._upcoming.popleft()
+            try:
+                manager = start_job()
+            except Exception as e:
+                # not critical, the stream creates it's BULK Job on it's own, when it's read
+                LOGGER.info(f"Couldn't start the BULK Job ahead of the stream read. Details: {repr(e)}.")
+                continue
+            if manager and manager._job_id:
+                self._prefetched.append(manager)
+                self.register(manager)
+
+    def acquire(self, manager: "ShopifyBulkManager") -> None:
+        """
+        Waits for the concurrency slot to create the new BULK Job for the `manager`.
+        """
+        while not self.has_free_slot:
+            self._poll_running(manager)
+            if not self.has_free_slot:
+                sleep(self.check_interval)
+
+    def poll(self, manager: "ShopifyBulkManager") -> requests.Response:
+        """
+        Returns the status of the `manager` BULK Job, checking the status of the other running BULK Jobs at the same time.
+        """
+
+        job_id = manager._job_id
+        response = self._statuses.pop(job_id, None)
+        if response is None:
+            response = self._poll_running(manager)[job_id]
+        if self._status_of(response) in FINAL_STATUSES:
+            self._running.pop(job_id, None)
+            # the result is about to be processed, the next BULK Job can run meanwhile,
+            # but the slot is kept for the next slice of the stream being read
+            self.start_upcoming(reserved=1)
+        return response
+
+    def cancel_prefetched(self) -> None:
+        """
+        Cancels the BULK Jobs started ahead, which were never adopted by their streams.
+        """
+        for manager in list(self._prefetched):
+            LOGGER.info(
+                f"Stream: `{manager.http_client.name}`, canceling the BULK Job: `{manager._job_id}` started ahead, since it's not used."
+            )
+            try:
+                self.cancel_prefetched_job(manager)
+            except Exception as e:
+                LOGGER.info(f"Failed to cancel the BULK Job: `{manager._job_id}`. Details: {repr(e)}.")
+        self._upcoming.clear()
+
+    @staticmethod
+    def _status_of(response: requests.Response) -> Optional[str]:
+        try:
+            return ((response.json().get("data") or {}).get("node") or {}).get("status")
+        except (ValueError, AttributeError):
+            return None
+
+    def _poll_running(self, manager: "ShopifyBulkManager") -> Mapping[str, requests.Response]:
+        """
+        Polls the `manager` BULK Job along with all other running BULK Jobs, in one request.
+        The final statuses of other BULK Jobs are kept until their managers ask for them.
+        """
+
+        job_ids = [job_id for job_id in [manager._job_id, *self._running] if job_id]
+        job_ids = list(dict.fromkeys(job_ids))
+        if len(job_ids) == 1:
+            _, response = manager.http_client.send_request(
+                http_method="POST",
+                url=manager.base_url,
+                json={"query": ShopifyBulkTemplates.status(job_ids[0])},
+                request_kwargs={},
+            )
+            responses = {job_ids[0]: response}
+        else:
+            _, response = manager.http_client.send_request(
+                http_method="POST",
+                url=manager.base_url,
+                json={"query": ShopifyBulkTemplates.statuses(job_ids)},
+                request_kwargs={},
+            )
+            responses = self._split_statuses(response, job_ids)
+
+        for job_id, status_response in responses.items():
+            if job_id == manager._job_id:
+                continue
+            other = self._running.get(job_id)
+            if self._status_of(status_response) in FINAL_STATUSES:
+                self._running.pop(job_id, None)
+                self._statuses[job_id] = status_response
+            elif other and other in self._prefetched and other._job_elapsed_time_in_state > other._job_max_elapsed_time:
+                # the prefetched BULK Job is not tracked by it's stream yet, so it's canceled here, if it runs too long,
+                # it's stream will create the new one, with the reduced slice
+                LOGGER.info(f"Stream: `{other.http_client.name}`, the BULK Job: `{job_id}` started ahead runs longer than expected.")
+                self.cancel_prefetched_job(other)
+        return responses
+
+    def cancel_prefetched_job(self, manager: "ShopifyBulkManager") -> None:
+        """
+        Cancels the BULK Job started ahead, freeing it's concurrency slot.
+        """
+        self.release(manager)
+        manager._job_cancel_prefetched()
+
+    @staticmethod
+    def _split_statuses(response: requests.Response, job_ids: List[str]) -> Mapping[str, requests.Response]:
+        """
+        Splits the `nodes` status response into the single `node` status responses, one per BULK Job,
+        as if each BULK Job was polled on it's own.
+        """
+
+        try:
+            content = response.json()
+        except ValueError:
+            # each BULK Job gets the response as is, so the manager reports it
+            return {job_id: response for job_id in job_ids}
+
+        nodes = (content.get("data") or {}).get("nodes") or []
+        nodes_by_id = {node.get("id"): node for node in nodes if node}
+        responses = {}
+        for job_id in job_ids:
+            single: Dict[str, Any] = {key: value for key, value in content.items() if key != "data"}
+            single["data"] = {"node": nodes_by_id.get(job_id)}
+            status_response = requests.Response()
+            status_response.status_code = response.status_code
+            status_response.headers = response.headers
+            status_response.url = response.url
+            status_response.request = response.request
+            status_response.encoding = "utf-8"
+            status_response._content = json.dumps(single).encode("utf-8")
+            responses[job_id] = status_response
+        return responses
@@ -4,6 +4,7 @@
 
 
 import re
+from functools import lru_cache
 from typing import Any, Mapping, MutableMapping, Optional, Union
 from urllib.parse import parse_qsl, urlparse
 
@@ -15,10 +16,15 @@ from .exceptions import ShopifyBulkExceptions
 # default end line tag
 END_OF_FILE: str = "<end_of_file>"
 BULK_PARENT_KEY: str = "__parentId"
+# the numeric part of the GraphQL `id`, like: `gid://shopify/Order/19435458986123`
+ID_PATTERN: re.Pattern = re.compile(r"\d+")
+# the UTC date-time with seconds precision, like: `2023-01-01T15:00:00Z`, the most common one in the BULK Job results
+UTC_DATETIME_PATTERN: re.Pattern = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
 
 
 class BulkTools:
     @staticmethod
+    @lru_cache(maxsize=4096)
     def camel_to_snake(camel_case: str) -> str:
         snake_case = []
         for char in camel_case:
@@ -65,6 +71,9 @@ class BulkTools:
 
     @staticmethod
     def _datetime_str_to_rfc3339(value: str) -> str:
+        if UTC_DATETIME_PATTERN.fullmatch(value):
+            # the same output as `pendulum` gives, without parsing
+            return f"{value[:-1]}+00:00"
         return pdm.parse(value).to_rfc3339_string()
 
     @staticmethod
@@ -93,6 +102,6 @@ class BulkTools:
         # some fields that expected to be resolved as ids, might not be populated for the particular `RECORD`,
         # we should return `None` to make the field `null` in the output as the result of the transformation.
         if str_input:
-            return output_type(re.search(r"\d+", str_input).group())
+            return output_type(ID_PATTERN.search(str_input).group())
         else:
             return None
@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+
+from typing import Any, Dict, Final, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
+
+from .query import ShopifyBulkQuery
+from .tools import BULK_PARENT_KEY, BulkTools
+
+
+# what to do with the line of the BULK Job result, based on it's `__typename`
+NEW_RECORD: Final[int] = 1
+NEW_COMPONENT: Final[int] = 2
+
+
+class ShopifyBulkRecordTransform:
+    """
+    The per-line work of `ShopifyBulkRecord`, compiled once per `ShopifyBulkQuery` subclass and `record_composition`:
+        - `dispatch`: the `__typename` > `NEW_RECORD` / `NEW_COMPONENT` table, instead of type checks for every line.
+        - `resolve_id()`: the `id` resolution with the precompiled pattern.
+        - `fields_names_to_snake_case()`: the field names renames, memoized for the query.
+
+    Example:
+        record_composition = {"new_record": "Collection", "record_components": ["CollectionPublication"]}
+        dispatch = {"CollectionPublication": NEW_COMPONENT, "Collection": NEW_RECORD}
+    """
+
+    # the compiled transforms, see `for_query()`
+    _compiled: Dict[Tuple[Type[ShopifyBulkQuery], Tuple[str, ...], Tuple[str, ...]], "ShopifyBulkRecordTransform"] = {}
+
+    def __init__(self, new_record: Optional[Union[List[str], str]], components: Iterable[str]) -> None:
+        new_record_types = new_record if isinstance(new_record, list) else [new_record]
+        # the `new_record` type takes precedence over the same `component` type
+        self.dispatch: Mapping[Optional[str], int] = {
+            **{component: NEW_COMPONENT for component in components},
+            **{record_type: NEW_RECORD for record_type in new_record_types if record_type},
+        }
+        self._renames: Dict[str, str] = {BULK_PARENT_KEY: BULK_PARENT_KEY}
+
+    @classmethod
+    def for_query(cls, query: ShopifyBulkQuery, composition: Optional[Mapping[str, Any]] = None) -> "ShopifyBulkRecordTransform":
+        composition = (query.record_composition if composition is None else composition) or {}
+        new_record = composition.get("new_record")
+        new_record_key = tuple(new_record) if isinstance(new_record, list) else (new_record,)
+        components = tuple(composition.get("record_components", []))
+        key = (type(query), new_record_key, components)
+        if key not in cls._compiled:
+            cls._compiled[key] = cls(new_record, components)
+        return cls._compiled[key]
+
+    @staticmethod
+    def resolve_id(record: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+        """
+        Same as `ShopifyBulkRecord.record_resolve_id()`:
+            { "id": "gid://shopify/Order/19435458986123"} > { "id": 19435458986123, "admin_graphql_api_id": "gid://shopify/Order/19435458986123"}
+        """
+
+        id = record.get("id")
+        if id and isinstance(id, str):
+            record["admin_graphql_api_id"] = id
+            record["id"] = BulkTools.resolve_str_id(id)
+        return record
+
+    def fields_names_to_snake_case(self, record: Optional[Mapping[str, Any]]) -> Optional[MutableMapping[str, Any]]:
+        """
+        Same as `BulkTools.fields_names_to_snake_case()`, but each field name is converted once per query.
+        """
+
+        if record:
+            renames = self._renames
+            output = {}
+            for key, value in record.items():
+                name = renames.get(key)
+                if name is None:
+                    name = renames[key] = BulkTools.camel_to_snake(key)
+                output[name] = value
+            return output
@@ -4,17 +4,22 @@
 
 
 import logging
-from typing import Any, List, Mapping, Tuple
+from functools import partial
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Tuple
 
 from requests.exceptions import ConnectionError, RequestException, SSLError
 
-from airbyte_cdk.models import FailureType, SyncMode
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, ConfiguredAirbyteCatalog, FailureType, SyncMode
 from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.utils import AirbyteTracedException
 
 from .auth import MissingAccessTokenError, ShopifyAuthenticator
 from .scopes import ShopifyScopes
+from .shopify_graphql.bulk.job import ShopifyBulkManager
+from .shopify_graphql.bulk.scheduler import ShopifyBulkJobScheduler
+from .streams.base_streams import IncrementalShopifyGraphQlBulkStream
 from .streams.streams import (
     AbandonedCheckouts,
     Articles,
@@ -127,6 +132,10 @@ class ConnectionCheckTest:
 
 
 class SourceShopify(AbstractSource):
+    _bulk_job_scheduler: Optional[ShopifyBulkJobScheduler] = None
+    # the streams being read, see `read()`
+    _stream_instances: Optional[List[Stream]] = None
+
     @property
     def continue_sync_on_stream_failure(self) -> bool:
         return True
@@ -149,7 +158,7 @@ class SourceShopify(AbstractSource):
         config["authenticator"] = ShopifyAuthenticator(config)
         return ConnectionCheckTest(config).test_connection()
 
-    def select_transactions_stream(self, config: Mapping[str, Any]) -> Stream:
+    def select_transactions_stream(self, config: Mapping[str, Any], job_scheduler: Optional[ShopifyBulkJobScheduler] = None) -> Stream:
         """
         Allow the Customer to decide which API type to use when it comes to the `Transactions` stream.
         """
@@ -157,17 +166,22 @@ class SourceShopify(AbstractSource):
         if should_fetch_user_id:
             return Transactions(config)
         else:
-            return TransactionsGraphql(config)
+            return TransactionsGraphql(config, job_scheduler=job_scheduler)
 
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         """
         Mapping a input config of the user input configuration as defined in the connector spec.
         Defining streams to run.
         """
+        if self._stream_instances is not None:
+            return self._stream_instances
         config["shop"] = self.get_shop_name(config)
         config["authenticator"] = ShopifyAuthenticator(config)
         # add `shop_id` int value
         config["shop_id"] = ConnectionCheckTest(config).get_shop_id()
+        # the BULK Jobs of all streams share the concurrency limit of the shop
+        job_scheduler = ShopifyBulkJobScheduler(max_concurrent_jobs=config.get("bulk_max_concurrent_jobs", 1))
+        self._bulk_job_scheduler = job_scheduler
         # define scopes checker
         scopes_manager: ShopifyScopes = ShopifyScopes(config)
         # get the list of the permitted streams, based on the authenticated user scopes
@@ -177,49 +191,84 @@ class SourceShopify(AbstractSource):
             Articles(config),
             BalanceTransactions(config),
             Blogs(config),
-            Collections(config),
+            Collections(config, job_scheduler=job_scheduler),
             Collects(config),
             CustomCollections(config),
-            CustomerJourneySummary(config),
+            CustomerJourneySummary(config, job_scheduler=job_scheduler),
             Customers(config),
-            DiscountCodes(config),
+            DiscountCodes(config, job_scheduler=job_scheduler),
             Disputes(config),
             DraftOrders(config),
-            FulfillmentOrders(config),
+            FulfillmentOrders(config, job_scheduler=job_scheduler),
             Fulfillments(config),
-            InventoryItems(config),
-            InventoryLevels(config),
+            InventoryItems(config, job_scheduler=job_scheduler),
+            InventoryLevels(config, job_scheduler=job_scheduler),
             Locations(config),
             MetafieldArticles(config),
             MetafieldBlogs(config),
-            MetafieldCollections(config),
-            MetafieldCustomers(config),
-            MetafieldDraftOrders(config),
-            MetafieldLocations(config),
-            MetafieldOrders(config),
+            MetafieldCollections(config, job_scheduler=job_scheduler),
+            MetafieldCustomers(config, job_scheduler=job_scheduler),
+            MetafieldDraftOrders(config, job_scheduler=job_scheduler),
+            MetafieldLocations(config, job_scheduler=job_scheduler),
+            MetafieldOrders(config, job_scheduler=job_scheduler),
             MetafieldPages(config),
-            MetafieldProductImages(config),
-            MetafieldProducts(config),
-            MetafieldProductVariants(config),
+            MetafieldProductImages(config, job_scheduler=job_scheduler),
+            MetafieldProducts(config, job_scheduler=job_scheduler),
+            MetafieldProductVariants(config, job_scheduler=job_scheduler),
             MetafieldShops(config),
             MetafieldSmartCollections(config),
-            OrderAgreements(config),
+            OrderAgreements(config, job_scheduler=job_scheduler),
             OrderRefunds(config),
-            OrderRisks(config),
+            OrderRisks(config, job_scheduler=job_scheduler),
             Orders(config),
             Pages(config),
             PriceRules(config),
-            ProductImages(config),
-            Products(config),
-            ProductVariants(config),
+            ProductImages(config, job_scheduler=job_scheduler),
+            Products(config, job_scheduler=job_scheduler),
+            ProductVariants(config, job_scheduler=job_scheduler),
             Shop(config),
             SmartCollections(config),
             TenderTransactions(config),
-            self.select_transactions_stream(config),
-            CustomerAddress(config),
-            Countries(config=config, parent=ProfileLocationGroups(config)),
+            self.select_transactions_stream(config, job_scheduler),
+            CustomerAddress(config, job_scheduler=job_scheduler),
+            Countries(config=config, parent=ProfileLocationGroups(config, job_scheduler=job_scheduler)),
         ]
 
         return [
             stream_instance for stream_instance in stream_instances if self.format_stream_name(stream_instance.name) in permitted_streams
         ]
+
+    def read(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[List[AirbyteStateMessage]] = None,
+    ) -> Iterator[AirbyteMessage]:
+        # the streams are created once for the read, so the BULK Jobs started ahead are adopted by the stream instances being read
+        self._stream_instances = self.streams(config)
+        try:
+            # the BULK Jobs of the selected streams are started ahead, in the order of the catalog
+            self._bulk_job_scheduler.plan(self._upcoming_bulk_jobs(self._stream_instances, catalog, ConnectorStateManager(state=state)))
+            # the slot is kept for the BULK Jobs of the stream being read, so nothing is started ahead with the single slot
+            self._bulk_job_scheduler.start_upcoming(reserved=1)
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            self._bulk_job_scheduler.cancel_prefetched()
+            self._stream_instances = None
+
+    @staticmethod
+    def _upcoming_bulk_jobs(
+        stream_instances: List[Stream], catalog: ConfiguredAirbyteCatalog, state_manager: ConnectorStateManager
+    ) -> List[Tuple[str, Callable[[], Optional[ShopifyBulkManager]]]]:
+        """
+        Returns the BULK Jobs to start ahead, for the selected BULK streams by their names, in the order of the catalog.
+        """
+        bulk_streams = {stream.name: stream for stream in stream_instances if isinstance(stream, IncrementalShopifyGraphQlBulkStream)}
+        upcoming = []
+        for configured_stream in catalog.streams:
+            stream_instance = bulk_streams.get(configured_stream.stream.name)
+            if stream_instance:
+                stream_state = state_manager.get_stream_state(stream_instance.name, stream_instance.namespace)
+                upcoming.append((stream_instance.name, partial(stream_instance.prefetch_first_job, stream_state)))
+        return upcoming
@@ -16,6 +16,7 @@ from requests.exceptions import RequestException
 from source_shopify.http_request import ShopifyErrorHandler
 from source_shopify.shopify_graphql.bulk.job import ShopifyBulkManager
 from source_shopify.shopify_graphql.bulk.query import DeliveryZoneList, ShopifyBulkQuery
+from source_shopify.shopify_graphql.bulk.scheduler import ShopifyBulkJobScheduler
 from source_shopify.transform import DataTypeEnforcer
 from source_shopify.utils import ApiTypeEnum, ShopifyNonRetryableErrors
 from source_shopify.utils import EagerlyCachedStreamState as stream_state_cache
@@ -639,8 +640,10 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
 
     parent_stream_class: Optional[Union[ShopifyStream, IncrementalShopifyStream]] = None
 
-    def __init__(self, config: Dict) -> None:
+    def __init__(self, config: Dict, job_scheduler: Optional[ShopifyBulkJobScheduler] = None) -> None:
         super().__init__(config)
+        # the BULK Jobs of all streams are scheduled together, see `SourceShopify.read()`
+        self.job_scheduler = job_scheduler
         # define BULK Manager instance
         self.job_manager: ShopifyBulkManager = ShopifyBulkManager(
             http_client=self.bulk_http_client,
@@ -653,6 +656,10 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
             job_checkpoint_interval=config.get("job_checkpoint_interval", 200_000),
             parent_stream_name=self.parent_stream_name,
             parent_stream_cursor=self.parent_stream_cursor,
+            # parse the BULK Job result while it's downloaded, optionally spilling it to the disk
+            job_result_streaming=config.get("job_result_streaming", True),
+            job_result_spill_to_disk=config.get("job_result_spill_to_disk", False),
+            job_scheduler=job_scheduler,
         )
 
     @property
@@ -803,15 +810,40 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
         if self.job_manager._job_adjust_slice_from_checkpoint:
             self.logger.info(f"Stream {self.name}, continue from checkpoint: `{self._checkpoint_cursor}`.")
 
+    def _get_slice_end(self, start: datetime, end: datetime) -> datetime:
+        prefetched_slice = self.job_manager._job_prefetched_slice
+        if prefetched_slice and prefetched_slice.get("start") == start.to_rfc3339_string():
+            # the BULK Job for this slice was created ahead, see `prefetch_first_job()`
+            return pdm.parse(prefetched_slice["end"])
+        self.job_manager.job_size_normalize(start, end)
+        return self.job_manager.get_adjusted_job_start(start)
+
+    def prefetch_first_job(self, stream_state: Optional[Mapping[str, Any]] = None) -> Optional[ShopifyBulkManager]:
+        """
+        Creates the BULK Job for the first slice, ahead of the stream read, used by the `ShopifyBulkJobScheduler`.
+        """
+        if self.filter_field:
+            start = pdm.parse(self._get_state_value(stream_state))
+            end = pdm.now()
+            if start >= end:
+                return None
+            slice_end = self._get_slice_end(start, end)
+            stream_slice = {"start": start.to_rfc3339_string(), "end": slice_end.to_rfc3339_string()}
+        else:
+            stream_slice = {}
+        return self.job_manager.prefetch_job(stream_slice, self.filter_field)
+
     @stream_state_cache.cache_stream_state
     def stream_slices(self, stream_state: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        if self.job_scheduler:
+            # the BULK Jobs of this stream are no longer started ahead
+            self.job_scheduler.stream_started(self.name)
         if self.filter_field:
             state = self._get_state_value(stream_state)
             start = pdm.parse(state)
             end = pdm.now()
             while start < end:
-                self.job_manager.job_size_normalize(start, end)
-                slice_end = self.job_manager.get_adjusted_job_start(start)
+                slice_end = self._get_slice_end(start, end)
                 self.emit_slice_message(start, slice_end)
                 yield {"start": start.to_rfc3339_string(), "end": slice_end.to_rfc3339_string()}
                 # increment the end of the slice or reduce the next slice
@@ -363,6 +363,8 @@ def test_job_running_with_canceled_scenario(
 
     stream.job_manager._job_id = job_id
     stream.job_manager._job_checkpoint_interval = 5
+    # save the checkpointed result to the file, instead of streaming it
+    stream.job_manager.job_result_streaming = False
     # faking self-canceled job
     stream.job_manager._job_self_canceled = True
     # mocking the nested request call to retrieve the data from result URL
@@ -444,6 +446,42 @@ def test_bulk_stream_parse_response(
         assert test_records == expected_result
 
 
+@pytest.mark.parametrize(
+    "job_result_streaming, job_result_spill_to_disk",
+    [
+        (False, False),
+        (True, False),
+        (True, True),
+    ],
+    ids=["download then parse", "stream", "stream with spill to disk"],
+)
+def test_bulk_stream_result_processing_modes(
+    tmp_path,
+    monkeypatch,
+    requests_mock,
+    bulk_job_completed_response,
+    metafield_jsonl_content_example,
+    metafield_parse_response_expected_result,
+    auth_config,
+    job_result_streaming,
+    job_result_spill_to_disk,
+) -> None:
+    # the result file is saved to the working directory
+    monkeypatch.chdir(tmp_path)
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager.job_result_streaming = job_result_streaming
+    stream.job_manager.job_result_spill_to_disk = job_result_spill_to_disk
+    test_result_url = bulk_job_completed_response.get("data").get("node").get("url")
+    requests_mock.post(stream.job_manager.base_url, json=bulk_job_completed_response)
+    requests_mock.get(test_result_url, text=metafield_jsonl_content_example)
+
+    test_records = list(stream.read_records(SyncMode.full_refresh, stream_slice={}))
+
+    assert test_records == [metafield_parse_response_expected_result]
+    # no result files are left behind
+    assert list(tmp_path.iterdir()) == []
+
+
 @pytest.mark.parametrize(
     "stream, stream_state, with_start_date, expected_start",
     [
@@ -0,0 +1,98 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+from unittest.mock import MagicMock
+
+import pytest
+from requests.exceptions import ChunkedEncodingError
+from source_shopify.shopify_graphql.bulk.exceptions import ShopifyBulkExceptions
+from source_shopify.shopify_graphql.bulk.result import ShopifyBulkResult
+
+
+_CONTENT = '{"id":1,"title":"Café"}\n{"id":2,"title":"Thé"}\n{"id":3,"title":"Crème"}\n'.encode("utf-8")
+
+
+def _response(content: bytes, status_code: int = 200, fail_after: int = None) -> MagicMock:
+    def iter_content(chunk_size):
+        for position in range(0, len(content), chunk_size):
+            if fail_after is not None and position >= fail_after:
+                raise ChunkedEncodingError("Connection broken")
+            yield content[position : position + chunk_size]
+
+    response = MagicMock()
+    response.status_code = status_code
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+def _http_client(*responses: MagicMock) -> MagicMock:
+    http_client = MagicMock()
+    http_client.name = "test_stream"
+    http_client.send_request.side_effect = [(None, response) for response in responses]
+    return http_client
+
+
+def _requested_ranges(http_client: MagicMock):
+    return [call.kwargs["headers"].get("Range") for call in http_client.send_request.call_args_list]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 16, 1024], ids=["1 byte", "5 bytes", "16 bytes", "whole content"])
+def test_split_lines_keeps_lines_and_characters_across_chunks(chunk_size) -> None:
+    chunks = [_CONTENT[position : position + chunk_size] for position in range(0, len(_CONTENT), chunk_size)]
+    assert list(ShopifyBulkResult.split_lines(chunks)) == _CONTENT.decode("utf-8").splitlines()
+
+
+def test_split_lines_yields_last_line_without_line_break() -> None:
+    assert list(ShopifyBulkResult.split_lines([b'{"id":1}\n{"id"', b":2}"])) == ['{"id":1}', '{"id":2}']
+
+
+def test_download_is_resumed_from_the_last_received_byte() -> None:
+    http_client = _http_client(_response(_CONTENT, fail_after=20), _response(_CONTENT[20:], status_code=206))
+    result = ShopifyBulkResult(http_client, "https://result.url", chunk_size=10)
+
+    assert b"".join(result.iter_chunks()) == _CONTENT
+    assert _requested_ranges(http_client) == [None, "bytes=20-"]
+
+
+def test_download_is_resumed_when_the_server_ignores_the_range() -> None:
+    http_client = _http_client(_response(_CONTENT, fail_after=20), _response(_CONTENT))
+    result = ShopifyBulkResult(http_client, "https://result.url", chunk_size=7)
+
+    assert b"".join(result.iter_chunks()) == _CONTENT
+
+
+def test_download_fails_after_max_retries() -> None:
+    http_client = _http_client(*[_response(_CONTENT, fail_after=0) for _ in range(3)])
+    result = ShopifyBulkResult(http_client, "https://result.url", max_retries=2)
+
+    with pytest.raises(ShopifyBulkExceptions.BulkJobResultDownloadError):
+        list(result.lines())
+
+
+def test_spilled_result_is_read_and_removed(tmp_path) -> None:
+    spill_filename = tmp_path / "bulk-123.jsonl"
+    http_client = _http_client(_response(_CONTENT, fail_after=20), _response(_CONTENT[20:], status_code=206))
+    result = ShopifyBulkResult(http_client, "https://result.url", chunk_size=10, spill_filename=str(spill_filename))
+
+    assert list(result.lines()) == _CONTENT.decode("utf-8").splitlines()
+    assert not spill_filename.exists()
+
+
+def test_spilled_result_download_error_is_raised(tmp_path) -> None:
+    spill_filename = tmp_path / "bulk-123.jsonl"
+    http_client = _http_client(_response(_CONTENT, fail_after=0))
+    result = ShopifyBulkResult(http_client, "https://result.url", spill_filename=str(spill_filename), max_retries=0)
+
+    with pytest.raises(ShopifyBulkExceptions.BulkJobResultDownloadError):
+        list(result.lines())
+    assert not spill_filename.exists()
+
+
+def test_spilled_download_stops_when_lines_are_no_longer_read(tmp_path) -> None:
+    spill_filename = tmp_path / "bulk-123.jsonl"
+    http_client = _http_client(_response(_CONTENT))
+    lines = ShopifyBulkResult(http_client, "https://result.url", chunk_size=10, spill_filename=str(spill_filename)).lines()
+
+    assert next(lines) == '{"id":1,"title":"Café"}'
+    lines.close()
+    assert not spill_filename.exists()
@@ -0,0 +1,202 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+from functools import partial
+from typing import Any, Dict, List, Mapping
+
+import pytest
+import requests
+from source_shopify.shopify_graphql.bulk.scheduler import ShopifyBulkJobScheduler
+from source_shopify.streams.streams import MetafieldOrders, Products
+
+
+class _FakeBulkServer:
+    """
+    Answers the BULK Job mutations and status queries, keeping the status of each created BULK Job.
+    """
+
+    def __init__(self) -> None:
+        self.statuses: Dict[str, str] = {}
+        self.queries: List[str] = []
+
+    def _node(self, job_id: str) -> Mapping[str, Any]:
+        return {"id": job_id, "status": self.statuses[job_id], "createdAt": "2024-01-01T00:00:00Z", "objectCount": "0", "url": None}
+
+    def __call__(self, request, context) -> Mapping[str, Any]:
+        query = request.json()["query"]
+        self.queries.append(query)
+        if "bulkOperationRunQuery" in query:
+            job_id = f"gid://shopify/BulkOperation/{len(self.statuses) + 1}"
+            self.statuses[job_id] = "CREATED"
+            return {"data": {"bulkOperationRunQuery": {"bulkOperation": {"id": job_id, "status": "CREATED"}, "userErrors": []}}}
+        if "bulkOperationCancel" in query:
+            job_id = query.split('id: "')[1].split('"')[0]
+            self.statuses[job_id] = "CANCELED"
+            return {"data": {"bulkOperationCancel": {"bulkOperation": {"id": job_id, "status": "CANCELING"}, "userErrors": []}}}
+        if "nodes(ids" in query:
+            job_ids = [job_id for job_id in self.statuses if f'"{job_id}"' in query]
+            return {"data": {"nodes": [self._node(job_id) for job_id in job_ids]}, "extensions": {"cost": {}}}
+        job_id = query.split('id: "')[1].split('"')[0]
+        return {"data": {"node": self._node(job_id)}, "extensions": {"cost": {}}}
+
+    def count(self, operation: str) -> int:
+        return len([query for query in self.queries if operation in query])
+
+
+@pytest.fixture
+def bulk_server(requests_mock, auth_config) -> _FakeBulkServer:
+    server = _FakeBulkServer()
+    requests_mock.post(MetafieldOrders(auth_config).job_manager.base_url, json=server)
+    return server
+
+
+def _scheduled_streams(auth_config, max_concurrent_jobs: int = 1):
+    scheduler = ShopifyBulkJobScheduler(max_concurrent_jobs=max_concurrent_jobs)
+    return scheduler, MetafieldOrders(auth_config, job_scheduler=scheduler), Products(auth_config, job_scheduler=scheduler)
+
+
+def test_split_statuses_keeps_other_keys() -> None:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(
+        {"data": {"nodes": [{"id": "job_1", "status": "RUNNING"}, None]}, "extensions": {"cost": {"actualQueryCost": 2}}}
+    ).encode()
+
+    responses = ShopifyBulkJobScheduler._split_statuses(response, ["job_1", "job_2"])
+
+    assert responses["job_1"].json() == {
+        "extensions": {"cost": {"actualQueryCost": 2}},
+        "data": {"node": {"id": "job_1", "status": "RUNNING"}},
+    }
+    assert responses["job_2"].json()["data"] == {"node": None}
+
+
+def test_upcoming_job_is_started_ahead_and_adopted(bulk_server, auth_config) -> None:
+    scheduler, orders, products = _scheduled_streams(auth_config, max_concurrent_jobs=2)
+
+    orders.job_manager.create_job(next(iter(orders.stream_slices())), orders.filter_field)
+    scheduler.plan([("products", partial(products.prefetch_first_job, None))])
+    # the spare slot is kept for the next `orders` BULK Job
+    scheduler.start_upcoming(reserved=1)
+    assert bulk_server.count("bulkOperationRunQuery") == 1
+
+    bulk_server.statuses[orders.job_manager._job_id] = "COMPLETED"
+    response = scheduler.poll(orders.job_manager)
+    assert response.json()["data"]["node"]["status"] == "COMPLETED"
+    # the `products` BULK Job is started, as soon as the `orders` BULK Job is completed
+    assert bulk_server.count("bulkOperationRunQuery") == 2
+    prefetched_job_id = products.job_manager._job_id
+    assert prefetched_job_id
+
+    products.job_manager.create_job(next(iter(products.stream_slices())), products.filter_field)
+    # the BULK Job created ahead is adopted, instead of creating the new one
+    assert bulk_server.count("bulkOperationRunQuery") == 2
+    assert products.job_manager._job_id == prefetched_job_id
+    assert not scheduler._prefetched
+
+
+def test_upcoming_job_does_not_take_the_only_slot(mocker, bulk_server, auth_config) -> None:
+    scheduler, orders, products = _scheduled_streams(auth_config)
+    orders.job_manager.create_job(next(iter(orders.stream_slices())), orders.filter_field)
+    scheduler.plan([("products", partial(products.prefetch_first_job, None))])
+
+    bulk_server.statuses[orders.job_manager._job_id] = "COMPLETED"
+    scheduler.poll(orders.job_manager)
+    assert bulk_server.count("bulkOperationRunQuery") == 1
+    assert not products.job_manager._job_id
+
+    # the next `orders` BULK Job doesn't wait for the slot
+    scheduler_sleep = mocker.patch("source_shopify.shopify_graphql.bulk.scheduler.sleep")
+    orders.job_manager.create_job({"start": "2024-01-01T00:00:00+00:00", "end": "2024-01-02T00:00:00+00:00"}, orders.filter_field)
+    assert scheduler_sleep.call_count == 0
+    assert list(scheduler._running) == [orders.job_manager._job_id]
+
+
+def test_prefetched_job_for_other_slice_is_replaced(bulk_server, auth_config) -> None:
+    scheduler, orders, products = _scheduled_streams(auth_config)
+    scheduler.plan([("products", partial(products.prefetch_first_job, None))])
+    scheduler.start_upcoming()
+    prefetched_job_id = products.job_manager._job_id
+
+    products.job_manager.create_job({"start": "2024-01-01T00:00:00+00:00", "end": "2024-01-02T00:00:00+00:00"}, products.filter_field)
+
+    assert bulk_server.statuses[prefetched_job_id] == "CANCELED"
+    assert bulk_server.count("bulkOperationRunQuery") == 2
+    assert products.job_manager._job_id != prefetched_job_id
+    assert list(scheduler._running) == [products.job_manager._job_id]
+
+
+def test_running_jobs_are_polled_at_once(bulk_server, auth_config) -> None:
+    scheduler, orders, products = _scheduled_streams(auth_config, max_concurrent_jobs=2)
+    orders.job_manager.create_job(next(iter(orders.stream_slices())), orders.filter_field)
+    scheduler.plan([("products", partial(products.prefetch_first_job, None))])
+    scheduler.start_upcoming()
+    assert len(scheduler._running) == 2
+
+    bulk_server.statuses[products.job_manager._job_id] = "COMPLETED"
+    scheduler.poll(orders.job_manager)
+    assert bulk_server.count("nodes(ids") == 1
+    # the final status of the `products` BULK Job is kept, until it's stream asks for it
+    assert list(scheduler._running) == [orders.job_manager._job_id]
+
+    response = scheduler.poll(products.job_manager)
+    assert response.json()["data"]["node"]["status"] == "COMPLETED"
+    assert bulk_server.count("nodes(ids") == 1
+    assert bulk_server.count("node(id") == 0
+
+
+def test_job_is_created_when_slot_is_free(mocker, bulk_server, auth_config) -> None:
+    scheduler, orders, products = _scheduled_streams(auth_config)
+    orders.job_manager.create_job(next(iter(orders.stream_slices())), orders.filter_field)
+    orders_job_id = orders.job_manager._job_id
+
+    def complete_on_second_poll(*args, **kwargs) -> None:
+        bulk_server.statuses[orders_job_id] = "COMPLETED"
+
+    scheduler_sleep = mocker.patch("source_shopify.shopify_graphql.bulk.scheduler.sleep", side_effect=complete_on_second_poll)
+    products.job_manager.create_job(next(iter(products.stream_slices())), products.filter_field)
+
+    assert scheduler_sleep.call_count == 1
+    assert bulk_server.count("bulkOperationRunQuery") == 2
+    assert list(scheduler._running) == [products.job_manager._job_id]
+
+
+def test_cancel_prefetched(bulk_server, auth_config) -> None:
+    scheduler, orders, products = _scheduled_streams(auth_config)
+    scheduler.plan([("products", partial(products.prefetch_first_job, None))])
+    scheduler.start_upcoming()
+    prefetched_job_id = products.job_manager._job_id
+
+    scheduler.cancel_prefetched()
+
+    assert bulk_server.statuses[prefetched_job_id] == "CANCELED"
+    assert not products.job_manager._job_id
+    assert not products.job_manager._job_prefetched_slice
+    assert not scheduler._running and not scheduler._prefetched
+
+
+def test_started_stream_drops_its_upcoming_jobs(auth_config) -> None:
+    scheduler = ShopifyBulkJobScheduler()
+    scheduler.plan([("metafield_orders", lambda: None), ("products", lambda: None), ("product_variants", lambda: None)])
+
+    scheduler.stream_started("products")
+    assert [name for name, _ in scheduler._upcoming] == ["product_variants"]
+
+    # the streams without the BULK Jobs planned don't change the queue
+    scheduler.stream_started("orders")
+    assert [name for name, _ in scheduler._upcoming] == ["product_variants"]
+
+
+def test_stream_read_drops_its_upcoming_job(bulk_server, auth_config) -> None:
+    scheduler, orders, products = _scheduled_streams(auth_config)
+    scheduler.plan([("products", partial(products.prefetch_first_job, None))])
+
+    next(iter(products.stream_slices()))
+    scheduler.start_upcoming()
+
+    # the stream creates it's BULK Jobs on it's own, once it's read
+    assert not scheduler._upcoming
+    assert bulk_server.count("bulkOperationRunQuery") == 0
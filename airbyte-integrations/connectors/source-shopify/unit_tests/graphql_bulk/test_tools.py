@@ -37,9 +37,18 @@ def test_filename_from_url(job_result_url, error_type, expected) -> None:
         assert BulkTools.filename_from_url(job_result_url) == expected
 
 
-def test_from_iso8601_to_rfc3339() -> None:
-    record = {"date": "2023-01-01T15:00:00Z"}
-    assert BulkTools.from_iso8601_to_rfc3339(record, "date") == "2023-01-01T15:00:00+00:00"
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2023-01-01T15:00:00Z", "2023-01-01T15:00:00+00:00"),
+        ("2023-01-01T15:00:00.123Z", "2023-01-01T15:00:00.123000+00:00"),
+        ("2023-01-01T15:00:00+02:00", "2023-01-01T15:00:00+02:00"),
+        (None, None),
+    ],
+)
+def test_from_iso8601_to_rfc3339(value, expected) -> None:
+    record = {"date": value}
+    assert BulkTools.from_iso8601_to_rfc3339(record, "date") == expected
 
 
 def test_fields_names_to_snake_case() -> None:
@@ -0,0 +1,39 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+import pytest
+from source_shopify.shopify_graphql.bulk.query import Collection, MetafieldCustomer, MetafieldOrder
+from source_shopify.shopify_graphql.bulk.transform import NEW_COMPONENT, NEW_RECORD, ShopifyBulkRecordTransform
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (MetafieldOrder, {"Metafield": NEW_RECORD}),
+        (MetafieldCustomer, {"Customer": NEW_RECORD, "Metafield": NEW_COMPONENT}),
+        (Collection, {"Collection": NEW_RECORD, "CollectionPublication": NEW_COMPONENT}),
+    ],
+    ids=["MetafieldOrder", "MetafieldCustomer", "Collection"],
+)
+def test_dispatch(basic_config, query, expected) -> None:
+    assert ShopifyBulkRecordTransform.for_query(query(basic_config)).dispatch == expected
+
+
+def test_new_record_takes_precedence_over_component() -> None:
+    assert ShopifyBulkRecordTransform(["Product", "Metafield"], ["Metafield"]).dispatch == {"Product": NEW_RECORD, "Metafield": NEW_RECORD}
+
+
+def test_transform_is_compiled_once_per_query(basic_config) -> None:
+    transform = ShopifyBulkRecordTransform.for_query(MetafieldOrder(basic_config))
+    assert ShopifyBulkRecordTransform.for_query(MetafieldOrder(basic_config)) is transform
+    assert ShopifyBulkRecordTransform.for_query(MetafieldCustomer(basic_config)) is not transform
+
+
+def test_fields_names_to_snake_case() -> None:
+    transform = ShopifyBulkRecordTransform("Order", [])
+    record = {"camelCase": "value", "snake_case": "value", "__parentId": "value"}
+    expected = {"camel_case": "value", "snake_case": "value", "__parentId": "value"}
+    assert transform.fields_names_to_snake_case(record) == expected
+    # the memoized renames give the same result
+    assert transform.fields_names_to_snake_case(record) == expected
+    assert transform.fields_names_to_snake_case({}) is None
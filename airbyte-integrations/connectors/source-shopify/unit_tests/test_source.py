@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 from source_shopify.auth import ShopifyAuthenticator
+from source_shopify.shopify_graphql.bulk.scheduler import ShopifyBulkJobScheduler
 from source_shopify.source import ConnectionCheckTest, ShopifyScopes, SourceShopify
 from source_shopify.streams.streams import (
     AbandonedCheckouts,
@@ -49,6 +50,7 @@ from source_shopify.streams.streams import (
     TransactionsGraphql,
 )
 
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
 from airbyte_cdk.utils import AirbyteTracedException
 
 from .conftest import records_per_slice
@@ -354,6 +356,43 @@ def test_user_scopes_generate_full_list_of_streams(config, mocker):
     assert len(source.streams(config)) == expected_streams_number
 
 
+def test_read_starts_bulk_jobs_ahead_in_catalog_order(config, mocker, logger):
+    source = SourceShopify()
+    mocker.patch.object(ShopifyAuthenticator, "get_auth_header", return_value={"X-Shopify-Access-Token": "test_toke"})
+    mocker.patch.object(ConnectionCheckTest, "get_shop_id", return_value=123456)
+    mocker.patch.object(ShopifyScopes, "get_user_scopes", return_value=["read_orders", "read_products"])
+    plan = mocker.patch.object(ShopifyBulkJobScheduler, "plan")
+    start_upcoming = mocker.patch.object(ShopifyBulkJobScheduler, "start_upcoming")
+    cancel_prefetched = mocker.patch.object(ShopifyBulkJobScheduler, "cancel_prefetched")
+    # the streams read by the CDK are returned as the message
+    mocker.patch(
+        "airbyte_cdk.sources.abstract_source.AbstractSource.read", side_effect=lambda logger, config, *args: iter([source.streams(config)])
+    )
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=name, json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+            for name in ["products", "orders", "metafield_orders"]
+        ]
+    )
+
+    [read_streams] = list(source.read(logger, config, catalog))
+
+    upcoming = plan.call_args.args[0]
+    assert [name for name, _ in upcoming] == ["products", "metafield_orders"]
+    # the BULK Jobs started ahead belong to the stream instances being read
+    planned_stream = upcoming[0][1].func.__self__
+    assert any(stream is planned_stream for stream in read_streams)
+    assert planned_stream.job_scheduler is source._bulk_job_scheduler
+    start_upcoming.assert_called_once_with(reserved=1)
+    cancel_prefetched.assert_called_once()
+    # the next reads create the new streams
+    assert source.streams(config) is not read_streams
+
+
 @pytest.mark.parametrize(
     "response_data, expected_token",
     [